@@ -0,0 +1,27 @@
+"""Fixtures for the benchmarks."""
+
+import pytest
+
+from fitbit_web import auth, client, mock_server
+
+TOKENS = auth.AuthTokens(
+    access_token="mock-access-0",
+    expires_in=28800,
+    refresh_token="mock-refresh-0",
+    scope=("activity", "heartrate", "profile", "sleep"),
+    token_type="Bearer",
+    user_id="MOCK01",
+)
+
+
+@pytest.fixture(scope="session")
+def server():
+    """Mock server without rate limits."""
+    with mock_server.MockServer(rate_limit=10**9).run_in_thread() as server:
+        yield server
+
+
+@pytest.fixture
+def web_client(server: mock_server.MockServer) -> client.Client:
+    """Client connected to the mock server."""
+    return client.Client(TOKENS, base_url=server.base_url)
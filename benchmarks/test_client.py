@@ -0,0 +1,70 @@
+"""Throughput and latency of the client against the mock server.
+
+Besides the timings collected by pytest-benchmark, the requests/sec and the p50/p99
+latency of the individual requests are stored in the `extra_info` of each benchmark.
+"""
+
+import asyncio
+import statistics
+import time
+
+import pytest
+
+from fitbit_web import client
+
+REQUESTS = 50
+CONCURRENCY = 10
+ENDPOINTS = {
+    "profile": ((), "profile"),
+    "heart_intraday": (("2024-01-01", "1min"), "heart_by_date_intraday"),
+    "sleep_range": (("2024-01-01", "2024-01-31"), "sleep_by_date_range"),
+}
+
+
+def _record(benchmark, latencies: list[float], elapsed: float):
+    quantiles = statistics.quantiles(latencies, n=100)
+    benchmark.extra_info.update(
+        requests_per_second=len(latencies) / elapsed,
+        p50_ms=quantiles[49] * 1000,
+        p99_ms=quantiles[98] * 1000,
+    )
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def get_test(benchmark, web_client: client.Client, endpoint: str):
+    """Sequential requests using the sync methods."""
+    args, name = ENDPOINTS[endpoint]
+    method = getattr(web_client, f"get_{name}")
+
+    def run():
+        latencies = []
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            method(*args)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    start = time.perf_counter()
+    latencies = benchmark.pedantic(run, rounds=3)
+    _record(benchmark, latencies, (time.perf_counter() - start) / 3)
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def aget_test(benchmark, web_client: client.Client, endpoint: str):
+    """Concurrent requests using the async methods."""
+    args, name = ENDPOINTS[endpoint]
+    method = getattr(web_client, f"aget_{name}")
+
+    async def timed(semaphore: asyncio.Semaphore):
+        async with semaphore:
+            start = time.perf_counter()
+            await method(*args)
+            return time.perf_counter() - start
+
+    async def main():
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        return await asyncio.gather(*(timed(semaphore) for _ in range(REQUESTS)))
+
+    start = time.perf_counter()
+    latencies = benchmark.pedantic(lambda: asyncio.run(main()), rounds=3)
+    _record(benchmark, latencies, (time.perf_counter() - start) / 3)
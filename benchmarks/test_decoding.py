@@ -0,0 +1,78 @@
+"""Decoding cost and memory use of large intraday payloads."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from fitbit_web import mock_server, streaming
+
+POINTS = 1_000_000
+PREFIX = "activities-heart-intraday.dataset.item"
+
+
+@pytest.fixture(scope="module")
+def intraday() -> bytes:
+    """A full day of 1 second heart rate data."""
+    return json.dumps(
+        mock_server.payload(
+            "/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json",
+            {"date": "2024-01-01", "detail-level": "1sec"},
+        )
+    ).encode()
+
+
+@pytest.fixture(scope="module")
+def million_points() -> bytes:
+    """An intraday payload with one million points."""
+    return json.dumps(
+        {
+            "activities-heart-intraday": {
+                "dataset": [
+                    {
+                        "time": f"{i // 3600 % 24:02}:{i // 60 % 60:02}:{i % 60:02}",
+                        "value": 60 + i % 100,
+                    }
+                    for i in range(POINTS)
+                ]
+            }
+        }
+    ).encode()
+
+
+def json_loads_test(benchmark, intraday: bytes):
+    """Decoding of a day of 1 second data with `json.loads`."""
+    benchmark(json.loads, intraday)
+
+
+def streaming_parse_test(benchmark, intraday: bytes):
+    """Decoding of a day of 1 second data with the streaming parser."""
+    chunks = [
+        intraday[i : i + streaming.CHUNK_SIZE]
+        for i in range(0, len(intraday), streaming.CHUNK_SIZE)
+    ]
+    benchmark(lambda: sum(1 for _ in streaming.parse(chunks, PREFIX)))
+
+
+@pytest.mark.parametrize("mode", ["json", "streaming"])
+def memory_test(benchmark, million_points: bytes, mode: str):
+    """Peak memory for decoding one million intraday points."""
+
+    def decode():
+        if mode == "json":
+            return len(
+                json.loads(million_points)["activities-heart-intraday"]["dataset"]
+            )
+        chunks = (
+            million_points[i : i + streaming.CHUNK_SIZE]
+            for i in range(0, len(million_points), streaming.CHUNK_SIZE)
+        )
+        return sum(1 for _ in streaming.parse(chunks, PREFIX))
+
+    tracemalloc.start()
+    try:
+        benchmark.pedantic(decode, rounds=1)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info.update(peak_bytes=peak, bytes_per_point=peak / POINTS)
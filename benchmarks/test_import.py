@@ -0,0 +1,25 @@
+"""Cold-start cost of importing the client."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import fitbit_web.client",
+        "import fitbit_web.client; fitbit_web.client.Client.get_profile",
+    ],
+    ids=["client", "client_and_endpoint"],
+)
+def import_test(benchmark, statement: str):
+    """Import in a fresh interpreter, including the interpreter start up."""
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", statement],),
+        kwargs={"check": True},
+        rounds=10,
+        warmup_rounds=1,
+    )
@@ -0,0 +1,35 @@
+"""Cost of resampling a day of 1 second samples to 5 minute buckets."""
+
+import collections
+
+import numpy as np
+import pytest
+
+from fitbit_web import resample
+
+TIMES = np.arange(24 * 60 * 60, dtype=np.int64)
+VALUES = np.random.default_rng(0).integers(50, 160, len(TIMES)).astype(np.float64)
+
+
+def python_mean(times, values, width):
+    """Bucket means using dicts, as done before `resample`."""
+    totals, counts = collections.defaultdict(float), collections.Counter()
+    for time, value in zip(times, values):
+        totals[time // width] += value
+        counts[time // width] += 1
+    return {bucket: totals[bucket] / counts[bucket] for bucket in totals}
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [resample.resample, python_mean],
+    ids=["resample", "python"],
+)
+def resample_test(benchmark, fn):
+    """Resampling with the vectorized module or a pure Python loop."""
+    times, values = (
+        (TIMES, VALUES)
+        if fn is resample.resample
+        else (TIMES.tolist(), VALUES.tolist())
+    )
+    benchmark(fn, times, values, 300)
@@ -0,0 +1,92 @@
+"""Cost of the per-call formatting utilities."""
+
+import datetime
+
+import pytest
+
+from fitbit_web import utils
+
+TEMPLATE = "/1/user/-/activities/heart/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json"
+
+
+def format_url_test(benchmark):
+    """Formatting of a url with path parameters."""
+    benchmark(
+        utils.format_url,
+        TEMPLATE,
+        {
+            "date": "2024-01-01",
+            "detail-level": "1min",
+            "start-time": "08:00",
+            "end-time": "09:00",
+        },
+    )
+
+
+def format_url_template_test(benchmark):
+    """Formatting of a url precompiled by the generated methods."""
+    benchmark(
+        utils.UrlTemplate(TEMPLATE).build,
+        {
+            "date": "2024-01-01",
+            "detail-level": "1min",
+            "start-time": "08:00",
+            "end-time": "09:00",
+        },
+    )
+
+
+def format_url_query_test(benchmark):
+    """Formatting of a url with query parameters."""
+    benchmark(
+        utils.format_url,
+        "/1/user/-/activities/list.json",
+        query_kwargs={
+            "sort": "asc",
+            "limit": 100,
+            "afterDate": "2024-01-01",
+            "offset": 0,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2024-01-01", datetime.date(2024, 1, 1), "today"],
+    ids=["str", "date", "today"],
+)
+def format_date_test(benchmark, value):
+    """Formatting of dates."""
+    benchmark(utils.format_date, value)
+
+
+def strptime_date_test(benchmark):
+    """Parsing a date with `strptime`, as done before the fast path, for reference."""
+    benchmark(
+        lambda value: f"{datetime.datetime.strptime(value, '%Y-%m-%d'):%Y-%m-%d}",
+        "2024-01-01",
+    )
+
+
+def format_dates_test(benchmark):
+    """Formatting of a year of distinct dates, as when generating per-day requests."""
+    dates = [
+        datetime.date(2024, 1, 1) + datetime.timedelta(days=day) for day in range(366)
+    ]
+    benchmark(lambda: [utils.format_date(date) for date in dates])
+
+
+@pytest.mark.parametrize("value", ["08:00", datetime.time(8)], ids=["str", "time"])
+def format_time_test(benchmark, value):
+    """Formatting of times."""
+    benchmark(utils.format_time, value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2024-01-01T08:00:00", "2024-01-01", datetime.datetime(2024, 1, 1, 8)],
+    ids=["timestamp-str", "date-str", "datetime"],
+)
+def format_date_or_timestamp_test(benchmark, value):
+    """Formatting of the date or timestamp parameters."""
+    benchmark(utils.format_date_or_timestamp, value)
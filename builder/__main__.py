@@ -1,6 +1,8 @@
 """Script for building an API from the swagger json schema of Fitbit Web API."""
 
 import hashlib
+import os
+import re
 from collections import defaultdict
 from types import MappingProxyType
 from typing import Any, Mapping, Sequence
@@ -67,25 +69,211 @@ def _print_dict(params: Sequence[builder.api.Parameters]):
     )
 
 
+def _imports(source: str) -> str:
+    """Build the imports of the annotations used by the source of a module."""
+    imports = "import datetime\n" if "datetime." in source else ""
+    names = [
+        name
+        for name in ("Annotated", "Literal", "Union")
+        if re.search(rf"\b{name}\[", source)
+    ]
+    if names:
+        imports += f"from typing import {', '.join(names)}\n"
+    return imports
+
+
+def max_range_days(path: str, operation: builder.api.Operation) -> int | None:
+    """Get the maximum span of a date range endpoint.
+
+    The span is read from the description of the endpoint where given (e.g. "the
+    maximum date range cannot exceed 30 days"), otherwise from `MAX_RANGE_DAYS`.
+    """
+    if match := re.search(
+        r"maximum date range[^.]*?(\d+) days", operation.description or ""
+    ):
+        return int(match[1])
+    return builder.constants.MAX_RANGE_DAYS.get(path)
+
+
+def build_metadata(
+    tags: Mapping[str, Sequence[tuple[str, builder.api.Operation]]],
+    spacing: str = "\t",
+    async_prefix: str | None = None,
+) -> str:
+    r"""Build the module with the metadata of the endpoints.
+
+    Parameters
+    ----------
+    tags : Mapping[str, Sequence[tuple[str, builder.api.Operation]]]
+        The paths and operations of each tag.
+    spacing : str, optional
+        The spacing to use, by default "\t"
+    async_prefix : str | None, optional
+        The prefix of the async methods, by default None if there are none.
+
+    Returns
+    -------
+    str
+        The source of the module.
+    """
+    endpoints = ""
+    for tag, operations in tags.items():
+        for path, operation in operations:
+            name = builder.utils.camel_to_snake_case(operation.operation_id)
+            parameters = "".join(
+                f"""{spacing*3}Parameter(
+{spacing*4}name={param.name!r},
+{spacing*4}argument={builder.utils.camel_to_snake_case(param.name.replace('-', '_'))!r},
+{spacing*4}location={param.in_!r},
+{spacing*4}type={param.type!r},
+{spacing*4}formats={(param.format,) if isinstance(param.format, str) else tuple(param.format or ())!r},
+{spacing*4}enum={None if param.enum is None else tuple(param.enum)!r},
+{spacing*4}required={param.required!r},
+{spacing*4}default={param.default!r},
+{spacing*3}),
+"""
+                for param in operation.parameters or ()
+            )
+            endpoints += f"""{spacing}{name!r}: Endpoint(
+{spacing*2}name={name!r},
+{spacing*2}path={path!r},
+{spacing*2}tag={tag!r},
+{spacing*2}module={builder.utils.tag_to_module_name(tag)!r},
+{spacing*2}scopes={tuple(sorted(operation.security[0].oauth2)) if operation.security else ()!r},
+{spacing*2}parameters=(
+{parameters}{spacing*2}),
+{spacing*2}max_range_days={max_range_days(path, operation)!r},
+{spacing}),
+"""
+    aliases = (
+        ""
+        if async_prefix is None
+        else f"""
+{spacing}**{{f"{async_prefix}{{name}}": endpoint for name, endpoint in _ENDPOINTS.items()}},"""
+    )
+    return f"""
+\"\"\"Autogenerated metadata of the endpoints of the Fitbit Web API.\"\"\"
+import dataclasses
+from types import MappingProxyType
+from typing import Any, Literal, Mapping
+
+
+@dataclasses.dataclass(frozen=True)
+class Parameter:
+{spacing}\"\"\"A parameter of an endpoint.
+
+{spacing}Attributes
+{spacing}----------
+{spacing}name : str
+{spacing}    The name of the parameter in the API (e.g. `base-date`).
+{spacing}argument : str
+{spacing}    The name of the argument of the methods (e.g. `base_date`).
+{spacing}location : Literal["path", "query"]
+{spacing}    Where the parameter is sent.
+{spacing}type : Literal["boolean", "integer", "string"] | None
+{spacing}    The type of the parameter.
+{spacing}formats : tuple[Literal["date", "time", "timestamp"], ...]
+{spacing}    The formats accepted by the parameter, if any.
+{spacing}enum : tuple[str, ...] | None
+{spacing}    The allowed values, if restricted.
+{spacing}required : bool
+{spacing}    Whether the parameter is required.
+{spacing}default : Any
+{spacing}    The default value.
+{spacing}\"\"\"
+
+{spacing}name: str
+{spacing}argument: str
+{spacing}location: Literal["path", "query"]
+{spacing}type: Literal["boolean", "integer", "string"] | None
+{spacing}formats: tuple[Literal["date", "time", "timestamp"], ...]
+{spacing}enum: tuple[str, ...] | None
+{spacing}required: bool
+{spacing}default: Any
+
+
+@dataclasses.dataclass(frozen=True)
+class Endpoint:
+{spacing}\"\"\"The metadata of an endpoint.
+
+{spacing}Attributes
+{spacing}----------
+{spacing}name : str
+{spacing}    The name of the sync method.
+{spacing}path : str
+{spacing}    The path template of the endpoint.
+{spacing}tag : str
+{spacing}    The tag of the endpoint in the spec.
+{spacing}module : str
+{spacing}    The module of `fitbit_web.api` containing the methods.
+{spacing}scopes : tuple[str, ...]
+{spacing}    The scopes listed for the endpoint.
+{spacing}parameters : tuple[Parameter, ...]
+{spacing}    The path and query parameters.
+{spacing}max_range_days : int | None
+{spacing}    The maximum span of a date range endpoint, if known.
+{spacing}\"\"\"
+
+{spacing}name: str
+{spacing}path: str
+{spacing}tag: str
+{spacing}module: str
+{spacing}scopes: tuple[str, ...]
+{spacing}parameters: tuple[Parameter, ...]
+{spacing}max_range_days: int | None
+
+{spacing}def parameter(self, name: str) -> Parameter:
+{spacing*2}\"\"\"Get a parameter by its API or argument name.\"\"\"
+{spacing*2}for parameter in self.parameters:
+{spacing*3}if name in (parameter.name, parameter.argument):
+{spacing*4}return parameter
+{spacing*2}raise KeyError(name)
+
+
+_ENDPOINTS = {{
+{endpoints}}}
+
+ENDPOINTS: Mapping[str, Endpoint] = MappingProxyType({{
+{spacing}**_ENDPOINTS,{aliases}
+}})
+\"\"\"The metadata of each endpoint, by the name of its sync and async methods.\"\"\"
+"""
+
+
 def build(
     api: builder.api.FitbitWebAPI,
     utils_path: str,
+    api_path: str,
     output_path: str | None = None,
     spacing: str = "\t",
     include_async: bool | str = False,
-):
+) -> dict[str, str]:
     r"""Build the client API.
 
+    The endpoints are split by their first tag into one module each, alongside a
+    `base` module with the abstract methods and an `__init__` which loads the
+    modules lazily.
+
     Parameters
     ----------
     api : FitbitWebAPI
         The source API model.
     utils_path : str
         The path to the utils package as a python module (e.g. `fitbit_web.utils`)
+    api_path : str
+        The path to the generated package as a python module (e.g. `fitbit_web.api`)
     output_path : str | None, optional
-        The output path, by default None
+        The directory of the generated package, by default None
     spacing : str, optional
         The spacing to use, by default "\t"
+    include_async : bool | str, optional
+        Whether to include async methods. If a string, it is used as the prefix of
+        the async methods, by default False
+
+    Returns
+    -------
+    dict[str, str]
+        The source of each module of the package, by file name.
     """
 
     def make_def(
@@ -140,20 +328,15 @@ def build(
             )
 
         output += f'\n{spacing*2}"""\n'
-        output += f"{spacing*2}{fn_return}self._{fn_def.split('def ')[-1].strip()}get('{path}'{path_kwargs}{query_kwargs})"
+        output += f"{spacing*2}{fn_return}self._{fn_def.split('def ')[-1].strip()}get({url_name(props)}{path_kwargs}{query_kwargs})"
 
         return output
 
-    output = f"""
-\"\"\"Abstract implementations for the Fitbit Web API.\"\"\"
-import abc
-import datetime
-from typing import Any, Literal, Annotated, Union
-import {utils_path} as utils
+    def url_name(props: builder.api.Operation) -> str:
+        return f"_{builder.utils.camel_to_snake_case(props.operation_id).upper()}_URL"
 
-class FitbitWebApi(abc.ABC):
-{spacing}\"\"\"API containing the autogenerated methods for the Fitbit Web API.\"\"\"
-{spacing}
+    async_prefix = include_async if isinstance(include_async, str) else ""
+    abstract_get = f"""
 {spacing}@abc.abstractmethod
 {spacing}def _get(
 {spacing*2}self,
@@ -164,9 +347,9 @@ class FitbitWebApi(abc.ABC):
 {spacing*2}...
 """
     if include_async is not False:
-        output += f"""
+        abstract_get += f"""
 {spacing}@abc.abstractmethod
-{spacing}async def _{include_async if isinstance(include_async,str) else ''}get(
+{spacing}async def _{async_prefix}get(
 {spacing*2}self,
 {spacing*2}url: str,
 {spacing*2}param_kwargs: dict[str, Any] | None = None,
@@ -174,27 +357,190 @@ class FitbitWebApi(abc.ABC):
 {spacing}) -> dict[str, Any]:
 {spacing*2}...
 """
+    tags: dict[str, list[tuple[str, builder.api.Operation]]] = defaultdict(list)
     for path, path_properties in api.paths.items():
         if "get" not in path_properties:
             continue
-        output += make_def(path, path_properties["get"]) + "\n"
-    if include_async is not False:
-        for path, path_properties in api.paths.items():
-            if "get" not in path_properties:
-                continue
-            output += (
-                make_def(
-                    path,
-                    path_properties["get"],
-                    fn_def=f"async def {include_async if isinstance(include_async,str) else ''}",
-                    fn_return="return await ",
-                )
-                + "\n"
+        operation = path_properties["get"]
+        tags[operation.tags[0] if operation.tags else "Other"].append(
+            (path, operation)
+        )
+
+    outputs: dict[str, str] = {}
+    methods: dict[str, tuple[str, str]] = {}
+    mixins: dict[str, dict[str, str]] = {}
+    for tag, operations in tags.items():
+        module = builder.utils.tag_to_module_name(tag)
+        mixin = builder.utils.tag_to_class_name(tag)
+        mixins[module] = {"sync": mixin}
+        output = f"""
+
+class {mixin}(BaseApi):
+{spacing}\"\"\"Methods for the {tag} endpoints.\"\"\"
+"""
+        for path, operation in operations:
+            output += make_def(path, operation) + "\n"
+            methods[builder.utils.camel_to_snake_case(operation.operation_id)] = (
+                module,
+                mixin,
             )
+        if include_async is not False:
+            mixins[module]["async"] = f"Async{mixin}"
+            output += f"""
+
+class Async{mixin}(BaseApi):
+{spacing}\"\"\"Async methods for the {tag} endpoints.\"\"\"
+"""
+            for path, operation in operations:
+                output += (
+                    make_def(
+                        path,
+                        operation,
+                        fn_def=f"async def {async_prefix}",
+                        fn_return="return await ",
+                    )
+                    + "\n"
+                )
+                methods[
+                    async_prefix
+                    + builder.utils.camel_to_snake_case(operation.operation_id)
+                ] = (module, f"Async{mixin}")
+        outputs[f"{module}.py"] = f"""
+\"\"\"Autogenerated methods for the {tag} endpoints.\"\"\"
+{_imports(output)}
+import {utils_path} as utils
+from {api_path}.base import BaseApi
+
+{"".join(f"{url_name(operation)} = utils.UrlTemplate('{path}'){chr(10)}" for path, operation in operations)}
+{output}"""
+
+    outputs["metadata.py"] = build_metadata(
+        tags, spacing, None if include_async is False else async_prefix
+    )
+    outputs["base.py"] = f"""
+\"\"\"Base of the autogenerated mixins for the Fitbit Web API.\"\"\"
+import abc
+from typing import Any
+
+class BaseApi(abc.ABC):
+{spacing}\"\"\"Abstract methods used by the autogenerated methods.\"\"\"
+{abstract_get}"""
+    classes = sorted(set(methods.values()))
+    type_imports = "\n".join(
+        f"{spacing}from {api_path}.{module} import {mixin}" for module, mixin in classes
+    )
+    modules = "".join(
+        f"{spacing}'{module}': MappingProxyType({modes!r}),\n"
+        for module, modes in sorted(mixins.items())
+    )
+    outputs["__init__.py"] = f"""
+\"\"\"Abstract implementations for the Fitbit Web API.
+
+The endpoints are grouped by tag into submodules (e.g. `{api_path}.{classes[0][0]}`) with a
+sync and an async mixin each, which are only imported when one of their methods is first
+used. `mixins` can be used to compose a class from only some of the groups.
+\"\"\"
+import abc
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, Mapping
+
+from {api_path}.base import BaseApi
+
+if TYPE_CHECKING:
+{type_imports}
+
+{spacing}class _Endpoints({", ".join(mixin for _, mixin in classes)}):
+{spacing*2}...
+
+else:
+{spacing}_Endpoints = BaseApi
+
+METHODS: Mapping[str, tuple[str, str]] = MappingProxyType({{
+{"".join(f"{spacing}'{name}': ('{module}', '{mixin}'),{chr(10)}" for name, (module, mixin) in methods.items())}}})
+\"\"\"The module and mixin of each endpoint method.\"\"\"
+
+MIXINS: Mapping[str, Mapping[str, str]] = MappingProxyType({{
+{modules}}})
+\"\"\"The sync and async mixins of each module.\"\"\"
+
+
+def method(name: str) -> Callable[..., Any]:
+{spacing}\"\"\"Get an endpoint method by name, importing its module if needed.\"\"\"
+{spacing}module, mixin = METHODS[name]
+{spacing}return getattr(
+{spacing*2}getattr(importlib.import_module(f"{{__name__}}.{{module}}"), mixin), name
+{spacing})
+
+
+def mixins(
+{spacing}modules: Iterable[str] | None = None,
+{spacing}mode: Literal["sync", "async", "both"] = "both",
+) -> tuple[type[BaseApi], ...]:
+{spacing}\"\"\"Import the mixins of some endpoint groups.
+
+{spacing}Parameters
+{spacing}----------
+{spacing}modules : Iterable[str] | None, optional
+{spacing}    The names of the modules of the groups (see `MIXINS`), by default all.
+{spacing}mode : Literal["sync", "async", "both"], optional
+{spacing}    Whether to get the sync or async methods, by default both.
+
+{spacing}Returns
+{spacing}-------
+{spacing}tuple[type[BaseApi], ...]
+{spacing}    The mixins, which only require `_get` and/or `_aget` to be implemented.
+{spacing}\"\"\"
+{spacing}modes = ("sync", "async") if mode == "both" else (mode,)
+{spacing}return tuple(
+{spacing*2}getattr(importlib.import_module(f"{{__name__}}.{{module}}"), MIXINS[module][m])
+{spacing*2}for module in (MIXINS if modules is None else modules)
+{spacing*2}for m in modes
+{spacing})
+
+
+class _LazyMethods(abc.ABCMeta):
+{spacing}\"\"\"Metaclass loading the endpoint methods on first access from the class.\"\"\"
+
+{spacing}def __getattr__(cls, name: str) -> Any:
+{spacing*2}\"\"\"Load an endpoint method into the class.\"\"\"
+{spacing*2}if name not in METHODS:
+{spacing*3}raise AttributeError(
+{spacing*4}f"type object {{cls.__name__!r}} has no attribute {{name!r}}"
+{spacing*3})
+{spacing*2}setattr(FitbitWebApi, name, method(name))
+{spacing*2}return getattr(cls, name)
+
+{spacing}def __dir__(cls):
+{spacing*2}\"\"\"List the attributes of the class, with the endpoint methods.\"\"\"
+{spacing*2}return sorted({{*super().__dir__(), *METHODS}})
+
+
+class FitbitWebApi(_Endpoints, metaclass=_LazyMethods):
+{spacing}\"\"\"API containing the autogenerated methods for the Fitbit Web API.
+
+{spacing}The methods are loaded from their submodule on first access.
+{spacing}\"\"\"
+
+{spacing}def __getattr__(self, name: str) -> Any:
+{spacing*2}\"\"\"Load an endpoint method into the class.\"\"\"
+{spacing*2}if name not in METHODS:
+{spacing*3}raise AttributeError(
+{spacing*4}f"{{type(self).__name__!r}} object has no attribute {{name!r}}"
+{spacing*3})
+{spacing*2}setattr(FitbitWebApi, name, method(name))
+{spacing*2}return getattr(self, name)
+
+{spacing}def __dir__(self):
+{spacing*2}\"\"\"List the attributes of the instance, with the endpoint methods.\"\"\"
+{spacing*2}return sorted({{*super().__dir__(), *METHODS}})
+"""
     if output_path is not None:
-        with open(output_path, "w") as fp:
-            fp.write(output)
-    return output
+        os.makedirs(output_path, exist_ok=True)
+        for name, output in outputs.items():
+            with open(os.path.join(output_path, name), "w") as fp:
+                fp.write(output)
+    return outputs
 
 
 def apply_overrides(data: dict[tuple[str | int, ...], Any]):
@@ -240,14 +586,20 @@ def main():
         raise RuntimeError("The API has changed. Please re-check the repo.")
     api = builder.api.FitbitWebAPI.model_validate(apply_overrides(response.json()))
 
-    build(
+    output_path = os.path.dirname(client_api.__file__)
+    for module in {module for module, _ in client_api.METHODS.values()}:
+        os.remove(os.path.join(output_path, f"{module}.py"))
+    outputs = build(
         api,
-        output_path=client_api.__file__,
+        output_path=output_path,
         utils_path=utils.__name__,
+        api_path=client_api.__name__,
         include_async="a",
     )
-    isort.file(client_api.__file__)
-    black.main([client_api.__file__])
+    files = [os.path.join(output_path, name) for name in outputs]
+    for file in files:
+        isort.file(file, profile="black")
+    black.main(files)
 
 
 main()
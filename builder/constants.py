@@ -246,3 +246,25 @@ OVERRIDES: Mapping[tuple[str | int, ...], Any | None] = MappingProxyType(
         ),
     }
 )
+
+MAX_RANGE_DAYS: Mapping[str, int] = MappingProxyType(
+    {
+        "/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}.json": 1095,
+        "/1/user/-/activities/{resource-path}/date/{base-date}/{end-date}.json": 1095,
+        "/1/user/-/activities/tracker/{resource-path}/date/{base-date}/{end-date}.json": 1095,
+        "/1/user/-/body/log/fat/date/{base-date}/{end-date}.json": 31,
+        "/1/user/-/body/log/weight/date/{base-date}/{end-date}.json": 31,
+        "/1/user/-/body/{resource-path}/date/{base-date}/{end-date}.json": 1095,
+        "/1/user/-/br/date/{startDate}/{endDate}.json": 30,
+        "/1/user/-/br/date/{startDate}/{endDate}/all.json": 30,
+        "/1/user/-/cardioscore/date/{startDate}/{endDate}.json": 30,
+        "/1/user/-/activities/heart/date/{base-date}/{end-date}.json": 365,
+        "/1/user/-/hrv/date/{startDate}/{endDate}.json": 30,
+        "/1/user/-/hrv/date/{startDate}/{endDate}/all.json": 30,
+        "/1/user/-/foods/log/{resource-path}/date/{base-date}/{end-date}.json": 1095,
+        "/1.2/user/-/sleep/date/{base-date}/{end-date}.json": 100,
+        "/1/user/-/spo2/date/{startDate}/{endDate}/all.json": 30,
+    }
+)
+"""The maximum span (in days) of the date range endpoints, from the Fitbit
+documentation, where the spec does not state one."""
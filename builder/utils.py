@@ -10,3 +10,16 @@ def camel_to_snake_case(camel_cased: str) -> str:
     """
     camel_cased = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", camel_cased)
     return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", camel_cased).lower()
+
+
+def tag_to_module_name(tag: str) -> str:
+    """Convert a swagger tag to the name of a module (e.g. `Heart Rate` to `heart_rate`)."""
+    return re.sub(r"[^a-z0-9]+", "_", tag.lower()).strip("_")
+
+
+def tag_to_class_name(tag: str) -> str:
+    """Convert a swagger tag to the name of a class (e.g. `Heart Rate` to `HeartRateApi`)."""
+    return (
+        "".join(word[:1].upper() + word[1:] for word in re.split(r"[^A-Za-z0-9]+", tag))
+        + "Api"
+    )
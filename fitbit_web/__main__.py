@@ -0,0 +1,202 @@
+r"""Command line interface of the Fitbit Web API client.
+
+    python -m fitbit_web export --tokens tokens.json --token-store tokens.db \
+        --output fitbit.jsonl --resource get_sleep_by_date_range --since 2024-01-01
+    python -m fitbit_web ingest --tokens tokens.json --state state.db \
+        --output fitbit.db --resource get_sleep_by_date_range \
+        --resource get_activities_resource_by_date_range:resource_path=steps
+
+Resources are the names of range methods, with any other arguments after a colon as
+comma separated `name=value` pairs.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Any, Sequence
+
+from fitbit_web import backfill, utils
+
+
+def resource(value: str) -> backfill.Resource:
+    """Parse a resource given as `name[:argument=value,...]`."""
+    name, _, arguments = value.partition(":")
+    if not arguments:
+        return name
+    return name, dict(argument.split("=", 1) for argument in arguments.split(","))
+
+
+def load_tokens(path: str) -> list[dict[str, Any]]:
+    """Load a JSON file of tokens, or of a list of tokens."""
+    with open(path, encoding="utf-8") as fp:
+        tokens = json.load(fp)
+    return [tokens] if isinstance(tokens, dict) else tokens
+
+
+def report(progress: backfill.Progress) -> None:
+    """Print the progress of a command."""
+    eta = "" if progress.eta is None else f", done at {progress.eta:%H:%M:%S}"
+    print(f"\r{progress.done}/{progress.total} requests{eta}", end="", file=sys.stderr)
+
+
+def export(args: argparse.Namespace) -> int:
+    """Export the history of users to a file."""
+    import fitbit_web.export as exporter
+    from fitbit_web import cache, client, tokens
+
+    with tokens.open(args.token_store) as token_store, exporter.writer(
+        args.output, args.format
+    ) as output:
+        if args.tokens:
+            for values in load_tokens(args.tokens):
+                token_store.put(tokens.parse(values))
+        shared = None if args.no_cache else cache.Cache()
+        web_clients = []
+        for user_id in args.user or token_store.users():
+            if (user_tokens := token_store.get(user_id)) is None:
+                raise SystemExit(f"No tokens for user {user_id!r}.")
+            web_clients.append(
+                client.Client(
+                    user_tokens,
+                    base_url=args.base_url,
+                    cache=shared,
+                    token_store=token_store,
+                )
+            )
+        records = asyncio.run(
+            exporter.export(
+                output,
+                web_clients,
+                args.resource,
+                since=args.since,
+                until=args.until,
+                max_days=args.max_days,
+                concurrency=args.concurrency,
+                users=args.users,
+                checkpoint=args.journal,
+                progress=None if args.quiet else report,
+            )
+        )
+    print(f"\nWrote {records} records.", file=sys.stderr)
+    return 0
+
+
+def ingest(args: argparse.Namespace) -> int:
+    """Ingest the history of the users into a store."""
+    from fitbit_web import runner
+
+    if args.tokens:
+        with runner.State(args.state) as state:
+            runner.import_tokens(state, load_tokens(args.tokens))
+    config = runner.Config(
+        state=args.state,
+        output=args.output,
+        resources=args.resource,
+        journal=args.journal,
+        since=args.since,
+        until=args.until,
+        workers=args.workers,
+        concurrency=args.concurrency,
+        node=args.node,
+        nodes=args.nodes,
+        base_url=args.base_url,
+    )
+    summary = runner.run(config)
+    print(f"Made {summary.requests} requests.", file=sys.stderr)
+    for user_id, error in summary.failures.items():
+        print(f"Failed to ingest user {user_id}: {error}", file=sys.stderr)
+    return 1 if summary.failures else 0
+
+
+def parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line."""
+    root = argparse.ArgumentParser(
+        prog="python -m fitbit_web", description=__doc__.split("\n")[0]
+    )
+    commands = root.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("export", help=export.__doc__)
+    command.add_argument(
+        "--token-store",
+        required=True,
+        help="The store of the users' tokens, in SQLite if ending in `.db`.",
+    )
+    command.add_argument(
+        "--tokens", help="A JSON file of tokens (or a list of) to add to the store."
+    )
+    command.add_argument(
+        "--user", action="append", help="A user to export, by default all."
+    )
+    command.add_argument(
+        "--output", required=True, help="The file to write the responses to."
+    )
+    command.add_argument(
+        "--format",
+        choices=["jsonl", "parquet", "sqlite"],
+        help="The format of the output, by default from its suffix.",
+    )
+    command.add_argument(
+        "--resource",
+        action="append",
+        type=resource,
+        required=True,
+        help="A range method to export, as `name[:argument=value,...]`.",
+    )
+    command.add_argument("--journal", help="The journal of the completed requests.")
+    command.add_argument("--since", help="The first date, by default when joined.")
+    command.add_argument("--until", default="today", help="The last date.")
+    command.add_argument("--max-days", type=int, help="The most days of each request.")
+    command.add_argument(
+        "--concurrency", type=int, default=4, help="The requests at a time per user."
+    )
+    command.add_argument(
+        "--users", type=int, default=8, help="The users exported at a time."
+    )
+    command.add_argument(
+        "--no-cache", action="store_true", help="Do not cache the responses."
+    )
+    command.add_argument(
+        "--quiet", action="store_true", help="Do not report the progress."
+    )
+    command.add_argument("--base-url", default=utils.BASE_URL)
+    command.set_defaults(handler=export)
+    command = commands.add_parser("ingest", help=ingest.__doc__)
+    command.add_argument(
+        "--state", required=True, help="The SQLite database of the users' tokens."
+    )
+    command.add_argument(
+        "--tokens", help="A JSON file of tokens (or a list of) to add to the state."
+    )
+    command.add_argument(
+        "--output", required=True, help="The SQLite store of the samples."
+    )
+    command.add_argument(
+        "--resource",
+        action="append",
+        type=resource,
+        required=True,
+        help="A range method to ingest, as `name[:argument=value,...]`.",
+    )
+    command.add_argument("--journal", help="The journal of the completed requests.")
+    command.add_argument("--since", help="The first date, by default when joined.")
+    command.add_argument("--until", default="today", help="The last date.")
+    command.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    command.add_argument(
+        "--concurrency", type=int, default=8, help="The users at a time per worker."
+    )
+    command.add_argument("--node", type=int, default=0, help="The index of the node.")
+    command.add_argument("--nodes", type=int, default=1, help="The number of nodes.")
+    command.add_argument("--base-url", default=utils.BASE_URL)
+    command.set_defaults(handler=ingest)
+    return root
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line."""
+    args = parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
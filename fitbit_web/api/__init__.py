@@ -0,0 +1,654 @@
+"""Abstract implementations for the Fitbit Web API.
+
+The endpoints are grouped by tag into submodules (e.g. `fitbit_web.api.active_zone_minutes_intraday_time_series`) with a
+sync and an async mixin each, which are only imported when one of their methods is first
+used. `mixins` can be used to compose a class from only some of the groups.
+"""
+
+import abc
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, Mapping
+
+from fitbit_web.api.base import BaseApi
+
+if TYPE_CHECKING:
+    from fitbit_web.api.active_zone_minutes_intraday_time_series import (
+        ActiveZoneMinutesIntradayTimeSeriesApi,
+        AsyncActiveZoneMinutesIntradayTimeSeriesApi,
+    )
+    from fitbit_web.api.active_zone_minutes_time_series import (
+        ActiveZoneMinutesTimeSeriesApi,
+        AsyncActiveZoneMinutesTimeSeriesApi,
+    )
+    from fitbit_web.api.activity import ActivityApi, AsyncActivityApi
+    from fitbit_web.api.activity_intraday_time_series import (
+        ActivityIntradayTimeSeriesApi,
+        AsyncActivityIntradayTimeSeriesApi,
+    )
+    from fitbit_web.api.activity_time_series import (
+        ActivityTimeSeriesApi,
+        AsyncActivityTimeSeriesApi,
+    )
+    from fitbit_web.api.body import AsyncBodyApi, BodyApi
+    from fitbit_web.api.body_time_series import (
+        AsyncBodyTimeSeriesApi,
+        BodyTimeSeriesApi,
+    )
+    from fitbit_web.api.breathing_rate import AsyncBreathingRateApi, BreathingRateApi
+    from fitbit_web.api.breathing_rate_intraday import (
+        AsyncBreathingRateIntradayApi,
+        BreathingRateIntradayApi,
+    )
+    from fitbit_web.api.cardio_fitness_score_vo2_max import (
+        AsyncCardioFitnessScoreVO2MaxApi,
+        CardioFitnessScoreVO2MaxApi,
+    )
+    from fitbit_web.api.devices import AsyncDevicesApi, DevicesApi
+    from fitbit_web.api.electrocardiogram import (
+        AsyncElectrocardiogramApi,
+        ElectrocardiogramApi,
+    )
+    from fitbit_web.api.friends import AsyncFriendsApi, FriendsApi
+    from fitbit_web.api.heart_rate_intraday_time_series import (
+        AsyncHeartRateIntradayTimeSeriesApi,
+        HeartRateIntradayTimeSeriesApi,
+    )
+    from fitbit_web.api.heart_rate_time_series import (
+        AsyncHeartRateTimeSeriesApi,
+        HeartRateTimeSeriesApi,
+    )
+    from fitbit_web.api.heart_rate_variability import (
+        AsyncHeartRateVariabilityApi,
+        HeartRateVariabilityApi,
+    )
+    from fitbit_web.api.heart_rate_variability_intraday import (
+        AsyncHeartRateVariabilityIntradayApi,
+        HeartRateVariabilityIntradayApi,
+    )
+    from fitbit_web.api.nutrition import AsyncNutritionApi, NutritionApi
+    from fitbit_web.api.nutrition_time_series import (
+        AsyncNutritionTimeSeriesApi,
+        NutritionTimeSeriesApi,
+    )
+    from fitbit_web.api.sleep import AsyncSleepApi, SleepApi
+    from fitbit_web.api.spo2 import AsyncSpO2Api, SpO2Api
+    from fitbit_web.api.spo2_intraday import AsyncSpO2IntradayApi, SpO2IntradayApi
+    from fitbit_web.api.subscriptions import AsyncSubscriptionsApi, SubscriptionsApi
+    from fitbit_web.api.temperature import AsyncTemperatureApi, TemperatureApi
+    from fitbit_web.api.user import AsyncUserApi, UserApi
+
+    class _Endpoints(
+        ActiveZoneMinutesIntradayTimeSeriesApi,
+        AsyncActiveZoneMinutesIntradayTimeSeriesApi,
+        ActiveZoneMinutesTimeSeriesApi,
+        AsyncActiveZoneMinutesTimeSeriesApi,
+        ActivityApi,
+        AsyncActivityApi,
+        ActivityIntradayTimeSeriesApi,
+        AsyncActivityIntradayTimeSeriesApi,
+        ActivityTimeSeriesApi,
+        AsyncActivityTimeSeriesApi,
+        AsyncBodyApi,
+        BodyApi,
+        AsyncBodyTimeSeriesApi,
+        BodyTimeSeriesApi,
+        AsyncBreathingRateApi,
+        BreathingRateApi,
+        AsyncBreathingRateIntradayApi,
+        BreathingRateIntradayApi,
+        AsyncCardioFitnessScoreVO2MaxApi,
+        CardioFitnessScoreVO2MaxApi,
+        AsyncDevicesApi,
+        DevicesApi,
+        AsyncElectrocardiogramApi,
+        ElectrocardiogramApi,
+        AsyncFriendsApi,
+        FriendsApi,
+        AsyncHeartRateIntradayTimeSeriesApi,
+        HeartRateIntradayTimeSeriesApi,
+        AsyncHeartRateTimeSeriesApi,
+        HeartRateTimeSeriesApi,
+        AsyncHeartRateVariabilityApi,
+        HeartRateVariabilityApi,
+        AsyncHeartRateVariabilityIntradayApi,
+        HeartRateVariabilityIntradayApi,
+        AsyncNutritionApi,
+        NutritionApi,
+        AsyncNutritionTimeSeriesApi,
+        NutritionTimeSeriesApi,
+        AsyncSleepApi,
+        SleepApi,
+        AsyncSpO2Api,
+        SpO2Api,
+        AsyncSpO2IntradayApi,
+        SpO2IntradayApi,
+        AsyncSubscriptionsApi,
+        SubscriptionsApi,
+        AsyncTemperatureApi,
+        TemperatureApi,
+        AsyncUserApi,
+        UserApi,
+    ): ...
+
+else:
+    _Endpoints = BaseApi
+
+METHODS: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "get_azm_by_date_intraday": (
+            "active_zone_minutes_intraday_time_series",
+            "ActiveZoneMinutesIntradayTimeSeriesApi",
+        ),
+        "get_azm_by_date_time_series_intraday": (
+            "active_zone_minutes_intraday_time_series",
+            "ActiveZoneMinutesIntradayTimeSeriesApi",
+        ),
+        "get_azm_by_interval_intraday": (
+            "active_zone_minutes_intraday_time_series",
+            "ActiveZoneMinutesIntradayTimeSeriesApi",
+        ),
+        "get_azm_by_interval_time_series_intraday": (
+            "active_zone_minutes_intraday_time_series",
+            "ActiveZoneMinutesIntradayTimeSeriesApi",
+        ),
+        "aget_azm_by_date_intraday": (
+            "active_zone_minutes_intraday_time_series",
+            "AsyncActiveZoneMinutesIntradayTimeSeriesApi",
+        ),
+        "aget_azm_by_date_time_series_intraday": (
+            "active_zone_minutes_intraday_time_series",
+            "AsyncActiveZoneMinutesIntradayTimeSeriesApi",
+        ),
+        "aget_azm_by_interval_intraday": (
+            "active_zone_minutes_intraday_time_series",
+            "AsyncActiveZoneMinutesIntradayTimeSeriesApi",
+        ),
+        "aget_azm_by_interval_time_series_intraday": (
+            "active_zone_minutes_intraday_time_series",
+            "AsyncActiveZoneMinutesIntradayTimeSeriesApi",
+        ),
+        "get_azm_time_series_by_date": (
+            "active_zone_minutes_time_series",
+            "ActiveZoneMinutesTimeSeriesApi",
+        ),
+        "get_azm_time_series_by_interval": (
+            "active_zone_minutes_time_series",
+            "ActiveZoneMinutesTimeSeriesApi",
+        ),
+        "aget_azm_time_series_by_date": (
+            "active_zone_minutes_time_series",
+            "AsyncActiveZoneMinutesTimeSeriesApi",
+        ),
+        "aget_azm_time_series_by_interval": (
+            "active_zone_minutes_time_series",
+            "AsyncActiveZoneMinutesTimeSeriesApi",
+        ),
+        "get_activities_by_date": ("activity", "ActivityApi"),
+        "get_activities_log": ("activity", "ActivityApi"),
+        "get_activities_log_list": ("activity", "ActivityApi"),
+        "get_activities_tcx": ("activity", "ActivityApi"),
+        "get_activities_types": ("activity", "ActivityApi"),
+        "get_activities_type_detail": ("activity", "ActivityApi"),
+        "get_frequent_activities": ("activity", "ActivityApi"),
+        "get_recent_activities": ("activity", "ActivityApi"),
+        "get_favorite_activities": ("activity", "ActivityApi"),
+        "get_activities_goals": ("activity", "ActivityApi"),
+        "aget_activities_by_date": ("activity", "AsyncActivityApi"),
+        "aget_activities_log": ("activity", "AsyncActivityApi"),
+        "aget_activities_log_list": ("activity", "AsyncActivityApi"),
+        "aget_activities_tcx": ("activity", "AsyncActivityApi"),
+        "aget_activities_types": ("activity", "AsyncActivityApi"),
+        "aget_activities_type_detail": ("activity", "AsyncActivityApi"),
+        "aget_frequent_activities": ("activity", "AsyncActivityApi"),
+        "aget_recent_activities": ("activity", "AsyncActivityApi"),
+        "aget_favorite_activities": ("activity", "AsyncActivityApi"),
+        "aget_activities_goals": ("activity", "AsyncActivityApi"),
+        "get_activities_resource_by_date_range": (
+            "activity_time_series",
+            "ActivityTimeSeriesApi",
+        ),
+        "get_activities_tracker_resource_by_date_range": (
+            "activity_time_series",
+            "ActivityTimeSeriesApi",
+        ),
+        "get_activities_resource_by_date_period": (
+            "activity_time_series",
+            "ActivityTimeSeriesApi",
+        ),
+        "get_activities_tracker_resource_by_date_period": (
+            "activity_time_series",
+            "ActivityTimeSeriesApi",
+        ),
+        "aget_activities_resource_by_date_range": (
+            "activity_time_series",
+            "AsyncActivityTimeSeriesApi",
+        ),
+        "aget_activities_tracker_resource_by_date_range": (
+            "activity_time_series",
+            "AsyncActivityTimeSeriesApi",
+        ),
+        "aget_activities_resource_by_date_period": (
+            "activity_time_series",
+            "AsyncActivityTimeSeriesApi",
+        ),
+        "aget_activities_tracker_resource_by_date_period": (
+            "activity_time_series",
+            "AsyncActivityTimeSeriesApi",
+        ),
+        "get_activities_resource_by_date_range_intraday": (
+            "activity_intraday_time_series",
+            "ActivityIntradayTimeSeriesApi",
+        ),
+        "get_activities_resource_by_date_intraday": (
+            "activity_intraday_time_series",
+            "ActivityIntradayTimeSeriesApi",
+        ),
+        "get_activities_resource_by_date_range_time_series_intraday": (
+            "activity_intraday_time_series",
+            "ActivityIntradayTimeSeriesApi",
+        ),
+        "get_activities_resource_by_date_time_series_intraday": (
+            "activity_intraday_time_series",
+            "ActivityIntradayTimeSeriesApi",
+        ),
+        "aget_activities_resource_by_date_range_intraday": (
+            "activity_intraday_time_series",
+            "AsyncActivityIntradayTimeSeriesApi",
+        ),
+        "aget_activities_resource_by_date_intraday": (
+            "activity_intraday_time_series",
+            "AsyncActivityIntradayTimeSeriesApi",
+        ),
+        "aget_activities_resource_by_date_range_time_series_intraday": (
+            "activity_intraday_time_series",
+            "AsyncActivityIntradayTimeSeriesApi",
+        ),
+        "aget_activities_resource_by_date_time_series_intraday": (
+            "activity_intraday_time_series",
+            "AsyncActivityIntradayTimeSeriesApi",
+        ),
+        "get_body_fat_by_date": ("body", "BodyApi"),
+        "get_body_fat_by_date_period": ("body", "BodyApi"),
+        "get_body_fat_by_date_range": ("body", "BodyApi"),
+        "get_body_goals": ("body", "BodyApi"),
+        "get_weight_by_date": ("body", "BodyApi"),
+        "get_weight_by_date_period": ("body", "BodyApi"),
+        "get_weight_by_date_range": ("body", "BodyApi"),
+        "aget_body_fat_by_date": ("body", "AsyncBodyApi"),
+        "aget_body_fat_by_date_period": ("body", "AsyncBodyApi"),
+        "aget_body_fat_by_date_range": ("body", "AsyncBodyApi"),
+        "aget_body_goals": ("body", "AsyncBodyApi"),
+        "aget_weight_by_date": ("body", "AsyncBodyApi"),
+        "aget_weight_by_date_period": ("body", "AsyncBodyApi"),
+        "aget_weight_by_date_range": ("body", "AsyncBodyApi"),
+        "get_body_resource_by_date_period": ("body_time_series", "BodyTimeSeriesApi"),
+        "get_body_resource_by_date_range": ("body_time_series", "BodyTimeSeriesApi"),
+        "aget_body_resource_by_date_period": (
+            "body_time_series",
+            "AsyncBodyTimeSeriesApi",
+        ),
+        "aget_body_resource_by_date_range": (
+            "body_time_series",
+            "AsyncBodyTimeSeriesApi",
+        ),
+        "get_breathing_rate_summary_by_date": ("breathing_rate", "BreathingRateApi"),
+        "get_breathing_rate_summary_by_interval": (
+            "breathing_rate",
+            "BreathingRateApi",
+        ),
+        "aget_breathing_rate_summary_by_date": (
+            "breathing_rate",
+            "AsyncBreathingRateApi",
+        ),
+        "aget_breathing_rate_summary_by_interval": (
+            "breathing_rate",
+            "AsyncBreathingRateApi",
+        ),
+        "get_breathing_rate_intraday_by_date": (
+            "breathing_rate_intraday",
+            "BreathingRateIntradayApi",
+        ),
+        "get_breathing_rate_intraday_by_interval": (
+            "breathing_rate_intraday",
+            "BreathingRateIntradayApi",
+        ),
+        "aget_breathing_rate_intraday_by_date": (
+            "breathing_rate_intraday",
+            "AsyncBreathingRateIntradayApi",
+        ),
+        "aget_breathing_rate_intraday_by_interval": (
+            "breathing_rate_intraday",
+            "AsyncBreathingRateIntradayApi",
+        ),
+        "get_vo2_max_summary_by_date": (
+            "cardio_fitness_score_vo2_max",
+            "CardioFitnessScoreVO2MaxApi",
+        ),
+        "get_vo2_max_summary_by_interval": (
+            "cardio_fitness_score_vo2_max",
+            "CardioFitnessScoreVO2MaxApi",
+        ),
+        "aget_vo2_max_summary_by_date": (
+            "cardio_fitness_score_vo2_max",
+            "AsyncCardioFitnessScoreVO2MaxApi",
+        ),
+        "aget_vo2_max_summary_by_interval": (
+            "cardio_fitness_score_vo2_max",
+            "AsyncCardioFitnessScoreVO2MaxApi",
+        ),
+        "get_devices": ("devices", "DevicesApi"),
+        "get_alarms": ("devices", "DevicesApi"),
+        "aget_devices": ("devices", "AsyncDevicesApi"),
+        "aget_alarms": ("devices", "AsyncDevicesApi"),
+        "get_ecg_log_list": ("electrocardiogram", "ElectrocardiogramApi"),
+        "aget_ecg_log_list": ("electrocardiogram", "AsyncElectrocardiogramApi"),
+        "get_friends": ("friends", "FriendsApi"),
+        "get_friends_leaderboard": ("friends", "FriendsApi"),
+        "aget_friends": ("friends", "AsyncFriendsApi"),
+        "aget_friends_leaderboard": ("friends", "AsyncFriendsApi"),
+        "get_heart_by_date_period": (
+            "heart_rate_time_series",
+            "HeartRateTimeSeriesApi",
+        ),
+        "get_heart_by_date_range": ("heart_rate_time_series", "HeartRateTimeSeriesApi"),
+        "aget_heart_by_date_period": (
+            "heart_rate_time_series",
+            "AsyncHeartRateTimeSeriesApi",
+        ),
+        "aget_heart_by_date_range": (
+            "heart_rate_time_series",
+            "AsyncHeartRateTimeSeriesApi",
+        ),
+        "get_heart_by_date_range_intraday": (
+            "heart_rate_intraday_time_series",
+            "HeartRateIntradayTimeSeriesApi",
+        ),
+        "get_heart_by_date_range_timestamp_intraday": (
+            "heart_rate_intraday_time_series",
+            "HeartRateIntradayTimeSeriesApi",
+        ),
+        "get_heart_by_date_intraday": (
+            "heart_rate_intraday_time_series",
+            "HeartRateIntradayTimeSeriesApi",
+        ),
+        "get_heart_by_date_timestamp_intraday": (
+            "heart_rate_intraday_time_series",
+            "HeartRateIntradayTimeSeriesApi",
+        ),
+        "aget_heart_by_date_range_intraday": (
+            "heart_rate_intraday_time_series",
+            "AsyncHeartRateIntradayTimeSeriesApi",
+        ),
+        "aget_heart_by_date_range_timestamp_intraday": (
+            "heart_rate_intraday_time_series",
+            "AsyncHeartRateIntradayTimeSeriesApi",
+        ),
+        "aget_heart_by_date_intraday": (
+            "heart_rate_intraday_time_series",
+            "AsyncHeartRateIntradayTimeSeriesApi",
+        ),
+        "aget_heart_by_date_timestamp_intraday": (
+            "heart_rate_intraday_time_series",
+            "AsyncHeartRateIntradayTimeSeriesApi",
+        ),
+        "get_hrv_summary_date": ("heart_rate_variability", "HeartRateVariabilityApi"),
+        "get_hrv_summary_interval": (
+            "heart_rate_variability",
+            "HeartRateVariabilityApi",
+        ),
+        "aget_hrv_summary_date": (
+            "heart_rate_variability",
+            "AsyncHeartRateVariabilityApi",
+        ),
+        "aget_hrv_summary_interval": (
+            "heart_rate_variability",
+            "AsyncHeartRateVariabilityApi",
+        ),
+        "get_hrv_intraday_by_date": (
+            "heart_rate_variability_intraday",
+            "HeartRateVariabilityIntradayApi",
+        ),
+        "get_hrv_intraday_by_interval": (
+            "heart_rate_variability_intraday",
+            "HeartRateVariabilityIntradayApi",
+        ),
+        "aget_hrv_intraday_by_date": (
+            "heart_rate_variability_intraday",
+            "AsyncHeartRateVariabilityIntradayApi",
+        ),
+        "aget_hrv_intraday_by_interval": (
+            "heart_rate_variability_intraday",
+            "AsyncHeartRateVariabilityIntradayApi",
+        ),
+        "get_foods_locales": ("nutrition", "NutritionApi"),
+        "get_foods_goal": ("nutrition", "NutritionApi"),
+        "get_foods_by_date": ("nutrition", "NutritionApi"),
+        "get_water_by_date": ("nutrition", "NutritionApi"),
+        "get_water_goal": ("nutrition", "NutritionApi"),
+        "get_favorite_foods": ("nutrition", "NutritionApi"),
+        "get_frequent_foods": ("nutrition", "NutritionApi"),
+        "get_meals": ("nutrition", "NutritionApi"),
+        "get_recent_foods": ("nutrition", "NutritionApi"),
+        "get_foods_info": ("nutrition", "NutritionApi"),
+        "get_foods_units": ("nutrition", "NutritionApi"),
+        "get_foods_list": ("nutrition", "NutritionApi"),
+        "aget_foods_locales": ("nutrition", "AsyncNutritionApi"),
+        "aget_foods_goal": ("nutrition", "AsyncNutritionApi"),
+        "aget_foods_by_date": ("nutrition", "AsyncNutritionApi"),
+        "aget_water_by_date": ("nutrition", "AsyncNutritionApi"),
+        "aget_water_goal": ("nutrition", "AsyncNutritionApi"),
+        "aget_favorite_foods": ("nutrition", "AsyncNutritionApi"),
+        "aget_frequent_foods": ("nutrition", "AsyncNutritionApi"),
+        "aget_meals": ("nutrition", "AsyncNutritionApi"),
+        "aget_recent_foods": ("nutrition", "AsyncNutritionApi"),
+        "aget_foods_info": ("nutrition", "AsyncNutritionApi"),
+        "aget_foods_units": ("nutrition", "AsyncNutritionApi"),
+        "aget_foods_list": ("nutrition", "AsyncNutritionApi"),
+        "get_foods_by_date_range": ("nutrition_time_series", "NutritionTimeSeriesApi"),
+        "get_foods_resource_by_date_period": (
+            "nutrition_time_series",
+            "NutritionTimeSeriesApi",
+        ),
+        "aget_foods_by_date_range": (
+            "nutrition_time_series",
+            "AsyncNutritionTimeSeriesApi",
+        ),
+        "aget_foods_resource_by_date_period": (
+            "nutrition_time_series",
+            "AsyncNutritionTimeSeriesApi",
+        ),
+        "get_sleep_by_date": ("sleep", "SleepApi"),
+        "get_sleep_by_date_range": ("sleep", "SleepApi"),
+        "get_sleep_list": ("sleep", "SleepApi"),
+        "get_sleep_goal": ("sleep", "SleepApi"),
+        "aget_sleep_by_date": ("sleep", "AsyncSleepApi"),
+        "aget_sleep_by_date_range": ("sleep", "AsyncSleepApi"),
+        "aget_sleep_list": ("sleep", "AsyncSleepApi"),
+        "aget_sleep_goal": ("sleep", "AsyncSleepApi"),
+        "get_sp_o2_summary_by_date": ("spo2", "SpO2Api"),
+        "get_sp_o2_summary_by_interval": ("spo2", "SpO2Api"),
+        "aget_sp_o2_summary_by_date": ("spo2", "AsyncSpO2Api"),
+        "aget_sp_o2_summary_by_interval": ("spo2", "AsyncSpO2Api"),
+        "get_sp_o2_intraday_by_date": ("spo2_intraday", "SpO2IntradayApi"),
+        "get_sp_o2_intraday_by_interval": ("spo2_intraday", "SpO2IntradayApi"),
+        "aget_sp_o2_intraday_by_date": ("spo2_intraday", "AsyncSpO2IntradayApi"),
+        "aget_sp_o2_intraday_by_interval": ("spo2_intraday", "AsyncSpO2IntradayApi"),
+        "get_subscriptions_list": ("subscriptions", "SubscriptionsApi"),
+        "aget_subscriptions_list": ("subscriptions", "AsyncSubscriptionsApi"),
+        "get_temp_core_summary_by_date": ("temperature", "TemperatureApi"),
+        "get_temp_core_summary_by_interval": ("temperature", "TemperatureApi"),
+        "get_temp_skin_summary_date": ("temperature", "TemperatureApi"),
+        "get_temp_skin_summary_by_interval": ("temperature", "TemperatureApi"),
+        "aget_temp_core_summary_by_date": ("temperature", "AsyncTemperatureApi"),
+        "aget_temp_core_summary_by_interval": ("temperature", "AsyncTemperatureApi"),
+        "aget_temp_skin_summary_date": ("temperature", "AsyncTemperatureApi"),
+        "aget_temp_skin_summary_by_interval": ("temperature", "AsyncTemperatureApi"),
+        "get_badges": ("user", "UserApi"),
+        "get_profile": ("user", "UserApi"),
+        "aget_badges": ("user", "AsyncUserApi"),
+        "aget_profile": ("user", "AsyncUserApi"),
+    }
+)
+"""The module and mixin of each endpoint method."""
+
+MIXINS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        "active_zone_minutes_intraday_time_series": MappingProxyType(
+            {
+                "sync": "ActiveZoneMinutesIntradayTimeSeriesApi",
+                "async": "AsyncActiveZoneMinutesIntradayTimeSeriesApi",
+            }
+        ),
+        "active_zone_minutes_time_series": MappingProxyType(
+            {
+                "sync": "ActiveZoneMinutesTimeSeriesApi",
+                "async": "AsyncActiveZoneMinutesTimeSeriesApi",
+            }
+        ),
+        "activity": MappingProxyType(
+            {"sync": "ActivityApi", "async": "AsyncActivityApi"}
+        ),
+        "activity_intraday_time_series": MappingProxyType(
+            {
+                "sync": "ActivityIntradayTimeSeriesApi",
+                "async": "AsyncActivityIntradayTimeSeriesApi",
+            }
+        ),
+        "activity_time_series": MappingProxyType(
+            {"sync": "ActivityTimeSeriesApi", "async": "AsyncActivityTimeSeriesApi"}
+        ),
+        "body": MappingProxyType({"sync": "BodyApi", "async": "AsyncBodyApi"}),
+        "body_time_series": MappingProxyType(
+            {"sync": "BodyTimeSeriesApi", "async": "AsyncBodyTimeSeriesApi"}
+        ),
+        "breathing_rate": MappingProxyType(
+            {"sync": "BreathingRateApi", "async": "AsyncBreathingRateApi"}
+        ),
+        "breathing_rate_intraday": MappingProxyType(
+            {
+                "sync": "BreathingRateIntradayApi",
+                "async": "AsyncBreathingRateIntradayApi",
+            }
+        ),
+        "cardio_fitness_score_vo2_max": MappingProxyType(
+            {
+                "sync": "CardioFitnessScoreVO2MaxApi",
+                "async": "AsyncCardioFitnessScoreVO2MaxApi",
+            }
+        ),
+        "devices": MappingProxyType({"sync": "DevicesApi", "async": "AsyncDevicesApi"}),
+        "electrocardiogram": MappingProxyType(
+            {"sync": "ElectrocardiogramApi", "async": "AsyncElectrocardiogramApi"}
+        ),
+        "friends": MappingProxyType({"sync": "FriendsApi", "async": "AsyncFriendsApi"}),
+        "heart_rate_intraday_time_series": MappingProxyType(
+            {
+                "sync": "HeartRateIntradayTimeSeriesApi",
+                "async": "AsyncHeartRateIntradayTimeSeriesApi",
+            }
+        ),
+        "heart_rate_time_series": MappingProxyType(
+            {"sync": "HeartRateTimeSeriesApi", "async": "AsyncHeartRateTimeSeriesApi"}
+        ),
+        "heart_rate_variability": MappingProxyType(
+            {"sync": "HeartRateVariabilityApi", "async": "AsyncHeartRateVariabilityApi"}
+        ),
+        "heart_rate_variability_intraday": MappingProxyType(
+            {
+                "sync": "HeartRateVariabilityIntradayApi",
+                "async": "AsyncHeartRateVariabilityIntradayApi",
+            }
+        ),
+        "nutrition": MappingProxyType(
+            {"sync": "NutritionApi", "async": "AsyncNutritionApi"}
+        ),
+        "nutrition_time_series": MappingProxyType(
+            {"sync": "NutritionTimeSeriesApi", "async": "AsyncNutritionTimeSeriesApi"}
+        ),
+        "sleep": MappingProxyType({"sync": "SleepApi", "async": "AsyncSleepApi"}),
+        "spo2": MappingProxyType({"sync": "SpO2Api", "async": "AsyncSpO2Api"}),
+        "spo2_intraday": MappingProxyType(
+            {"sync": "SpO2IntradayApi", "async": "AsyncSpO2IntradayApi"}
+        ),
+        "subscriptions": MappingProxyType(
+            {"sync": "SubscriptionsApi", "async": "AsyncSubscriptionsApi"}
+        ),
+        "temperature": MappingProxyType(
+            {"sync": "TemperatureApi", "async": "AsyncTemperatureApi"}
+        ),
+        "user": MappingProxyType({"sync": "UserApi", "async": "AsyncUserApi"}),
+    }
+)
+"""The sync and async mixins of each module."""
+
+
+def method(name: str) -> Callable[..., Any]:
+    """Get an endpoint method by name, importing its module if needed."""
+    module, mixin = METHODS[name]
+    return getattr(
+        getattr(importlib.import_module(f"{__name__}.{module}"), mixin), name
+    )
+
+
+def mixins(
+    modules: Iterable[str] | None = None,
+    mode: Literal["sync", "async", "both"] = "both",
+) -> tuple[type[BaseApi], ...]:
+    """Import the mixins of some endpoint groups.
+
+    Parameters
+    ----------
+    modules : Iterable[str] | None, optional
+        The names of the modules of the groups (see `MIXINS`), by default all.
+    mode : Literal["sync", "async", "both"], optional
+        Whether to get the sync or async methods, by default both.
+
+    Returns
+    -------
+    tuple[type[BaseApi], ...]
+        The mixins, which only require `_get` and/or `_aget` to be implemented.
+    """
+    modes = ("sync", "async") if mode == "both" else (mode,)
+    return tuple(
+        getattr(importlib.import_module(f"{__name__}.{module}"), MIXINS[module][m])
+        for module in (MIXINS if modules is None else modules)
+        for m in modes
+    )
+
+
+class _LazyMethods(abc.ABCMeta):
+    """Metaclass loading the endpoint methods on first access from the class."""
+
+    def __getattr__(cls, name: str) -> Any:
+        """Load an endpoint method into the class."""
+        if name not in METHODS:
+            raise AttributeError(
+                f"type object {cls.__name__!r} has no attribute {name!r}"
+            )
+        setattr(FitbitWebApi, name, method(name))
+        return getattr(cls, name)
+
+    def __dir__(cls):
+        """List the attributes of the class, with the endpoint methods."""
+        return sorted({*super().__dir__(), *METHODS})
+
+
+class FitbitWebApi(_Endpoints, metaclass=_LazyMethods):
+    """API containing the autogenerated methods for the Fitbit Web API.
+
+    The methods are loaded from their submodule on first access.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        """Load an endpoint method into the class."""
+        if name not in METHODS:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        setattr(FitbitWebApi, name, method(name))
+        return getattr(self, name)
+
+    def __dir__(self):
+        """List the attributes of the instance, with the endpoint methods."""
+        return sorted({*super().__dir__(), *METHODS})
@@ -0,0 +1,320 @@
+"""Autogenerated methods for the Active Zone Minutes Intraday Time Series endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_AZM_BY_DATE_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/active-zone-minutes/date/{date}/1d/{detail-level}.json"
+)
+_GET_AZM_BY_DATE_TIME_SERIES_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/active-zone-minutes/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json"
+)
+_GET_AZM_BY_INTERVAL_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}/{detail-level}.json"
+)
+_GET_AZM_BY_INTERVAL_TIME_SERIES_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}/time/{start-time}/{end-time}.json"
+)
+
+
+class ActiveZoneMinutesIntradayTimeSeriesApi(BaseApi):
+    """Methods for the Active Zone Minutes Intraday Time Series endpoints."""
+
+    def get_azm_by_date_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1min", "5min", "15min"],
+    ):
+        """Get AZM Intraday by Date.
+
+        Returns the active zone minutes intraday data for a 24 hour period by specifying a date and/or time range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{date}/1d/{detail-level}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        detail_level : Literal['1min', '5min', '15min']
+                The detail for which data will be returned. **Supported:** 1min | 5min | 15min
+        """
+        return self._get(
+            _GET_AZM_BY_DATE_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "detail-level": detail_level,
+            },
+        )
+
+    def get_azm_by_date_time_series_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1min", "5min", "15min"],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+    ):
+        """Get AZM Intraday by Date.
+
+        Returns the active zone minutes intraday data for a 24 hour period by specifying a date and/or time range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        detail_level : Literal['1min', '5min', '15min']
+                The detail for which data will be returned. **Supported:** 1min | 5min | 15min
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end of the period in the format HH:mm.
+        """
+        return self._get(
+            _GET_AZM_BY_DATE_TIME_SERIES_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "detail-level": detail_level,
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+            },
+        )
+
+    def get_azm_by_interval_intraday(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1min", "5min", "15min"],
+    ):
+        """Get AZM Intraday by Interval.
+
+        Returns the active zone minutes intraday data for a 24 hour period by specifying a date range and/or time range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}/{detail-level}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        detail_level : Literal['1min', '5min', '15min']
+                The detail for which data will be returned. **Support:** 1min | 5min | 15min
+        """
+        return self._get(
+            _GET_AZM_BY_INTERVAL_INTRADAY_URL,
+            param_kwargs={
+                "start-date": utils.format_date(start_date),
+                "end-date": utils.format_date(end_date),
+                "detail-level": detail_level,
+            },
+        )
+
+    def get_azm_by_interval_time_series_intraday(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1min", "5min", "15min"],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+    ):
+        """Get AZM Intraday by Interval.
+
+        Returns the active zone minutes intraday data for a 24 hour period by specifying a date range and/or time range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        detail_level : Literal['1min', '5min', '15min']
+                The detail for which data will be returned. **Support:** 1min | 5min | 15min
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end of the period in the format HH:mm.
+        """
+        return self._get(
+            _GET_AZM_BY_INTERVAL_TIME_SERIES_INTRADAY_URL,
+            param_kwargs={
+                "start-date": utils.format_date(start_date),
+                "end-date": utils.format_date(end_date),
+                "detail-level": detail_level,
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+            },
+        )
+
+
+class AsyncActiveZoneMinutesIntradayTimeSeriesApi(BaseApi):
+    """Async methods for the Active Zone Minutes Intraday Time Series endpoints."""
+
+    async def aget_azm_by_date_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1min", "5min", "15min"],
+    ):
+        """Get AZM Intraday by Date.
+
+        Returns the active zone minutes intraday data for a 24 hour period by specifying a date and/or time range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{date}/1d/{detail-level}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        detail_level : Literal['1min', '5min', '15min']
+                The detail for which data will be returned. **Supported:** 1min | 5min | 15min
+        """
+        return await self._aget(
+            _GET_AZM_BY_DATE_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "detail-level": detail_level,
+            },
+        )
+
+    async def aget_azm_by_date_time_series_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1min", "5min", "15min"],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+    ):
+        """Get AZM Intraday by Date.
+
+        Returns the active zone minutes intraday data for a 24 hour period by specifying a date and/or time range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        detail_level : Literal['1min', '5min', '15min']
+                The detail for which data will be returned. **Supported:** 1min | 5min | 15min
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end of the period in the format HH:mm.
+        """
+        return await self._aget(
+            _GET_AZM_BY_DATE_TIME_SERIES_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "detail-level": detail_level,
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+            },
+        )
+
+    async def aget_azm_by_interval_intraday(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1min", "5min", "15min"],
+    ):
+        """Get AZM Intraday by Interval.
+
+        Returns the active zone minutes intraday data for a 24 hour period by specifying a date range and/or time range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}/{detail-level}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        detail_level : Literal['1min', '5min', '15min']
+                The detail for which data will be returned. **Support:** 1min | 5min | 15min
+        """
+        return await self._aget(
+            _GET_AZM_BY_INTERVAL_INTRADAY_URL,
+            param_kwargs={
+                "start-date": utils.format_date(start_date),
+                "end-date": utils.format_date(end_date),
+                "detail-level": detail_level,
+            },
+        )
+
+    async def aget_azm_by_interval_time_series_intraday(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1min", "5min", "15min"],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+    ):
+        """Get AZM Intraday by Interval.
+
+        Returns the active zone minutes intraday data for a 24 hour period by specifying a date range and/or time range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        detail_level : Literal['1min', '5min', '15min']
+                The detail for which data will be returned. **Support:** 1min | 5min | 15min
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end of the period in the format HH:mm.
+        """
+        return await self._aget(
+            _GET_AZM_BY_INTERVAL_TIME_SERIES_INTRADAY_URL,
+            param_kwargs={
+                "start-date": utils.format_date(start_date),
+                "end-date": utils.format_date(end_date),
+                "detail-level": detail_level,
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+            },
+        )
@@ -0,0 +1,132 @@
+"""Autogenerated methods for the Active Zone Minutes Time Series endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_AZM_TIME_SERIES_BY_DATE_URL = utils.UrlTemplate(
+    "/1/user/-/activities/active-zone-minutes/date/{date}/{period}.json"
+)
+_GET_AZM_TIME_SERIES_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}.json"
+)
+
+
+class ActiveZoneMinutesTimeSeriesApi(BaseApi):
+    """Methods for the Active Zone Minutes Time Series endpoints."""
+
+    def get_azm_time_series_by_date(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y"],
+    ):
+        """Get AZM Time Series by Date.
+
+        Returns the daily summary values over a period of time by specifying a date and time period.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{date}/{period}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y']
+                The range for which data will be returned. **Supported:** 1d | 7d | 30d | 1w | 1m | 3m | 6m | 1y
+        """
+        return self._get(
+            _GET_AZM_TIME_SERIES_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date), "period": period},
+        )
+
+    def get_azm_time_series_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get AZM Time Series by Interval.
+
+        Returns the daily summary values over an interval by specifying a date range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+        """
+        return self._get(
+            _GET_AZM_TIME_SERIES_BY_INTERVAL_URL,
+            param_kwargs={
+                "start-date": utils.format_date(start_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncActiveZoneMinutesTimeSeriesApi(BaseApi):
+    """Async methods for the Active Zone Minutes Time Series endpoints."""
+
+    async def aget_azm_time_series_by_date(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y"],
+    ):
+        """Get AZM Time Series by Date.
+
+        Returns the daily summary values over a period of time by specifying a date and time period.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{date}/{period}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y']
+                The range for which data will be returned. **Supported:** 1d | 7d | 30d | 1w | 1m | 3m | 6m | 1y
+        """
+        return await self._aget(
+            _GET_AZM_TIME_SERIES_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date), "period": period},
+        )
+
+    async def aget_azm_time_series_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get AZM Time Series by Interval.
+
+        Returns the daily summary values over an interval by specifying a date range.
+
+        Endpoint: '/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}.json'
+        Scopes: ['activity']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today
+        """
+        return await self._aget(
+            _GET_AZM_TIME_SERIES_BY_INTERVAL_URL,
+            param_kwargs={
+                "start-date": utils.format_date(start_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
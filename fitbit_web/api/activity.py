@@ -0,0 +1,380 @@
+"""Autogenerated methods for the Activity endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_ACTIVITIES_BY_DATE_URL = utils.UrlTemplate("/1/user/-/activities/date/{date}.json")
+_GET_ACTIVITIES_LOG_URL = utils.UrlTemplate("/1/user/-/activities.json")
+_GET_ACTIVITIES_LOG_LIST_URL = utils.UrlTemplate("/1/user/-/activities/list.json")
+_GET_ACTIVITIES_TCX_URL = utils.UrlTemplate("/1/user/-/activities/{log-id}.tcx")
+_GET_ACTIVITIES_TYPES_URL = utils.UrlTemplate("/1/activities.json")
+_GET_ACTIVITIES_TYPE_DETAIL_URL = utils.UrlTemplate("/1/activities/{activity-id}.json")
+_GET_FREQUENT_ACTIVITIES_URL = utils.UrlTemplate("/1/user/-/activities/frequent.json")
+_GET_RECENT_ACTIVITIES_URL = utils.UrlTemplate("/1/user/-/activities/recent.json")
+_GET_FAVORITE_ACTIVITIES_URL = utils.UrlTemplate("/1/user/-/activities/favorite.json")
+_GET_ACTIVITIES_GOALS_URL = utils.UrlTemplate(
+    "/1/user/-/activities/goals/{period}.json"
+)
+
+
+class ActivityApi(BaseApi):
+    """Methods for the Activity endpoints."""
+
+    def get_activities_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Activity Summary by Date.
+
+        Retrieves a summary and list of a user's activities and activity log entries for a given day.
+
+        Endpoint: '/1/user/-/activities/date/{date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd
+        """
+        return self._get(
+            _GET_ACTIVITIES_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    def get_activities_log(self):
+        """Get Lifetime Stats.
+
+        Updates a user's daily activity goals and returns a response using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return self._get(_GET_ACTIVITIES_LOG_URL)
+
+    def get_activities_log_list(
+        self,
+        sort: Literal["asc", "desc"],
+        limit: int,
+        before_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        after_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        offset: int = 0,
+    ):
+        """Get Activity Log List.
+
+        Retreives a list of user's activity log entries before or after a given day with offset and limit using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/list.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        sort : Literal['asc', 'desc']
+                The sort order of entries by date asc (ascending) or desc (descending).
+
+        limit : int
+                The maximum number of entries returned (maximum;100).
+
+        before_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss. Only yyyy-MM-dd is required. Either beforeDate or afterDate should be specified.
+
+        after_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss.
+
+        offset : int
+                The offset number of entries.
+        """
+        return self._get(
+            _GET_ACTIVITIES_LOG_LIST_URL,
+            query_kwargs={
+                "sort": sort,
+                "limit": limit,
+                "beforeDate": utils.format_date_or_timestamp(before_date),
+                "afterDate": utils.format_date_or_timestamp(after_date),
+                "offset": offset,
+            },
+        )
+
+    def get_activities_tcx(self, log_id: str, include_partial_tcx: bool | None = None):
+        """Get Activity TCX.
+
+        Retreives the details of a user's location and heart rate data during a logged exercise activity.
+
+        Endpoint: '/1/user/-/activities/{log-id}.tcx'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        log_id : str
+                The activity's log ID.
+
+        include_partial_tcx : bool, optional
+                Include TCX points regardless of GPS data being present
+        """
+        return self._get(
+            _GET_ACTIVITIES_TCX_URL,
+            param_kwargs={"log-id": log_id},
+            query_kwargs={"includePartialTCX": include_partial_tcx},
+        )
+
+    def get_activities_types(self):
+        """Browse Activity Types.
+
+        Retreives a tree of all valid Fitbit public activities from the activities catelog as well as private custom activities the user created in the format requested.
+
+        Endpoint: '/1/activities.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return self._get(_GET_ACTIVITIES_TYPES_URL)
+
+    def get_activities_type_detail(self, activity_id: str):
+        """Get Activity Type.
+
+        Returns the detail of a specific activity in the Fitbit activities database in the format requested. If activity has levels, it also returns a list of activity level details.
+
+        Endpoint: '/1/activities/{activity-id}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        activity_id : str
+                The activity ID.
+        """
+        return self._get(
+            _GET_ACTIVITIES_TYPE_DETAIL_URL, param_kwargs={"activity-id": activity_id}
+        )
+
+    def get_frequent_activities(self):
+        """Get Frequent Activities.
+
+        Retreives a list of a user's frequent activities in the format requested using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/frequent.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return self._get(_GET_FREQUENT_ACTIVITIES_URL)
+
+    def get_recent_activities(self):
+        """Get Recent Activity Types.
+
+        Retreives a list of a user's recent activities types logged with some details of the last activity log of that type using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/recent.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return self._get(_GET_RECENT_ACTIVITIES_URL)
+
+    def get_favorite_activities(self):
+        """Get Favorite Activities.
+
+        Returns a list of a user's favorite activities.
+
+        Endpoint: '/1/user/-/activities/favorite.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return self._get(_GET_FAVORITE_ACTIVITIES_URL)
+
+    def get_activities_goals(self, period: Literal["daily", "weekly"]):
+        """Get Activity Goals.
+
+        Retreives a user's current daily or weekly activity goals using measurement units as defined in the unit system, which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/goals/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        period : Literal['daily', 'weekly']
+                daily or weekly.
+        """
+        return self._get(_GET_ACTIVITIES_GOALS_URL, param_kwargs={"period": period})
+
+
+class AsyncActivityApi(BaseApi):
+    """Async methods for the Activity endpoints."""
+
+    async def aget_activities_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Activity Summary by Date.
+
+        Retrieves a summary and list of a user's activities and activity log entries for a given day.
+
+        Endpoint: '/1/user/-/activities/date/{date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    async def aget_activities_log(self):
+        """Get Lifetime Stats.
+
+        Updates a user's daily activity goals and returns a response using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return await self._aget(_GET_ACTIVITIES_LOG_URL)
+
+    async def aget_activities_log_list(
+        self,
+        sort: Literal["asc", "desc"],
+        limit: int,
+        before_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        after_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        offset: int = 0,
+    ):
+        """Get Activity Log List.
+
+        Retreives a list of user's activity log entries before or after a given day with offset and limit using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/list.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        sort : Literal['asc', 'desc']
+                The sort order of entries by date asc (ascending) or desc (descending).
+
+        limit : int
+                The maximum number of entries returned (maximum;100).
+
+        before_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss. Only yyyy-MM-dd is required. Either beforeDate or afterDate should be specified.
+
+        after_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss.
+
+        offset : int
+                The offset number of entries.
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_LOG_LIST_URL,
+            query_kwargs={
+                "sort": sort,
+                "limit": limit,
+                "beforeDate": utils.format_date_or_timestamp(before_date),
+                "afterDate": utils.format_date_or_timestamp(after_date),
+                "offset": offset,
+            },
+        )
+
+    async def aget_activities_tcx(
+        self, log_id: str, include_partial_tcx: bool | None = None
+    ):
+        """Get Activity TCX.
+
+        Retreives the details of a user's location and heart rate data during a logged exercise activity.
+
+        Endpoint: '/1/user/-/activities/{log-id}.tcx'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        log_id : str
+                The activity's log ID.
+
+        include_partial_tcx : bool, optional
+                Include TCX points regardless of GPS data being present
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_TCX_URL,
+            param_kwargs={"log-id": log_id},
+            query_kwargs={"includePartialTCX": include_partial_tcx},
+        )
+
+    async def aget_activities_types(self):
+        """Browse Activity Types.
+
+        Retreives a tree of all valid Fitbit public activities from the activities catelog as well as private custom activities the user created in the format requested.
+
+        Endpoint: '/1/activities.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return await self._aget(_GET_ACTIVITIES_TYPES_URL)
+
+    async def aget_activities_type_detail(self, activity_id: str):
+        """Get Activity Type.
+
+        Returns the detail of a specific activity in the Fitbit activities database in the format requested. If activity has levels, it also returns a list of activity level details.
+
+        Endpoint: '/1/activities/{activity-id}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        activity_id : str
+                The activity ID.
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_TYPE_DETAIL_URL, param_kwargs={"activity-id": activity_id}
+        )
+
+    async def aget_frequent_activities(self):
+        """Get Frequent Activities.
+
+        Retreives a list of a user's frequent activities in the format requested using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/frequent.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return await self._aget(_GET_FREQUENT_ACTIVITIES_URL)
+
+    async def aget_recent_activities(self):
+        """Get Recent Activity Types.
+
+        Retreives a list of a user's recent activities types logged with some details of the last activity log of that type using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/recent.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return await self._aget(_GET_RECENT_ACTIVITIES_URL)
+
+    async def aget_favorite_activities(self):
+        """Get Favorite Activities.
+
+        Returns a list of a user's favorite activities.
+
+        Endpoint: '/1/user/-/activities/favorite.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return await self._aget(_GET_FAVORITE_ACTIVITIES_URL)
+
+    async def aget_activities_goals(self, period: Literal["daily", "weekly"]):
+        """Get Activity Goals.
+
+        Retreives a user's current daily or weekly activity goals using measurement units as defined in the unit system, which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/goals/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        period : Literal['daily', 'weekly']
+                daily or weekly.
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_GOALS_URL, param_kwargs={"period": period}
+        )
@@ -0,0 +1,368 @@
+"""Autogenerated methods for the Activity Intraday Time Series endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_ACTIVITIES_RESOURCE_BY_DATE_RANGE_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/{resource-path}/date/{base-date}/{end-date}/{detail-level}.json"
+)
+_GET_ACTIVITIES_RESOURCE_BY_DATE_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}.json"
+)
+_GET_ACTIVITIES_RESOURCE_BY_DATE_RANGE_TIME_SERIES_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/{resource-path}/date/{date}/{end-date}/{detail-level}/time/{start-time}/{end-time}.json"
+)
+_GET_ACTIVITIES_RESOURCE_BY_DATE_TIME_SERIES_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json"
+)
+
+
+class ActivityIntradayTimeSeriesApi(BaseApi):
+    """Methods for the Activity Intraday Time Series endpoints."""
+
+    def get_activities_resource_by_date_range_intraday(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        resource_path: Literal[
+            "calories", "steps", "distance", "floors", "elevation"
+        ] = "steps",
+        detail_level: Literal["1min", "15min"] = "1min",
+    ):
+        """Get Activity Intraday Time Series.
+
+        Returns the Activity Intraday Time Series for a given resource in the format requested.
+
+        Endpoint: '/1/user/-/activities/{resource-path}/date/{base-date}/{end-date}/{detail-level}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        resource_path : Literal['calories', 'steps', 'distance', 'floors', 'elevation']
+                The resource-path; see options in the Resource Path Options section in the full documentation.
+
+        detail_level : Literal['1min', '15min']
+                Number of data points to include. Either 1min or 15min. Optional.
+        """
+        return self._get(
+            _GET_ACTIVITIES_RESOURCE_BY_DATE_RANGE_INTRADAY_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+                "resource-path": resource_path,
+                "detail-level": detail_level,
+            },
+        )
+
+    def get_activities_resource_by_date_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        resource_path: Literal[
+            "calories", "steps", "distance", "floors", "elevation"
+        ] = "steps",
+        detail_level: Literal["1min", "15min"] = "1min",
+    ):
+        """Get Intraday Time Series.
+
+        Returns the Intraday Time Series for a given resource in the format requested.
+
+        Endpoint: '/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        resource_path : Literal['calories', 'steps', 'distance', 'floors', 'elevation']
+                The resource-path; see options in the Resource Path Options section in the full documentation.
+
+        detail_level : Literal['1min', '15min']
+                Number of data points to include. Either 1min or 15min. Optional.
+        """
+        return self._get(
+            _GET_ACTIVITIES_RESOURCE_BY_DATE_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "resource-path": resource_path,
+                "detail-level": detail_level,
+            },
+        )
+
+    def get_activities_resource_by_date_range_time_series_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        resource_path: Literal[
+            "calories", "steps", "distance", "floors", "elevation"
+        ] = "steps",
+        detail_level: Literal["1min", "15min"] = "1min",
+    ):
+        """Get Activity Intraday Time Series.
+
+        Returns the Intraday Time Series for a given resource in the format requested.
+
+        Endpoint: '/1/user/-/activities/{resource-path}/date/{date}/{end-date}/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end of the period in the format HH:mm.
+
+        resource_path : Literal['calories', 'steps', 'distance', 'floors', 'elevation']
+                The resource-path; see options in the Resource Path Options section in the full documentation.
+
+        detail_level : Literal['1min', '15min']
+                Number of data points to include. Either 1min or 15min.
+        """
+        return self._get(
+            _GET_ACTIVITIES_RESOURCE_BY_DATE_RANGE_TIME_SERIES_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "end-date": utils.format_date(end_date),
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+                "resource-path": resource_path,
+                "detail-level": detail_level,
+            },
+        )
+
+    def get_activities_resource_by_date_time_series_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        resource_path: Literal[
+            "calories", "steps", "distance", "floors", "elevation"
+        ] = "steps",
+        detail_level: Literal["1min", "15min"] = "1min",
+    ):
+        """Get Intraday Time Series.
+
+        Returns the Intraday Time Series for a given resource in the format requested.
+
+        Endpoint: '/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end of the period in the format HH:mm.
+
+        resource_path : Literal['calories', 'steps', 'distance', 'floors', 'elevation']
+                The resource-path; see options in the Resource Path Options section in the full documentation.
+
+        detail_level : Literal['1min', '15min']
+                Number of data points to include. Either 1min or 15min.
+        """
+        return self._get(
+            _GET_ACTIVITIES_RESOURCE_BY_DATE_TIME_SERIES_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+                "resource-path": resource_path,
+                "detail-level": detail_level,
+            },
+        )
+
+
+class AsyncActivityIntradayTimeSeriesApi(BaseApi):
+    """Async methods for the Activity Intraday Time Series endpoints."""
+
+    async def aget_activities_resource_by_date_range_intraday(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        resource_path: Literal[
+            "calories", "steps", "distance", "floors", "elevation"
+        ] = "steps",
+        detail_level: Literal["1min", "15min"] = "1min",
+    ):
+        """Get Activity Intraday Time Series.
+
+        Returns the Activity Intraday Time Series for a given resource in the format requested.
+
+        Endpoint: '/1/user/-/activities/{resource-path}/date/{base-date}/{end-date}/{detail-level}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        resource_path : Literal['calories', 'steps', 'distance', 'floors', 'elevation']
+                The resource-path; see options in the Resource Path Options section in the full documentation.
+
+        detail_level : Literal['1min', '15min']
+                Number of data points to include. Either 1min or 15min. Optional.
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_RESOURCE_BY_DATE_RANGE_INTRADAY_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+                "resource-path": resource_path,
+                "detail-level": detail_level,
+            },
+        )
+
+    async def aget_activities_resource_by_date_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        resource_path: Literal[
+            "calories", "steps", "distance", "floors", "elevation"
+        ] = "steps",
+        detail_level: Literal["1min", "15min"] = "1min",
+    ):
+        """Get Intraday Time Series.
+
+        Returns the Intraday Time Series for a given resource in the format requested.
+
+        Endpoint: '/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        resource_path : Literal['calories', 'steps', 'distance', 'floors', 'elevation']
+                The resource-path; see options in the Resource Path Options section in the full documentation.
+
+        detail_level : Literal['1min', '15min']
+                Number of data points to include. Either 1min or 15min. Optional.
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_RESOURCE_BY_DATE_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "resource-path": resource_path,
+                "detail-level": detail_level,
+            },
+        )
+
+    async def aget_activities_resource_by_date_range_time_series_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        resource_path: Literal[
+            "calories", "steps", "distance", "floors", "elevation"
+        ] = "steps",
+        detail_level: Literal["1min", "15min"] = "1min",
+    ):
+        """Get Activity Intraday Time Series.
+
+        Returns the Intraday Time Series for a given resource in the format requested.
+
+        Endpoint: '/1/user/-/activities/{resource-path}/date/{date}/{end-date}/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end of the period in the format HH:mm.
+
+        resource_path : Literal['calories', 'steps', 'distance', 'floors', 'elevation']
+                The resource-path; see options in the Resource Path Options section in the full documentation.
+
+        detail_level : Literal['1min', '15min']
+                Number of data points to include. Either 1min or 15min.
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_RESOURCE_BY_DATE_RANGE_TIME_SERIES_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "end-date": utils.format_date(end_date),
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+                "resource-path": resource_path,
+                "detail-level": detail_level,
+            },
+        )
+
+    async def aget_activities_resource_by_date_time_series_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        resource_path: Literal[
+            "calories", "steps", "distance", "floors", "elevation"
+        ] = "steps",
+        detail_level: Literal["1min", "15min"] = "1min",
+    ):
+        """Get Intraday Time Series.
+
+        Returns the Intraday Time Series for a given resource in the format requested.
+
+        Endpoint: '/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd or today.
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end of the period in the format HH:mm.
+
+        resource_path : Literal['calories', 'steps', 'distance', 'floors', 'elevation']
+                The resource-path; see options in the Resource Path Options section in the full documentation.
+
+        detail_level : Literal['1min', '15min']
+                Number of data points to include. Either 1min or 15min.
+        """
+        return await self._aget(
+            _GET_ACTIVITIES_RESOURCE_BY_DATE_TIME_SERIES_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+                "resource-path": resource_path,
+                "detail-level": detail_level,
+            },
+        )
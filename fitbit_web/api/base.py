@@ -0,0 +1,24 @@
+"""Base of the autogenerated mixins for the Fitbit Web API."""
+
+import abc
+from typing import Any
+
+
+class BaseApi(abc.ABC):
+    """Abstract methods used by the autogenerated methods."""
+
+    @abc.abstractmethod
+    def _get(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ) -> dict[str, Any]: ...
+
+    @abc.abstractmethod
+    async def _aget(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ) -> dict[str, Any]: ...
@@ -0,0 +1,353 @@
+"""Autogenerated methods for the Body endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_BODY_FAT_BY_DATE_URL = utils.UrlTemplate("/1/user/-/body/log/fat/date/{date}.json")
+_GET_BODY_FAT_BY_DATE_PERIOD_URL = utils.UrlTemplate(
+    "/1/user/-/body/log/fat/date/{date}/{period}.json"
+)
+_GET_BODY_FAT_BY_DATE_RANGE_URL = utils.UrlTemplate(
+    "/1/user/-/body/log/fat/date/{base-date}/{end-date}.json"
+)
+_GET_BODY_GOALS_URL = utils.UrlTemplate("/1/user/-/body/log/{goal-type}/goal.json")
+_GET_WEIGHT_BY_DATE_URL = utils.UrlTemplate(
+    "/1/user/-/body/log/weight/date/{date}.json"
+)
+_GET_WEIGHT_BY_DATE_PERIOD_URL = utils.UrlTemplate(
+    "/1/user/-/body/log/weight/date/{date}/{period}.json"
+)
+_GET_WEIGHT_BY_DATE_RANGE_URL = utils.UrlTemplate(
+    "/1/user/-/body/log/weight/date/{base-date}/{end-date}.json"
+)
+
+
+class BodyApi(BaseApi):
+    """Methods for the Body endpoints."""
+
+    def get_body_fat_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body fat log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/fat/date/{date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd.
+        """
+        return self._get(
+            _GET_BODY_FAT_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    def get_body_fat_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"],
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body fat log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/fat/date/{date}/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y', 'max']
+                The range for which data will be returned. Options are 1d, 7d, 30d, 1w, 1m, 3m, 6m, 1y, or max.
+        """
+        return self._get(
+            _GET_BODY_FAT_BY_DATE_PERIOD_URL,
+            param_kwargs={"date": utils.format_date(date), "period": period},
+        )
+
+    def get_body_fat_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body fat log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/fat/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+        """
+        return self._get(
+            _GET_BODY_FAT_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
+
+    def get_body_goals(self, goal_type: Literal["weight", "fat"]):
+        """Get Body Goals.
+
+        Retreives a user's current body fat percentage or weight goal using units in the unit systems that corresponds to the Accept-Language header providedin the format requested.
+
+        Endpoint: '/1/user/-/body/log/{goal-type}/goal.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        goal_type : Literal['weight', 'fat']
+                weight or fat.
+        """
+        return self._get(_GET_BODY_GOALS_URL, param_kwargs={"goal-type": goal_type})
+
+    def get_weight_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Weight Logs.
+
+        Retreives a list of all user's body weight log entries for a given day using units in the unit systems which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/body/log/weight/date/{date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd.
+        """
+        return self._get(
+            _GET_WEIGHT_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    def get_weight_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"],
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body weight log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/weight/date/{date}/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y', 'max']
+                The range for which data will be returned. Options are 1d, 7d, 30d, 1w, 1m, 3m, 6m, 1y, or max.
+        """
+        return self._get(
+            _GET_WEIGHT_BY_DATE_PERIOD_URL,
+            param_kwargs={"date": utils.format_date(date), "period": period},
+        )
+
+    def get_weight_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body fat log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/weight/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+        """
+        return self._get(
+            _GET_WEIGHT_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncBodyApi(BaseApi):
+    """Async methods for the Body endpoints."""
+
+    async def aget_body_fat_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body fat log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/fat/date/{date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd.
+        """
+        return await self._aget(
+            _GET_BODY_FAT_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    async def aget_body_fat_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"],
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body fat log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/fat/date/{date}/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y', 'max']
+                The range for which data will be returned. Options are 1d, 7d, 30d, 1w, 1m, 3m, 6m, 1y, or max.
+        """
+        return await self._aget(
+            _GET_BODY_FAT_BY_DATE_PERIOD_URL,
+            param_kwargs={"date": utils.format_date(date), "period": period},
+        )
+
+    async def aget_body_fat_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body fat log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/fat/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+        """
+        return await self._aget(
+            _GET_BODY_FAT_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
+
+    async def aget_body_goals(self, goal_type: Literal["weight", "fat"]):
+        """Get Body Goals.
+
+        Retreives a user's current body fat percentage or weight goal using units in the unit systems that corresponds to the Accept-Language header providedin the format requested.
+
+        Endpoint: '/1/user/-/body/log/{goal-type}/goal.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        goal_type : Literal['weight', 'fat']
+                weight or fat.
+        """
+        return await self._aget(
+            _GET_BODY_GOALS_URL, param_kwargs={"goal-type": goal_type}
+        )
+
+    async def aget_weight_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Weight Logs.
+
+        Retreives a list of all user's body weight log entries for a given day using units in the unit systems which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/body/log/weight/date/{date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd.
+        """
+        return await self._aget(
+            _GET_WEIGHT_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    async def aget_weight_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"],
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body weight log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/weight/date/{date}/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format yyyy-MM-dd.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y', 'max']
+                The range for which data will be returned. Options are 1d, 7d, 30d, 1w, 1m, 3m, 6m, 1y, or max.
+        """
+        return await self._aget(
+            _GET_WEIGHT_BY_DATE_PERIOD_URL,
+            param_kwargs={"date": utils.format_date(date), "period": period},
+        )
+
+    async def aget_weight_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Body Fat Logs.
+
+        Retreives a list of all user's body fat log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/body/log/weight/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+        """
+        return await self._aget(
+            _GET_WEIGHT_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
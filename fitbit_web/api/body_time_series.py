@@ -0,0 +1,154 @@
+"""Autogenerated methods for the Body Time Series endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_BODY_RESOURCE_BY_DATE_PERIOD_URL = utils.UrlTemplate(
+    "/1/user/-/body/{resource-path}/date/{date}/{period}.json"
+)
+_GET_BODY_RESOURCE_BY_DATE_RANGE_URL = utils.UrlTemplate(
+    "/1/user/-/body/{resource-path}/date/{base-date}/{end-date}.json"
+)
+
+
+class BodyTimeSeriesApi(BaseApi):
+    """Methods for the Body Time Series endpoints."""
+
+    def get_body_resource_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"],
+        resource_path: Literal["bmi", "fat", "weight"] = "weight",
+    ):
+        """Get Body Time Series.
+
+        Returns time series data in the specified range for a given resource in the format requested using units in the unit system that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/body/{resource-path}/date/{date}/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y', 'max']
+                The range for which data will be returned. Options are 1d, 7d, 30d, 1w, 1m, 3m, 6m, 1y, or max.
+
+        resource_path : Literal['bmi', 'fat', 'weight']
+                The resource path, which incudes the bmi, fat, or weight options.
+        """
+        return self._get(
+            _GET_BODY_RESOURCE_BY_DATE_PERIOD_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "period": period,
+                "resource-path": resource_path,
+            },
+        )
+
+    def get_body_resource_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        resource_path: Literal["bmi", "fat", "weight"] = "weight",
+    ):
+        """Get Body Time Series.
+
+        Returns time series data in the specified range for a given resource in the format requested using units in the unit system that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/body/{resource-path}/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+
+        resource_path : Literal['bmi', 'fat', 'weight']
+                The resource path, which incudes the bmi, fat, or weight options.
+        """
+        return self._get(
+            _GET_BODY_RESOURCE_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+                "resource-path": resource_path,
+            },
+        )
+
+
+class AsyncBodyTimeSeriesApi(BaseApi):
+    """Async methods for the Body Time Series endpoints."""
+
+    async def aget_body_resource_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"],
+        resource_path: Literal["bmi", "fat", "weight"] = "weight",
+    ):
+        """Get Body Time Series.
+
+        Returns time series data in the specified range for a given resource in the format requested using units in the unit system that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/body/{resource-path}/date/{date}/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y', 'max']
+                The range for which data will be returned. Options are 1d, 7d, 30d, 1w, 1m, 3m, 6m, 1y, or max.
+
+        resource_path : Literal['bmi', 'fat', 'weight']
+                The resource path, which incudes the bmi, fat, or weight options.
+        """
+        return await self._aget(
+            _GET_BODY_RESOURCE_BY_DATE_PERIOD_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "period": period,
+                "resource-path": resource_path,
+            },
+        )
+
+    async def aget_body_resource_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        resource_path: Literal["bmi", "fat", "weight"] = "weight",
+    ):
+        """Get Body Time Series.
+
+        Returns time series data in the specified range for a given resource in the format requested using units in the unit system that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/body/{resource-path}/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+
+        resource_path : Literal['bmi', 'fat', 'weight']
+                The resource path, which incudes the bmi, fat, or weight options.
+        """
+        return await self._aget(
+            _GET_BODY_RESOURCE_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+                "resource-path": resource_path,
+            },
+        )
@@ -0,0 +1,122 @@
+"""Autogenerated methods for the Breathing Rate endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_BREATHING_RATE_SUMMARY_BY_DATE_URL = utils.UrlTemplate(
+    "/1/user/-/br/date/{date}.json"
+)
+_GET_BREATHING_RATE_SUMMARY_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/br/date/{startDate}/{endDate}.json"
+)
+
+
+class BreathingRateApi(BaseApi):
+    """Methods for the Breathing Rate endpoints."""
+
+    def get_breathing_rate_summary_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Breathing Rate Summary by Date.
+
+        This endpoint returns average breathing rate data for a single date. Breathing Rate data applies specifically to a user’s “main sleep,” which is the longest single period of time during which they were asleep on a given date.
+
+        Endpoint: '/1/user/-/br/date/{date}.json'
+        Scopes: ['respiratory_rate']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_BREATHING_RATE_SUMMARY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    def get_breathing_rate_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Breathing Rate Summary by Interval.
+
+        This endpoint returns average breathing rate data for a date range. Breathing Rate data applies specifically to a user’s “main sleep,” which is the longest single period of time during which they were asleep on a given date.
+
+        Endpoint: '/1/user/-/br/date/{startDate}/{endDate}.json'
+        Scopes: ['respiratory_rate']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_BREATHING_RATE_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncBreathingRateApi(BaseApi):
+    """Async methods for the Breathing Rate endpoints."""
+
+    async def aget_breathing_rate_summary_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Breathing Rate Summary by Date.
+
+        This endpoint returns average breathing rate data for a single date. Breathing Rate data applies specifically to a user’s “main sleep,” which is the longest single period of time during which they were asleep on a given date.
+
+        Endpoint: '/1/user/-/br/date/{date}.json'
+        Scopes: ['respiratory_rate']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_BREATHING_RATE_SUMMARY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    async def aget_breathing_rate_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Breathing Rate Summary by Interval.
+
+        This endpoint returns average breathing rate data for a date range. Breathing Rate data applies specifically to a user’s “main sleep,” which is the longest single period of time during which they were asleep on a given date.
+
+        Endpoint: '/1/user/-/br/date/{startDate}/{endDate}.json'
+        Scopes: ['respiratory_rate']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_BREATHING_RATE_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
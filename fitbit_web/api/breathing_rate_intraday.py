@@ -0,0 +1,122 @@
+"""Autogenerated methods for the Breathing Rate Intraday endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_BREATHING_RATE_INTRADAY_BY_DATE_URL = utils.UrlTemplate(
+    "/1/user/-/br/date/{date}/all.json"
+)
+_GET_BREATHING_RATE_INTRADAY_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/br/date/{startDate}/{endDate}/all.json"
+)
+
+
+class BreathingRateIntradayApi(BaseApi):
+    """Methods for the Breathing Rate Intraday endpoints."""
+
+    def get_breathing_rate_intraday_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Breathing Rate Intraday by Date.
+
+        This endpoint returns intraday breathing rate data for a single date. It measures the average breathing rate throughout the day and categories your breathing rate by sleep stage. Sleep stages vary between light sleep, deep sleep, REM sleep, and full sleep.
+
+        Endpoint: '/1/user/-/br/date/{date}/all.json'
+        Scopes: ['respiratory_rate']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_BREATHING_RATE_INTRADAY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    def get_breathing_rate_intraday_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Breathing Rate Intraday by Interval.
+
+        This endpoint returns intraday breathing rate data for a date range. It measures the average breathing rate throughout the day and categories your breathing rate by sleep stage. Sleep stages vary between light sleep, deep sleep, REM sleep, and full sleep.
+
+        Endpoint: '/1/user/-/br/date/{startDate}/{endDate}/all.json'
+        Scopes: ['respiratory_rate']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_BREATHING_RATE_INTRADAY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncBreathingRateIntradayApi(BaseApi):
+    """Async methods for the Breathing Rate Intraday endpoints."""
+
+    async def aget_breathing_rate_intraday_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Breathing Rate Intraday by Date.
+
+        This endpoint returns intraday breathing rate data for a single date. It measures the average breathing rate throughout the day and categories your breathing rate by sleep stage. Sleep stages vary between light sleep, deep sleep, REM sleep, and full sleep.
+
+        Endpoint: '/1/user/-/br/date/{date}/all.json'
+        Scopes: ['respiratory_rate']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_BREATHING_RATE_INTRADAY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    async def aget_breathing_rate_intraday_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Breathing Rate Intraday by Interval.
+
+        This endpoint returns intraday breathing rate data for a date range. It measures the average breathing rate throughout the day and categories your breathing rate by sleep stage. Sleep stages vary between light sleep, deep sleep, REM sleep, and full sleep.
+
+        Endpoint: '/1/user/-/br/date/{startDate}/{endDate}/all.json'
+        Scopes: ['respiratory_rate']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_BREATHING_RATE_INTRADAY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
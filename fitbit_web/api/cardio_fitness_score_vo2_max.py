@@ -0,0 +1,122 @@
+"""Autogenerated methods for the Cardio Fitness Score (VO2 Max) endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_VO2_MAX_SUMMARY_BY_DATE_URL = utils.UrlTemplate(
+    "/1/user/-/cardioscore/date/{date}.json"
+)
+_GET_VO2_MAX_SUMMARY_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/cardioscore/date/{startDate}/{endDate}.json"
+)
+
+
+class CardioFitnessScoreVO2MaxApi(BaseApi):
+    """Methods for the Cardio Fitness Score (VO2 Max) endpoints."""
+
+    def get_vo2_max_summary_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get VO2 Max Summary by Date.
+
+        This endpoint returns the Cardio Fitness Score (VO2 Max) data for a single date. VO2 Max values will be shown as a range if no run data is available or a single numeric value if the user uses a GPS for runs.
+
+        Endpoint: '/1/user/-/cardioscore/date/{date}.json'
+        Scopes: ['cardio_fitness']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_VO2_MAX_SUMMARY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    def get_vo2_max_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get VO2 Max Summary by Interval.
+
+        This endpoint returns the Cardio Fitness Score (VO2 Max) data for a date range. VO2 Max values will be shown as a range if no run data is available or a single numeric value if the user uses a GPS for runs.
+
+        Endpoint: '/1/user/-/cardioscore/date/{startDate}/{endDate}.json'
+        Scopes: ['cardio_fitness']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_VO2_MAX_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncCardioFitnessScoreVO2MaxApi(BaseApi):
+    """Async methods for the Cardio Fitness Score (VO2 Max) endpoints."""
+
+    async def aget_vo2_max_summary_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get VO2 Max Summary by Date.
+
+        This endpoint returns the Cardio Fitness Score (VO2 Max) data for a single date. VO2 Max values will be shown as a range if no run data is available or a single numeric value if the user uses a GPS for runs.
+
+        Endpoint: '/1/user/-/cardioscore/date/{date}.json'
+        Scopes: ['cardio_fitness']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_VO2_MAX_SUMMARY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    async def aget_vo2_max_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get VO2 Max Summary by Interval.
+
+        This endpoint returns the Cardio Fitness Score (VO2 Max) data for a date range. VO2 Max values will be shown as a range if no run data is available or a single numeric value if the user uses a GPS for runs.
+
+        Endpoint: '/1/user/-/cardioscore/date/{startDate}/{endDate}.json'
+        Scopes: ['cardio_fitness']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_VO2_MAX_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
@@ -0,0 +1,69 @@
+"""Autogenerated methods for the Devices endpoints."""
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_DEVICES_URL = utils.UrlTemplate("/1/user/-/devices.json")
+_GET_ALARMS_URL = utils.UrlTemplate(
+    "/1/user/-/devices/tracker/{tracker-id}/alarms.json"
+)
+
+
+class DevicesApi(BaseApi):
+    """Methods for the Devices endpoints."""
+
+    def get_devices(self):
+        """Get Devices.
+
+        Returns a list of the Fitbit devices connected to a user's account.
+
+        Endpoint: '/1/user/-/devices.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return self._get(_GET_DEVICES_URL)
+
+    def get_alarms(self, tracker_id: int):
+        """Get Alarms.
+
+        Returns alarms for a device
+
+        Endpoint: '/1/user/-/devices/tracker/{tracker-id}/alarms.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        tracker_id : int
+                The ID of the tracker for which data is returned. The tracker-id value is found via the Get Devices endpoint.
+        """
+        return self._get(_GET_ALARMS_URL, param_kwargs={"tracker-id": tracker_id})
+
+
+class AsyncDevicesApi(BaseApi):
+    """Async methods for the Devices endpoints."""
+
+    async def aget_devices(self):
+        """Get Devices.
+
+        Returns a list of the Fitbit devices connected to a user's account.
+
+        Endpoint: '/1/user/-/devices.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return await self._aget(_GET_DEVICES_URL)
+
+    async def aget_alarms(self, tracker_id: int):
+        """Get Alarms.
+
+        Returns alarms for a device
+
+        Endpoint: '/1/user/-/devices/tracker/{tracker-id}/alarms.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        tracker_id : int
+                The ID of the tracker for which data is returned. The tracker-id value is found via the Get Devices endpoint.
+        """
+        return await self._aget(
+            _GET_ALARMS_URL, param_kwargs={"tracker-id": tracker_id}
+        )
@@ -0,0 +1,119 @@
+"""Autogenerated methods for the Electrocardiogram endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_ECG_LOG_LIST_URL = utils.UrlTemplate("/1/user/-/ecg/list.json")
+
+
+class ElectrocardiogramApi(BaseApi):
+    """Methods for the Electrocardiogram endpoints."""
+
+    def get_ecg_log_list(
+        self,
+        sort: Literal["asc", "desc"],
+        limit: int,
+        before_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        after_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        offset: int = 0,
+    ):
+        """Get ECG Log List.
+
+        This endpoint is used for querying the user's on-device ECG readings.
+
+        Endpoint: '/1/user/-/ecg/list.json'
+        Scopes: ['electrocardiogram']
+
+        Parameters
+        ----------
+        sort : Literal['asc', 'desc']
+                The sort order of entries by date asc (ascending) or desc (descending).
+
+        limit : int
+                The maximum number of entries returned (maximum;10).
+
+        before_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss. Only yyyy-MM-dd is required. Either beforeDate or afterDate should be specified.
+
+        after_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss.
+
+        offset : int
+                The offset number of entries.
+        """
+        return self._get(
+            _GET_ECG_LOG_LIST_URL,
+            query_kwargs={
+                "sort": sort,
+                "limit": limit,
+                "beforeDate": utils.format_date_or_timestamp(before_date),
+                "afterDate": utils.format_date_or_timestamp(after_date),
+                "offset": offset,
+            },
+        )
+
+
+class AsyncElectrocardiogramApi(BaseApi):
+    """Async methods for the Electrocardiogram endpoints."""
+
+    async def aget_ecg_log_list(
+        self,
+        sort: Literal["asc", "desc"],
+        limit: int,
+        before_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        after_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        offset: int = 0,
+    ):
+        """Get ECG Log List.
+
+        This endpoint is used for querying the user's on-device ECG readings.
+
+        Endpoint: '/1/user/-/ecg/list.json'
+        Scopes: ['electrocardiogram']
+
+        Parameters
+        ----------
+        sort : Literal['asc', 'desc']
+                The sort order of entries by date asc (ascending) or desc (descending).
+
+        limit : int
+                The maximum number of entries returned (maximum;10).
+
+        before_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss. Only yyyy-MM-dd is required. Either beforeDate or afterDate should be specified.
+
+        after_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss.
+
+        offset : int
+                The offset number of entries.
+        """
+        return await self._aget(
+            _GET_ECG_LOG_LIST_URL,
+            query_kwargs={
+                "sort": sort,
+                "limit": limit,
+                "beforeDate": utils.format_date_or_timestamp(before_date),
+                "afterDate": utils.format_date_or_timestamp(after_date),
+                "offset": offset,
+            },
+        )
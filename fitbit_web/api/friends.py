@@ -0,0 +1,55 @@
+"""Autogenerated methods for the Friends endpoints."""
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_FRIENDS_URL = utils.UrlTemplate("/1.1/user/-/friends.json")
+_GET_FRIENDS_LEADERBOARD_URL = utils.UrlTemplate("/1.1/user/-/leaderboard/friends.json")
+
+
+class FriendsApi(BaseApi):
+    """Methods for the Friends endpoints."""
+
+    def get_friends(self):
+        """Get Friends.
+
+        Returns data of a user's friends in the format requested using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1.1/user/-/friends.json'
+        Scopes: ['social']
+        """
+        return self._get(_GET_FRIENDS_URL)
+
+    def get_friends_leaderboard(self):
+        """Get Friends Leaderboard.
+
+        Returns data of a user's friends in the format requested using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1.1/user/-/leaderboard/friends.json'
+        Scopes: ['social']
+        """
+        return self._get(_GET_FRIENDS_LEADERBOARD_URL)
+
+
+class AsyncFriendsApi(BaseApi):
+    """Async methods for the Friends endpoints."""
+
+    async def aget_friends(self):
+        """Get Friends.
+
+        Returns data of a user's friends in the format requested using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1.1/user/-/friends.json'
+        Scopes: ['social']
+        """
+        return await self._aget(_GET_FRIENDS_URL)
+
+    async def aget_friends_leaderboard(self):
+        """Get Friends Leaderboard.
+
+        Returns data of a user's friends in the format requested using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1.1/user/-/leaderboard/friends.json'
+        Scopes: ['social']
+        """
+        return await self._aget(_GET_FRIENDS_LEADERBOARD_URL)
@@ -0,0 +1,312 @@
+"""Autogenerated methods for the Heart Rate Intraday Time Series endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_HEART_BY_DATE_RANGE_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/heart/date/{date}/{end-date}/{detail-level}.json"
+)
+_GET_HEART_BY_DATE_RANGE_TIMESTAMP_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/heart/date/{date}/{end-date}/{detail-level}/time/{start-time}/{end-time}.json"
+)
+_GET_HEART_BY_DATE_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json"
+)
+_GET_HEART_BY_DATE_TIMESTAMP_INTRADAY_URL = utils.UrlTemplate(
+    "/1/user/-/activities/heart/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json"
+)
+
+
+class HeartRateIntradayTimeSeriesApi(BaseApi):
+    """Methods for the Heart Rate Intraday Time Series endpoints."""
+
+    def get_heart_by_date_range_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1sec", "1min", "5min", "15min"] = "1min",
+    ):
+        """Get Heart Rate Intraday Time Series.
+
+        Returns the intraday time series for a given resource in the format requested. If your application has the appropriate access, your calls to a time series endpoint for a specific day (by using start and end dates on the same day or a period of 1d), the response will include extended intraday values with a one-minute detail level for that day. Unlike other time series calls that allow fetching data of other users, intraday data is available only for and to the authorized user.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/{end-date}/{detail-level}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date in the format of yyyy-MM-dd or today.
+
+        detail_level : Literal['1sec', '1min', '5min', '15min']
+                The number of data points to include either 1sec, 1min, 5min or 15min.
+        """
+        return self._get(
+            _GET_HEART_BY_DATE_RANGE_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "end-date": utils.format_date(end_date),
+                "detail-level": detail_level,
+            },
+        )
+
+    def get_heart_by_date_range_timestamp_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        detail_level: Literal["1sec", "1min", "5min", "15min"] = "1min",
+    ):
+        """Get Heart Rate Intraday Time Series.
+
+        Returns the intraday time series for a given resource in the format requested. If your application has the appropriate access, your calls to a time series endpoint for a specific day (by using start and end dates on the same day or a period of 1d), the response will include extended intraday values with a one-minute detail level for that day. Unlike other time series calls that allow fetching data of other users, intraday data is available only for and to the authorized user.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/{end-date}/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date in the format of yyyy-MM-dd or today.
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format of HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end time of the period in the format of HH:mm.
+
+        detail_level : Literal['1sec', '1min', '5min', '15min']
+                The number of data points to include either 1sec, 1min, 5min or 15min.
+        """
+        return self._get(
+            _GET_HEART_BY_DATE_RANGE_TIMESTAMP_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "end-date": utils.format_date(end_date),
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+                "detail-level": detail_level,
+            },
+        )
+
+    def get_heart_by_date_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1sec", "1min", "5min", "15min"] = "1min",
+    ):
+        """Get Heart Rate Intraday Time Series.
+
+        Returns the intraday time series for a given resource in the format requested. If your application has the appropriate access, your calls to a time series endpoint for a specific day (by using start and end dates on the same day or a period of 1d), the response will include extended intraday values with a one-minute detail level for that day. Unlike other time series calls that allow fetching data of other users, intraday data is available only for and to the authorized user.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        detail_level : Literal['1sec', '1min', '5min', '15min']
+                The number of data points to include either 1sec, 1min, 5min or 15min.
+        """
+        return self._get(
+            _GET_HEART_BY_DATE_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "detail-level": detail_level,
+            },
+        )
+
+    def get_heart_by_date_timestamp_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        detail_level: Literal["1sec", "1min", "5min", "15min"] = "1min",
+    ):
+        """Get Heart Rate Intraday Time Series.
+
+        Returns the intraday time series for a given resource in the format requested. If your application has the appropriate access, your calls to a time series endpoint for a specific day (by using start and end dates on the same day or a period of 1d), the response will include extended intraday values with a one-minute detail level for that day. Unlike other time series calls that allow fetching data of other users, intraday data is available only for and to the authorized user.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format of HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end time of the period in the format of HH:mm.
+
+        detail_level : Literal['1sec', '1min', '5min', '15min']
+                The number of data points to include either 1sec, 1min, 5min or 15min.
+        """
+        return self._get(
+            _GET_HEART_BY_DATE_TIMESTAMP_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+                "detail-level": detail_level,
+            },
+        )
+
+
+class AsyncHeartRateIntradayTimeSeriesApi(BaseApi):
+    """Async methods for the Heart Rate Intraday Time Series endpoints."""
+
+    async def aget_heart_by_date_range_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1sec", "1min", "5min", "15min"] = "1min",
+    ):
+        """Get Heart Rate Intraday Time Series.
+
+        Returns the intraday time series for a given resource in the format requested. If your application has the appropriate access, your calls to a time series endpoint for a specific day (by using start and end dates on the same day or a period of 1d), the response will include extended intraday values with a one-minute detail level for that day. Unlike other time series calls that allow fetching data of other users, intraday data is available only for and to the authorized user.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/{end-date}/{detail-level}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date in the format of yyyy-MM-dd or today.
+
+        detail_level : Literal['1sec', '1min', '5min', '15min']
+                The number of data points to include either 1sec, 1min, 5min or 15min.
+        """
+        return await self._aget(
+            _GET_HEART_BY_DATE_RANGE_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "end-date": utils.format_date(end_date),
+                "detail-level": detail_level,
+            },
+        )
+
+    async def aget_heart_by_date_range_timestamp_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        detail_level: Literal["1sec", "1min", "5min", "15min"] = "1min",
+    ):
+        """Get Heart Rate Intraday Time Series.
+
+        Returns the intraday time series for a given resource in the format requested. If your application has the appropriate access, your calls to a time series endpoint for a specific day (by using start and end dates on the same day or a period of 1d), the response will include extended intraday values with a one-minute detail level for that day. Unlike other time series calls that allow fetching data of other users, intraday data is available only for and to the authorized user.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/{end-date}/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date in the format of yyyy-MM-dd or today.
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format of HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end time of the period in the format of HH:mm.
+
+        detail_level : Literal['1sec', '1min', '5min', '15min']
+                The number of data points to include either 1sec, 1min, 5min or 15min.
+        """
+        return await self._aget(
+            _GET_HEART_BY_DATE_RANGE_TIMESTAMP_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "end-date": utils.format_date(end_date),
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+                "detail-level": detail_level,
+            },
+        )
+
+    async def aget_heart_by_date_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        detail_level: Literal["1sec", "1min", "5min", "15min"] = "1min",
+    ):
+        """Get Heart Rate Intraday Time Series.
+
+        Returns the intraday time series for a given resource in the format requested. If your application has the appropriate access, your calls to a time series endpoint for a specific day (by using start and end dates on the same day or a period of 1d), the response will include extended intraday values with a one-minute detail level for that day. Unlike other time series calls that allow fetching data of other users, intraday data is available only for and to the authorized user.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        detail_level : Literal['1sec', '1min', '5min', '15min']
+                The number of data points to include either 1sec, 1min, 5min or 15min.
+        """
+        return await self._aget(
+            _GET_HEART_BY_DATE_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "detail-level": detail_level,
+            },
+        )
+
+    async def aget_heart_by_date_timestamp_intraday(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        start_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        end_time: Union[datetime.time, Annotated[str, "HH:mm"]],
+        detail_level: Literal["1sec", "1min", "5min", "15min"] = "1min",
+    ):
+        """Get Heart Rate Intraday Time Series.
+
+        Returns the intraday time series for a given resource in the format requested. If your application has the appropriate access, your calls to a time series endpoint for a specific day (by using start and end dates on the same day or a period of 1d), the response will include extended intraday values with a one-minute detail level for that day. Unlike other time series calls that allow fetching data of other users, intraday data is available only for and to the authorized user.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        start_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The start of the period in the format of HH:mm.
+
+        end_time : Union[datetime.time, Annotated[str, 'HH:mm']]
+                The end time of the period in the format of HH:mm.
+
+        detail_level : Literal['1sec', '1min', '5min', '15min']
+                The number of data points to include either 1sec, 1min, 5min or 15min.
+        """
+        return await self._aget(
+            _GET_HEART_BY_DATE_TIMESTAMP_INTRADAY_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "start-time": utils.format_time(start_time),
+                "end-time": utils.format_time(end_time),
+                "detail-level": detail_level,
+            },
+        )
@@ -0,0 +1,128 @@
+"""Autogenerated methods for the Heart Rate Time Series endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_HEART_BY_DATE_PERIOD_URL = utils.UrlTemplate(
+    "/1/user/-/activities/heart/date/{date}/{period}.json"
+)
+_GET_HEART_BY_DATE_RANGE_URL = utils.UrlTemplate(
+    "/1/user/-/activities/heart/date/{base-date}/{end-date}.json"
+)
+
+
+class HeartRateTimeSeriesApi(BaseApi):
+    """Methods for the Heart Rate Time Series endpoints."""
+
+    def get_heart_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m"],
+    ):
+        """Get Heart Rate Time Series.
+
+        Returns the time series data in the specified range for a given resource in the format requested using units in the unit systems that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the period specified in the format yyyy-MM-dd or today.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m']
+                The range of which data will be returned. Options are 1d, 7d, 30d, 1w, and 1m.
+        """
+        return self._get(
+            _GET_HEART_BY_DATE_PERIOD_URL,
+            param_kwargs={"date": utils.format_date(date), "period": period},
+        )
+
+    def get_heart_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Heart Rate Time Series.
+
+        Returns the time series data in the specified range for a given resource in the format requested using units in the unit systems that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/heart/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in  the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+        """
+        return self._get(
+            _GET_HEART_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncHeartRateTimeSeriesApi(BaseApi):
+    """Async methods for the Heart Rate Time Series endpoints."""
+
+    async def aget_heart_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m"],
+    ):
+        """Get Heart Rate Time Series.
+
+        Returns the time series data in the specified range for a given resource in the format requested using units in the unit systems that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/heart/date/{date}/{period}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the period specified in the format yyyy-MM-dd or today.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m']
+                The range of which data will be returned. Options are 1d, 7d, 30d, 1w, and 1m.
+        """
+        return await self._aget(
+            _GET_HEART_BY_DATE_PERIOD_URL,
+            param_kwargs={"date": utils.format_date(date), "period": period},
+        )
+
+    async def aget_heart_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Heart Rate Time Series.
+
+        Returns the time series data in the specified range for a given resource in the format requested using units in the unit systems that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/activities/heart/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in  the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+        """
+        return await self._aget(
+            _GET_HEART_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
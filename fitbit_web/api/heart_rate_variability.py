@@ -0,0 +1,118 @@
+"""Autogenerated methods for the Heart Rate Variability endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_HRV_SUMMARY_DATE_URL = utils.UrlTemplate("/1/user/-/hrv/date/{date}.json")
+_GET_HRV_SUMMARY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/hrv/date/{startDate}/{endDate}.json"
+)
+
+
+class HeartRateVariabilityApi(BaseApi):
+    """Methods for the Heart Rate Variability endpoints."""
+
+    def get_hrv_summary_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get HRV Summary by Date.
+
+        This endpoint returns the Heart Rate Variability (HRV) data for a single date. HRV data applies specifically to a user’s “main sleep,” which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/hrv/date/{date}.json'
+        Scopes: ['heartrate']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_HRV_SUMMARY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    def get_hrv_summary_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get HRV Summary by Interval.
+
+        This endpoint returns the Heart Rate Variability (HRV) data for a date range. HRV data applies specifically to a user’s “main sleep,” which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/hrv/date/{startDate}/{endDate}.json'
+        Scopes: ['heartrate']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_HRV_SUMMARY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncHeartRateVariabilityApi(BaseApi):
+    """Async methods for the Heart Rate Variability endpoints."""
+
+    async def aget_hrv_summary_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get HRV Summary by Date.
+
+        This endpoint returns the Heart Rate Variability (HRV) data for a single date. HRV data applies specifically to a user’s “main sleep,” which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/hrv/date/{date}.json'
+        Scopes: ['heartrate']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_HRV_SUMMARY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    async def aget_hrv_summary_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get HRV Summary by Interval.
+
+        This endpoint returns the Heart Rate Variability (HRV) data for a date range. HRV data applies specifically to a user’s “main sleep,” which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/hrv/date/{startDate}/{endDate}.json'
+        Scopes: ['heartrate']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_HRV_SUMMARY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
@@ -0,0 +1,120 @@
+"""Autogenerated methods for the Heart Rate Variability Intraday endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_HRV_INTRADAY_BY_DATE_URL = utils.UrlTemplate("/1/user/-/hrv/date/{date}/all.json")
+_GET_HRV_INTRADAY_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/hrv/date/{startDate}/{endDate}/all.json"
+)
+
+
+class HeartRateVariabilityIntradayApi(BaseApi):
+    """Methods for the Heart Rate Variability Intraday endpoints."""
+
+    def get_hrv_intraday_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get HRV Intraday by Date.
+
+        This endpoint returns the Heart Rate Variability (HRV) intraday data for a single date. HRV data applies specifically to a user’s “main sleep,” which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/hrv/date/{date}/all.json'
+        Scopes: ['heartrate']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_HRV_INTRADAY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    def get_hrv_intraday_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get HRV Intraday by Interval.
+
+        This endpoint returns the Heart Rate Variability (HRV) intraday data for a single date. HRV data applies specifically to a user’s “main sleep,” which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/hrv/date/{startDate}/{endDate}/all.json'
+        Scopes: ['heartrate']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_HRV_INTRADAY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncHeartRateVariabilityIntradayApi(BaseApi):
+    """Async methods for the Heart Rate Variability Intraday endpoints."""
+
+    async def aget_hrv_intraday_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get HRV Intraday by Date.
+
+        This endpoint returns the Heart Rate Variability (HRV) intraday data for a single date. HRV data applies specifically to a user’s “main sleep,” which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/hrv/date/{date}/all.json'
+        Scopes: ['heartrate']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_HRV_INTRADAY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    async def aget_hrv_intraday_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get HRV Intraday by Interval.
+
+        This endpoint returns the Heart Rate Variability (HRV) intraday data for a single date. HRV data applies specifically to a user’s “main sleep,” which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/hrv/date/{startDate}/{endDate}/all.json'
+        Scopes: ['heartrate']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_HRV_INTRADAY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
@@ -0,0 +1,2808 @@
+"""Autogenerated metadata of the endpoints of the Fitbit Web API."""
+
+import dataclasses
+from types import MappingProxyType
+from typing import Any, Literal, Mapping
+
+
+@dataclasses.dataclass(frozen=True)
+class Parameter:
+    """A parameter of an endpoint.
+
+    Attributes
+    ----------
+    name : str
+        The name of the parameter in the API (e.g. `base-date`).
+    argument : str
+        The name of the argument of the methods (e.g. `base_date`).
+    location : Literal["path", "query"]
+        Where the parameter is sent.
+    type : Literal["boolean", "integer", "string"] | None
+        The type of the parameter.
+    formats : tuple[Literal["date", "time", "timestamp"], ...]
+        The formats accepted by the parameter, if any.
+    enum : tuple[str, ...] | None
+        The allowed values, if restricted.
+    required : bool
+        Whether the parameter is required.
+    default : Any
+        The default value.
+    """
+
+    name: str
+    argument: str
+    location: Literal["path", "query"]
+    type: Literal["boolean", "integer", "string"] | None
+    formats: tuple[Literal["date", "time", "timestamp"], ...]
+    enum: tuple[str, ...] | None
+    required: bool
+    default: Any
+
+
+@dataclasses.dataclass(frozen=True)
+class Endpoint:
+    """The metadata of an endpoint.
+
+    Attributes
+    ----------
+    name : str
+        The name of the sync method.
+    path : str
+        The path template of the endpoint.
+    tag : str
+        The tag of the endpoint in the spec.
+    module : str
+        The module of `fitbit_web.api` containing the methods.
+    scopes : tuple[str, ...]
+        The scopes listed for the endpoint.
+    parameters : tuple[Parameter, ...]
+        The path and query parameters.
+    max_range_days : int | None
+        The maximum span of a date range endpoint, if known.
+    """
+
+    name: str
+    path: str
+    tag: str
+    module: str
+    scopes: tuple[str, ...]
+    parameters: tuple[Parameter, ...]
+    max_range_days: int | None
+
+    def parameter(self, name: str) -> Parameter:
+        """Get a parameter by its API or argument name."""
+        for parameter in self.parameters:
+            if name in (parameter.name, parameter.argument):
+                return parameter
+        raise KeyError(name)
+
+
+_ENDPOINTS = {
+    "get_azm_by_date_intraday": Endpoint(
+        name="get_azm_by_date_intraday",
+        path="/1/user/-/activities/active-zone-minutes/date/{date}/1d/{detail-level}.json",
+        tag="Active Zone Minutes Intraday Time Series",
+        module="active_zone_minutes_intraday_time_series",
+        scopes=("activity",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1min", "5min", "15min"),
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_azm_by_date_time_series_intraday": Endpoint(
+        name="get_azm_by_date_time_series_intraday",
+        path="/1/user/-/activities/active-zone-minutes/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json",
+        tag="Active Zone Minutes Intraday Time Series",
+        module="active_zone_minutes_intraday_time_series",
+        scopes=("activity",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1min", "5min", "15min"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="start-time",
+                argument="start_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-time",
+                argument="end_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_azm_by_interval_intraday": Endpoint(
+        name="get_azm_by_interval_intraday",
+        path="/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}/{detail-level}.json",
+        tag="Active Zone Minutes Intraday Time Series",
+        module="active_zone_minutes_intraday_time_series",
+        scopes=("activity",),
+        parameters=(
+            Parameter(
+                name="start-date",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1min", "5min", "15min"),
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_azm_by_interval_time_series_intraday": Endpoint(
+        name="get_azm_by_interval_time_series_intraday",
+        path="/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}/time/{start-time}/{end-time}.json",
+        tag="Active Zone Minutes Intraday Time Series",
+        module="active_zone_minutes_intraday_time_series",
+        scopes=("activity",),
+        parameters=(
+            Parameter(
+                name="start-date",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1min", "5min", "15min"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="start-time",
+                argument="start_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-time",
+                argument="end_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_azm_time_series_by_date": Endpoint(
+        name="get_azm_time_series_by_date",
+        path="/1/user/-/activities/active-zone-minutes/date/{date}/{period}.json",
+        tag="Active Zone Minutes Time Series",
+        module="active_zone_minutes_time_series",
+        scopes=("activity",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y"),
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_azm_time_series_by_interval": Endpoint(
+        name="get_azm_time_series_by_interval",
+        path="/1/user/-/activities/active-zone-minutes/date/{start-date}/{end-date}.json",
+        tag="Active Zone Minutes Time Series",
+        module="active_zone_minutes_time_series",
+        scopes=("activity",),
+        parameters=(
+            Parameter(
+                name="start-date",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=1095,
+    ),
+    "get_activities_by_date": Endpoint(
+        name="get_activities_by_date",
+        path="/1/user/-/activities/date/{date}.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_log": Endpoint(
+        name="get_activities_log",
+        path="/1/user/-/activities.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_activities_log_list": Endpoint(
+        name="get_activities_log_list",
+        path="/1/user/-/activities/list.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="sort",
+                argument="sort",
+                location="query",
+                type="string",
+                formats=(),
+                enum=("asc", "desc"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="limit",
+                argument="limit",
+                location="query",
+                type="integer",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="beforeDate",
+                argument="before_date",
+                location="query",
+                type="string",
+                formats=("date", "timestamp"),
+                enum=None,
+                required=False,
+                default=None,
+            ),
+            Parameter(
+                name="afterDate",
+                argument="after_date",
+                location="query",
+                type="string",
+                formats=("date", "timestamp"),
+                enum=None,
+                required=False,
+                default=None,
+            ),
+            Parameter(
+                name="offset",
+                argument="offset",
+                location="query",
+                type="integer",
+                formats=(),
+                enum=None,
+                required=True,
+                default="0",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_tcx": Endpoint(
+        name="get_activities_tcx",
+        path="/1/user/-/activities/{log-id}.tcx",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="log-id",
+                argument="log_id",
+                location="path",
+                type="string",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="includePartialTCX",
+                argument="include_partial_tcx",
+                location="query",
+                type="boolean",
+                formats=(),
+                enum=None,
+                required=False,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_types": Endpoint(
+        name="get_activities_types",
+        path="/1/activities.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_activities_type_detail": Endpoint(
+        name="get_activities_type_detail",
+        path="/1/activities/{activity-id}.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="activity-id",
+                argument="activity_id",
+                location="path",
+                type="string",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_frequent_activities": Endpoint(
+        name="get_frequent_activities",
+        path="/1/user/-/activities/frequent.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_recent_activities": Endpoint(
+        name="get_recent_activities",
+        path="/1/user/-/activities/recent.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_favorite_activities": Endpoint(
+        name="get_favorite_activities",
+        path="/1/user/-/activities/favorite.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_activities_goals": Endpoint(
+        name="get_activities_goals",
+        path="/1/user/-/activities/goals/{period}.json",
+        tag="Activity",
+        module="activity",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("daily", "weekly"),
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_resource_by_date_range": Endpoint(
+        name="get_activities_resource_by_date_range",
+        path="/1/user/-/activities/{resource-path}/date/{base-date}/{end-date}.json",
+        tag="Activity Time Series",
+        module="activity_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=(
+                    "calories",
+                    "caloriesBMR",
+                    "steps",
+                    "distance",
+                    "floors",
+                    "elevation",
+                    "minutesSedentary",
+                    "minutesLightlyActive",
+                    "minutesFairlyActive",
+                    "minutesVeryActive",
+                    "activityCalories",
+                ),
+                required=True,
+                default="steps",
+            ),
+        ),
+        max_range_days=1095,
+    ),
+    "get_activities_tracker_resource_by_date_range": Endpoint(
+        name="get_activities_tracker_resource_by_date_range",
+        path="/1/user/-/activities/tracker/{resource-path}/date/{base-date}/{end-date}.json",
+        tag="Activity Time Series",
+        module="activity_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=(
+                    "calories",
+                    "caloriesBMR",
+                    "steps",
+                    "distance",
+                    "floors",
+                    "elevation",
+                    "minutesSedentary",
+                    "minutesLightlyActive",
+                    "minutesFairlyActive",
+                    "minutesVeryActive",
+                    "activityCalories",
+                ),
+                required=True,
+                default="steps",
+            ),
+        ),
+        max_range_days=1095,
+    ),
+    "get_activities_resource_by_date_period": Endpoint(
+        name="get_activities_resource_by_date_period",
+        path="/1/user/-/activities/{resource-path}/date/{date}/{period}.json",
+        tag="Activity Time Series",
+        module="activity_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=(
+                    "calories",
+                    "caloriesBMR",
+                    "steps",
+                    "distance",
+                    "floors",
+                    "elevation",
+                    "minutesSedentary",
+                    "minutesLightlyActive",
+                    "minutesFairlyActive",
+                    "minutesVeryActive",
+                    "activityCalories",
+                ),
+                required=True,
+                default="steps",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_tracker_resource_by_date_period": Endpoint(
+        name="get_activities_tracker_resource_by_date_period",
+        path="/1/user/-/activities/tracker/{resource-path}/date/{date}/{period}.json",
+        tag="Activity Time Series",
+        module="activity_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=(
+                    "calories",
+                    "caloriesBMR",
+                    "steps",
+                    "distance",
+                    "floors",
+                    "elevation",
+                    "minutesSedentary",
+                    "minutesLightlyActive",
+                    "minutesFairlyActive",
+                    "minutesVeryActive",
+                    "activityCalories",
+                ),
+                required=True,
+                default="steps",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_resource_by_date_range_intraday": Endpoint(
+        name="get_activities_resource_by_date_range_intraday",
+        path="/1/user/-/activities/{resource-path}/date/{base-date}/{end-date}/{detail-level}.json",
+        tag="Activity Intraday Time Series",
+        module="activity_intraday_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("calories", "steps", "distance", "floors", "elevation"),
+                required=True,
+                default="steps",
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1min", "15min"),
+                required=True,
+                default="1min",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_resource_by_date_intraday": Endpoint(
+        name="get_activities_resource_by_date_intraday",
+        path="/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}.json",
+        tag="Activity Intraday Time Series",
+        module="activity_intraday_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("calories", "steps", "distance", "floors", "elevation"),
+                required=True,
+                default="steps",
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1min", "15min"),
+                required=True,
+                default="1min",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_resource_by_date_range_time_series_intraday": Endpoint(
+        name="get_activities_resource_by_date_range_time_series_intraday",
+        path="/1/user/-/activities/{resource-path}/date/{date}/{end-date}/{detail-level}/time/{start-time}/{end-time}.json",
+        tag="Activity Intraday Time Series",
+        module="activity_intraday_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="start-time",
+                argument="start_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-time",
+                argument="end_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("calories", "steps", "distance", "floors", "elevation"),
+                required=True,
+                default="steps",
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1min", "15min"),
+                required=True,
+                default="1min",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_activities_resource_by_date_time_series_intraday": Endpoint(
+        name="get_activities_resource_by_date_time_series_intraday",
+        path="/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json",
+        tag="Activity Intraday Time Series",
+        module="activity_intraday_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="start-time",
+                argument="start_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-time",
+                argument="end_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("calories", "steps", "distance", "floors", "elevation"),
+                required=True,
+                default="steps",
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1min", "15min"),
+                required=True,
+                default="1min",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_body_fat_by_date": Endpoint(
+        name="get_body_fat_by_date",
+        path="/1/user/-/body/log/fat/date/{date}.json",
+        tag="Body",
+        module="body",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_body_fat_by_date_period": Endpoint(
+        name="get_body_fat_by_date_period",
+        path="/1/user/-/body/log/fat/date/{date}/{period}.json",
+        tag="Body",
+        module="body",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"),
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_body_fat_by_date_range": Endpoint(
+        name="get_body_fat_by_date_range",
+        path="/1/user/-/body/log/fat/date/{base-date}/{end-date}.json",
+        tag="Body",
+        module="body",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=31,
+    ),
+    "get_body_goals": Endpoint(
+        name="get_body_goals",
+        path="/1/user/-/body/log/{goal-type}/goal.json",
+        tag="Body",
+        module="body",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="goal-type",
+                argument="goal_type",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("weight", "fat"),
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_weight_by_date": Endpoint(
+        name="get_weight_by_date",
+        path="/1/user/-/body/log/weight/date/{date}.json",
+        tag="Body",
+        module="body",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_weight_by_date_period": Endpoint(
+        name="get_weight_by_date_period",
+        path="/1/user/-/body/log/weight/date/{date}/{period}.json",
+        tag="Body",
+        module="body",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"),
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_weight_by_date_range": Endpoint(
+        name="get_weight_by_date_range",
+        path="/1/user/-/body/log/weight/date/{base-date}/{end-date}.json",
+        tag="Body",
+        module="body",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=31,
+    ),
+    "get_body_resource_by_date_period": Endpoint(
+        name="get_body_resource_by_date_period",
+        path="/1/user/-/body/{resource-path}/date/{date}/{period}.json",
+        tag="Body Time Series",
+        module="body_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("bmi", "fat", "weight"),
+                required=True,
+                default="weight",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_body_resource_by_date_range": Endpoint(
+        name="get_body_resource_by_date_range",
+        path="/1/user/-/body/{resource-path}/date/{base-date}/{end-date}.json",
+        tag="Body Time Series",
+        module="body_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("bmi", "fat", "weight"),
+                required=True,
+                default="weight",
+            ),
+        ),
+        max_range_days=1095,
+    ),
+    "get_breathing_rate_summary_by_date": Endpoint(
+        name="get_breathing_rate_summary_by_date",
+        path="/1/user/-/br/date/{date}.json",
+        tag="Breathing Rate",
+        module="breathing_rate",
+        scopes=("respiratory_rate",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_breathing_rate_summary_by_interval": Endpoint(
+        name="get_breathing_rate_summary_by_interval",
+        path="/1/user/-/br/date/{startDate}/{endDate}.json",
+        tag="Breathing Rate",
+        module="breathing_rate",
+        scopes=("respiratory_rate",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=30,
+    ),
+    "get_breathing_rate_intraday_by_date": Endpoint(
+        name="get_breathing_rate_intraday_by_date",
+        path="/1/user/-/br/date/{date}/all.json",
+        tag="Breathing Rate Intraday",
+        module="breathing_rate_intraday",
+        scopes=("respiratory_rate",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_breathing_rate_intraday_by_interval": Endpoint(
+        name="get_breathing_rate_intraday_by_interval",
+        path="/1/user/-/br/date/{startDate}/{endDate}/all.json",
+        tag="Breathing Rate Intraday",
+        module="breathing_rate_intraday",
+        scopes=("respiratory_rate",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=30,
+    ),
+    "get_vo2_max_summary_by_date": Endpoint(
+        name="get_vo2_max_summary_by_date",
+        path="/1/user/-/cardioscore/date/{date}.json",
+        tag="Cardio Fitness Score (VO2 Max)",
+        module="cardio_fitness_score_vo2_max",
+        scopes=("cardio_fitness",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_vo2_max_summary_by_interval": Endpoint(
+        name="get_vo2_max_summary_by_interval",
+        path="/1/user/-/cardioscore/date/{startDate}/{endDate}.json",
+        tag="Cardio Fitness Score (VO2 Max)",
+        module="cardio_fitness_score_vo2_max",
+        scopes=("cardio_fitness",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=30,
+    ),
+    "get_devices": Endpoint(
+        name="get_devices",
+        path="/1/user/-/devices.json",
+        tag="Devices",
+        module="devices",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_alarms": Endpoint(
+        name="get_alarms",
+        path="/1/user/-/devices/tracker/{tracker-id}/alarms.json",
+        tag="Devices",
+        module="devices",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="tracker-id",
+                argument="tracker_id",
+                location="path",
+                type="integer",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_ecg_log_list": Endpoint(
+        name="get_ecg_log_list",
+        path="/1/user/-/ecg/list.json",
+        tag="Electrocardiogram",
+        module="electrocardiogram",
+        scopes=("electrocardiogram",),
+        parameters=(
+            Parameter(
+                name="sort",
+                argument="sort",
+                location="query",
+                type="string",
+                formats=(),
+                enum=("asc", "desc"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="limit",
+                argument="limit",
+                location="query",
+                type="integer",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="beforeDate",
+                argument="before_date",
+                location="query",
+                type="string",
+                formats=("date", "timestamp"),
+                enum=None,
+                required=False,
+                default=None,
+            ),
+            Parameter(
+                name="afterDate",
+                argument="after_date",
+                location="query",
+                type="string",
+                formats=("date", "timestamp"),
+                enum=None,
+                required=False,
+                default=None,
+            ),
+            Parameter(
+                name="offset",
+                argument="offset",
+                location="query",
+                type="integer",
+                formats=(),
+                enum=None,
+                required=True,
+                default="0",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_friends": Endpoint(
+        name="get_friends",
+        path="/1.1/user/-/friends.json",
+        tag="Friends",
+        module="friends",
+        scopes=("social",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_friends_leaderboard": Endpoint(
+        name="get_friends_leaderboard",
+        path="/1.1/user/-/leaderboard/friends.json",
+        tag="Friends",
+        module="friends",
+        scopes=("social",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_heart_by_date_period": Endpoint(
+        name="get_heart_by_date_period",
+        path="/1/user/-/activities/heart/date/{date}/{period}.json",
+        tag="Heart Rate Time Series",
+        module="heart_rate_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1d", "7d", "30d", "1w", "1m"),
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_heart_by_date_range": Endpoint(
+        name="get_heart_by_date_range",
+        path="/1/user/-/activities/heart/date/{base-date}/{end-date}.json",
+        tag="Heart Rate Time Series",
+        module="heart_rate_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=365,
+    ),
+    "get_heart_by_date_range_intraday": Endpoint(
+        name="get_heart_by_date_range_intraday",
+        path="/1/user/-/activities/heart/date/{date}/{end-date}/{detail-level}.json",
+        tag="Heart Rate Intraday Time Series",
+        module="heart_rate_intraday_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1sec", "1min", "5min", "15min"),
+                required=True,
+                default="1min",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_heart_by_date_range_timestamp_intraday": Endpoint(
+        name="get_heart_by_date_range_timestamp_intraday",
+        path="/1/user/-/activities/heart/date/{date}/{end-date}/{detail-level}/time/{start-time}/{end-time}.json",
+        tag="Heart Rate Intraday Time Series",
+        module="heart_rate_intraday_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="start-time",
+                argument="start_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-time",
+                argument="end_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1sec", "1min", "5min", "15min"),
+                required=True,
+                default="1min",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_heart_by_date_intraday": Endpoint(
+        name="get_heart_by_date_intraday",
+        path="/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json",
+        tag="Heart Rate Intraday Time Series",
+        module="heart_rate_intraday_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1sec", "1min", "5min", "15min"),
+                required=True,
+                default="1min",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_heart_by_date_timestamp_intraday": Endpoint(
+        name="get_heart_by_date_timestamp_intraday",
+        path="/1/user/-/activities/heart/date/{date}/1d/{detail-level}/time/{start-time}/{end-time}.json",
+        tag="Heart Rate Intraday Time Series",
+        module="heart_rate_intraday_time_series",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="start-time",
+                argument="start_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-time",
+                argument="end_time",
+                location="path",
+                type="string",
+                formats=("time",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="detail-level",
+                argument="detail_level",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1sec", "1min", "5min", "15min"),
+                required=True,
+                default="1min",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_hrv_summary_date": Endpoint(
+        name="get_hrv_summary_date",
+        path="/1/user/-/hrv/date/{date}.json",
+        tag="Heart Rate Variability",
+        module="heart_rate_variability",
+        scopes=("heartrate",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_hrv_summary_interval": Endpoint(
+        name="get_hrv_summary_interval",
+        path="/1/user/-/hrv/date/{startDate}/{endDate}.json",
+        tag="Heart Rate Variability",
+        module="heart_rate_variability",
+        scopes=("heartrate",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=30,
+    ),
+    "get_hrv_intraday_by_date": Endpoint(
+        name="get_hrv_intraday_by_date",
+        path="/1/user/-/hrv/date/{date}/all.json",
+        tag="Heart Rate Variability Intraday",
+        module="heart_rate_variability_intraday",
+        scopes=("heartrate",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_hrv_intraday_by_interval": Endpoint(
+        name="get_hrv_intraday_by_interval",
+        path="/1/user/-/hrv/date/{startDate}/{endDate}/all.json",
+        tag="Heart Rate Variability Intraday",
+        module="heart_rate_variability_intraday",
+        scopes=("heartrate",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=30,
+    ),
+    "get_foods_locales": Endpoint(
+        name="get_foods_locales",
+        path="/1/foods/locales.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_foods_goal": Endpoint(
+        name="get_foods_goal",
+        path="/1/user/-/foods/log/goal.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_foods_by_date": Endpoint(
+        name="get_foods_by_date",
+        path="/1/user/-/foods/log/date/{date}.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_water_by_date": Endpoint(
+        name="get_water_by_date",
+        path="/1/user/-/foods/log/water/date/{date}.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_water_goal": Endpoint(
+        name="get_water_goal",
+        path="/1/user/-/foods/log/water/goal.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_favorite_foods": Endpoint(
+        name="get_favorite_foods",
+        path="/1/user/-/foods/log/favorite.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_frequent_foods": Endpoint(
+        name="get_frequent_foods",
+        path="/1/user/-/foods/log/frequent.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_meals": Endpoint(
+        name="get_meals",
+        path="/1/user/-/meals.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_recent_foods": Endpoint(
+        name="get_recent_foods",
+        path="/1/user/-/foods/log/recent.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_foods_info": Endpoint(
+        name="get_foods_info",
+        path="/1/foods/{food-id}.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(
+            Parameter(
+                name="food-id",
+                argument="food_id",
+                location="path",
+                type="string",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_foods_units": Endpoint(
+        name="get_foods_units",
+        path="/1/foods/units.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_foods_list": Endpoint(
+        name="get_foods_list",
+        path="/1/foods/search.json",
+        tag="Nutrition",
+        module="nutrition",
+        scopes=("nutrition",),
+        parameters=(
+            Parameter(
+                name="query",
+                argument="query",
+                location="query",
+                type="string",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_foods_by_date_range": Endpoint(
+        name="get_foods_by_date_range",
+        path="/1/user/-/foods/log/{resource-path}/date/{base-date}/{end-date}.json",
+        tag="Nutrition Time Series",
+        module="nutrition_time_series",
+        scopes=("nutrition",),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("caloriesIn", "water"),
+                required=True,
+                default="caloriesIn",
+            ),
+        ),
+        max_range_days=1095,
+    ),
+    "get_foods_resource_by_date_period": Endpoint(
+        name="get_foods_resource_by_date_period",
+        path="/1/user/-/foods/log/{resource-path}/date/{date}/{period}.json",
+        tag="Nutrition Time Series",
+        module="nutrition_time_series",
+        scopes=("nutrition",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="period",
+                argument="period",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="resource-path",
+                argument="resource_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=("caloriesIn", "water"),
+                required=True,
+                default="caloriesIn",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_sleep_by_date": Endpoint(
+        name="get_sleep_by_date",
+        path="/1.2/user/-/sleep/date/{date}.json",
+        tag="Sleep",
+        module="sleep",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_sleep_by_date_range": Endpoint(
+        name="get_sleep_by_date_range",
+        path="/1.2/user/-/sleep/date/{base-date}/{end-date}.json",
+        tag="Sleep",
+        module="sleep",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="base-date",
+                argument="base_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="end-date",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=100,
+    ),
+    "get_sleep_list": Endpoint(
+        name="get_sleep_list",
+        path="/1.2/user/-/sleep/list.json",
+        tag="Sleep",
+        module="sleep",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="sort",
+                argument="sort",
+                location="query",
+                type="string",
+                formats=(),
+                enum=("asc", "desc"),
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="limit",
+                argument="limit",
+                location="query",
+                type="integer",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="beforeDate",
+                argument="before_date",
+                location="query",
+                type="string",
+                formats=("date", "timestamp"),
+                enum=None,
+                required=False,
+                default=None,
+            ),
+            Parameter(
+                name="afterDate",
+                argument="after_date",
+                location="query",
+                type="string",
+                formats=("date", "timestamp"),
+                enum=None,
+                required=False,
+                default=None,
+            ),
+            Parameter(
+                name="offset",
+                argument="offset",
+                location="query",
+                type="integer",
+                formats=(),
+                enum=None,
+                required=True,
+                default="0",
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_sleep_goal": Endpoint(
+        name="get_sleep_goal",
+        path="/1.2/user/-/sleep/goal.json",
+        tag="Sleep",
+        module="sleep",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_sp_o2_summary_by_date": Endpoint(
+        name="get_sp_o2_summary_by_date",
+        path="/1/user/-/spo2/date/{date}.json",
+        tag="SpO2",
+        module="spo2",
+        scopes=("oxygen_saturation",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_sp_o2_summary_by_interval": Endpoint(
+        name="get_sp_o2_summary_by_interval",
+        path="/1/user/-/spo2/date/{startDate}/{endDate}.json",
+        tag="SpO2",
+        module="spo2",
+        scopes=("oxygen_saturation",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_sp_o2_intraday_by_date": Endpoint(
+        name="get_sp_o2_intraday_by_date",
+        path="/1/user/-/spo2/date/{date}/all.json",
+        tag="SpO2 Intraday",
+        module="spo2_intraday",
+        scopes=("oxygen_saturation",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_sp_o2_intraday_by_interval": Endpoint(
+        name="get_sp_o2_intraday_by_interval",
+        path="/1/user/-/spo2/date/{startDate}/{endDate}/all.json",
+        tag="SpO2 Intraday",
+        module="spo2_intraday",
+        scopes=("oxygen_saturation",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=30,
+    ),
+    "get_subscriptions_list": Endpoint(
+        name="get_subscriptions_list",
+        path="/1/user/-/{collection-path}/apiSubscriptions.json",
+        tag="Subscriptions",
+        module="subscriptions",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(
+            Parameter(
+                name="collection-path",
+                argument="collection_path",
+                location="path",
+                type="string",
+                formats=(),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_temp_core_summary_by_date": Endpoint(
+        name="get_temp_core_summary_by_date",
+        path="/1/user/-/temp/core/date/{date}.json",
+        tag="Temperature",
+        module="temperature",
+        scopes=("temperature",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_temp_core_summary_by_interval": Endpoint(
+        name="get_temp_core_summary_by_interval",
+        path="/1/user/-/temp/core/date/{startDate}/{endDate}.json",
+        tag="Temperature",
+        module="temperature",
+        scopes=("temperature",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=30,
+    ),
+    "get_temp_skin_summary_date": Endpoint(
+        name="get_temp_skin_summary_date",
+        path="/1/user/-/temp/skin/date/{date}.json",
+        tag="Temperature",
+        module="temperature",
+        scopes=("temperature",),
+        parameters=(
+            Parameter(
+                name="date",
+                argument="date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=None,
+    ),
+    "get_temp_skin_summary_by_interval": Endpoint(
+        name="get_temp_skin_summary_by_interval",
+        path="/1/user/-/temp/skin/date/{startDate}/{endDate}.json",
+        tag="Temperature",
+        module="temperature",
+        scopes=("temperature",),
+        parameters=(
+            Parameter(
+                name="startDate",
+                argument="start_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+            Parameter(
+                name="endDate",
+                argument="end_date",
+                location="path",
+                type="string",
+                formats=("date",),
+                enum=None,
+                required=True,
+                default=None,
+            ),
+        ),
+        max_range_days=30,
+    ),
+    "get_badges": Endpoint(
+        name="get_badges",
+        path="/1/user/-/badges.json",
+        tag="User",
+        module="user",
+        scopes=(
+            "activity",
+            "heartrate",
+            "location",
+            "nutrition",
+            "profile",
+            "settings",
+            "sleep",
+            "social",
+            "weight",
+        ),
+        parameters=(),
+        max_range_days=None,
+    ),
+    "get_profile": Endpoint(
+        name="get_profile",
+        path="/1/user/-/profile.json",
+        tag="User",
+        module="user",
+        scopes=("location", "profile", "weight"),
+        parameters=(),
+        max_range_days=None,
+    ),
+}
+
+ENDPOINTS: Mapping[str, Endpoint] = MappingProxyType(
+    {
+        **_ENDPOINTS,
+        **{f"a{name}": endpoint for name, endpoint in _ENDPOINTS.items()},
+    }
+)
+"""The metadata of each endpoint, by the name of its sync and async methods."""
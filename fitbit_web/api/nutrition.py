@@ -0,0 +1,324 @@
+"""Autogenerated methods for the Nutrition endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_FOODS_LOCALES_URL = utils.UrlTemplate("/1/foods/locales.json")
+_GET_FOODS_GOAL_URL = utils.UrlTemplate("/1/user/-/foods/log/goal.json")
+_GET_FOODS_BY_DATE_URL = utils.UrlTemplate("/1/user/-/foods/log/date/{date}.json")
+_GET_WATER_BY_DATE_URL = utils.UrlTemplate("/1/user/-/foods/log/water/date/{date}.json")
+_GET_WATER_GOAL_URL = utils.UrlTemplate("/1/user/-/foods/log/water/goal.json")
+_GET_FAVORITE_FOODS_URL = utils.UrlTemplate("/1/user/-/foods/log/favorite.json")
+_GET_FREQUENT_FOODS_URL = utils.UrlTemplate("/1/user/-/foods/log/frequent.json")
+_GET_MEALS_URL = utils.UrlTemplate("/1/user/-/meals.json")
+_GET_RECENT_FOODS_URL = utils.UrlTemplate("/1/user/-/foods/log/recent.json")
+_GET_FOODS_INFO_URL = utils.UrlTemplate("/1/foods/{food-id}.json")
+_GET_FOODS_UNITS_URL = utils.UrlTemplate("/1/foods/units.json")
+_GET_FOODS_LIST_URL = utils.UrlTemplate("/1/foods/search.json")
+
+
+class NutritionApi(BaseApi):
+    """Methods for the Nutrition endpoints."""
+
+    def get_foods_locales(self):
+        """Get Food Locales.
+
+        Returns the food locales that the user may choose to search, log, and create food in.
+
+        Endpoint: '/1/foods/locales.json'
+        Scopes: ['nutrition']
+        """
+        return self._get(_GET_FOODS_LOCALES_URL)
+
+    def get_foods_goal(self):
+        """Get Food Goals.
+
+        Returns a user's current daily calorie consumption goal and/or foodPlan value in the format requested.
+
+        Endpoint: '/1/user/-/foods/log/goal.json'
+        Scopes: ['nutrition']
+        """
+        return self._get(_GET_FOODS_GOAL_URL)
+
+    def get_foods_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Food Logs.
+
+        Retreives a summary and list of a user's food log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/foods/log/date/{date}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+        """
+        return self._get(
+            _GET_FOODS_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    def get_water_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Water Logs.
+
+        Retreives a summary and list of a user's water log entries for a given day in the requested using units in the unit system that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/foods/log/water/date/{date}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+        """
+        return self._get(
+            _GET_WATER_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    def get_water_goal(self):
+        """Get Water Goal.
+
+        Retreives a summary and list of a user's water goal entries for a given day in the requested using units in the unit system that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/foods/log/water/goal.json'
+        Scopes: ['nutrition']
+        """
+        return self._get(_GET_WATER_GOAL_URL)
+
+    def get_favorite_foods(self):
+        """Get Favorite Foods.
+
+        Returns a list of a user's favorite foods in the format requested. A favorite food in the list provides a quick way to log the food via the Log Food endpoint.
+
+        Endpoint: '/1/user/-/foods/log/favorite.json'
+        Scopes: ['nutrition']
+        """
+        return self._get(_GET_FAVORITE_FOODS_URL)
+
+    def get_frequent_foods(self):
+        """Get Frequent Foods.
+
+        Returns a list of a user's frequent foods in the format requested. A frequent food in the list provides a quick way to log the food via the Log Food endpoint.
+
+        Endpoint: '/1/user/-/foods/log/frequent.json'
+        Scopes: ['nutrition']
+        """
+        return self._get(_GET_FREQUENT_FOODS_URL)
+
+    def get_meals(self):
+        """Get Meals.
+
+        Returns a list of meals created by user in the user's food log in the format requested. User creates and manages meals on the Food Log tab on the website.
+
+        Endpoint: '/1/user/-/meals.json'
+        Scopes: ['nutrition']
+        """
+        return self._get(_GET_MEALS_URL)
+
+    def get_recent_foods(self):
+        """Get Recent Foods.
+
+        Returns a list of a user's frequent foods in the format requested. A frequent food in the list provides a quick way to log the food via the Log Food endpoint.
+
+        Endpoint: '/1/user/-/foods/log/recent.json'
+        Scopes: ['nutrition']
+        """
+        return self._get(_GET_RECENT_FOODS_URL)
+
+    def get_foods_info(self, food_id: str):
+        """Get Food.
+
+        Returns the details of a specific food in the Fitbit food databases or a private food that an authorized user has entered in the format requested.
+
+        Endpoint: '/1/foods/{food-id}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        food_id : str
+                The ID of the food.
+        """
+        return self._get(_GET_FOODS_INFO_URL, param_kwargs={"food-id": food_id})
+
+    def get_foods_units(self):
+        """Get Food Units.
+
+        Returns a list of all valid Fitbit food units in the format requested.
+
+        Endpoint: '/1/foods/units.json'
+        Scopes: ['nutrition']
+        """
+        return self._get(_GET_FOODS_UNITS_URL)
+
+    def get_foods_list(self, query: str):
+        """Search Foods.
+
+        Returns a list of public foods from the Fitbit food database and private food the user created in the format requested.
+
+        Endpoint: '/1/foods/search.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        query : str
+                The URL-encoded search query.
+        """
+        return self._get(_GET_FOODS_LIST_URL, query_kwargs={"query": query})
+
+
+class AsyncNutritionApi(BaseApi):
+    """Async methods for the Nutrition endpoints."""
+
+    async def aget_foods_locales(self):
+        """Get Food Locales.
+
+        Returns the food locales that the user may choose to search, log, and create food in.
+
+        Endpoint: '/1/foods/locales.json'
+        Scopes: ['nutrition']
+        """
+        return await self._aget(_GET_FOODS_LOCALES_URL)
+
+    async def aget_foods_goal(self):
+        """Get Food Goals.
+
+        Returns a user's current daily calorie consumption goal and/or foodPlan value in the format requested.
+
+        Endpoint: '/1/user/-/foods/log/goal.json'
+        Scopes: ['nutrition']
+        """
+        return await self._aget(_GET_FOODS_GOAL_URL)
+
+    async def aget_foods_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Food Logs.
+
+        Retreives a summary and list of a user's food log entries for a given day in the format requested.
+
+        Endpoint: '/1/user/-/foods/log/date/{date}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+        """
+        return await self._aget(
+            _GET_FOODS_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    async def aget_water_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Water Logs.
+
+        Retreives a summary and list of a user's water log entries for a given day in the requested using units in the unit system that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/foods/log/water/date/{date}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+        """
+        return await self._aget(
+            _GET_WATER_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    async def aget_water_goal(self):
+        """Get Water Goal.
+
+        Retreives a summary and list of a user's water goal entries for a given day in the requested using units in the unit system that corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/foods/log/water/goal.json'
+        Scopes: ['nutrition']
+        """
+        return await self._aget(_GET_WATER_GOAL_URL)
+
+    async def aget_favorite_foods(self):
+        """Get Favorite Foods.
+
+        Returns a list of a user's favorite foods in the format requested. A favorite food in the list provides a quick way to log the food via the Log Food endpoint.
+
+        Endpoint: '/1/user/-/foods/log/favorite.json'
+        Scopes: ['nutrition']
+        """
+        return await self._aget(_GET_FAVORITE_FOODS_URL)
+
+    async def aget_frequent_foods(self):
+        """Get Frequent Foods.
+
+        Returns a list of a user's frequent foods in the format requested. A frequent food in the list provides a quick way to log the food via the Log Food endpoint.
+
+        Endpoint: '/1/user/-/foods/log/frequent.json'
+        Scopes: ['nutrition']
+        """
+        return await self._aget(_GET_FREQUENT_FOODS_URL)
+
+    async def aget_meals(self):
+        """Get Meals.
+
+        Returns a list of meals created by user in the user's food log in the format requested. User creates and manages meals on the Food Log tab on the website.
+
+        Endpoint: '/1/user/-/meals.json'
+        Scopes: ['nutrition']
+        """
+        return await self._aget(_GET_MEALS_URL)
+
+    async def aget_recent_foods(self):
+        """Get Recent Foods.
+
+        Returns a list of a user's frequent foods in the format requested. A frequent food in the list provides a quick way to log the food via the Log Food endpoint.
+
+        Endpoint: '/1/user/-/foods/log/recent.json'
+        Scopes: ['nutrition']
+        """
+        return await self._aget(_GET_RECENT_FOODS_URL)
+
+    async def aget_foods_info(self, food_id: str):
+        """Get Food.
+
+        Returns the details of a specific food in the Fitbit food databases or a private food that an authorized user has entered in the format requested.
+
+        Endpoint: '/1/foods/{food-id}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        food_id : str
+                The ID of the food.
+        """
+        return await self._aget(_GET_FOODS_INFO_URL, param_kwargs={"food-id": food_id})
+
+    async def aget_foods_units(self):
+        """Get Food Units.
+
+        Returns a list of all valid Fitbit food units in the format requested.
+
+        Endpoint: '/1/foods/units.json'
+        Scopes: ['nutrition']
+        """
+        return await self._aget(_GET_FOODS_UNITS_URL)
+
+    async def aget_foods_list(self, query: str):
+        """Search Foods.
+
+        Returns a list of public foods from the Fitbit food database and private food the user created in the format requested.
+
+        Endpoint: '/1/foods/search.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        query : str
+                The URL-encoded search query.
+        """
+        return await self._aget(_GET_FOODS_LIST_URL, query_kwargs={"query": query})
@@ -0,0 +1,154 @@
+"""Autogenerated methods for the Nutrition Time Series endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_FOODS_BY_DATE_RANGE_URL = utils.UrlTemplate(
+    "/1/user/-/foods/log/{resource-path}/date/{base-date}/{end-date}.json"
+)
+_GET_FOODS_RESOURCE_BY_DATE_PERIOD_URL = utils.UrlTemplate(
+    "/1/user/-/foods/log/{resource-path}/date/{date}/{period}.json"
+)
+
+
+class NutritionTimeSeriesApi(BaseApi):
+    """Methods for the Nutrition Time Series endpoints."""
+
+    def get_foods_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        resource_path: Literal["caloriesIn", "water"] = "caloriesIn",
+    ):
+        """Get Food or Water Time Series.
+
+        Updates a user's daily activity goals and returns a response using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/foods/log/{resource-path}/date/{base-date}/{end-date}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+
+        resource_path : Literal['caloriesIn', 'water']
+                The resouce path. See options in the Resouce Path Options section in the full documentation.
+        """
+        return self._get(
+            _GET_FOODS_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+                "resource-path": resource_path,
+            },
+        )
+
+    def get_foods_resource_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"],
+        resource_path: Literal["caloriesIn", "water"] = "caloriesIn",
+    ):
+        """Get Food or Water Time Series.
+
+        Updates a user's daily activity goals and returns a response using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/foods/log/{resource-path}/date/{date}/{period}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the period specified in the format yyyy-MM-dd or today.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y', 'max']
+                The range for which data will be returned. Options are 1d, 7d, 30d, 1w, 3m, 6m, 1y, or max.
+
+        resource_path : Literal['caloriesIn', 'water']
+                The resouce path. See options in the Resouce Path Options section in the full documentation.
+        """
+        return self._get(
+            _GET_FOODS_RESOURCE_BY_DATE_PERIOD_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "period": period,
+                "resource-path": resource_path,
+            },
+        )
+
+
+class AsyncNutritionTimeSeriesApi(BaseApi):
+    """Async methods for the Nutrition Time Series endpoints."""
+
+    async def aget_foods_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        resource_path: Literal["caloriesIn", "water"] = "caloriesIn",
+    ):
+        """Get Food or Water Time Series.
+
+        Updates a user's daily activity goals and returns a response using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/foods/log/{resource-path}/date/{base-date}/{end-date}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The range start date in the format yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the range.
+
+        resource_path : Literal['caloriesIn', 'water']
+                The resouce path. See options in the Resouce Path Options section in the full documentation.
+        """
+        return await self._aget(
+            _GET_FOODS_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+                "resource-path": resource_path,
+            },
+        )
+
+    async def aget_foods_resource_by_date_period(
+        self,
+        date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        period: Literal["1d", "7d", "30d", "1w", "1m", "3m", "6m", "1y", "max"],
+        resource_path: Literal["caloriesIn", "water"] = "caloriesIn",
+    ):
+        """Get Food or Water Time Series.
+
+        Updates a user's daily activity goals and returns a response using units in the unit system which corresponds to the Accept-Language header provided.
+
+        Endpoint: '/1/user/-/foods/log/{resource-path}/date/{date}/{period}.json'
+        Scopes: ['nutrition']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The end date of the period specified in the format yyyy-MM-dd or today.
+
+        period : Literal['1d', '7d', '30d', '1w', '1m', '3m', '6m', '1y', 'max']
+                The range for which data will be returned. Options are 1d, 7d, 30d, 1w, 3m, 6m, 1y, or max.
+
+        resource_path : Literal['caloriesIn', 'water']
+                The resouce path. See options in the Resouce Path Options section in the full documentation.
+        """
+        return await self._aget(
+            _GET_FOODS_RESOURCE_BY_DATE_PERIOD_URL,
+            param_kwargs={
+                "date": utils.format_date(date),
+                "period": period,
+                "resource-path": resource_path,
+            },
+        )
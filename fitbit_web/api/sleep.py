@@ -0,0 +1,238 @@
+"""Autogenerated methods for the Sleep endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_SLEEP_BY_DATE_URL = utils.UrlTemplate("/1.2/user/-/sleep/date/{date}.json")
+_GET_SLEEP_BY_DATE_RANGE_URL = utils.UrlTemplate(
+    "/1.2/user/-/sleep/date/{base-date}/{end-date}.json"
+)
+_GET_SLEEP_LIST_URL = utils.UrlTemplate("/1.2/user/-/sleep/list.json")
+_GET_SLEEP_GOAL_URL = utils.UrlTemplate("/1.2/user/-/sleep/goal.json")
+
+
+class SleepApi(BaseApi):
+    """Methods for the Sleep endpoints."""
+
+    def get_sleep_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Sleep Log.
+
+        The Get Sleep Logs by Date endpoint returns a summary and list of a user's sleep log entries (including naps) as well as detailed sleep entry data for a given day.
+
+        Endpoint: '/1.2/user/-/sleep/date/{date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+        """
+        return self._get(
+            _GET_SLEEP_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    def get_sleep_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Sleep Logs by Date Range.
+
+        The Get Sleep Logs by Date Range endpoint returns a list of a user's sleep log entries (including naps) as well as detailed sleep entry data for a given date range (inclusive of start and end dates).
+
+        Endpoint: '/1.2/user/-/sleep/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+        """
+        return self._get(
+            _GET_SLEEP_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
+
+    def get_sleep_list(
+        self,
+        sort: Literal["asc", "desc"],
+        limit: int,
+        before_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        after_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        offset: int = 0,
+    ):
+        """Get Sleep Logs List.
+
+        The Get Sleep Logs List endpoint returns a list of a user's sleep logs (including naps) before or after a given day with offset, limit, and sort order.
+
+        Endpoint: '/1.2/user/-/sleep/list.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        sort : Literal['asc', 'desc']
+                The sort order of entries by date asc (ascending) or desc (descending).
+
+        limit : int
+                The maximum number of entries returned (maximum;100).
+
+        before_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss. Only yyyy-MM-dd is required. Either beforeDate or afterDate should be specified.
+
+        after_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss.
+
+        offset : int
+                The offset number of entries.
+        """
+        return self._get(
+            _GET_SLEEP_LIST_URL,
+            query_kwargs={
+                "sort": sort,
+                "limit": limit,
+                "beforeDate": utils.format_date_or_timestamp(before_date),
+                "afterDate": utils.format_date_or_timestamp(after_date),
+                "offset": offset,
+            },
+        )
+
+    def get_sleep_goal(self):
+        """Get Sleep Goal.
+
+        Returns the user's sleep goal.
+
+        Endpoint: '/1.2/user/-/sleep/goal.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return self._get(_GET_SLEEP_GOAL_URL)
+
+
+class AsyncSleepApi(BaseApi):
+    """Async methods for the Sleep endpoints."""
+
+    async def aget_sleep_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Sleep Log.
+
+        The Get Sleep Logs by Date endpoint returns a summary and list of a user's sleep log entries (including naps) as well as detailed sleep entry data for a given day.
+
+        Endpoint: '/1.2/user/-/sleep/date/{date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+        """
+        return await self._aget(
+            _GET_SLEEP_BY_DATE_URL, param_kwargs={"date": utils.format_date(date)}
+        )
+
+    async def aget_sleep_by_date_range(
+        self,
+        base_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Sleep Logs by Date Range.
+
+        The Get Sleep Logs by Date Range endpoint returns a list of a user's sleep log entries (including naps) as well as detailed sleep entry data for a given date range (inclusive of start and end dates).
+
+        Endpoint: '/1.2/user/-/sleep/date/{base-date}/{end-date}.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        base_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date of records to be returned. In the format yyyy-MM-dd.
+        """
+        return await self._aget(
+            _GET_SLEEP_BY_DATE_RANGE_URL,
+            param_kwargs={
+                "base-date": utils.format_date(base_date),
+                "end-date": utils.format_date(end_date),
+            },
+        )
+
+    async def aget_sleep_list(
+        self,
+        sort: Literal["asc", "desc"],
+        limit: int,
+        before_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        after_date: (
+            Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+            | str
+            | None
+        ) = None,
+        offset: int = 0,
+    ):
+        """Get Sleep Logs List.
+
+        The Get Sleep Logs List endpoint returns a list of a user's sleep logs (including naps) before or after a given day with offset, limit, and sort order.
+
+        Endpoint: '/1.2/user/-/sleep/list.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        sort : Literal['asc', 'desc']
+                The sort order of entries by date asc (ascending) or desc (descending).
+
+        limit : int
+                The maximum number of entries returned (maximum;100).
+
+        before_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss. Only yyyy-MM-dd is required. Either beforeDate or afterDate should be specified.
+
+        after_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']] | str, optional
+                The date in the format yyyy-MM-ddTHH:mm:ss.
+
+        offset : int
+                The offset number of entries.
+        """
+        return await self._aget(
+            _GET_SLEEP_LIST_URL,
+            query_kwargs={
+                "sort": sort,
+                "limit": limit,
+                "beforeDate": utils.format_date_or_timestamp(before_date),
+                "afterDate": utils.format_date_or_timestamp(after_date),
+                "offset": offset,
+            },
+        )
+
+    async def aget_sleep_goal(self):
+        """Get Sleep Goal.
+
+        Returns the user's sleep goal.
+
+        Endpoint: '/1.2/user/-/sleep/goal.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return await self._aget(_GET_SLEEP_GOAL_URL)
@@ -0,0 +1,120 @@
+"""Autogenerated methods for the SpO2 endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_SP_O2_SUMMARY_BY_DATE_URL = utils.UrlTemplate("/1/user/-/spo2/date/{date}.json")
+_GET_SP_O2_SUMMARY_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/spo2/date/{startDate}/{endDate}.json"
+)
+
+
+class SpO2Api(BaseApi):
+    """Methods for the SpO2 endpoints."""
+
+    def get_sp_o2_summary_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get SpO2 Summary by Date.
+
+        This endpoint returns the SpO2 summary data for a single date. SpO2 applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/spo2/date/{date}.json'
+        Scopes: ['oxygen_saturation']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_SP_O2_SUMMARY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    def get_sp_o2_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get SpO2 Summary by Interval.
+
+        This endpoint returns the SpO2 summary data for a date range. SpO2 applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/spo2/date/{startDate}/{endDate}.json'
+        Scopes: ['oxygen_saturation']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_SP_O2_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncSpO2Api(BaseApi):
+    """Async methods for the SpO2 endpoints."""
+
+    async def aget_sp_o2_summary_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get SpO2 Summary by Date.
+
+        This endpoint returns the SpO2 summary data for a single date. SpO2 applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/spo2/date/{date}.json'
+        Scopes: ['oxygen_saturation']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_SP_O2_SUMMARY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    async def aget_sp_o2_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get SpO2 Summary by Interval.
+
+        This endpoint returns the SpO2 summary data for a date range. SpO2 applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/spo2/date/{startDate}/{endDate}.json'
+        Scopes: ['oxygen_saturation']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_SP_O2_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
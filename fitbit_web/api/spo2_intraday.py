@@ -0,0 +1,122 @@
+"""Autogenerated methods for the SpO2 Intraday endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_SP_O2_INTRADAY_BY_DATE_URL = utils.UrlTemplate(
+    "/1/user/-/spo2/date/{date}/all.json"
+)
+_GET_SP_O2_INTRADAY_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/spo2/date/{startDate}/{endDate}/all.json"
+)
+
+
+class SpO2IntradayApi(BaseApi):
+    """Methods for the SpO2 Intraday endpoints."""
+
+    def get_sp_o2_intraday_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get SpO2 Intraday by Date.
+
+        This endpoint returns the SpO2 intraday data for a single date. SpO2 applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/spo2/date/{date}/all.json'
+        Scopes: ['oxygen_saturation']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_SP_O2_INTRADAY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    def get_sp_o2_intraday_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get SpO2 Intraday by Interval.
+
+        This endpoint returns the SpO2 intraday data for a specified date range. SpO2 applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/spo2/date/{startDate}/{endDate}/all.json'
+        Scopes: ['oxygen_saturation']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_SP_O2_INTRADAY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncSpO2IntradayApi(BaseApi):
+    """Async methods for the SpO2 Intraday endpoints."""
+
+    async def aget_sp_o2_intraday_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get SpO2 Intraday by Date.
+
+        This endpoint returns the SpO2 intraday data for a single date. SpO2 applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/spo2/date/{date}/all.json'
+        Scopes: ['oxygen_saturation']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_SP_O2_INTRADAY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    async def aget_sp_o2_intraday_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get SpO2 Intraday by Interval.
+
+        This endpoint returns the SpO2 intraday data for a specified date range. SpO2 applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/spo2/date/{startDate}/{endDate}/all.json'
+        Scopes: ['oxygen_saturation']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_SP_O2_INTRADAY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
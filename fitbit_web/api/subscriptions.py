@@ -0,0 +1,52 @@
+"""Autogenerated methods for the Subscriptions endpoints."""
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_SUBSCRIPTIONS_LIST_URL = utils.UrlTemplate(
+    "/1/user/-/{collection-path}/apiSubscriptions.json"
+)
+
+
+class SubscriptionsApi(BaseApi):
+    """Methods for the Subscriptions endpoints."""
+
+    def get_subscriptions_list(self, collection_path: str):
+        """Get a List of Subscriptions.
+
+        Retreives a list of a user's subscriptions for your application in the format requested. You can either fetch subscriptions for a specific collection or the entire list of subscriptions for the user. For best practice, make sure that your application maintains this list on your side and use this endpoint only to periodically ensure data consistency.
+
+        Endpoint: '/1/user/-/{collection-path}/apiSubscriptions.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        collection_path : str
+                This is the resource of the collection to receive notifications from (foods, activities, sleep, or body). If not present, subscription will be created for all collections. If you have both all and specific collection subscriptions, you will get duplicate notifications on that collections' updates. Each subscriber can have only one subscription for a specific user's collection.
+        """
+        return self._get(
+            _GET_SUBSCRIPTIONS_LIST_URL,
+            param_kwargs={"collection-path": collection_path},
+        )
+
+
+class AsyncSubscriptionsApi(BaseApi):
+    """Async methods for the Subscriptions endpoints."""
+
+    async def aget_subscriptions_list(self, collection_path: str):
+        """Get a List of Subscriptions.
+
+        Retreives a list of a user's subscriptions for your application in the format requested. You can either fetch subscriptions for a specific collection or the entire list of subscriptions for the user. For best practice, make sure that your application maintains this list on your side and use this endpoint only to periodically ensure data consistency.
+
+        Endpoint: '/1/user/-/{collection-path}/apiSubscriptions.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+
+        Parameters
+        ----------
+        collection_path : str
+                This is the resource of the collection to receive notifications from (foods, activities, sleep, or body). If not present, subscription will be created for all collections. If you have both all and specific collection subscriptions, you will get duplicate notifications on that collections' updates. Each subscriber can have only one subscription for a specific user's collection.
+        """
+        return await self._aget(
+            _GET_SUBSCRIPTIONS_LIST_URL,
+            param_kwargs={"collection-path": collection_path},
+        )
@@ -0,0 +1,228 @@
+"""Autogenerated methods for the Temperature endpoints."""
+
+import datetime
+from typing import Annotated, Literal, Union
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_TEMP_CORE_SUMMARY_BY_DATE_URL = utils.UrlTemplate(
+    "/1/user/-/temp/core/date/{date}.json"
+)
+_GET_TEMP_CORE_SUMMARY_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/temp/core/date/{startDate}/{endDate}.json"
+)
+_GET_TEMP_SKIN_SUMMARY_DATE_URL = utils.UrlTemplate(
+    "/1/user/-/temp/skin/date/{date}.json"
+)
+_GET_TEMP_SKIN_SUMMARY_BY_INTERVAL_URL = utils.UrlTemplate(
+    "/1/user/-/temp/skin/date/{startDate}/{endDate}.json"
+)
+
+
+class TemperatureApi(BaseApi):
+    """Methods for the Temperature endpoints."""
+
+    def get_temp_core_summary_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Temperature (Core) Summary by Date.
+
+        Returns the Temperature (Core) data for a single date. Temperature (Core) data applies specifically to data logged manually by the user throughout the day.
+
+        Endpoint: '/1/user/-/temp/core/date/{date}.json'
+        Scopes: ['temperature']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_TEMP_CORE_SUMMARY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    def get_temp_core_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Temperature (Core) Summary by Interval.
+
+        Returns Temperature (Core) data for a date range. Temperature (Core) data applies specifically to data logged manually by the user throughout the day and the maximum date range cannot exceed 30 days.
+
+        Endpoint: '/1/user/-/temp/core/date/{startDate}/{endDate}.json'
+        Scopes: ['temperature']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_TEMP_CORE_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+    def get_temp_skin_summary_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Temperature (Skin) Summary by Date.
+
+        Returns the Temperature (Skin) data for a single date. Temperature (Skin) data applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/temp/skin/date/{date}.json'
+        Scopes: ['temperature']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_TEMP_SKIN_SUMMARY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    def get_temp_skin_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Temperature (Skin) Summary by Interval.
+
+        Returns Temperature (Skin) data for a date range. It only returns a value for dates on which the Fitbit device was able to record Temperature (skin) data and the maximum date range cannot exceed 30 days.
+
+        Endpoint: '/1/user/-/temp/skin/date/{startDate}/{endDate}.json'
+        Scopes: ['temperature']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return self._get(
+            _GET_TEMP_SKIN_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+
+class AsyncTemperatureApi(BaseApi):
+    """Async methods for the Temperature endpoints."""
+
+    async def aget_temp_core_summary_by_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Temperature (Core) Summary by Date.
+
+        Returns the Temperature (Core) data for a single date. Temperature (Core) data applies specifically to data logged manually by the user throughout the day.
+
+        Endpoint: '/1/user/-/temp/core/date/{date}.json'
+        Scopes: ['temperature']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_TEMP_CORE_SUMMARY_BY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    async def aget_temp_core_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Temperature (Core) Summary by Interval.
+
+        Returns Temperature (Core) data for a date range. Temperature (Core) data applies specifically to data logged manually by the user throughout the day and the maximum date range cannot exceed 30 days.
+
+        Endpoint: '/1/user/-/temp/core/date/{startDate}/{endDate}.json'
+        Scopes: ['temperature']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_TEMP_CORE_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
+
+    async def aget_temp_skin_summary_date(
+        self, date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]]
+    ):
+        """Get Temperature (Skin) Summary by Date.
+
+        Returns the Temperature (Skin) data for a single date. Temperature (Skin) data applies specifically to a user’s “main sleep”, which is the longest single period of time asleep on a given date.
+
+        Endpoint: '/1/user/-/temp/skin/date/{date}.json'
+        Scopes: ['temperature']
+
+        Parameters
+        ----------
+        date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_TEMP_SKIN_SUMMARY_DATE_URL,
+            param_kwargs={"date": utils.format_date(date)},
+        )
+
+    async def aget_temp_skin_summary_by_interval(
+        self,
+        start_date: Union[
+            datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]
+        ],
+        end_date: Union[datetime.date, Literal["today"], Annotated[str, "yyyy-MM-dd"]],
+    ):
+        """Get Temperature (Skin) Summary by Interval.
+
+        Returns Temperature (Skin) data for a date range. It only returns a value for dates on which the Fitbit device was able to record Temperature (skin) data and the maximum date range cannot exceed 30 days.
+
+        Endpoint: '/1/user/-/temp/skin/date/{startDate}/{endDate}.json'
+        Scopes: ['temperature']
+
+        Parameters
+        ----------
+        start_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+
+        end_date : Union[datetime.date, Literal['today'], Annotated[str, 'yyyy-MM-dd']]
+                The date in the format of yyyy-MM-dd or today.
+        """
+        return await self._aget(
+            _GET_TEMP_SKIN_SUMMARY_BY_INTERVAL_URL,
+            param_kwargs={
+                "startDate": utils.format_date(start_date),
+                "endDate": utils.format_date(end_date),
+            },
+        )
@@ -0,0 +1,55 @@
+"""Autogenerated methods for the User endpoints."""
+
+import fitbit_web.utils as utils
+from fitbit_web.api.base import BaseApi
+
+_GET_BADGES_URL = utils.UrlTemplate("/1/user/-/badges.json")
+_GET_PROFILE_URL = utils.UrlTemplate("/1/user/-/profile.json")
+
+
+class UserApi(BaseApi):
+    """Methods for the User endpoints."""
+
+    def get_badges(self):
+        """Get Badges.
+
+        Retrieves the user's badges in the format requested. Response includes all badges for the user as seen on the Fitbit website badge locker (both activity and weight related.) The endpoint returns weight and distance badges based on the user's unit profile preference as on the website.
+
+        Endpoint: '/1/user/-/badges.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return self._get(_GET_BADGES_URL)
+
+    def get_profile(self):
+        """Get Profile.
+
+        Returns a user's profile. The authenticated owner receives all values. However, the authenticated user's access to other users' data is subject to those users' privacy settings. Numerical values are returned in the unit system specified in the Accept-Language header.
+
+        Endpoint: '/1/user/-/profile.json'
+        Scopes: ['location', 'profile', 'weight']
+        """
+        return self._get(_GET_PROFILE_URL)
+
+
+class AsyncUserApi(BaseApi):
+    """Async methods for the User endpoints."""
+
+    async def aget_badges(self):
+        """Get Badges.
+
+        Retrieves the user's badges in the format requested. Response includes all badges for the user as seen on the Fitbit website badge locker (both activity and weight related.) The endpoint returns weight and distance badges based on the user's unit profile preference as on the website.
+
+        Endpoint: '/1/user/-/badges.json'
+        Scopes: ['activity', 'heartrate', 'location', 'nutrition', 'profile', 'settings', 'sleep', 'social', 'weight']
+        """
+        return await self._aget(_GET_BADGES_URL)
+
+    async def aget_profile(self):
+        """Get Profile.
+
+        Returns a user's profile. The authenticated owner receives all values. However, the authenticated user's access to other users' data is subject to those users' privacy settings. Numerical values are returned in the unit system specified in the Accept-Language header.
+
+        Endpoint: '/1/user/-/profile.json'
+        Scopes: ['location', 'profile', 'weight']
+        """
+        return await self._aget(_GET_PROFILE_URL)
@@ -0,0 +1,235 @@
+"""Memory-mapped archive of intraday samples.
+
+Samples are stored as fixed-width little-endian records of an `int64` timestamp
+(seconds since the epoch, see `series`) and a `float64` value, after a 16 byte
+header. There is one file per user, resource and month::
+
+    <root>/<user_id>/<resource>/<yyyy-mm>.fbts
+
+Files are kept sorted by time: samples after the last archived one are appended, and
+earlier ones (e.g. from a backfill running most recent first) are merged by rewriting
+their month. Files are read through `numpy.memmap` so slicing years of data does not
+copy it into memory::
+
+    archive = Archive("data")
+    archive.ingest(tokens.user_id, web_client.get_heart_by_date_intraday("today", "1sec"))
+    records = archive.read(tokens.user_id, "activities-heart-intraday", "2024-01-01")
+    records["time"], records["value"]
+"""
+
+import datetime
+import os
+import pathlib
+from typing import Any, Iterator
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore
+
+from fitbit_web import series
+
+MAGIC = b"FBTS\x01\x00\x00\x00"
+HEADER_SIZE = 16
+SUFFIX = ".fbts"
+
+if np is not None:
+    RECORD = np.dtype([("time", "<i8"), ("value", "<f8")])
+    """The layout of a record."""
+
+
+def _month(timestamp: int) -> str:
+    return f"{np.datetime64(timestamp, 's').astype('datetime64[M]')}"
+
+
+class Archive:
+    """Archive of the intraday samples of users."""
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        """Open an archive, creating its directory when first written to.
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If numpy is not installed.
+        """
+        if np is None:
+            raise ModuleNotFoundError(
+                "numpy is required for `Archive`. Install with `fitbit-web[numpy]`."
+            )
+        self.root = pathlib.Path(root)
+
+    def path(self, user_id: str, resource: str, month: str) -> pathlib.Path:
+        """Get the path of the file of a month (as `yyyy-mm`)."""
+        return self.root / user_id / resource / f"{month}{SUFFIX}"
+
+    def append(self, user_id: str, resource: str, times: Any, values: Any) -> int:
+        """Append samples to the archive.
+
+        Samples at an already archived time are skipped, so re-appending a fetched
+        day is a no-op. Samples before the last archived sample of their month are
+        merged in, which rewrites the file of that month.
+
+        Parameters
+        ----------
+        user_id : str
+            The user of the samples.
+        resource : str
+            The resource of the samples.
+        times : array-like
+            The timestamps in seconds since the epoch.
+        values : array-like
+            The values.
+
+        Returns
+        -------
+        int
+            The number of samples appended.
+        """
+        records = np.empty(len(times), RECORD)
+        records["time"] = times
+        records["value"] = values
+        if not len(records):
+            return 0
+        records = records[np.argsort(records["time"], kind="stable")]
+        months = np.asarray(records["time"], "datetime64[s]").astype("datetime64[M]")
+        bounds = np.flatnonzero(months[1:] != months[:-1]) + 1
+        appended = 0
+        for chunk in np.split(records, bounds):
+            path = self.path(user_id, resource, _month(int(chunk["time"][0])))
+            appended += _append(path, chunk)
+        return appended
+
+    def ingest(
+        self,
+        user_id: str,
+        response: Any,
+        date: str | datetime.date | None = None,
+        name: str = "value",
+    ) -> int:
+        """Append the samples of a response, see `series.samples` for the arguments.
+
+        Returns
+        -------
+        int
+            The number of samples appended.
+        """
+        return sum(
+            self.append(user_id, resource, samples.times, samples.values)
+            for resource, samples in series.samples(response, date, name).items()
+        )
+
+    def months(
+        self,
+        user_id: str,
+        resource: str,
+        start: series.Time | None = None,
+        end: series.Time | None = None,
+    ) -> Iterator["np.ndarray"]:
+        """Iterate over the memory-mapped records of each month in a time range.
+
+        Parameters
+        ----------
+        user_id : str
+            The user of the samples.
+        resource : str
+            The resource of the samples.
+        start : series.Time | None, optional
+            The inclusive start of the range, by default from the first sample.
+        end : series.Time | None, optional
+            The exclusive end of the range, by default until the last sample.
+
+        Yields
+        ------
+        np.ndarray
+            Read-only views of the records of each month, with the `RECORD` dtype.
+        """
+        start = None if start is None else series.timestamp(start)
+        end = None if end is None else series.timestamp(end)
+        directory = self.root / user_id / resource
+        if not directory.is_dir():
+            return
+        first = None if start is None else _month(start)
+        last = None if end is None else _month(end - 1)
+        for path in sorted(directory.glob(f"*{SUFFIX}")):
+            month = path.name.removesuffix(SUFFIX)
+            if (first is not None and month < first) or (
+                last is not None and month > last
+            ):
+                continue
+            records = _map(path)
+            low = 0 if start is None else np.searchsorted(records["time"], start)
+            high = (
+                len(records) if end is None else np.searchsorted(records["time"], end)
+            )
+            if high > low:
+                yield records[low:high]
+
+    def read(
+        self,
+        user_id: str,
+        resource: str,
+        start: series.Time | None = None,
+        end: series.Time | None = None,
+    ) -> "np.ndarray":
+        """Read the records in a time range, see `months` for the arguments.
+
+        Returns
+        -------
+        np.ndarray
+            The records with the `RECORD` dtype. This is a view of the file if the
+            range is within a month, otherwise the months are concatenated.
+        """
+        months = list(self.months(user_id, resource, start, end))
+        if len(months) == 1:
+            return months[0]
+        if not months:
+            return np.empty(0, RECORD)
+        return np.concatenate(months)
+
+
+def _map(path: pathlib.Path) -> "np.ndarray":
+    size = (path.stat().st_size - HEADER_SIZE) // RECORD.itemsize
+    if size <= 0:
+        return np.empty(0, RECORD)
+    with open(path, "rb") as fp:
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an archive file.")
+    return np.memmap(path, RECORD, "r", offset=HEADER_SIZE, shape=(size,))
+
+
+def _append(path: pathlib.Path, records: "np.ndarray") -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as fp:
+        size = fp.seek(0, os.SEEK_END)
+        if size < HEADER_SIZE:
+            fp.truncate(0)
+            fp.write(MAGIC.ljust(HEADER_SIZE, b"\0"))
+            size = HEADER_SIZE
+        elif (partial := (size - HEADER_SIZE) % RECORD.itemsize) != 0:
+            size -= partial
+            fp.truncate(size)
+        if size > HEADER_SIZE:
+            fp.seek(size - RECORD.itemsize)
+            last = np.frombuffer(fp.read(RECORD.itemsize), RECORD)["time"][0]
+            if records["time"][0] <= last:
+                fp.seek(HEADER_SIZE)
+                archived = np.frombuffer(fp.read(size - HEADER_SIZE), RECORD)
+                fp.close()
+                return _merge(path, archived, records)
+        fp.seek(size)
+        fp.write(records.tobytes())
+    return len(records)
+
+
+def _merge(path: pathlib.Path, archived: "np.ndarray", records: "np.ndarray") -> int:
+    merged = np.concatenate([archived, records])
+    _, first = np.unique(merged["time"], return_index=True)
+    if len(first) == len(archived):
+        return 0
+    temporary = path.with_name(f"{path.name}.tmp")
+    with open(temporary, "wb") as fp:
+        fp.write(MAGIC.ljust(HEADER_SIZE, b"\0"))
+        fp.write(merged[first].tobytes())
+    os.replace(temporary, path)
+    return len(first) - len(archived)
@@ -8,11 +8,8 @@ import secrets
 import threading
 import typing
 import urllib.parse
-import webbrowser
-from http import server
 from typing import Literal, Sequence, cast
 
-import requests
 from dotenv import load_dotenv
 
 try:
@@ -68,6 +65,8 @@ class AuthTokens:
 
     def refresh(self) -> "AuthTokens":
         """Refresh the auth tokens."""
+        import requests
+
         response = requests.post(
             f"{REFRESH_URL}client_id={CLIENT_ID}&refresh_token={self.refresh_token}",
             headers={
@@ -77,6 +76,8 @@ class AuthTokens:
             },
             timeout=2.0,
         ).json()
+        if "errors" in response:
+            raise Exception(response)
         response["scope"] = tuple(w.strip() for w in response["scope"].split())
 
         return AuthTokens(**response)
@@ -118,6 +119,8 @@ def token_from_code(code: str, code_verifier: str = CODE_VERIFIER) -> AuthTokens
 
     Note that the code_verified must be hashed as in the original process.
     """
+    import requests
+
     response = requests.post(
         get_token_url(code, code_verifier=code_verifier),
         headers={
@@ -156,6 +159,9 @@ def get_tokens_local(
     RuntimeError
         If redirect is not to localhost.
     """
+    import webbrowser
+    from http import server
+
     check_secrets()
     oauth2_url = get_authorization_url(scopes, code_verifier=code_verifier)
     if auto_open:
@@ -0,0 +1,381 @@
+"""Planning and running the backfill of the history of a user.
+
+The history is covered by the fewest requests the maximum range of each endpoint
+allows, which are made most recent first so the latest data is available soonest.
+When the rate limit is exhausted the run waits for its window to reset, and completed
+requests are recorded in a `journal` so an interrupted run resumes where it stopped::
+
+    requests = backfill.plan(
+        ["get_sleep_by_date_range", ("get_heart_by_date_range", {})],
+        since=backfill.history_start(web_client),
+    )
+    with backfill.Backfill(requests, checkpoint="backfill.jsonl") as job:
+        for request, response in job.run(web_client):
+            db.ingest(tokens.user_id, response)
+            print(job.progress())
+"""
+
+import asyncio
+import datetime
+import json
+import math
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Mapping, NamedTuple, Protocol
+
+from fitbit_web import cache, instrumentation, journal, scopes, utils
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from fitbit_web import client
+
+DEFAULT_MAX_DAYS = 30
+"""The days of each request to endpoints without a documented maximum range."""
+WINDOW = 60 * 60
+"""The length in seconds of the rate limit window of the Web API."""
+
+Resource = str | tuple[str, Mapping[str, Any]]
+"""A range method, with any other arguments (e.g. `{"resource_path": "steps"}`)."""
+
+
+class Request(NamedTuple):
+    """A request of a backfill, as a method of the client and its arguments."""
+
+    name: str
+    arguments: Mapping[str, Any]
+
+    @property
+    def key(self) -> str:
+        """The key identifying the request in journals."""
+        return json.dumps([self.name, self.arguments], sort_keys=True)
+
+
+class Progress(NamedTuple):
+    """The progress of a backfill."""
+
+    done: int
+    total: int
+    eta: datetime.datetime | None
+    """The estimated completion time, if the rate limit has been seen."""
+
+
+class ProfileClient(Protocol):
+    """A client with the profile endpoint, e.g. `client.Client`."""
+
+    def get_profile(self) -> Any:
+        """Get the profile of the user."""
+
+
+def history_start(web_client: ProfileClient) -> str:
+    """Get the date the user joined Fitbit, i.e. the start of their history."""
+    return web_client.get_profile()["user"]["memberSince"]
+
+
+def plan(
+    resources: Iterable[Resource],
+    since: str | datetime.date,
+    until: str | datetime.date = "today",
+    max_days: int | None = None,
+) -> list[Request]:
+    """Plan the requests covering the history of a user.
+
+    Parameters
+    ----------
+    resources : Iterable[Resource]
+        The range methods to backfill (e.g. `get_sleep_by_date_range`), with any
+        arguments other than the dates.
+    since : str | datetime.date
+        The first date of the history, see `history_start`.
+    until : str | datetime.date, optional
+        The last date of the history, by default today.
+    max_days : int | None, optional
+        The most days of each request, if fewer than the maximum range of the
+        endpoints, by default no limit.
+
+    Returns
+    -------
+    list[Request]
+        The requests, most recent first. Each spans the maximum range of its
+        endpoint (or `DEFAULT_MAX_DAYS`), except the oldest.
+
+    Raises
+    ------
+    ValueError
+        If a method is not of a range endpoint.
+    """
+    first = datetime.date.fromisoformat(utils.format_date(since)).toordinal()
+    last = datetime.date.fromisoformat(utils.format_date(until)).toordinal()
+    requests: list[tuple[int, Request]] = []
+    for resource in resources:
+        name, arguments = (resource, {}) if isinstance(resource, str) else resource
+        endpoint = scopes.endpoint(name)
+        if (dates := cache.date_range(endpoint.path)) is None:
+            raise ValueError(f"{name!r} is not the method of a range endpoint.")
+        start, end = (endpoint.parameter(p).argument for p in dates[:2])
+        span = dates.max_days or DEFAULT_MAX_DAYS
+        if max_days is not None:
+            span = max(min(span, max_days), 1)
+        for high in range(last, first - 1, -span):
+            low = max(high - span + 1, first)
+            requests.append(
+                (
+                    high,
+                    Request(
+                        name,
+                        {
+                            **arguments,
+                            start: datetime.date.fromordinal(low).isoformat(),
+                            end: datetime.date.fromordinal(high).isoformat(),
+                        },
+                    ),
+                )
+            )
+    requests.sort(key=lambda request: -request[0])
+    return [request for _, request in requests]
+
+
+class Quota(instrumentation.Hook):
+    """Hook tracking the rate limit from the responses of the requests it observes."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Create a hook which has not seen the rate limit yet.
+
+        Parameters
+        ----------
+        clock : Callable[[], float], optional
+            The current time, by default `time.time`.
+        """
+        self.clock = clock
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset: float | None = None
+        self.latency = 0.0
+        self._requests = 0
+
+    def request_end(self, info: instrumentation.RequestInfo) -> None:
+        """Record the rate limit of the response."""
+        if info.cache_hit:
+            return
+        if info.rate_limit is not None:
+            self.limit = info.rate_limit
+        if info.rate_limit_remaining is not None:
+            self.remaining = info.rate_limit_remaining
+        if info.status == 429:
+            self.remaining = 0
+        if info.rate_limit_reset is not None:
+            self.reset = self.clock() + info.rate_limit_reset
+        if info.latency is not None:
+            self._requests += 1
+            self.latency += (info.latency - self.latency) / self._requests
+
+    def wait(self) -> float:
+        """Get the seconds to wait for before the next request."""
+        if self.remaining != 0 or self.reset is None:
+            return 0
+        return max(self.reset - self.clock(), 0)
+
+    def eta(self, pending: int) -> float | None:
+        """Estimate the seconds to make a number of requests, if the limit is known."""
+        if self.remaining is None or self.limit is None or self.reset is None:
+            return None
+        if pending <= self.remaining:
+            return pending * self.latency
+        windows = math.ceil((pending - self.remaining) / max(self.limit, 1))
+        last = pending - self.remaining - (windows - 1) * self.limit
+        return (
+            max(self.reset - self.clock(), 0)
+            + (windows - 1) * WINDOW
+            + last * self.latency
+        )
+
+
+class _RateLimited(instrumentation.Hook):
+    def __init__(self) -> None:
+        self.exceeded = False
+
+    def request_end(self, info: instrumentation.RequestInfo) -> None:
+        self.exceeded = self.exceeded or info.status == 429
+
+
+class Backfill:
+    """A resumable run of the requests of a backfill."""
+
+    def __init__(
+        self,
+        requests: Iterable[Request],
+        checkpoint: journal.Journal | str | os.PathLike | None = None,
+        job: str = "",
+        retries: int = 3,
+        sleep: Callable[[float], Any] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Create a backfill, resuming from its checkpoint if there is one.
+
+        Parameters
+        ----------
+        requests : Iterable[Request]
+            The requests in the order to make them, see `plan`.
+        checkpoint : journal.Journal | str | os.PathLike | None, optional
+            The journal recording the completed requests, or its path (see
+            `journal.open`), by default an in-memory journal. A journal opened from
+            a path is closed by `close`.
+        job : str, optional
+            The name of the backfill, which prefixes the keys of its requests in the
+            journal (separated by a colon), e.g. the user ID so a journal can be
+            shared by the backfills of several users, by default none.
+        retries : int, optional
+            The number of times a request is retried after exceeding the rate limit,
+            by default 3.
+        sleep : Callable[[float], Any], optional
+            The function waiting for the rate limit to reset in `run`, by default
+            `time.sleep`.
+        clock : Callable[[], float], optional
+            The current time, by default `time.time`.
+        """
+        self.requests = list(requests)
+        self._owns_journal = not isinstance(checkpoint, journal.Journal)
+        if checkpoint is None:
+            checkpoint = journal.MemoryJournal()
+        elif not isinstance(checkpoint, journal.Journal):
+            checkpoint = journal.open(checkpoint)
+        self.journal = checkpoint
+        self.job = job
+        self.retries = retries
+        self.sleep = sleep
+        self.clock = clock
+        self.quota = Quota(clock)
+
+    def __enter__(self) -> "Self":
+        """Use the backfill as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Close the backfill."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the journal, if it was opened from a path by the backfill."""
+        if self._owns_journal:
+            self.journal.close()
+
+    @property
+    def pending(self) -> list[Request]:
+        """The requests which have not been completed."""
+        return list(self.journal.pending(self.requests, self._key))
+
+    def progress(self) -> Progress:
+        """Get the progress, with an estimate of the completion time."""
+        pending = len(self.pending)
+        seconds = self.quota.eta(pending)
+        return Progress(
+            done=len(self.requests) - pending,
+            total=len(self.requests),
+            eta=(
+                None
+                if seconds is None
+                else datetime.datetime.fromtimestamp(self.clock() + seconds)
+            ),
+        )
+
+    def run(self, web_client: "client.BaseClient") -> Iterator[tuple[Request, Any]]:
+        """Make the pending requests, waiting for the rate limit when exhausted.
+
+        A request is recorded as completed once its response has been consumed, i.e.
+        when the next one is requested from the iterator. The rate limit is tracked
+        from the requests of the backfill only, so the client can be shared.
+
+        Parameters
+        ----------
+        web_client : client.BaseClient
+            The client of the user, which has the methods of the requests.
+
+        Yields
+        ------
+        tuple[Request, Any]
+            Each request and its response.
+        """
+        for request in self.pending:
+            yield request, self._fetch(web_client, request)
+            self.journal.record(self._key(request))
+
+    async def arun(
+        self, web_client: "client.BaseClient", concurrency: int = 1
+    ) -> AsyncIterator[tuple[Request, Any]]:
+        """Make the pending requests with the async methods, see `run`.
+
+        Parameters
+        ----------
+        web_client : client.BaseClient
+            The client of the user, which has the methods of the requests.
+        concurrency : int, optional
+            The number of requests made at a time, by default 1. Responses are then
+            yielded in order of completion, and closing the iterator cancels the
+            requests in progress.
+
+        Yields
+        ------
+        tuple[Request, Any]
+            Each request and its response.
+        """
+        pending: set[asyncio.Task] = set()
+        try:
+            for request in self.pending:
+                while len(pending) >= max(concurrency, 1):
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+                        await self._record(task.result()[0])
+                pending.add(asyncio.create_task(self._afetch(web_client, request)))
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+                    await self._record(task.result()[0])
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _fetch(self, web_client: "client.BaseClient", request: Request) -> Any:
+        attempt = 0
+        while True:
+            if (delay := self.quota.wait()) > 0:
+                self.sleep(delay)
+            rate_limited = _RateLimited()
+            try:
+                with instrumentation.observe(self.quota, rate_limited):
+                    return getattr(web_client, request.name)(**request.arguments)
+            except Exception:
+                if not rate_limited.exceeded or attempt == self.retries:
+                    raise
+            attempt += 1
+
+    async def _afetch(
+        self, web_client: "client.BaseClient", request: Request
+    ) -> tuple[Request, Any]:
+        attempt = 0
+        while True:
+            if (delay := self.quota.wait()) > 0:
+                await asyncio.sleep(delay)
+            rate_limited = _RateLimited()
+            try:
+                with instrumentation.observe(self.quota, rate_limited):
+                    return request, await getattr(web_client, f"a{request.name}")(
+                        **request.arguments
+                    )
+            except Exception:
+                if not rate_limited.exceeded or attempt == self.retries:
+                    raise
+            attempt += 1
+
+    async def _record(self, request: Request) -> None:
+        await asyncio.to_thread(self.journal.record, self._key(request))
+
+    def _key(self, request: Request) -> str:
+        return f"{self.job}:{request.key}" if self.job else request.key
@@ -0,0 +1,219 @@
+"""Circuit breaker failing fast on the endpoints which are failing.
+
+Outages of the Web API are often of one family of endpoints (e.g. intraday heart
+rate), and retrying them wastes the rate limit budget and the time of the healthy
+endpoints. A breaker tracks the errors of each endpoint template: once the rate of
+server errors (or failed connections) in a window exceeds a threshold, the circuit
+of the endpoint opens and its requests fail fast with `CircuitOpenError`. After a
+while the circuit is half-open and lets probe requests through, closing again if
+they succeed::
+
+    circuit = breaker.CircuitBreaker(failure_rate=0.5, open_for=30)
+    web_client = client.Client(tokens, breaker=circuit)
+
+A breaker can be shared by the clients of many users, so an outage seen by one
+stops the requests of all of them.
+"""
+
+import collections
+import contextlib
+import dataclasses
+import threading
+import time
+from typing import Callable, Iterator, Literal
+
+from fitbit_web import instrumentation
+
+State = Literal["closed", "open", "half-open"]
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of making a request to an endpoint whose circuit is open."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        """Create the error of an open circuit.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint template of the circuit.
+        retry_after : float
+            The seconds until probe requests are let through.
+        """
+        super().__init__(
+            f"The circuit of {endpoint} is open, retry in {retry_after:.1f}s."
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        """The seconds until probe requests are let through."""
+
+
+@dataclasses.dataclass
+class _Circuit:
+    outcomes: collections.deque = dataclasses.field(default_factory=collections.deque)
+    """The times and successes of the requests in the window."""
+    failures: int = 0
+    opened: float | None = None
+    probes: int = 0
+
+
+class CircuitBreaker:
+    """Circuit breaker of the requests to each endpoint template."""
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: float = 60,
+        open_for: float = 30,
+        probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a breaker.
+
+        Parameters
+        ----------
+        failure_rate : float, optional
+            The fraction of the requests in the window which must fail for a circuit
+            to open, by default 0.5.
+        min_requests : int, optional
+            The number of requests in the window before a circuit can open, by
+            default 10.
+        window : float, optional
+            The seconds of the requests the failure rate is of, by default 60.
+        open_for : float, optional
+            The seconds a circuit is open before it lets probes through, by default
+            30.
+        probes : int, optional
+            The number of requests let through at a time while half-open, by default
+            1.
+        clock : Callable[[], float], optional
+            The current time, by default `time.monotonic`.
+        """
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.open_for = open_for
+        self.probes = probes
+        self.clock = clock
+        self._circuits: dict[str, _Circuit] = collections.defaultdict(_Circuit)
+        self._lock = threading.Lock()
+
+    def state(self, endpoint: str) -> State:
+        """Get the state of the circuit of an endpoint template."""
+        with self._lock:
+            circuit = self._circuits[endpoint]
+            if circuit.opened is None:
+                return "closed"
+            if self.clock() - circuit.opened < self.open_for:
+                return "open"
+            return "half-open"
+
+    def allow(self, endpoint: str) -> bool:
+        """Let a request to an endpoint template through.
+
+        Returns
+        -------
+        bool
+            Whether the request is a probe of a half-open circuit.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit is open, or half-open with all its probes in progress.
+        """
+        with self._lock:
+            circuit = self._circuits[endpoint]
+            if circuit.opened is None:
+                return False
+            if (wait := circuit.opened + self.open_for - self.clock()) > 0:
+                raise CircuitOpenError(endpoint, wait)
+            if circuit.probes >= self.probes:
+                raise CircuitOpenError(endpoint, 0)
+            circuit.probes += 1
+            return True
+
+    def record(self, endpoint: str, success: bool, probe: bool = False) -> None:
+        """Record the outcome of a request to an endpoint template.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint template.
+        success : bool
+            Whether the endpoint responded, i.e. without a server error.
+        probe : bool, optional
+            Whether the request was a probe, see `allow`, by default False.
+        """
+        now = self.clock()
+        with self._lock:
+            circuit = self._circuits[endpoint]
+            if probe:
+                circuit.probes -= 1
+                if success:
+                    circuit.outcomes.clear()
+                    circuit.failures = 0
+                    circuit.opened = None
+                else:
+                    circuit.opened = now
+                return
+            if circuit.opened is not None:
+                return
+            circuit.outcomes.append((now, success))
+            circuit.failures += not success
+            while circuit.outcomes and circuit.outcomes[0][0] <= now - self.window:
+                circuit.failures -= not circuit.outcomes.popleft()[1]
+            if len(
+                circuit.outcomes
+            ) >= self.min_requests and circuit.failures >= self.failure_rate * len(
+                circuit.outcomes
+            ):
+                circuit.opened = now
+
+    def release(self, endpoint: str, probe: bool) -> None:
+        """Give back the slot of a probe whose request has no outcome, see `allow`."""
+        if probe:
+            with self._lock:
+                self._circuits[endpoint].probes -= 1
+
+    @contextlib.contextmanager
+    def call(
+        self,
+        info: instrumentation.RequestInfo,
+        connection_errors: tuple[type[BaseException], ...] = (),
+    ) -> Iterator[None]:
+        """Guard a request, recording a server error or failed connection.
+
+        Other responses are successes. Requests which fail before a response without
+        a connection error (e.g. as the tokens could not be refreshed) and cancelled
+        requests are not recorded.
+
+        Parameters
+        ----------
+        info : instrumentation.RequestInfo
+            The request.
+        connection_errors : tuple[type[BaseException], ...], optional
+            The errors of the transport which are failed connections (e.g.
+            `requests.ConnectionError`), besides `ConnectionError` and
+            `TimeoutError`, by default none.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit of the endpoint is open.
+        """
+        probe = self.allow(info.endpoint)
+        try:
+            yield
+        except Exception as error:
+            if info.status is not None:
+                self.record(info.endpoint, info.status < 500, probe)
+            elif isinstance(error, (ConnectionError, TimeoutError, *connection_errors)):
+                self.record(info.endpoint, False, probe)
+            else:
+                self.release(info.endpoint, probe)
+            raise
+        except BaseException:
+            self.release(info.endpoint, probe)
+            raise
+        self.record(info.endpoint, True, probe)
@@ -0,0 +1,510 @@
+"""In-memory cache of the decoded responses of the client.
+
+Responses are cached per user, endpoint and parameters, and the responses of range
+endpoints (e.g. `get_sleep_by_date_range`) per day, so a range overlapping cached
+ranges is answered by requesting only the missing days. Intraday requests are also
+answered from cached responses of the same day at a finer detail level, which are
+aggregated to the requested level, and time window requests from cached full-day
+responses, which are sliced to the window. So a dashboard can fetch a day once and
+switch between zoom levels without further requests::
+
+    web_client = client.Client(tokens, cache=cache.Cache())
+    web_client.get_heart_by_date_intraday("2024-01-01", "1sec")
+    web_client.get_heart_by_date_intraday("2024-01-01", "15min")  # from the cache
+    web_client.get_heart_by_date_timestamp_intraday("2024-01-01", "08:00", "09:00")
+
+Deriving responses requires numpy, without it only identical requests are answered
+from the cache. Cached responses are returned as is, so must not be modified.
+"""
+
+import collections
+import datetime
+import functools
+import re
+import threading
+import time
+from typing import Any, Mapping, NamedTuple, Sequence
+
+from fitbit_web import resample, scopes, series
+
+Key = tuple[str, str, tuple[tuple[str, Any], ...], tuple[tuple[str, Any], ...]]
+
+WINDOW = "/time/{start-time}/{end-time}"
+"""The suffix of the templates of the time window variants of intraday endpoints."""
+MEAN_RESOURCES = frozenset(("activities-heart-intraday",))
+"""The intraday resources which are averaged, rather than summed, when aggregated."""
+
+DATE_FIELDS = ("dateTime", "dateOfSleep", "date")
+"""The fields of the items of range responses which hold their date."""
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def key(
+    user_id: str,
+    endpoint: str,
+    param_kwargs: Mapping[str, Any] | None = None,
+    query_kwargs: Mapping[str, Any] | None = None,
+) -> Key:
+    """Get the key of a request."""
+    return (
+        user_id,
+        endpoint,
+        tuple(sorted((param_kwargs or {}).items())),
+        tuple(sorted((query_kwargs or {}).items())),
+    )
+
+
+def _recent(params: Mapping[str, Any]) -> bool:
+    today = datetime.date.today().isoformat()
+    return any(
+        isinstance(value, str) and _DATE.fullmatch(value) and value >= today
+        for value in params.values()
+    )
+
+
+class DateRange(NamedTuple):
+    """The date parameters of an endpoint of a range of days."""
+
+    start: str
+    end: str
+    max_days: int | None
+
+
+@functools.cache
+def date_range(endpoint: str) -> DateRange | None:
+    """Get the date parameters of a range endpoint, e.g. `get_sleep_by_date_range`.
+
+    Intraday endpoints are excluded, as their datasets do not hold dates.
+    """
+    try:
+        metadata = scopes.endpoint(endpoint)
+    except KeyError:
+        return None
+    dates = [
+        parameter.name
+        for parameter in metadata.parameters
+        if parameter.location == "path" and "date" in parameter.formats
+    ]
+    if len(dates) != 2 or "{detail-level}" in endpoint:
+        return None
+    return DateRange(dates[0], dates[1], metadata.max_range_days)
+
+
+def days(start: str, end: str) -> list[str]:
+    """Get the dates from `start` to `end` (inclusive) in the format `yyyy-MM-dd`."""
+    first = datetime.date.fromisoformat(start).toordinal()
+    last = datetime.date.fromisoformat(end).toordinal()
+    return [
+        datetime.date.fromordinal(day).isoformat() for day in range(first, last + 1)
+    ]
+
+
+def _group(items: Any, dates: Sequence[str]) -> dict[str, list[Any]] | None:
+    if not isinstance(items, list):
+        return None
+    groups: dict[str, list[Any]] = {date: [] for date in dates}
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        date = next((item[f] for f in DATE_FIELDS if isinstance(item.get(f), str)), "")
+        if (group := groups.get(date[:10])) is None:
+            return None
+        group.append(item)
+    return groups
+
+
+def split(response: Any, dates: Sequence[str]) -> dict[str, Any] | None:
+    """Split the response of a range endpoint into the responses of each day.
+
+    Parameters
+    ----------
+    response : Any
+        The decoded response, a list of items or an object of lists of items, each
+        with a date in one of the `DATE_FIELDS`.
+    dates : Sequence[str]
+        The dates of the range of the request.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The response of each date, which is empty for days without items, or `None`
+        if the response has another shape.
+    """
+    if isinstance(response, list):
+        return _group(response, dates)
+    if not isinstance(response, dict) or not response:
+        return None
+    parts: dict[str, Any] = {date: {} for date in dates}
+    for name, items in response.items():
+        if (groups := _group(items, dates)) is None:
+            return None
+        for date, group in groups.items():
+            parts[date][name] = group
+    return parts
+
+
+def join(parts: Sequence[Any]) -> Any:
+    """Join the responses of consecutive days, the inverse of `split`."""
+    if parts and isinstance(parts[0], list):
+        return [item for part in parts for item in part]
+    joined: dict[str, list[Any]] = {}
+    for part in parts:
+        for name, items in part.items():
+            joined.setdefault(name, []).extend(items)
+    return joined
+
+
+def _clock(seconds: int) -> str:
+    return f"{seconds // 3600:02}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+
+
+def _value(value: float) -> int | float:
+    return int(value) if value.is_integer() else value
+
+
+def aggregate(
+    response: Any,
+    detail_level: str,
+    start_time: str | None = None,
+    end_time: str | None = None,
+) -> Any | None:
+    """Derive an intraday response at a coarser detail level or in a time window.
+
+    The samples of each intraday dataset are bucketed at the detail level, heart rate
+    is averaged and the other resources (e.g. steps) summed. Buckets without samples
+    are omitted, as in the responses of the Web API. The daily values are kept as is.
+
+    Parameters
+    ----------
+    response : Any
+        The decoded response of an intraday endpoint at a finer detail level.
+    detail_level : str
+        The detail level of the derived response, e.g. `"15min"`.
+    start_time : str | None, optional
+        The start of the window as `HH:mm`, by default the start of the day.
+    end_time : str | None, optional
+        The inclusive end of the window as `HH:mm`, by default the end of the day.
+
+    Returns
+    -------
+    Any | None
+        The derived response, or `None` if the response has no intraday datasets.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If numpy is not installed.
+    """
+    if not isinstance(response, dict):
+        return None
+    width = resample.seconds(detail_level)
+    low = 0 if start_time is None else series.clock(start_time)
+    high = 24 * 60 * 60 if end_time is None else series.clock(end_time) + 60
+    derived, found = dict(response), False
+    for name, intraday in response.items():
+        if not name.endswith("-intraday"):
+            continue
+        if not isinstance(intraday, dict) or "dataset" not in intraday:
+            return None
+        found = True
+        times, values = [], []
+        for sample in intraday["dataset"]:
+            if low <= (seconds := series.clock(sample["time"])) < high:
+                times.append(seconds)
+                values.append(sample["value"])
+        buckets = resample.resample(times, values, width)
+        totals = buckets.mean if name in MEAN_RESOURCES else buckets.sum
+        derived[name] = {
+            **intraday,
+            "dataset": [
+                {"time": _clock(int(bucket)), "value": _value(float(total))}
+                for bucket, total, count in zip(
+                    buckets.time.astype("int64"), totals, buckets.counts
+                )
+                if count
+            ],
+            "datasetInterval": width if width < 60 else width // 60,
+            "datasetType": "second" if width < 60 else "minute",
+        }
+    return derived if found else None
+
+
+class Cache:
+    """Least recently used cache of responses.
+
+    The responses of range endpoints (see `date_range`) are stored per day, so a
+    range is answered from the cached days and `missing` gives the requests for the
+    days that are not cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float | None = None,
+        recent_ttl: float | None = 5 * 60,
+        maxdays: int = 100_000,
+    ) -> None:
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The number of responses to keep, by default 256.
+        ttl : float | None, optional
+            The seconds after which responses expire, by default never.
+        recent_ttl : float | None, optional
+            The seconds after which responses for today (or later) expire, as they
+            may still change, by default 5 minutes.
+        maxdays : int, optional
+            The number of days of range responses to keep, by default 100000.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.recent_ttl = recent_ttl
+        self.maxdays = maxdays
+        self._entries: collections.OrderedDict[Any, tuple[float | None, Any]] = (
+            collections.OrderedDict()
+        )
+        self._days: collections.OrderedDict[Any, tuple[float | None, Any]] = (
+            collections.OrderedDict()
+        )
+        self._unsplit: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of responses and days stored."""
+        return len(self._entries) + len(self._days)
+
+    def clear(self) -> None:
+        """Remove all the responses."""
+        with self._lock:
+            self._entries.clear()
+            self._days.clear()
+
+    def put(
+        self,
+        user_id: str,
+        endpoint: str,
+        param_kwargs: Mapping[str, Any] | None,
+        query_kwargs: Mapping[str, Any] | None,
+        response: Any,
+    ) -> None:
+        """Cache the response of a request."""
+        if days_key := self._days_key(user_id, endpoint, param_kwargs, query_kwargs):
+            series_key, dates = days_key
+            if (parts := split(response, dates)) is not None:
+                for date, part in parts.items():
+                    self._store(
+                        self._days,
+                        self.maxdays,
+                        (series_key, date),
+                        part,
+                        {"date": date},
+                    )
+                return
+            self._unsplit.add(endpoint)
+        self._store(
+            self._entries,
+            self.maxsize,
+            key(user_id, endpoint, param_kwargs, query_kwargs),
+            response,
+            param_kwargs or {},
+        )
+
+    def get(
+        self,
+        user_id: str,
+        endpoint: str,
+        param_kwargs: Mapping[str, Any] | None = None,
+        query_kwargs: Mapping[str, Any] | None = None,
+    ) -> Any | None:
+        """Get the response of a request, from the cache or derived from it.
+
+        Parameters
+        ----------
+        user_id : str
+            The user the request is for.
+        endpoint : str
+            The template of the endpoint.
+        param_kwargs : Mapping[str, Any] | None, optional
+            The formatted path parameters.
+        query_kwargs : Mapping[str, Any] | None, optional
+            The formatted query parameters.
+
+        Returns
+        -------
+        Any | None
+            The response, or `None` if it is not cached and cannot be derived.
+        """
+        if days_key := self._days_key(user_id, endpoint, param_kwargs, query_kwargs):
+            series_key, dates = days_key
+            parts = []
+            for date in dates:
+                if (part := self._lookup(self._days, (series_key, date))) is None:
+                    return None
+                parts.append(part)
+            return join(parts)
+        entry = key(user_id, endpoint, param_kwargs, query_kwargs)
+        response = self._lookup(self._entries, entry)
+        if response is None and param_kwargs:
+            response = self._derive(user_id, endpoint, param_kwargs, query_kwargs)
+            if response is not None:
+                self.put(user_id, endpoint, param_kwargs, query_kwargs, response)
+        return response
+
+    def missing(
+        self,
+        user_id: str,
+        endpoint: str,
+        param_kwargs: Mapping[str, Any] | None = None,
+        query_kwargs: Mapping[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get the requests for the days of a range request which are not cached.
+
+        Consecutive missing days are coalesced into as few requests as the maximum
+        range of the endpoint allows.
+
+        Parameters
+        ----------
+        user_id : str
+            The user the request is for.
+        endpoint : str
+            The template of the endpoint.
+        param_kwargs : Mapping[str, Any] | None, optional
+            The formatted path parameters.
+        query_kwargs : Mapping[str, Any] | None, optional
+            The formatted query parameters.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The path parameters of the requests, or just `param_kwargs` if the
+            responses of the endpoint are not stored per day.
+        """
+        days_key = self._days_key(user_id, endpoint, param_kwargs, query_kwargs)
+        bounds = date_range(endpoint)
+        if not days_key or bounds is None or param_kwargs is None:
+            return [dict(param_kwargs or {})]
+        series_key, dates = days_key
+        start, end, max_days = bounds
+        runs: list[list[str]] = []
+        previous = None
+        for index, date in enumerate(dates):
+            if self._lookup(self._days, (series_key, date)) is not None:
+                continue
+            if previous != index - 1 or (max_days and len(runs[-1]) >= max_days):
+                runs.append([])
+            runs[-1].append(date)
+            previous = index
+        return [{**param_kwargs, start: run[0], end: run[-1]} for run in runs]
+
+    def _days_key(
+        self,
+        user_id: str,
+        endpoint: str,
+        param_kwargs: Mapping[str, Any] | None,
+        query_kwargs: Mapping[str, Any] | None,
+    ) -> tuple[Key, list[str]] | None:
+        if (
+            not param_kwargs
+            or endpoint in self._unsplit
+            or (dates := date_range(endpoint)) is None
+        ):
+            return None
+        try:
+            selected = days(param_kwargs[dates.start], param_kwargs[dates.end])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not selected:
+            return None
+        params = {
+            name: value
+            for name, value in param_kwargs.items()
+            if name not in (dates.start, dates.end)
+        }
+        return key(user_id, endpoint, params, query_kwargs), selected
+
+    def _store(
+        self,
+        entries: collections.OrderedDict[Any, tuple[float | None, Any]],
+        maxsize: int,
+        entry: Any,
+        response: Any,
+        params: Mapping[str, Any],
+    ) -> None:
+        ttl = self.ttl
+        if self.recent_ttl is not None and _recent(params):
+            ttl = self.recent_ttl if ttl is None else min(ttl, self.recent_ttl)
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            entries[entry] = (expires, response)
+            entries.move_to_end(entry)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+
+    def _lookup(
+        self,
+        entries: collections.OrderedDict[Any, tuple[float | None, Any]],
+        entry: Any,
+    ) -> Any | None:
+        with self._lock:
+            if (cached := entries.get(entry)) is None:
+                return None
+            expires, response = cached
+            if expires is not None and expires <= time.monotonic():
+                del entries[entry]
+                return None
+            entries.move_to_end(entry)
+            return response
+
+    def _derive(
+        self,
+        user_id: str,
+        endpoint: str,
+        param_kwargs: Mapping[str, Any],
+        query_kwargs: Mapping[str, Any] | None,
+    ) -> Any | None:
+        level = param_kwargs.get("detail-level")
+        if level not in resample.INTERVALS or resample.np is None:
+            return None
+        width = resample.seconds(level)
+        finer = sorted(
+            (
+                name
+                for name, seconds in resample.INTERVALS.items()
+                if seconds <= width and width % seconds == 0
+            ),
+            key=resample.seconds,
+            reverse=True,
+        )
+        sources = [(endpoint, dict(param_kwargs))]
+        if WINDOW in endpoint and "/1d/" in endpoint:
+            day = {
+                name: value
+                for name, value in param_kwargs.items()
+                if name not in ("start-time", "end-time")
+            }
+            sources.append((endpoint.replace(WINDOW, ""), day))
+        for source, params in sources:
+            for name in finer:
+                if source == endpoint and name == level:
+                    continue
+                response = self._lookup(
+                    self._entries,
+                    key(
+                        user_id, source, {**params, "detail-level": name}, query_kwargs
+                    ),
+                )
+                if response is None:
+                    continue
+                window = source != endpoint
+                derived = aggregate(
+                    response,
+                    level,
+                    param_kwargs.get("start-time") if window else None,
+                    param_kwargs.get("end-time") if window else None,
+                )
+                if derived is not None:
+                    return derived
+        return None
@@ -1,62 +1,372 @@
 """Implementation of main client."""
 
-from typing import Any
+import asyncio
+import contextlib
+import datetime
+import functools
+import json
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Literal
 
-import aiohttp
-import requests
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+    from fitbit_web import breaker, cache, pipeline, tokens
 
 try:
     from loguru import logger
+
+    def _debug(message: str, *args: Any) -> None:
+        logger.opt(depth=1).debug(message, *args)
+
 except ModuleNotFoundError:
     import logging
 
     logger = logging.getLogger()  # type: ignore
 
-from fitbit_web import api, auth, utils
+    def _debug(message: str, *args: Any) -> None:
+        if logger.isEnabledFor(logging.DEBUG):  # type: ignore[attr-defined]
+            logger.debug(message.format(*args), stacklevel=2)
+
+
+from fitbit_web import api, auth, instrumentation, scopes, streaming, utils
 
 TIMEOUT: float = 2
 
 
-class Client(api.FitbitWebApi):
-    """Fitbit WebAPI client."""
+class BaseClient(api.BaseApi):
+    """Requests of the Fitbit WebAPI clients, without any endpoints.
+
+    JSON responses are decoded, any other content (e.g. the TCX of an activity) is
+    returned as raw bytes which can be parsed with `fitbit_web.tcx`.
+    """
 
-    def __init__(self, tokens: auth.AuthTokens) -> None:
-        """Create a client using the given auth tokens."""
+    def __init__(
+        self,
+        tokens: auth.AuthTokens,
+        base_url: str = utils.BASE_URL,
+        hooks: Sequence[instrumentation.Hook] = (),
+        check_scopes: bool = True,
+        cache: "cache.Cache | None" = None,
+        token_store: "tokens.TokenStore | None" = None,
+        breaker: "breaker.CircuitBreaker | None" = None,
+    ) -> None:
+        """Create a client using the given auth tokens.
+
+        Parameters
+        ----------
+        tokens : auth.AuthTokens
+            The tokens used to authorize the requests.
+        base_url : str, optional
+            The root of the Web API, by default the Fitbit server. This can be set
+            to use a different server, e.g. `fitbit_web.mock_server`.
+        hooks : Sequence[instrumentation.Hook], optional
+            Hooks called at the start and end of each request, e.g. to collect
+            metrics, by default none.
+        check_scopes : bool, optional
+            Whether to raise a `scopes.ScopeError` instead of making a request the
+            tokens have none of the scopes for, by default True. The check is skipped
+            if the scopes of the tokens are not known.
+        cache : cache.Cache | None, optional
+            The cache of the decoded responses, by default none. Streamed responses
+            are never cached. The days of a range request which are not cached are
+            requested separately, see `cache.Cache.missing`, and period requests
+            are made as the equivalent range requests, see `periods.normalize`.
+        token_store : tokens.TokenStore | None, optional
+            The store the tokens are refreshed through, so clients in other
+            processes use the refreshed tokens instead of refreshing them again, by
+            default none.
+        breaker : breaker.CircuitBreaker | None, optional
+            The circuit breaker of the endpoints, so requests to endpoints with many
+            server errors fail fast with a `breaker.CircuitOpenError`, by default
+            none. Cached responses are returned regardless.
+        """
         self.__tokens = tokens
+        self.base_url = base_url
+        self.hooks = tuple(hooks)
+        self.check_scopes = check_scopes
+        self.cache = cache
+        self.token_store = token_store
+        self.breaker = breaker
 
-    def _get(
+    @property
+    def tokens(self) -> auth.AuthTokens:
+        """The auth tokens, which are replaced when refreshed."""
+        return self.__tokens
+
+    def streaming(self, prefix: str | None = None) -> streaming.StreamingApi:
+        """Get a view of the client which streams response bodies.
+
+        The methods of the returned object yield incrementally parsed values instead
+        of returning the decoded body, so that large (e.g. intraday) responses are
+        never held in memory. The async methods return an async iterator.
+
+        Parameters
+        ----------
+        prefix : str | None, optional
+            The ijson prefix of the items to yield (e.g.
+            `"activities-heart-intraday.dataset.item"`). If `None`, the raw
+            `(prefix, event, value)` parse events are yielded. Non-JSON bodies are
+            always yielded as raw chunks of bytes.
+
+        Returns
+        -------
+        StreamingApi
+            The streaming view of this client.
+        """
+        return streaming.StreamingApi(self, prefix)
+
+    def stream(
         self,
-        url: str,
-        param_kwargs: dict[str, Any] | None = None,
-        query_kwargs: dict[str, Any] | None = None,
-    ):
-        url = utils.format_url(url, param_kwargs, query_kwargs)
-        logger.debug(f"GETting from Fitbit WebAPI: {url}")
-        response = requests.get(
-            url,
-            headers={
-                "Authorization": f"Bearer {self.__tokens.access_token}",
-                "Accept": "application/json",
-            },
-            timeout=TIMEOUT,
+        method: str,
+        start: str | datetime.date,
+        end: str | datetime.date = "today",
+        concurrency: int = 4,
+        max_queue: int = 16,
+        max_days: int | None = None,
+        **arguments: Any,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Stream the responses of a date range day by day as they arrive.
+
+        The range is requested in chunks of the maximum range of the endpoint (or
+        a request per day for single date endpoints, e.g. `get_sleep_by_date`), at
+        most `concurrency` at a time. Responses which cannot be split into days (see
+        `cache.split`) are yielded whole, on the first date of their request.
+
+        Parameters
+        ----------
+        method : str
+            The name of the sync method, e.g. "get_sleep_by_date_range".
+        start : str | datetime.date
+            The first date.
+        end : str | datetime.date, optional
+            The last date, by default today.
+        concurrency : int, optional
+            The number of requests made at a time, by default 4.
+        max_queue : int, optional
+            The number of days which can wait to be consumed before no more requests
+            are made, by default 16.
+        max_days : int | None, optional
+            The most days of each request, by default the maximum of the endpoint.
+        **arguments : Any
+            The other arguments of the method, e.g. `resource_path`.
+
+        Returns
+        -------
+        AsyncIterator[tuple[str, Any]]
+            The date and response of each day, in order of completion. Closing the
+            iterator cancels the requests in progress.
+
+        Raises
+        ------
+        ValueError
+            If the method is not of a date endpoint, or of an endpoint with several
+            dates which is not a range endpoint (e.g. a multi-day intraday one).
+        """
+        from fitbit_web import pipeline
+
+        return pipeline.stream(
+            self, method, start, end, concurrency, max_queue, max_days, **arguments
         )
-        logger.debug(f"Got status code {response.status_code}")
-        if response.status_code == 401:
-            logger.debug("Refreshing token...")
+
+    def raw(self) -> "pipeline.RawApi":
+        """Get a view of the client whose methods return the raw response bodies.
+
+        The bodies are neither decoded nor cached, e.g. to decode them in another
+        process with `fitbit_web.pipeline`.
+        """
+        from fitbit_web import pipeline
+
+        return pipeline.RawApi(self)
+
+    def _refresh(self) -> None:
+        """Refresh the tokens, through the token store if there is one.
+
+        The refresh is a synchronous request, which with a `tokens.SqliteTokenStore`
+        is made inside its `BEGIN IMMEDIATE` transaction. `_arequest` runs it in a
+        thread, so waiting for the refresh (or for a refresh by another process) does
+        not block the event loop.
+        """
+        _debug("Refreshing token...")
+        if self.token_store is None:
             self.__tokens = self.__tokens.refresh()
-            logger.debug(f"GETting from Fitbit WebAPI: {url}")
+        else:
+            self.__tokens = self.token_store.refresh(self.__tokens)
+
+    @contextlib.contextmanager
+    def _circuit(
+        self,
+        info: instrumentation.RequestInfo,
+        connection_errors: tuple[type[BaseException], ...],
+    ) -> Iterator[None]:
+        if self.breaker is None:
+            yield
+        else:
+            with self.breaker.call(info, connection_errors):
+                yield
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.__tokens.access_token}",
+            "Accept": "application/json",
+        }
+
+    @contextlib.contextmanager
+    def _instrument(
+        self,
+        endpoint: str,
+        param_kwargs: dict[str, Any] | None,
+        query_kwargs: dict[str, Any] | None,
+        mode: Literal["sync", "async"],
+    ) -> Iterator[instrumentation.RequestInfo]:
+        if self.check_scopes and self.__tokens.scope:
+            scopes.check(endpoint, self.__tokens.scope)
+        info = instrumentation.RequestInfo(
+            endpoint=endpoint,
+            url=utils.format_url(endpoint, param_kwargs, query_kwargs, self.base_url),
+            user_id=self.__tokens.user_id,
+            mode=mode,
+        )
+        instrumentation.request_start(self.hooks, info)
+        try:
+            yield info
+        except GeneratorExit:
+            instrumentation.request_end(self.hooks, info)
+            raise
+        except BaseException as e:
+            instrumentation.request_end(self.hooks, info, e)
+            raise
+        instrumentation.request_end(self.hooks, info)
+
+    def _normalize(
+        self, url: str, param_kwargs: dict[str, Any] | None
+    ) -> tuple[str, dict[str, Any] | None]:
+        if self.cache is None:
+            return url, param_kwargs
+        from fitbit_web import periods
+
+        return periods.normalize(url, param_kwargs)
+
+    def _cached(
+        self,
+        info: instrumentation.RequestInfo,
+        param_kwargs: dict[str, Any] | None,
+        query_kwargs: dict[str, Any] | None,
+    ) -> Any | None:
+        if self.cache is None:
+            return None
+        response = self.cache.get(
+            info.user_id, info.endpoint, param_kwargs, query_kwargs
+        )
+        if response is not None:
+            _debug("Answered from the cache: {}", info.url)
+            info.cache_hit = True
+            info.status = 200
+        return response
+
+    def _missing(
+        self,
+        info: instrumentation.RequestInfo,
+        param_kwargs: dict[str, Any] | None,
+        query_kwargs: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        if self.cache is None:
+            return []
+        missing = self.cache.missing(
+            info.user_id, info.endpoint, param_kwargs, query_kwargs
+        )
+        return [] if missing == [param_kwargs or {}] else missing
+
+    def _request(
+        self,
+        info: instrumentation.RequestInfo,
+        stream: bool = False,
+    ) -> "requests.Response":
+        import requests
+
+        with self._circuit(info, (requests.ConnectionError, requests.Timeout)):
+            _debug("GETting from Fitbit WebAPI: {}", info.url)
             response = requests.get(
-                url,
-                headers={
-                    "Authorization": f"Bearer {self.__tokens.access_token}",
-                    "Accept": "application/json",
-                },
-                timeout=TIMEOUT,
+                info.url, headers=self._headers(), timeout=TIMEOUT, stream=stream
             )
+            _debug("Got status code {}", response.status_code)
+            if response.status_code == 401:
+                response.close()
+                self._refresh()
+                info.retries += 1
+                _debug("GETting from Fitbit WebAPI: {}", info.url)
+                response = requests.get(
+                    info.url, headers=self._headers(), timeout=TIMEOUT, stream=stream
+                )
+            info.status = response.status_code
+            instrumentation.read_rate_limit(info, response.headers)
+            if response.status_code != 200:
+                raise Exception(response.text)
+            return response
+
+    @contextlib.asynccontextmanager
+    async def _arequest(
+        self,
+        session: "aiohttp.ClientSession",
+        info: instrumentation.RequestInfo,
+        stream: bool = False,
+    ) -> AsyncIterator["aiohttp.ClientResponse"]:
+        import aiohttp
+
+        timeout = aiohttp.ClientTimeout(
+            total=None if stream else TIMEOUT, sock_read=TIMEOUT
+        )
+        with self._circuit(info, (aiohttp.ClientError, asyncio.TimeoutError)):
+            _debug("GETting from Fitbit WebAPI: {}", info.url)
+            async with session.get(
+                info.url, headers=self._headers(), timeout=timeout
+            ) as response:
+                _debug("Got status code {}", response.status)
+                if response.status != 401:
+                    info.status = response.status
+                    instrumentation.read_rate_limit(info, response.headers)
+                    if response.status != 200:
+                        raise Exception(await response.text())
+                    yield response
+                    return
+            await asyncio.to_thread(self._refresh)
+            info.retries += 1
+            _debug("GETting from Fitbit WebAPI: {}", info.url)
+            async with session.get(
+                info.url, headers=self._headers(), timeout=timeout
+            ) as response:
+                info.status = response.status
+                instrumentation.read_rate_limit(info, response.headers)
+                if response.status != 200:
+                    raise Exception(await response.text())
+                yield response
 
-        if response.status_code != 200:
-            raise Exception(response.text)
-        return response.json()
+    def _get(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ):
+        url, param_kwargs = self._normalize(url, param_kwargs)
+        with self._instrument(url, param_kwargs, query_kwargs, "sync") as info:
+            if (cached := self._cached(info, param_kwargs, query_kwargs)) is not None:
+                return cached
+            if missing := self._missing(info, param_kwargs, query_kwargs):
+                for params in missing:
+                    self._get(url, params, query_kwargs)
+                cached = self._cached(info, param_kwargs, query_kwargs)
+                if cached is not None:
+                    return cached
+            response = self._request(info)
+            info.bytes = len(response.content)
+            if utils.is_json(response.headers.get("Content-Type")):
+                body = response.json()
+            else:
+                body = response.content
+            if self.cache is not None:
+                self.cache.put(info.user_id, url, param_kwargs, query_kwargs, body)
+            return body
 
     async def _aget(
         self,
@@ -64,32 +374,146 @@ class Client(api.FitbitWebApi):
         param_kwargs: dict[str, Any] | None = None,
         query_kwargs: dict[str, Any] | None = None,
     ):
-        url = utils.format_url(url, param_kwargs, query_kwargs)
-        logger.debug(f"GETting from Fitbit WebAPI: {url}")
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                headers={
-                    "Authorization": f"Bearer {self.__tokens.access_token}",
-                    "Accept": "application/json",
-                },
-                timeout=TIMEOUT,
-            ) as response:
-                logger.debug(f"Got status code {response.status}")
-                if response.status == 401:
-                    logger.debug("Refreshing token...")
-                    self.__tokens = self.__tokens.refresh()
-                    logger.debug(f"GETting from Fitbit WebAPI: {url}")
-                    async with session.get(
-                        url,
-                        headers={
-                            "Authorization": f"Bearer {self.__tokens.access_token}",
-                            "Accept": "application/json",
-                        },
-                        timeout=TIMEOUT,
-                    ) as response:
-                        if response.status != 200:
-                            raise Exception(response.text)
-                        else:
-                            return await response.json()
-                return await response.json()
+        import aiohttp
+
+        url, param_kwargs = self._normalize(url, param_kwargs)
+        with self._instrument(url, param_kwargs, query_kwargs, "async") as info:
+            if (cached := self._cached(info, param_kwargs, query_kwargs)) is not None:
+                return cached
+            if missing := self._missing(info, param_kwargs, query_kwargs):
+                for params in missing:
+                    await self._aget(url, params, query_kwargs)
+                cached = self._cached(info, param_kwargs, query_kwargs)
+                if cached is not None:
+                    return cached
+            async with (
+                aiohttp.ClientSession() as session,
+                self._arequest(session, info) as response,
+            ):
+                body = await response.read()
+                info.bytes = len(body)
+                if utils.is_json(response.headers.get("Content-Type")):
+                    body = json.loads(body)
+            if self.cache is not None:
+                self.cache.put(info.user_id, url, param_kwargs, query_kwargs, body)
+            return body
+
+    def _raw(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ) -> bytes:
+        with self._instrument(url, param_kwargs, query_kwargs, "sync") as info:
+            response = self._request(info)
+            info.bytes = len(response.content)
+            return response.content
+
+    async def _araw(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ) -> bytes:
+        import aiohttp
+
+        with self._instrument(url, param_kwargs, query_kwargs, "async") as info:
+            async with (
+                aiohttp.ClientSession() as session,
+                self._arequest(session, info) as response,
+            ):
+                body = await response.read()
+                info.bytes = len(body)
+                return body
+
+    def _stream(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+        prefix: str | None = None,
+    ) -> Iterator[Any]:
+        with (
+            self._instrument(url, param_kwargs, query_kwargs, "sync") as info,
+            self._request(info, stream=True) as response,
+        ):
+            chunks = _counted(response.iter_content(streaming.CHUNK_SIZE), info)
+            if utils.is_json(response.headers.get("Content-Type")):
+                yield from streaming.parse(chunks, prefix)
+            else:
+                yield from chunks
+
+    async def _astream(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+        prefix: str | None = None,
+    ) -> AsyncIterator[Any]:
+        import aiohttp
+
+        with self._instrument(url, param_kwargs, query_kwargs, "async") as info:
+            async with (
+                aiohttp.ClientSession() as session,
+                self._arequest(session, info, stream=True) as response,
+            ):
+                chunks = _acounted(
+                    response.content.iter_chunked(streaming.CHUNK_SIZE), info
+                )
+                if utils.is_json(response.headers.get("Content-Type")):
+                    async for value in streaming.aparse(chunks, prefix):
+                        yield value
+                else:
+                    async for chunk in chunks:
+                        yield chunk
+
+
+class Client(BaseClient, api.FitbitWebApi):
+    """Fitbit WebAPI client with all the endpoints.
+
+    JSON responses are decoded, any other content (e.g. the TCX of an activity) is
+    returned as raw bytes which can be parsed with `fitbit_web.tcx`.
+    """
+
+
+@functools.cache
+def compose(
+    *modules: str, mode: Literal["sync", "async", "both"] = "both"
+) -> type[BaseClient]:
+    """Compose a client class from only some groups of endpoints.
+
+    Parameters
+    ----------
+    *modules : str
+        The endpoint groups, as the names of their modules in `fitbit_web.api` (e.g.
+        `"sleep"`, `"heart_rate_time_series"`). By default all groups.
+    mode : Literal["sync", "async", "both"], optional
+        Whether to include the sync or async methods, by default both.
+
+    Returns
+    -------
+    type[BaseClient]
+        The client class, which is created once per combination of arguments.
+
+    Examples
+    --------
+    >>> AsyncSleepClient = client.compose("sleep", mode="async")
+    >>> await AsyncSleepClient(tokens).aget_sleep_by_date("today")
+    """
+    return type("Client", (*api.mixins(modules or None, mode), BaseClient), {})
+
+
+def _counted(
+    chunks: Iterator[bytes], info: instrumentation.RequestInfo
+) -> Iterator[bytes]:
+    for chunk in chunks:
+        info.bytes += len(chunk)
+        yield chunk
+
+
+async def _acounted(
+    chunks: AsyncIterator[bytes], info: instrumentation.RequestInfo
+) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        info.bytes += len(chunk)
+        yield chunk
@@ -0,0 +1,335 @@
+"""Bulk export of the history of users to JSON lines, Parquet or SQLite.
+
+The requests of each user are planned as a `backfill.plan` (so ranges are chunked to
+the maximum of each endpoint) and made with the async client, several users and
+several requests of each at a time. Responses are written as they complete and
+recorded in a journal, so an interrupted export resumes where it stopped. Clients
+sharing a `cache.Cache` do not request the days of overlapping resources twice::
+
+    with export.writer("fitbit.jsonl") as output:
+        asyncio.run(export.export(output, web_clients, ["get_sleep_by_date_range"]))
+
+It is run from the command line with `python -m fitbit_web export`.
+"""
+
+import abc
+import asyncio
+import datetime
+import json
+import os
+import pathlib
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped, import-not-found]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped, import-not-found]
+except ModuleNotFoundError:
+    pa = pq = None  # type: ignore
+
+from fitbit_web import backfill, journal, series, store
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from fitbit_web import client
+
+FORMATS = {
+    ".jsonl": "jsonl",
+    ".parquet": "parquet",
+    **{suffix: "sqlite" for suffix in journal.SQLITE_SUFFIXES},
+}
+"""The formats of the output paths by suffix."""
+PROFILE_URL = "/1/user/-/profile.json"
+"""The endpoint of the profile, which has the start of the history of a user."""
+
+
+class Writer(abc.ABC):
+    """Output of an export."""
+
+    resumable = True
+    """Whether the output is appended to, so an interrupted export can be resumed."""
+
+    def __enter__(self) -> "Self":
+        """Use the output as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Close the output."""
+        self.close()
+
+    @abc.abstractmethod
+    def write(self, user_id: str, request: backfill.Request, response: Any) -> int:
+        """Write the response of a request.
+
+        Returns
+        -------
+        int
+            The number of records written.
+        """
+
+    def close(self) -> None:
+        """Close the output."""
+
+
+class JsonlWriter(Writer):
+    """Output of the responses as JSON lines, appended to the file."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Open the file, creating its directory if needed."""
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def write(self, user_id: str, request: backfill.Request, response: Any) -> int:
+        """Append a line of the user, the request and its response."""
+        record = {
+            "user_id": user_id,
+            "method": request.name,
+            "arguments": request.arguments,
+            "response": response,
+        }
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        return 1
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+class SqliteWriter(Writer):
+    """Output of the samples of the responses to a `store.Store`."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Open (or create) the store."""
+        self.store = store.Store(path)
+
+    def write(self, user_id: str, request: backfill.Request, response: Any) -> int:
+        """Store the samples of a response, see `store.Store.ingest`."""
+        return self.store.ingest(user_id, response)
+
+    def close(self) -> None:
+        """Close the store."""
+        self.store.close()
+
+
+class ParquetWriter(Writer):
+    """Output of the samples of the responses to a Parquet file.
+
+    The file has a row of `user_id`, `resource`, `time` and `value` per sample, and
+    is written in row groups. Parquet files cannot be appended to, so an export to
+    Parquet is not resumed.
+    """
+
+    resumable = False
+
+    def __init__(self, path: str | os.PathLike, row_group_size: int = 100_000) -> None:
+        """Create the file.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the file, which is replaced.
+        row_group_size : int, optional
+            The number of samples buffered before a row group is written, by
+            default 100,000.
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If pyarrow is not installed.
+        """
+        if pa is None:
+            raise ModuleNotFoundError(
+                "pyarrow is required for `ParquetWriter`."
+                " Install with `fitbit-web[parquet]`."
+            )
+        self.row_group_size = row_group_size
+        self.schema = pa.schema(
+            [
+                ("user_id", pa.string()),
+                ("resource", pa.string()),
+                ("time", pa.timestamp("s")),
+                ("value", pa.float64()),
+            ]
+        )
+        pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._writer = pq.ParquetWriter(path, self.schema)
+        self._columns: dict[str, list] = {name: [] for name in self.schema.names}
+
+    def write(self, user_id: str, request: backfill.Request, response: Any) -> int:
+        """Buffer the samples of a response, see `series.samples`."""
+        count = 0
+        for resource, (times, values) in series.samples(response).items():
+            self._columns["user_id"] += [user_id] * len(times)
+            self._columns["resource"] += [resource] * len(times)
+            self._columns["time"] += times
+            self._columns["value"] += values
+            count += len(times)
+        if len(self._columns["time"]) >= self.row_group_size:
+            self.flush()
+        return count
+
+    def flush(self) -> None:
+        """Write the buffered samples as a row group."""
+        if self._columns["time"]:
+            self._writer.write_table(pa.table(self._columns, schema=self.schema))
+            self._columns = {name: [] for name in self.schema.names}
+
+    def close(self) -> None:
+        """Write the buffered samples and close the file."""
+        self.flush()
+        self._writer.close()
+
+
+def writer(path: str | os.PathLike, format: str | None = None) -> Writer:
+    """Open the output of an export.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path of the output.
+    format : str | None, optional
+        One of "jsonl", "parquet" or "sqlite", by default from the suffix of the
+        path, see `FORMATS`.
+
+    Raises
+    ------
+    ValueError
+        If the format is not known.
+    """
+    if format is None:
+        format = FORMATS.get(pathlib.Path(path).suffix.lower())
+    if format == "jsonl":
+        return JsonlWriter(path)
+    if format == "parquet":
+        return ParquetWriter(path)
+    if format == "sqlite":
+        return SqliteWriter(path)
+    raise ValueError(
+        f"Unknown format of {path}, expected one of {set(FORMATS.values())}."
+    )
+
+
+async def _export(
+    output: Writer,
+    web_client: "client.BaseClient",
+    resources: Sequence[backfill.Resource],
+    since: str | datetime.date | None,
+    until: str | datetime.date,
+    max_days: int | None,
+    concurrency: int,
+    checkpoint: journal.Journal,
+    jobs: list[backfill.Backfill],
+    progress: Callable[[backfill.Progress], Any] | None,
+) -> int:
+    user_id = web_client.tokens.user_id
+    if since is None:
+        profile = await web_client._aget(PROFILE_URL)
+        since = profile["user"]["memberSince"]
+    job = backfill.Backfill(
+        backfill.plan(resources, since, until, max_days), checkpoint, job=user_id
+    )
+    jobs.append(job)
+    count = 0
+    async for request, response in job.arun(web_client, concurrency):
+        count += output.write(user_id, request, response)
+        if progress is not None:
+            progress(_progress(jobs))
+    if progress is not None:
+        progress(_progress(jobs))
+    return count
+
+
+def _progress(jobs: Iterable[backfill.Backfill]) -> backfill.Progress:
+    done = total = 0
+    eta = None
+    for job in jobs:
+        current = job.progress()
+        done += current.done
+        total += current.total
+        if current.eta is not None and (eta is None or current.eta > eta):
+            eta = current.eta
+    return backfill.Progress(done, total, eta)
+
+
+async def export(
+    output: Writer,
+    web_clients: Iterable["client.BaseClient"],
+    resources: Sequence[backfill.Resource],
+    since: str | datetime.date | None = None,
+    until: str | datetime.date = "today",
+    max_days: int | None = None,
+    concurrency: int = 4,
+    users: int = 8,
+    checkpoint: journal.Journal | str | os.PathLike | None = None,
+    progress: Callable[[backfill.Progress], Any] | None = None,
+) -> int:
+    """Export the history of users.
+
+    Parameters
+    ----------
+    output : Writer
+        The output of the responses, see `writer`.
+    web_clients : Iterable[client.BaseClient]
+        The clients of the users, e.g. with a `cache.Cache` and a
+        `tokens.TokenStore`.
+    resources : Sequence[backfill.Resource]
+        The range methods to export, see `backfill.plan`.
+    since : str | datetime.date | None, optional
+        The first date, by default the start of the history of each user.
+    until : str | datetime.date, optional
+        The last date, by default today.
+    max_days : int | None, optional
+        The most days of each request, by default the maximum of each endpoint.
+    concurrency : int, optional
+        The number of requests made at a time for each user, by default 4.
+    users : int, optional
+        The number of users exported at a time, by default 8.
+    checkpoint : journal.Journal | str | os.PathLike | None, optional
+        The journal of the completed requests, or its path (see `journal.open`), by
+        default none. It is not used if the output is not resumable.
+    progress : Callable[[backfill.Progress], Any] | None, optional
+        Called with the progress of the users started so far after each response,
+        by default none.
+
+    Returns
+    -------
+    int
+        The number of records written.
+    """
+    if checkpoint is None or not output.resumable:
+        checkpoint = journal.MemoryJournal()
+    elif not isinstance(checkpoint, journal.Journal):
+        with journal.open(checkpoint) as opened:
+            return await export(
+                output,
+                web_clients,
+                resources,
+                since,
+                until,
+                max_days,
+                concurrency,
+                users,
+                opened,
+                progress,
+            )
+    slots = asyncio.Semaphore(max(users, 1))
+    jobs: list[backfill.Backfill] = []
+
+    async def run(web_client: "client.BaseClient") -> int:
+        async with slots:
+            return await _export(
+                output,
+                web_client,
+                resources,
+                since,
+                until,
+                max_days,
+                concurrency,
+                checkpoint,
+                jobs,
+                progress,
+            )
+
+    return sum(await asyncio.gather(*map(run, web_clients)))
@@ -0,0 +1,222 @@
+"""Hooks for collecting metrics and traces of the requests made by the client.
+
+A hook receives a `RequestInfo` when a request starts and the same (now completed)
+object when it ends. Adapters are provided for Prometheus and OpenTelemetry, which
+require `prometheus-client` and `opentelemetry-api` respectively::
+
+    client.Client(tokens, hooks=[instrumentation.PrometheusHook()])
+
+Hooks can also observe only the requests made in a context, e.g. those of one call of
+a client shared with other threads or tasks::
+
+    with instrumentation.observe(hook):
+        web_client.get_profile()
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import time
+from typing import Any, Iterator, Literal, Sequence
+
+
+@dataclasses.dataclass
+class RequestInfo:
+    """Details of a request made by the client.
+
+    The fields after `started` are filled in as the request progresses.
+    """
+
+    endpoint: str
+    url: str
+    user_id: str
+    mode: Literal["sync", "async"]
+    started: float = dataclasses.field(default_factory=time.perf_counter)
+    status: int | None = None
+    bytes: int = 0
+    latency: float | None = None
+    retries: int = 0
+    cache_hit: bool = False
+    rate_limit_remaining: int | None = None
+    rate_limit: int | None = None
+    """The number of requests allowed in each rate limit window."""
+    rate_limit_reset: int | None = None
+    """The seconds until the rate limit window resets, when the response was sent."""
+    error: BaseException | None = None
+    context: dict[Any, Any] = dataclasses.field(default_factory=dict)
+    """Storage for hooks to keep state between the start and end of a request."""
+
+
+class Hook:
+    """Base class of the hooks called on the request path."""
+
+    def request_start(self, info: RequestInfo) -> None:
+        """Call when a request starts."""
+
+    def request_end(self, info: RequestInfo) -> None:
+        """Call when a request ends, successfully or not."""
+
+
+_observers: contextvars.ContextVar[tuple[Hook, ...]] = contextvars.ContextVar(
+    "observers", default=()
+)
+
+
+@contextlib.contextmanager
+def observe(*hooks: Hook) -> Iterator[None]:
+    """Call hooks for the requests made in the current context.
+
+    The hooks are called after those of the client. As they are context-local, they
+    only see the requests of the current thread or asyncio task (and of the tasks it
+    creates), not those of other users of the same client.
+    """
+    token = _observers.set((*_observers.get(), *hooks))
+    try:
+        yield
+    finally:
+        _observers.reset(token)
+
+
+def request_start(hooks: Sequence[Hook], info: RequestInfo) -> None:
+    """Call the `request_start` of each hook, and of the observing hooks."""
+    for hook in (*hooks, *_observers.get()):
+        hook.request_start(info)
+
+
+def request_end(
+    hooks: Sequence[Hook], info: RequestInfo, error: BaseException | None = None
+) -> None:
+    """Complete the timing of a request and call the `request_end` of each hook."""
+    info.latency = time.perf_counter() - info.started
+    info.error = error
+    for hook in (*hooks, *_observers.get()):
+        hook.request_end(info)
+
+
+def rate_limit_remaining(headers: Any) -> int | None:
+    """Read the remaining rate limit from the headers of a response."""
+    if (remaining := headers.get("Fitbit-Rate-Limit-Remaining")) is None:
+        return None
+    return int(remaining)
+
+
+def read_rate_limit(info: RequestInfo, headers: Any) -> None:
+    """Read the rate limit fields of a request from the headers of its response."""
+    info.rate_limit_remaining = rate_limit_remaining(headers)
+    if (limit := headers.get("Fitbit-Rate-Limit-Limit")) is not None:
+        info.rate_limit = int(limit)
+    if (reset := headers.get("Fitbit-Rate-Limit-Reset")) is not None:
+        info.rate_limit_reset = int(reset)
+
+
+class PrometheusHook(Hook):
+    """Record requests as Prometheus metrics.
+
+    The metrics are labelled by endpoint template, so latency histograms can be
+    compared per endpoint.
+    """
+
+    def __init__(self, namespace: str = "fitbit_web", registry: Any = None) -> None:
+        """Create the metrics.
+
+        Parameters
+        ----------
+        namespace : str, optional
+            The namespace of the metrics, by default "fitbit_web"
+        registry : prometheus_client.CollectorRegistry, optional
+            The registry for the metrics, by default the global registry.
+        """
+        try:
+            import prometheus_client
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "prometheus-client is required for `PrometheusHook`."
+            ) from e
+        kwargs: dict[str, Any] = {"namespace": namespace}
+        if registry is not None:
+            kwargs["registry"] = registry
+        self.requests = prometheus_client.Counter(
+            "requests",
+            "Requests made to the Web API.",
+            ["endpoint", "status", "cache"],
+            **kwargs,
+        )
+        self.latency = prometheus_client.Histogram(
+            "request_latency_seconds",
+            "Latency of requests to the Web API.",
+            ["endpoint"],
+            **kwargs,
+        )
+        self.response_bytes = prometheus_client.Counter(
+            "response_bytes",
+            "Bytes received from the Web API.",
+            ["endpoint"],
+            **kwargs,
+        )
+        self.retries = prometheus_client.Counter(
+            "retries", "Retried requests to the Web API.", ["endpoint"], **kwargs
+        )
+        self.rate_limit_remaining = prometheus_client.Gauge(
+            "rate_limit_remaining",
+            "Remaining requests in the current rate limit window.",
+            ["user_id"],
+            **kwargs,
+        )
+
+    def request_end(self, info: RequestInfo) -> None:
+        """Record the request."""
+        status = "error" if info.status is None else f"{info.status}"
+        cache = "hit" if info.cache_hit else "miss"
+        self.requests.labels(info.endpoint, status, cache).inc()
+        if info.latency is not None:
+            self.latency.labels(info.endpoint).observe(info.latency)
+        self.response_bytes.labels(info.endpoint).inc(info.bytes)
+        if info.retries:
+            self.retries.labels(info.endpoint).inc(info.retries)
+        if info.rate_limit_remaining is not None:
+            self.rate_limit_remaining.labels(info.user_id).set(
+                info.rate_limit_remaining
+            )
+
+
+class OpenTelemetryHook(Hook):
+    """Record each request as an OpenTelemetry span."""
+
+    def __init__(self, tracer: Any = None) -> None:
+        """Create the hook, by default using the tracer of this package."""
+        try:
+            from opentelemetry import trace
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "opentelemetry-api is required for `OpenTelemetryHook`."
+            ) from e
+        self.trace = trace
+        self.tracer = tracer or trace.get_tracer(__name__)
+
+    def request_start(self, info: RequestInfo) -> None:
+        """Start the span."""
+        info.context[self] = self.tracer.start_span(
+            f"GET {info.endpoint}",
+            kind=self.trace.SpanKind.CLIENT,
+            attributes={
+                "http.method": "GET",
+                "http.url": info.url,
+                "fitbit.endpoint": info.endpoint,
+                "fitbit.user_id": info.user_id,
+            },
+        )
+
+    def request_end(self, info: RequestInfo) -> None:
+        """End the span."""
+        span = info.context.pop(self)
+        if info.status is not None:
+            span.set_attribute("http.status_code", info.status)
+        span.set_attribute("fitbit.bytes", info.bytes)
+        span.set_attribute("fitbit.retries", info.retries)
+        span.set_attribute("fitbit.cache_hit", info.cache_hit)
+        if info.rate_limit_remaining is not None:
+            span.set_attribute("fitbit.rate_limit_remaining", info.rate_limit_remaining)
+        if info.error is not None:
+            span.record_exception(info.error)
+            span.set_status(self.trace.Status(self.trace.StatusCode.ERROR))
+        span.end()
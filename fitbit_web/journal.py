@@ -0,0 +1,206 @@
+"""Append-only journals of the completed work of long-running jobs.
+
+A journal records the keys of completed requests (or any other units of work), so a
+job which is restarted after a crash skips the work already done. Journals are kept
+as JSON lines or in SQLite, and only ever appended to::
+
+    with journal.open("export.jsonl") as done:
+        for request in done.pending(requests, key=lambda request: request.key):
+            ...
+            done.record(request.key)
+
+Combined with idempotent writes (e.g. `store.Store.ingest`), a job can be stopped at
+any point and resumed at the cost of at most the work in progress.
+"""
+
+import abc
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+T = TypeVar("T")
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+"""The suffixes of the paths opened as `SqliteJournal` by `open`."""
+
+
+class Journal(abc.ABC):
+    """Journal of the keys of completed work."""
+
+    def __enter__(self) -> "Self":
+        """Use the journal as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Close the journal."""
+        self.close()
+
+    @abc.abstractmethod
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key has been recorded."""
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """Get the number of keys recorded."""
+
+    @abc.abstractmethod
+    def record(self, key: str) -> None:
+        """Record a key as completed, which is a no-op if already recorded."""
+
+    def close(self) -> None:
+        """Close the journal."""
+
+    def pending(self, items: Iterable[T], key: Callable[[T], str] = str) -> Iterator[T]:
+        """Iterate over the items whose keys have not been recorded."""
+        return (item for item in items if key(item) not in self)
+
+
+class MemoryJournal(Journal):
+    """Journal which is not persisted, e.g. for jobs which need not be resumed."""
+
+    def __init__(self) -> None:
+        """Create an empty journal."""
+        self.keys: set[str] = set()
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key has been recorded."""
+        return key in self.keys
+
+    def __len__(self) -> int:
+        """Get the number of keys recorded."""
+        return len(self.keys)
+
+    def record(self, key: str) -> None:
+        """Record a key as completed."""
+        self.keys.add(key)
+
+
+class JsonlJournal(Journal):
+    """Journal kept as a file of JSON lines, one per recorded key."""
+
+    def __init__(self, path: str | os.PathLike, sync: bool = False) -> None:
+        """Open (or create) a journal.
+
+        A partially written last line, e.g. from a crash, is discarded.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the file.
+        sync : bool, optional
+            Whether to `fsync` the file after each record, so records survive a
+            crash of the machine (not just the process), by default False.
+        """
+        self.path = pathlib.Path(path)
+        self.sync = sync
+        self.keys: set[str] = set()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a+b")
+        self._file.seek(0)
+        data = self._file.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            self._file.truncate(complete)
+        for line in data[:complete].splitlines():
+            if line.strip():
+                self.keys.add(json.loads(line)["key"])
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key has been recorded, from the keys read on opening."""
+        return key in self.keys
+
+    def __len__(self) -> int:
+        """Get the number of keys recorded."""
+        return len(self.keys)
+
+    def record(self, key: str) -> None:
+        """Append a key to the journal."""
+        with self._lock:
+            if key in self.keys:
+                return
+            line = json.dumps({"key": key, "time": time.time()}) + "\n"
+            self._file.write(line.encode())
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+            self.keys.add(key)
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+class SqliteJournal(Journal):
+    """Journal kept in a SQLite database, which can be shared by processes."""
+
+    def __init__(
+        self, path: str | os.PathLike, table: str = "journal", timeout: float = 5
+    ) -> None:
+        """Open (or create) a journal.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the database.
+        table : str, optional
+            The table of the keys, by default "journal".
+        timeout : float, optional
+            The seconds to wait for the write lock of another connection (e.g. of
+            another process) before raising a `sqlite3.OperationalError`, by default
+            5.
+        """
+        self.table = table
+        self.connection = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("  # nosec: B608
+            "key TEXT PRIMARY KEY, time REAL NOT NULL) WITHOUT ROWID"
+        )
+        self.connection.commit()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key has been recorded, by any connection."""
+        with self._lock:
+            return (
+                self.connection.execute(
+                    f"SELECT 1 FROM {self.table} WHERE key = ?", (key,)  # nosec: B608
+                ).fetchone()
+                is not None
+            )
+
+    def __len__(self) -> int:
+        """Get the number of keys recorded, by any connection."""
+        with self._lock:
+            return self.connection.execute(
+                f"SELECT COUNT(*) FROM {self.table}"  # nosec: B608
+            ).fetchone()[0]
+
+    def record(self, key: str) -> None:
+        """Insert a key into the journal."""
+        with self._lock, self.connection:
+            self.connection.execute(
+                f"INSERT OR IGNORE INTO {self.table} (key, time) VALUES (?, ?)",  # nosec: B608
+                (key, time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+
+def open(path: str | os.PathLike) -> Journal:
+    """Open a journal, in SQLite if the path has one of `SQLITE_SUFFIXES`."""
+    if pathlib.Path(path).suffix.lower() in SQLITE_SUFFIXES:
+        return SqliteJournal(path)
+    return JsonlJournal(path)
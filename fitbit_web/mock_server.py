@@ -0,0 +1,613 @@
+"""Local stand-in for the Fitbit Web API.
+
+The server answers every GET endpoint of `api.FitbitWebApi` with deterministic,
+synthetic payloads shaped like the real responses, and emulates the rate-limit
+headers, access token expiry, single-use refresh tokens and transient server
+errors. It is intended for testing and benchmarking the client without the real
+API::
+
+    with mock_server.MockServer(latency=0.01).run_in_thread() as server:
+        web_client = client.Client(tokens, base_url=server.base_url)
+
+It can also be run standalone with `python -m fitbit_web.mock_server`.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import datetime
+import functools
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from typing import Any, Iterator, Mapping, Sequence
+
+from aiohttp import web
+
+from fitbit_web import periods
+from fitbit_web.api import metadata
+
+RATE_LIMIT_HEADERS = (
+    "Fitbit-Rate-Limit-Limit",
+    "Fitbit-Rate-Limit-Remaining",
+    "Fitbit-Rate-Limit-Reset",
+)
+PERIOD_DAYS: Mapping[str, int] = {**periods.PERIOD_DAYS, "max": 365}
+DETAIL_SECONDS: Mapping[str, int] = {"1sec": 1, "1min": 60, "5min": 300, "15min": 900}
+PARAMETER_PATTERNS: Mapping[str, str] = {
+    "date": r"\d{4}-\d{2}-\d{2}|today",
+    "time": r"\d{2}:\d{2}",
+    "period": "|".join(PERIOD_DAYS),
+    "level": r"\d+(?:sec|min)",
+}
+
+
+def endpoints() -> tuple[str, ...]:
+    """Get the path templates of the GET endpoints of the Web API."""
+    return tuple(
+        dict.fromkeys(endpoint.path for endpoint in metadata.ENDPOINTS.values())
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Route:
+    """A compiled endpoint template."""
+
+    template: str
+    pattern: re.Pattern
+    names: tuple[str, ...]
+
+    @classmethod
+    def compile(cls, template: str) -> "Route":
+        """Compile an endpoint template into a route."""
+        names = tuple(re.findall(r"\{([^}]+)\}", template))
+        regex = ""
+        for literal, name in itertools.zip_longest(
+            re.split(r"\{[^}]+\}", template), names
+        ):
+            regex += re.escape(literal)
+            if name is not None:
+                kind = next(
+                    (
+                        pattern
+                        for key, pattern in PARAMETER_PATTERNS.items()
+                        if key in name.lower()
+                    ),
+                    r"[^/]+?",
+                )
+                regex += f"({kind})"
+        return cls(template, re.compile(f"^{regex}$"), names)
+
+    def match(self, path: str) -> dict[str, str] | None:
+        """Match a path against the route, returning the path parameters."""
+        if (match := self.pattern.match(path)) is None:
+            return None
+        return dict(zip(self.names, match.groups()))
+
+
+@functools.cache
+def routes() -> tuple[Route, ...]:
+    """Get the routes for all the endpoints, most specific first."""
+    return tuple(
+        sorted(
+            (Route.compile(template) for template in endpoints()),
+            key=lambda route: -len(re.sub(r"\{[^}]+\}", "", route.template)),
+        )
+    )
+
+
+def resolve(path: str) -> tuple[str, dict[str, str]] | None:
+    """Find the endpoint template and the path parameters for a path."""
+    for route in routes():
+        if (params := route.match(path)) is not None:
+            return route.template, params
+    return None
+
+
+def _date(value: str) -> datetime.date:
+    if value == "today":
+        return datetime.date.today()
+    return datetime.date.fromisoformat(value)
+
+
+def _days(params: Mapping[str, str]) -> list[datetime.date]:
+    dates = [_date(v) for k, v in params.items() if "date" in k.lower()]
+    if not dates:
+        dates = [datetime.date.today()]
+    end = dates[-1]
+    if (period := params.get("period", "")) in PERIOD_DAYS:
+        start = end - datetime.timedelta(days=PERIOD_DAYS[period] - 1)
+    else:
+        start = dates[0]
+    return [start + datetime.timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def _times(params: Mapping[str, str]) -> range:
+    step = DETAIL_SECONDS.get(params.get("detail-level", "1min"), 60)
+    start, end = 0, 24 * 60 * 60
+    if "start-time" in params:
+        hours, minutes = map(int, params["start-time"].split(":"))
+        start = hours * 3600 + minutes * 60
+    if "end-time" in params:
+        hours, minutes = map(int, params["end-time"].split(":"))
+        end = hours * 3600 + minutes * 60 + 60
+    return range(start, end, step)
+
+
+def _clock(seconds: int) -> str:
+    return f"{seconds // 3600:02}:{seconds // 60 % 60:02}:{seconds % 60:02}"
+
+
+def _series(key: str, days: Sequence[datetime.date], value: Any) -> dict[str, Any]:
+    return {key: [{"dateTime": f"{day}", "value": value(day)} for day in days]}
+
+
+def _intraday(
+    key: str, params: Mapping[str, str], value: Any
+) -> dict[str, dict[str, Any]]:
+    step = DETAIL_SECONDS.get(params.get("detail-level", "1min"), 60)
+    return {
+        key: {
+            "dataset": [{"time": _clock(t), "value": value(t)} for t in _times(params)],
+            "datasetInterval": step if step < 60 else step // 60,
+            "datasetType": "second" if step < 60 else "minute",
+        }
+    }
+
+
+def _minutes(
+    day: datetime.date, params: Mapping[str, str], value: Any
+) -> list[dict[str, Any]]:
+    return [
+        {"minute": f"{day}T{_clock(t)}", "value": value(t)}
+        for t in _times({**params, "detail-level": "1min"})
+    ]
+
+
+def _tcx(rng: random.Random, points: int = 600) -> bytes:
+    start = datetime.datetime(2024, 1, 1, 8, tzinfo=datetime.timezone.utc)
+    trackpoints = "".join(
+        f"<Trackpoint><Time>{start + datetime.timedelta(seconds=i):%Y-%m-%dT%H:%M:%S.000Z}</Time>"
+        f"<Position><LatitudeDegrees>{51.5 + i * 1e-5:.6f}</LatitudeDegrees>"
+        f"<LongitudeDegrees>{-0.12 + i * 1e-5:.6f}</LongitudeDegrees></Position>"
+        f"<AltitudeMeters>{20 + rng.random():.2f}</AltitudeMeters>"
+        f"<DistanceMeters>{i * 2.8:.1f}</DistanceMeters>"
+        f"<HeartRateBpm><Value>{rng.randint(120, 170)}</Value></HeartRateBpm>"
+        "</Trackpoint>"
+        for i in range(points)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<TrainingCenterDatabase xmlns="http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2">'
+        f'<Activities><Activity Sport="Running"><Id>{start:%Y-%m-%dT%H:%M:%S.000Z}</Id>'
+        f'<Lap StartTime="{start:%Y-%m-%dT%H:%M:%S.000Z}"><Track>{trackpoints}</Track></Lap>'
+        "</Activity></Activities></TrainingCenterDatabase>"
+    ).encode("utf-8")
+
+
+def payload(template: str, params: Mapping[str, str]) -> Any:
+    """Create a synthetic payload for an endpoint.
+
+    The payload is seeded by the template and parameters so repeated requests return
+    the same body.
+
+    Parameters
+    ----------
+    template : str
+        The endpoint template, e.g. `'/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json'`.
+    params : Mapping[str, str]
+        The path parameters of the request.
+
+    Returns
+    -------
+    Any
+        The JSON-serializable payload, or `bytes` for TCX.
+    """
+    rng = random.Random(zlib.crc32(f"{template}{sorted(params.items())}".encode()))
+    days = _days(params)
+    resource = params.get("resource-path", "steps")
+    intraday = "detail-level" in params or template.endswith("/all.json")
+    if template.endswith(".tcx"):
+        return _tcx(rng)
+    if "/activities/heart/" in template:
+        response = _series(
+            "activities-heart",
+            days,
+            lambda _: {
+                "customHeartRateZones": [],
+                "heartRateZones": [
+                    {
+                        "name": name,
+                        "min": low,
+                        "max": high,
+                        "minutes": rng.randint(0, 600),
+                    }
+                    for name, low, high in (
+                        ("Out of Range", 30, 91),
+                        ("Fat Burn", 91, 127),
+                        ("Cardio", 127, 154),
+                        ("Peak", 154, 220),
+                    )
+                ],
+                "restingHeartRate": rng.randint(50, 70),
+            },
+        )
+        if intraday:
+            response |= _intraday(
+                "activities-heart-intraday", params, lambda _: rng.randint(50, 160)
+            )
+        return response
+    if "/active-zone-minutes/" in template:
+        if intraday or "start-time" in params:
+            return {
+                "activities-active-zone-minutes-intraday": [
+                    {
+                        "dateTime": f"{day}",
+                        "minutes": _minutes(
+                            day,
+                            params,
+                            lambda _: {"activeZoneMinutes": rng.choice((0, 0, 1, 2))},
+                        ),
+                    }
+                    for day in days
+                ]
+            }
+        return _series(
+            "activities-active-zone-minutes",
+            days,
+            lambda _: {
+                "activeZoneMinutes": rng.randint(0, 90),
+                "fatBurnActiveZoneMinutes": rng.randint(0, 60),
+                "cardioActiveZoneMinutes": rng.randint(0, 30),
+            },
+        )
+    if "/activities/" in template and "resource-path" in params:
+        key = f"activities-{'tracker-' if '/tracker/' in template else ''}{resource}"
+        response = _series(key, days, lambda _: f"{rng.randint(0, 20000)}")
+        if intraday:
+            response |= _intraday(
+                f"{key}-intraday", params, lambda _: rng.choice((0, 0, 12, 60, 110))
+            )
+        return response
+    if "/body/log/fat/" in template or "/body/log/weight/" in template:
+        kind = "fat" if "/fat/" in template else "weight"
+        return {
+            kind: [
+                {
+                    "date": f"{day}",
+                    "time": "07:30:00",
+                    "logId": rng.randint(10**12, 10**13),
+                    "source": "API",
+                    kind: round(
+                        rng.uniform(15, 30) if kind == "fat" else rng.uniform(60, 90), 1
+                    ),
+                }
+                for day in days
+            ]
+        }
+    if "/body/" in template and "resource-path" in params:
+        return _series(f"body-{resource}", days, lambda _: f"{rng.uniform(15, 90):.2f}")
+    if "/foods/log/" in template and "resource-path" in params:
+        return _series(
+            f"foods-log-{resource}", days, lambda _: f"{rng.randint(0, 3000)}"
+        )
+    if "/sleep/" in template and "date" in template:
+        return {
+            "sleep": [
+                {
+                    "dateOfSleep": f"{day}",
+                    "duration": (asleep := rng.randint(300, 540)) * 60_000,
+                    "efficiency": rng.randint(80, 99),
+                    "isMainSleep": True,
+                    "logId": rng.randint(10**10, 10**11),
+                    "minutesAsleep": asleep,
+                    "startTime": f"{day - datetime.timedelta(days=1)}T23:00:00.000",
+                    "type": "stages",
+                }
+                for day in days
+            ]
+        }
+    if "/spo2/" in template:
+        entries = [
+            (
+                {
+                    "dateTime": f"{day}",
+                    "minutes": _minutes(
+                        day, params, lambda _: round(rng.uniform(90, 100), 1)
+                    ),
+                }
+                if intraday
+                else {
+                    "dateTime": f"{day}",
+                    "value": {"avg": 96.5, "min": 94.0, "max": 98.7},
+                }
+            )
+            for day in days
+        ]
+        return entries if len(entries) > 1 or "startDate" in params else entries[0]
+    if "/hrv/" in template:
+        return {
+            "hrv": [
+                (
+                    {
+                        "dateTime": f"{day}",
+                        "minutes": _minutes(
+                            day,
+                            {"start-time": "00:00", "end-time": "06:59"},
+                            lambda _: {
+                                "rmssd": round(rng.uniform(20, 60), 3),
+                                "coverage": 0.9,
+                                "hf": 200.0,
+                                "lf": 500.0,
+                            },
+                        ),
+                    }
+                    if intraday
+                    else {
+                        "dateTime": f"{day}",
+                        "value": {
+                            "dailyRmssd": round(rng.uniform(20, 60), 3),
+                            "deepRmssd": round(rng.uniform(20, 60), 3),
+                        },
+                    }
+                )
+                for day in days
+            ]
+        }
+    if "/br/" in template:
+        return {
+            "br": [
+                {
+                    "dateTime": f"{day}",
+                    "value": (
+                        {
+                            f"{stage}SleepSummary": {
+                                "breathingRate": round(rng.uniform(12, 18), 1)
+                            }
+                            for stage in ("deep", "rem", "full", "light")
+                        }
+                        if intraday
+                        else {"breathingRate": round(rng.uniform(12, 18), 1)}
+                    ),
+                }
+                for day in days
+            ]
+        }
+    if "/cardioscore/" in template:
+        return _series("cardioScore", days, lambda _: {"vo2Max": "44-48"})
+    if "/temp/core/" in template:
+        return _series("tempCore", days, lambda _: round(rng.uniform(36, 38), 2))
+    if "/temp/skin/" in template:
+        return _series(
+            "tempSkin",
+            days,
+            lambda _: {"nightlyRelative": round(rng.uniform(-1, 1), 1)},
+        )
+    if template.endswith("/profile.json"):
+        return {
+            "user": {
+                "encodedId": "MOCK01",
+                "displayName": "Mock",
+                "memberSince": "2020-01-01",
+                "timezone": "UTC",
+                "offsetFromUTCMillis": 0,
+            }
+        }
+    if template.endswith("/devices.json"):
+        return [
+            {
+                "id": "123456789",
+                "deviceVersion": "Charge 6",
+                "batteryLevel": 80,
+                "lastSyncTime": f"{days[-1]}T08:00:00.000",
+                "type": "TRACKER",
+            }
+        ]
+    return {}
+
+
+class MockServer:
+    """Local stand-in for the Fitbit Web API."""
+
+    def __init__(
+        self,
+        latency: float = 0,
+        rate_limit: int = 150,
+        rate_limit_window: float = 3600,
+        token_lifetime: int | None = None,
+        error_rate: float = 0,
+        seed: int = 0,
+    ) -> None:
+        """Create the server.
+
+        Parameters
+        ----------
+        latency : float, optional
+            The delay in seconds before each response, by default 0
+        rate_limit : int, optional
+            The number of requests allowed per window, by default 150
+        rate_limit_window : float, optional
+            The length of the rate-limit window in seconds, by default 3600
+        token_lifetime : int | None, optional
+            The number of requests an access token is valid for before it expires
+            with a 401, by default `None` (never expires)
+        error_rate : float, optional
+            The fraction of requests that fail with a 5xx, by default 0
+        seed : int, optional
+            The seed for the injected errors, by default 0
+        """
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.token_lifetime = token_lifetime
+        self.error_rate = error_rate
+        self.requests: list[str] = []
+        self.refreshes: list[str] = []
+        self._random = random.Random(seed)
+        self._failures: list[int] = []
+        self._token_uses: dict[str, int] = {}
+        self._window: tuple[float, int] = (time.monotonic(), 0)
+        self._refreshes = itertools.count(1)
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+        self.app = web.Application()
+        self.app.router.add_post("/oauth2/token", self._token)
+        self.app.router.add_get("/{path:.*}", self._handle)
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """Make the next requests fail with the given status (e.g. 429 or 503)."""
+        self._failures.extend([status] * count)
+
+    def _consume(self) -> tuple[bool, dict[str, str]]:
+        """Count a request against the rate limit, returning the headers."""
+        start, count = self._window
+        if (now := time.monotonic()) - start >= self.rate_limit_window:
+            start, count = now, 0
+        self._window = start, count + 1
+        return count < self.rate_limit, dict(
+            zip(
+                RATE_LIMIT_HEADERS,
+                (
+                    f"{self.rate_limit}",
+                    f"{max(self.rate_limit - count - 1, 0)}",
+                    f"{round(start + self.rate_limit_window - now)}",
+                ),
+            )
+        )
+
+    @staticmethod
+    def _error(status: int, error_type: str, message: str, **headers) -> web.Response:
+        return web.json_response(
+            {
+                "errors": [{"errorType": error_type, "message": message}],
+                "success": False,
+            },
+            status=status,
+            headers=headers,
+        )
+
+    async def _token(self, request: web.Request) -> web.Response:
+        refresh_token = request.query.get("refresh_token", "")
+        if refresh_token in self.refreshes:
+            return self._error(
+                400, "invalid_grant", f"Refresh token invalid: {refresh_token}"
+            )
+        self.refreshes.append(refresh_token)
+        count = next(self._refreshes)
+        return web.json_response(
+            {
+                "access_token": f"mock-access-{count}",
+                "expires_in": 28800,
+                "refresh_token": f"mock-refresh-{count}",
+                "scope": "activity heartrate location nutrition oxygen_saturation profile respiratory_rate settings sleep social temperature weight cardio_fitness electrocardiogram",
+                "token_type": "Bearer",
+                "user_id": "MOCK01",
+            }
+        )
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests.append(request.path_qs)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        uses = self._token_uses[token] = self._token_uses.get(token, 0) + 1
+        if self.token_lifetime is not None and uses > self.token_lifetime:
+            return self._error(401, "expired_token", f"Access token expired: {token}")
+        allowed, headers = self._consume()
+        if not allowed:
+            return self._error(
+                429,
+                "request",
+                "Too Many Requests",
+                **headers,
+                **{"Retry-After": headers["Fitbit-Rate-Limit-Reset"]},
+            )
+        if self._failures:
+            return self._error(
+                status := self._failures.pop(0),
+                "system",
+                f"Injected failure ({status})",
+                **headers,
+            )
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._error(503, "system", "Service Unavailable", **headers)
+        if (resolved := resolve(request.path)) is None:
+            return self._error(404, "not_found", f"Unknown resource: {request.path}")
+        template, params = resolved
+        body = _render(template, tuple(params.items()))
+        if isinstance(body, bytes):
+            return web.Response(
+                body=body,
+                content_type="application/vnd.garmin.tcx+xml",
+                headers=headers,
+            )
+        return web.Response(
+            body=body.encode(), content_type="application/json", headers=headers
+        )
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, returning the base url of the server."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}/"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @contextlib.contextmanager
+    def run_in_thread(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> Iterator["MockServer"]:
+        """Run the server in a background thread for the duration of the context."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(host, port), loop).result()
+        try:
+            yield self
+        finally:
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+@functools.lru_cache(maxsize=256)
+def _render(template: str, params: tuple[tuple[str, str], ...]) -> str | bytes:
+    body = payload(template, dict(params))
+    return body if isinstance(body, bytes) else json.dumps(body)
+
+
+def main():
+    """Run the mock server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--rate-limit", type=int, default=150)
+    parser.add_argument("--token-lifetime", type=int, default=None)
+    parser.add_argument("--error-rate", type=float, default=0)
+    args = parser.parse_args()
+    server = MockServer(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        token_lifetime=args.token_lifetime,
+        error_rate=args.error_rate,
+    )
+    web.run_app(server.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Normalization of period requests into the equivalent date range requests.
+
+Most time series have an endpoint for a period ending on a date (e.g.
+`get_heart_by_date_period(date, "7d")`) and one for a range of dates (e.g.
+`get_heart_by_date_range(base_date, end_date)`) which return the same data. Rewriting
+the period requests as range requests lets them share the per-day entries of
+`cache.Cache`::
+
+    periods.normalize(
+        "/1/user/-/activities/heart/date/{date}/{period}.json",
+        {"date": "2024-01-07", "period": "7d"},
+    )
+    # ("/1/user/-/activities/heart/date/{base-date}/{end-date}.json",
+    #  {"base-date": "2024-01-01", "end-date": "2024-01-07"})
+
+`max` periods are only normalized when the start of the history of the user is known.
+"""
+
+import datetime
+import functools
+from typing import Any, Mapping
+
+PERIOD_DAYS: Mapping[str, int] = {
+    "1d": 1,
+    "7d": 7,
+    "30d": 30,
+    "1w": 7,
+    "1m": 30,
+    "3m": 90,
+    "6m": 180,
+    "1y": 365,
+}
+"""The number of days of each period, ending on (and including) its date."""
+
+_PERIOD = "/date/{date}/{period}.json"
+
+
+@functools.cache
+def _ranges() -> dict[str, str]:
+    from fitbit_web import cache
+    from fitbit_web.api import metadata
+
+    ranges = {}
+    for endpoint in metadata.ENDPOINTS.values():
+        if (dates := cache.date_range(endpoint.path)) is None:
+            continue
+        suffix = f"/date/{{{dates.start}}}/{{{dates.end}}}.json"
+        if endpoint.path.endswith(suffix):
+            ranges[endpoint.path.removesuffix(suffix)] = endpoint.path
+    return ranges
+
+
+def range_endpoint(endpoint: str) -> str | None:
+    """Get the template of the range endpoint equivalent to a period endpoint."""
+    if not endpoint.endswith(_PERIOD):
+        return None
+    return _ranges().get(endpoint.removesuffix(_PERIOD))
+
+
+def start(date: str, period: str, since: str | None = None) -> str | None:
+    """Get the first date of a period ending on a date in the format `yyyy-MM-dd`.
+
+    Parameters
+    ----------
+    date : str
+        The last date of the period.
+    period : str
+        The period, e.g. `"7d"`.
+    since : str | None, optional
+        The first date of the history of the user, which is the start of `max`
+        periods, by default unknown.
+
+    Returns
+    -------
+    str | None
+        The first date, or `None` if it is not known.
+    """
+    if period == "max":
+        return since
+    if (days := PERIOD_DAYS.get(period)) is None:
+        return None
+    end = datetime.date.fromisoformat(date)
+    return (end - datetime.timedelta(days=days - 1)).isoformat()
+
+
+def normalize(
+    endpoint: str, param_kwargs: dict[str, Any] | None, since: str | None = None
+) -> tuple[str, dict[str, Any] | None]:
+    """Rewrite a period request as the equivalent range request.
+
+    Parameters
+    ----------
+    endpoint : str
+        The template of the endpoint.
+    param_kwargs : dict[str, Any] | None
+        The formatted path parameters.
+    since : str | None, optional
+        The start of `max` periods, see `start`.
+
+    Returns
+    -------
+    tuple[str, dict[str, Any] | None]
+        The template and path parameters of the range request, or the request as is
+        if it is not for a period or has no equivalent range request.
+    """
+    if (
+        not param_kwargs
+        or "period" not in param_kwargs
+        or (target := range_endpoint(endpoint)) is None
+    ):
+        return endpoint, param_kwargs
+    date = param_kwargs["date"]
+    try:
+        first = start(date, param_kwargs["period"], since)
+    except ValueError:
+        return endpoint, param_kwargs
+    if first is None:
+        return endpoint, param_kwargs
+    from fitbit_web import cache
+
+    if (dates := cache.date_range(target)) is None:
+        return endpoint, param_kwargs
+    params = {
+        name: value
+        for name, value in param_kwargs.items()
+        if name not in ("date", "period")
+    }
+    return target, {dates.start: first, dates.end: date, **params}
@@ -0,0 +1,267 @@
+"""Pipeline fanning the post-processing of responses out to a process pool.
+
+With the async client the bottleneck of an ingestion becomes decoding the JSON and
+extracting the samples, which are CPU bound. The pipeline fetches the raw bodies on
+the event loop and hands them to an executor (by default a `ProcessPoolExecutor`), so
+all the cores are used. At most `max_pending` requests are fetched or processed at a
+time, so the fetching never outruns the workers::
+
+    with pipeline.Pipeline() as pipe:
+        async for request, samples in pipe.run(web_client, requests):
+            db.insert(tokens.user_id, samples)
+
+The transform runs in the workers, so it must be picklable (e.g. a function of a
+module, or a `functools.partial` of one) and can also write its output, e.g. to a
+`store.Store` of its own.
+
+Without a transform, `stream` yields the responses of a date range day by day as
+soon as each request completes::
+
+    async for date, response in web_client.stream(
+        "get_sleep_by_date_range", "2024-01-01", "2024-12-31"
+    ):
+        ...
+"""
+
+import asyncio
+import concurrent.futures
+import datetime
+import json
+import os
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable
+
+from fitbit_web import api, backfill, cache, scopes, series, utils
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from fitbit_web import client
+    from fitbit_web.api import metadata
+
+
+def samples(
+    body: bytes, date: str | None = None, name: str = "value"
+) -> dict[str, series.Series]:
+    """Decode a response body into columnar samples, see `series.samples`."""
+    return series.samples(json.loads(body), date, name)
+
+
+class RawApi(api.FitbitWebApi):
+    """View of a client where the endpoints return the undecoded response bodies."""
+
+    def __init__(self, client: "client.BaseClient") -> None:
+        """Create a raw view of a client."""
+        self.__client = client
+
+    def _get(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ):
+        return self.__client._raw(url, param_kwargs, query_kwargs)
+
+    async def _aget(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ):
+        return await self.__client._araw(url, param_kwargs, query_kwargs)
+
+
+class Pipeline:
+    """Fetches responses with the async client and transforms them in an executor."""
+
+    def __init__(
+        self,
+        transform: Callable[[bytes], Any] = samples,
+        executor: concurrent.futures.Executor | None = None,
+        max_pending: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Create a pipeline.
+
+        Parameters
+        ----------
+        transform : Callable[[bytes], Any], optional
+            The function run in the executor on each response body, by default
+            `samples`.
+        executor : concurrent.futures.Executor | None, optional
+            The executor of the transform, by default a `ProcessPoolExecutor` with
+            `max_workers` workers, which is shut down with the pipeline.
+        max_pending : int | None, optional
+            The number of requests which can be fetched or transformed at a time, by
+            default twice `max_workers`.
+        max_workers : int | None, optional
+            The number of workers of the executor, by default the number of cores.
+        """
+        self.transform = transform
+        self._owned = executor is None
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.executor = executor or concurrent.futures.ProcessPoolExecutor(max_workers)
+        if max_pending is None:
+            max_pending = 2 * max_workers
+        self.max_pending = max(max_pending, 1)
+
+    def __enter__(self) -> "Self":
+        """Use the pipeline as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Shut down the executor, if it was created by the pipeline."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the executor, if it was created by the pipeline."""
+        if self._owned:
+            self.executor.shutdown()
+
+    async def _process(
+        self, raw: RawApi, request: backfill.Request
+    ) -> tuple[backfill.Request, Any]:
+        body = await getattr(raw, f"a{request.name}")(**request.arguments)
+        loop = asyncio.get_running_loop()
+        return request, await loop.run_in_executor(self.executor, self.transform, body)
+
+    async def run(
+        self, web_client: "client.BaseClient", requests: Iterable[backfill.Request]
+    ) -> AsyncIterator[tuple[backfill.Request, Any]]:
+        """Fetch and transform responses, yielding them as they complete.
+
+        No more requests are made while `max_pending` are waiting to be consumed, so
+        a slow consumer slows the fetching down. Closing the iterator cancels the
+        requests in progress.
+
+        Parameters
+        ----------
+        web_client : client.BaseClient
+            The client with the async methods of the requests.
+        requests : Iterable[backfill.Request]
+            The requests, as the names of the sync methods and their arguments (e.g.
+            from `backfill.plan`).
+
+        Yields
+        ------
+        tuple[backfill.Request, Any]
+            Each request and the output of the transform, in order of completion.
+        """
+        raw = web_client.raw()
+        pending: set[asyncio.Task] = set()
+        try:
+            for request in requests:
+                while len(pending) >= self.max_pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.create_task(self._process(raw, request)))
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+_DONE = object()
+
+
+def _requests(
+    method: str,
+    start: str,
+    end: str,
+    max_days: int | None,
+    arguments: dict[str, Any],
+) -> list[tuple[list[str], backfill.Request]]:
+    endpoint = scopes.endpoint(method)
+    if cache.date_range(endpoint.path) is not None:
+        return [
+            (cache.days(*(request.arguments[p] for p in _dates(endpoint))), request)
+            for request in reversed(
+                backfill.plan([(method, arguments)], start, end, max_days)
+            )
+        ]
+    dates = _dates(endpoint)
+    if not dates:
+        raise ValueError(f"{method!r} is not the method of a date endpoint.")
+    if len(dates) > 1:
+        raise ValueError(
+            f"{method!r} has several dates ({', '.join(dates)}) but is not the method"
+            " of a range endpoint."
+        )
+    (date,) = dates
+    return [
+        ([day], backfill.Request(method, {**arguments, date: day}))
+        for day in cache.days(start, end)
+    ]
+
+
+def _dates(endpoint: "metadata.Endpoint") -> list[str]:
+    return [
+        parameter.argument
+        for parameter in endpoint.parameters
+        if parameter.location == "path" and "date" in parameter.formats
+    ]
+
+
+async def stream(
+    web_client: "client.BaseClient",
+    method: str,
+    start: str | datetime.date,
+    end: str | datetime.date = "today",
+    concurrency: int = 4,
+    max_queue: int = 16,
+    max_days: int | None = None,
+    **arguments: Any,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Stream the responses of a date range day by day, see `client.BaseClient.stream`."""
+    requests = iter(
+        _requests(
+            method,
+            utils.format_date(start),
+            utils.format_date(end),
+            max_days,
+            arguments,
+        )
+    )
+    fetch = getattr(web_client, f"a{method}")
+    queue: asyncio.Queue = asyncio.Queue(max(max_queue, 1))
+
+    async def work() -> None:
+        try:
+            for dates, request in requests:
+                response = await fetch(**request.arguments)
+                parts = cache.split(response, dates) if len(dates) > 1 else None
+                if parts is None:
+                    await queue.put((dates[0], response))
+                    continue
+                for date in dates:
+                    await queue.put((date, parts[date]))
+        # Any error is forwarded to the consumer, which raises it from the stream.
+        except Exception as error:  # noqa: BLE001
+            await queue.put(error)
+        else:
+            await queue.put(_DONE)
+
+    workers = [asyncio.create_task(work()) for _ in range(max(concurrency, 1))]
+    try:
+        running = len(workers)
+        while running:
+            item = await queue.get()
+            if item is _DONE:
+                running -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
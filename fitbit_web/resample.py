@@ -0,0 +1,178 @@
+"""Vectorized resampling and aggregation of intraday samples.
+
+Samples (e.g. from `series.samples`, `store.Store.query` or `archive.Archive.read`)
+are grouped into fixed-width buckets aligned to the epoch, so `"1d"` buckets are
+days of the local time of the user. Buckets without samples are kept, so the output
+is a regular grid where gaps are visible::
+
+    buckets = resample.resample(times, values, "15min")
+    buckets.mean[buckets.counts == 0]  # nan
+
+Requires numpy.
+"""
+
+import datetime
+from typing import Any, NamedTuple
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore
+
+from fitbit_web import series
+
+INTERVALS: dict[str, int] = {
+    "1sec": 1,
+    "1min": 60,
+    "5min": 5 * 60,
+    "15min": 15 * 60,
+    "1h": 60 * 60,
+    "1d": 24 * 60 * 60,
+}
+"""The width in seconds of the named intervals, including the detail levels."""
+
+
+class Buckets(NamedTuple):
+    """The aggregates of each bucket of a resampled series.
+
+    `time` is the `datetime64[s]` start of each bucket. `counts` is the number of
+    samples and `sum` their total (0 if empty). `mean`, `min` and `max` are `nan` for
+    buckets with fewer than `min_count` samples.
+    """
+
+    time: "np.ndarray"
+    counts: "np.ndarray"
+    sum: "np.ndarray"
+    mean: "np.ndarray"
+    min: "np.ndarray"
+    max: "np.ndarray"
+
+
+def seconds(interval: str | int) -> int:
+    """Get the width of an interval in seconds, e.g. `"15min"` is 900."""
+    if isinstance(interval, str):
+        return INTERVALS[interval]
+    return int(interval)
+
+
+def _times(times: Any) -> "np.ndarray":
+    times = np.asarray(times)
+    if np.issubdtype(times.dtype, np.datetime64):
+        return times.astype("datetime64[s]").astype(np.int64)
+    return times.astype(np.int64, copy=False)
+
+
+def resample(
+    times: Any,
+    values: Any,
+    interval: str | int,
+    start: series.Time | None = None,
+    end: series.Time | None = None,
+    min_count: int = 1,
+) -> Buckets:
+    """Aggregate samples into fixed-width buckets.
+
+    Parameters
+    ----------
+    times : array-like
+        The timestamps, as seconds since the epoch or `datetime64`.
+    values : array-like
+        The values. `nan` values are treated as missing.
+    interval : str | int
+        The width of the buckets, as a name in `INTERVALS` or in seconds.
+    start : series.Time | None, optional
+        The start of the first bucket, by default the bucket of the first sample.
+    end : series.Time | None, optional
+        The exclusive end of the last bucket, by default after the last sample.
+    min_count : int, optional
+        The number of samples below which `mean`, `min` and `max` are `nan`, by
+        default 1.
+
+    Returns
+    -------
+    Buckets
+        The aggregates of each bucket.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If numpy is not installed.
+    """
+    if np is None:
+        raise ModuleNotFoundError(
+            "numpy is required for `resample`. Install with `fitbit-web[numpy]`."
+        )
+    width = seconds(interval)
+    times = _times(times)
+    values = np.asarray(values, dtype=np.float64)
+    if len(times) and np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind="stable")
+        times, values = times[order], values[order]
+    present = ~np.isnan(values)
+    if not present.all():
+        times, values = times[present], values[present]
+    origin = (
+        series.timestamp(start) // width * width
+        if start is not None
+        else (times[0] // width * width if len(times) else 0)
+    )
+    if end is not None:
+        size = max(-(-(series.timestamp(end) - origin) // width), 0)
+    else:
+        size = max(int((times[-1] - origin) // width + 1), 0) if len(times) else 0
+    index = (times - origin) // width
+    inside = (index >= 0) & (index < size)
+    if not inside.all():
+        index, values = index[inside], values[inside]
+    counts = np.bincount(index, minlength=size)[:size]
+    total = np.bincount(index, weights=values, minlength=size)[:size].astype(
+        np.float64, copy=False
+    )
+    minimum = np.full(size, np.nan)
+    maximum = np.full(size, np.nan)
+    if len(index):
+        starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+        minimum[index[starts]] = np.minimum.reduceat(values, starts)
+        maximum[index[starts]] = np.maximum.reduceat(values, starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / counts
+    sparse = counts < max(min_count, 1)
+    mean[sparse] = minimum[sparse] = maximum[sparse] = np.nan
+    return Buckets(
+        time=(origin + np.arange(size, dtype=np.int64) * width).astype("datetime64[s]"),
+        counts=counts,
+        sum=total,
+        mean=mean,
+        min=minimum,
+        max=maximum,
+    )
+
+
+def resample_response(
+    response: Any,
+    interval: str | int,
+    date: str | datetime.date | None = None,
+    name: str = "value",
+    min_count: int = 1,
+) -> dict[str, Buckets]:
+    """Resample each series of an intraday response.
+
+    Parameters
+    ----------
+    response : Any
+        The decoded response, e.g. of `get_heart_by_date_intraday`. See
+        `series.samples` for `date` and `name`.
+    interval : str | int
+        The width of the buckets, see `resample`.
+    min_count : int, optional
+        See `resample`, by default 1.
+
+    Returns
+    -------
+    dict[str, Buckets]
+        The buckets of each resource of the response.
+    """
+    return {
+        resource: resample(samples.times, samples.values, interval, min_count=min_count)
+        for resource, samples in series.samples(response, date, name).items()
+    }
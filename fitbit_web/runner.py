@@ -0,0 +1,318 @@
+"""Sharded ingestion of the history of many users across processes and nodes.
+
+Users are partitioned by consistent hashing of their IDs, first across nodes and then
+across the worker processes of a node, so adding a worker only moves a fraction of
+the users. Each worker runs its own event loop with an async client per user, and
+the workers share their state through SQLite files which are safe to use from
+several processes:
+
+* a `State` of the tokens of the users (in a `tokens.SqliteTokenStore`, which the
+  clients refresh them through) and their last seen rate limits, so a restarted worker
+  waits for an exhausted rate limit,
+* a `journal.SqliteJournal` of the completed requests, so a restarted run skips them,
+* a `store.Store` of the samples.
+
+It is run from the command line with `python -m fitbit_web ingest`, or::
+
+    runner.run(runner.Config(state="state.db", output="fitbit.db",
+                             resources=[("get_sleep_by_date_range", {})]))
+"""
+
+import asyncio
+import bisect
+import concurrent.futures
+import dataclasses
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, NamedTuple, Sequence
+
+try:
+    from loguru import logger
+
+    def _exception(message: str, *args: Any) -> None:
+        logger.opt(depth=1).exception(message, *args)
+
+except ModuleNotFoundError:
+    import logging
+
+    logger = logging.getLogger()  # type: ignore
+
+    def _exception(message: str, *args: Any) -> None:
+        if logger.isEnabledFor(logging.ERROR):  # type: ignore[attr-defined]
+            logger.exception(message.format(*args), stacklevel=2)
+
+
+from fitbit_web import backfill, client, journal, store, tokens, utils
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+TIMEOUT: float = 30
+"""The seconds the SQLite connections of a worker wait for those of other workers."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    user_id TEXT PRIMARY KEY,
+    remaining INTEGER,
+    reset REAL
+) WITHOUT ROWID;
+"""
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class Ring:
+    """Consistent hash ring assigning keys to shards."""
+
+    def __init__(self, shards: int, replicas: int = 64, salt: str = "") -> None:
+        """Create a ring.
+
+        Parameters
+        ----------
+        shards : int
+            The number of shards.
+        replicas : int, optional
+            The number of points of each shard on the ring, by default 64. More
+            points give a more even partition.
+        salt : str, optional
+            The salt of the hashes, so rings of different levels (e.g. nodes and
+            workers) partition independently, by default none.
+        """
+        if shards < 1:
+            raise ValueError("A ring needs at least one shard.")
+        self.salt = salt
+        points = sorted(
+            (_hash(f"{salt}{shard}:{replica}"), shard)
+            for shard in range(shards)
+            for replica in range(replicas)
+        )
+        self._hashes = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard(self, key: str) -> int:
+        """Get the shard of a key."""
+        index = bisect.bisect(self._hashes, _hash(f"{self.salt}{key}"))
+        return self._shards[index % len(self._shards)]
+
+
+def partition(keys: Iterable[str], ring: Ring, shards: int) -> list[list[str]]:
+    """Partition keys into the given number of shards of a ring."""
+    partitions: list[list[str]] = [[] for _ in range(shards)]
+    for key in keys:
+        partitions[ring.shard(key)].append(key)
+    return partitions
+
+
+class State:
+    """Tokens and rate limits of users shared by processes through SQLite."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Open (or create) the state.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the database.
+        """
+        self.token_store = tokens.SqliteTokenStore(path)
+        self.connection = sqlite3.connect(
+            path, timeout=TIMEOUT, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Self":
+        """Use the state as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Close the databases."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.token_store.close()
+        self.connection.close()
+
+    def load_rate_limit(self, user_id: str, quota: backfill.Quota) -> None:
+        """Restore the last seen rate limit of a user into a quota."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT remaining, reset FROM rate_limits WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        if row is not None and quota.reset is None:
+            quota.remaining, quota.reset = row
+
+    def save_rate_limit(self, user_id: str, quota: backfill.Quota) -> None:
+        """Store the rate limit of a user seen by a quota."""
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO rate_limits (user_id, remaining, reset)"
+                " VALUES (?, ?, ?)",
+                (user_id, quota.remaining, quota.reset),
+            )
+
+
+class Summary(NamedTuple):
+    """The outcome of the ingestion of some users."""
+
+    requests: int
+    """The number of requests made."""
+    failures: Mapping[str, str]
+    """The error of each user whose ingestion stopped, by user ID."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    """Configuration of an ingestion run."""
+
+    state: str
+    """The path of the `State` of the users."""
+    output: str
+    """The path of the `store.Store` of the samples."""
+    resources: Sequence[backfill.Resource]
+    """The range methods to ingest, see `backfill.plan`."""
+    journal: str | None = None
+    """The path of the `journal.SqliteJournal`, by default next to the output."""
+    since: str | None = None
+    """The first date to ingest, by default the start of the history of each user."""
+    until: str = "today"
+    workers: int = dataclasses.field(default_factory=lambda: os.cpu_count() or 1)
+    """The number of worker processes of the node."""
+    concurrency: int = 8
+    """The number of users ingested at a time by each worker."""
+    node: int = 0
+    nodes: int = 1
+    base_url: str = utils.BASE_URL
+    check_scopes: bool = True
+
+    @property
+    def journal_path(self) -> str:
+        """The path of the journal."""
+        return self.journal or f"{os.path.splitext(self.output)[0]}.journal.db"
+
+    def users(self, user_ids: Iterable[str]) -> list[list[str]]:
+        """Partition the users of this node across its workers."""
+        nodes = Ring(self.nodes, salt="node:")
+        mine = [user for user in user_ids if nodes.shard(user) == self.node]
+        return partition(mine, Ring(self.workers, salt="worker:"), self.workers)
+
+
+async def _ingest(
+    config: Config,
+    state: State,
+    done: journal.Journal,
+    db: store.Store,
+    user_id: str,
+) -> int:
+    user_tokens = await asyncio.to_thread(state.token_store.get, user_id)
+    if user_tokens is None:
+        raise KeyError(f"No tokens for user {user_id!r}.")
+    web_client = client.Client(
+        user_tokens,
+        base_url=config.base_url,
+        check_scopes=config.check_scopes,
+        token_store=state.token_store,
+    )
+    since = config.since
+    if since is None:
+        since = (await web_client.aget_profile())["user"]["memberSince"]
+    job = backfill.Backfill(
+        backfill.plan(config.resources, since, config.until), done, job=user_id
+    )
+    await asyncio.to_thread(state.load_rate_limit, user_id, job.quota)
+    requests = 0
+    async for _, response in job.arun(web_client):
+        await asyncio.to_thread(db.ingest, user_id, response)
+        requests += 1
+        await asyncio.to_thread(state.save_rate_limit, user_id, job.quota)
+    return requests
+
+
+async def _work(config: Config, user_ids: Sequence[str]) -> Summary:
+    slots = asyncio.Semaphore(max(config.concurrency, 1))
+    failures: dict[str, str] = {}
+    with State(config.state) as state, journal.SqliteJournal(
+        config.journal_path, timeout=TIMEOUT
+    ) as done, store.Store(config.output, timeout=TIMEOUT) as db:
+
+        async def ingest(user_id: str) -> int:
+            async with slots:
+                try:
+                    return await _ingest(config, state, done, db, user_id)
+                # Any error is logged and reported, and the other users carry on.
+                except Exception as error:  # noqa: BLE001
+                    _exception("Ingesting user {!r} failed.", user_id)
+                    failures[user_id] = repr(error)
+                    return 0
+
+        requests = sum(await asyncio.gather(*map(ingest, user_ids)))
+    return Summary(requests, failures)
+
+
+def work(config: Config, user_ids: Sequence[str]) -> Summary:
+    """Ingest the users of a worker in its own event loop.
+
+    A user whose ingestion fails is logged and reported, and the other users carry
+    on. Their completed requests are journaled, so a later run resumes them.
+    """
+    return asyncio.run(_work(config, user_ids))
+
+
+def run(config: Config, executor: concurrent.futures.Executor | None = None) -> Summary:
+    """Ingest the users of this node with a worker process per shard.
+
+    Parameters
+    ----------
+    config : Config
+        The configuration of the run.
+    executor : concurrent.futures.Executor | None, optional
+        The executor of the workers, by default a `ProcessPoolExecutor` with a
+        process per worker.
+
+    Returns
+    -------
+    Summary
+        The number of requests made and the errors of the users which failed, see
+        `work`.
+    """
+    with State(config.state) as state:
+        users = config.users(state.token_store.users())
+    store.Store(config.output, timeout=TIMEOUT).close()
+    journal.SqliteJournal(config.journal_path, timeout=TIMEOUT).close()
+    owned = executor is None
+    executor = executor or concurrent.futures.ProcessPoolExecutor(config.workers)
+    try:
+        futures = [executor.submit(work, config, shard) for shard in users if shard]
+        summaries = [future.result() for future in futures]
+    finally:
+        if owned:
+            executor.shutdown()
+    return Summary(
+        sum(summary.requests for summary in summaries),
+        {
+            user_id: error
+            for summary in summaries
+            for user_id, error in summary.failures.items()
+        },
+    )
+
+
+def import_tokens(state: State, values: Iterable[dict[str, Any]]) -> int:
+    """Store tokens decoded from JSON (e.g. as returned by the token endpoint).
+
+    Returns
+    -------
+    int
+        The number of users whose tokens were stored.
+    """
+    count = 0
+    for value in values:
+        state.token_store.put(tokens.parse(value))
+        count += 1
+    return count
@@ -0,0 +1,113 @@
+"""Checks of the scopes granted to a token against those listed for the endpoints.
+
+The spec lists several scopes for most endpoints and a request is only rejected when
+the token was granted none of them, so the checks here are for *any* of the scopes.
+Checking locally avoids spending the rate limit on requests that are certain to fail::
+
+    scopes.plan(tokens.scope, ["get_sleep_by_date", "get_heart_by_date"]).allowed
+"""
+
+import functools
+from typing import TYPE_CHECKING, Iterable, Mapping, NamedTuple
+
+if TYPE_CHECKING:
+    from fitbit_web.api import metadata
+
+
+class ScopeError(PermissionError):
+    """Raised when a token has none of the scopes of an endpoint."""
+
+
+class Plan(NamedTuple):
+    """The endpoints that can and cannot be called with some scopes."""
+
+    allowed: tuple[str, ...]
+    denied: Mapping[str, tuple[str, ...]]
+    """The scopes, any of which would allow each denied endpoint."""
+
+
+@functools.cache
+def _endpoints() -> dict[str, "metadata.Endpoint"]:
+    from fitbit_web.api import metadata
+
+    return {
+        **{endpoint.path: endpoint for endpoint in metadata.ENDPOINTS.values()},
+        **metadata.ENDPOINTS,
+    }
+
+
+def endpoint(name: str) -> "metadata.Endpoint":
+    """Get the metadata of an endpoint by method name or path template."""
+    return _endpoints()[name]
+
+
+@functools.lru_cache(maxsize=1024)
+def _allowed(name: str, scopes: frozenset[str]) -> bool:
+    if (found := _endpoints().get(name)) is None:
+        return True
+    return not found.scopes or not scopes.isdisjoint(found.scopes)
+
+
+def allowed(name: str, scopes: Iterable[str]) -> bool:
+    """Check whether an endpoint can be called with the given scopes.
+
+    Parameters
+    ----------
+    name : str
+        The method name (e.g. `get_sleep_by_date`) or path template of the endpoint.
+    scopes : Iterable[str]
+        The scopes granted to the token.
+
+    Returns
+    -------
+    bool
+        Whether any of the scopes of the endpoint has been granted, or the endpoint
+        is not in the spec.
+    """
+    return _allowed(name, frozenset(scopes))
+
+
+def check(name: str, scopes: Iterable[str]) -> None:
+    """Check that an endpoint can be called with the given scopes, see `allowed`.
+
+    Endpoints which are not in the spec (e.g. requested with `_get`) are allowed.
+
+    Raises
+    ------
+    ScopeError
+        If none of the scopes of the endpoint has been granted.
+    """
+    scopes = frozenset(scopes)
+    if not _allowed(name, scopes):
+        raise ScopeError(
+            f"{name!r} requires any of the scopes {endpoint(name).scopes}, but the"
+            f" token only has {tuple(sorted(scopes))}."
+        )
+
+
+def plan(scopes: Iterable[str], names: Iterable[str] | None = None) -> Plan:
+    """Split endpoints into those that can and cannot be called with some scopes.
+
+    Parameters
+    ----------
+    scopes : Iterable[str]
+        The scopes granted to the token (e.g. `AuthTokens.scope`).
+    names : Iterable[str] | None, optional
+        The method names of the endpoints, by default the sync methods of all the
+        endpoints.
+
+    Returns
+    -------
+    Plan
+        The allowed and denied endpoints, in the order given.
+    """
+    scopes = frozenset(scopes)
+    if names is None:
+        names = dict.fromkeys(endpoint.name for endpoint in _endpoints().values())
+    allowed, denied = [], {}
+    for name in names:
+        if _allowed(name, scopes):
+            allowed.append(name)
+        else:
+            denied[name] = endpoint(name).scopes
+    return Plan(tuple(allowed), denied)
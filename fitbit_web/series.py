@@ -0,0 +1,182 @@
+"""Extraction of the samples of the time series endpoints from their responses.
+
+The responses come in a few shapes which are all flattened into series of
+`(timestamp, value)` samples named by resource:
+
+* daily values, e.g. `{"activities-steps": [{"dateTime": "2024-01-01", "value": "9"}]}`
+  gives `activities-steps`.
+* daily values with several fields, e.g. `{"hrv": [{"dateTime": ..., "value":
+  {"dailyRmssd": ..., "deepRmssd": ...}}]}` gives `hrv.dailyRmssd` and
+  `hrv.deepRmssd`.
+* intraday datasets, e.g. `{"activities-heart-intraday": {"dataset": [{"time":
+  "08:00:00", "value": 61}]}}` gives `activities-heart-intraday`, on the date of the
+  daily values in the same response.
+* per minute values, e.g. `{"spo2": [{"dateTime": ..., "minutes": [{"minute":
+  "2024-01-01T08:00:00", "value": 95.1}]}]}`.
+* logs, e.g. `{"weight": [{"date": ..., "time": ..., "weight": 70.1, "bmi": 22}]}`
+  gives `weight` and `weight.bmi`.
+
+Timestamps are whole seconds since the epoch of the local time of the user, as the
+Web API does not return time zones. Values which are not numbers (e.g. a VO2 Max
+range of `"44-48"`) are skipped.
+"""
+
+import array
+import datetime
+from typing import Any, Iterable, NamedTuple
+
+Time = datetime.date | datetime.datetime | str | int
+"""A time accepted by `timestamp`."""
+
+_EPOCH = datetime.date(1970, 1, 1).toordinal()
+_SKIPPED = frozenset(("logId", "isMainSleep"))
+
+
+class Series(NamedTuple):
+    """The samples of a resource, in the order of the response.
+
+    The timestamps are an `int64` array of seconds since the epoch and the values a
+    `float64` array.
+    """
+
+    times: array.array
+    values: array.array
+
+
+def day(date: str) -> int:
+    """Get the timestamp of the start of a day in the format `yyyy-MM-dd`."""
+    return (datetime.date.fromisoformat(date[:10]).toordinal() - _EPOCH) * 86400
+
+
+def clock(time: str) -> int:
+    """Get the seconds since midnight of a time in the format `HH:mm[:ss]`."""
+    return int(time[:2]) * 3600 + int(time[3:5]) * 60 + int(time[6:8] or 0)
+
+
+def timestamp(value: Time | float) -> int:
+    """Convert a date, datetime, ISO string or timestamp to seconds since the epoch.
+
+    Datetimes are treated as local times, i.e. any time zone is ignored.
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        if len(value) <= 10:
+            return day(value)
+        return day(value) + clock(value[11:])
+    if isinstance(value, datetime.datetime):
+        return (
+            (value.toordinal() - _EPOCH) * 86400
+            + value.hour * 3600
+            + value.minute * 60
+            + value.second
+        )
+    return (value.toordinal() - _EPOCH) * 86400
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.series: dict[str, Series] = {}
+
+    def add(self, name: str, time: int, value: Any) -> None:
+        if isinstance(value, dict):
+            for field, item in value.items():
+                if field not in _SKIPPED:
+                    self.add(f"{name}.{field}", time, item)
+            return
+        if (number := _number(value)) is None:
+            return
+        if (series := self.series.get(name)) is None:
+            series = self.series[name] = Series(array.array("q"), array.array("d"))
+        series.times.append(time)
+        series.values.append(number)
+
+    def entries(self, name: str, entries: Iterable[Any]) -> None:
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            date = (
+                entry.get("dateTime") or entry.get("date") or entry.get("dateOfSleep")
+            )
+            if isinstance(minutes := entry.get("minutes"), list):
+                for minute in minutes:
+                    self.add(name, timestamp(minute["minute"]), minute["value"])
+            elif "value" in entry and date is not None:
+                self.add(name, day(date), entry["value"])
+            elif date is not None:
+                time = day(date) + (clock(entry["time"]) if "time" in entry else 0)
+                for field, value in entry.items():
+                    if field not in _SKIPPED and field != "time":
+                        self.add(
+                            name if field == name else f"{name}.{field}", time, value
+                        )
+
+    def dataset(self, name: str, intraday: dict[str, Any], date: str) -> None:
+        start = day(date)
+        for sample in intraday.get("dataset", ()):
+            self.add(name, start + clock(sample["time"]), sample["value"])
+
+
+def samples(
+    response: Any, date: str | datetime.date | None = None, name: str = "value"
+) -> dict[str, Series]:
+    """Extract the samples of the time series in a response.
+
+    Parameters
+    ----------
+    response : Any
+        The decoded response of a time series endpoint.
+    date : str | datetime.date | None, optional
+        The date of intraday datasets, by default the date of the daily values in
+        the response.
+    name : str, optional
+        The name of the series of responses which are a bare list of entries (e.g.
+        the SpO2 endpoints), by default "value".
+
+    Returns
+    -------
+    dict[str, Series]
+        The samples of each resource.
+    """
+    collector = _Collector()
+    if isinstance(response, list):
+        collector.entries(name, response)
+        return collector.series
+    if not isinstance(response, dict):
+        return collector.series
+    if "dateTime" in response or "minutes" in response:
+        collector.entries(name, [response])
+        return collector.series
+    if date is not None:
+        date = f"{date}"
+    for key, value in response.items():
+        if isinstance(value, list):
+            collector.entries(key, value)
+            if date is None:
+                date = next(
+                    (
+                        entry["dateTime"]
+                        for entry in value
+                        if isinstance(entry, dict) and "dateTime" in entry
+                    ),
+                    None,
+                )
+    for key, value in response.items():
+        if isinstance(value, dict) and "dataset" in value:
+            if date is None:
+                raise ValueError(f"The date of {key!r} is required.")
+            collector.dataset(key, value, date)
+    return collector.series
@@ -0,0 +1,237 @@
+"""Local SQLite store of the samples of the time series endpoints.
+
+Samples are kept in a single `WITHOUT ROWID` table clustered on `(user_id,
+resource, time)`, so the samples of a resource are stored contiguously and a range
+query is a single index scan. Re-ingesting a response replaces the stored values::
+
+    with store.Store("fitbit.db") as db:
+        db.ingest(tokens.user_id, web_client.get_heart_by_date_intraday("today", "1min"))
+        times, values = db.query(tokens.user_id, "activities-heart-intraday")
+"""
+
+import datetime
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore
+
+from fitbit_web import series
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    user_id TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (user_id, resource, time)
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT INTO samples (user_id, resource, time, value) VALUES (?, ?, ?, ?)
+ON CONFLICT (user_id, resource, time) DO UPDATE SET value = excluded.value
+"""
+
+
+class Store:
+    """Store of the time series of users."""
+
+    def __init__(
+        self, path: str | os.PathLike = ":memory:", timeout: float = 5
+    ) -> None:
+        """Open (or create) a store, which can be used from several threads.
+
+        Parameters
+        ----------
+        path : str | os.PathLike, optional
+            The path of the database, by default in memory.
+        timeout : float, optional
+            The seconds to wait for the write lock of another connection (e.g. of
+            another process) before raising a `sqlite3.OperationalError`, by default
+            5.
+        """
+        self.connection = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute(SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Self":
+        """Use the store as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Close the store."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def ingest(
+        self,
+        user_id: str,
+        response: Any,
+        date: str | datetime.date | None = None,
+        name: str = "value",
+    ) -> int:
+        """Store the samples of a response, replacing any stored at the same times.
+
+        Parameters
+        ----------
+        user_id : str
+            The user the response is for.
+        response : Any
+            The decoded response of a time series endpoint, see `series.samples`.
+        date : str | datetime.date | None, optional
+            The date of intraday datasets, by default the date in the response.
+        name : str, optional
+            The resource of responses without one (e.g. the SpO2 endpoints), by
+            default "value".
+
+        Returns
+        -------
+        int
+            The number of samples stored.
+        """
+        return self.insert(user_id, series.samples(response, date, name))
+
+    def insert(self, user_id: str, samples: dict[str, series.Series]) -> int:
+        """Store samples, replacing any stored at the same times.
+
+        Parameters
+        ----------
+        user_id : str
+            The user of the samples.
+        samples : dict[str, series.Series]
+            The samples of each resource.
+
+        Returns
+        -------
+        int
+            The number of samples stored.
+        """
+
+        def rows() -> Iterator[tuple[str, str, int, float]]:
+            for resource, (times, values) in samples.items():
+                for time, value in zip(times, values):
+                    yield user_id, resource, time, value
+
+        with self._lock, self.connection:
+            return self.connection.executemany(_UPSERT, rows()).rowcount
+
+    def delete(
+        self,
+        user_id: str,
+        resource: str | None = None,
+        start: series.Time | None = None,
+        end: series.Time | None = None,
+    ) -> int:
+        """Delete the samples of a user, see `query` for the arguments.
+
+        Returns
+        -------
+        int
+            The number of samples deleted.
+        """
+        where, args = _where(user_id, resource, start, end)
+        with self._lock, self.connection:
+            return self.connection.execute(
+                f"DELETE FROM samples WHERE {where}", args  # nosec: B608
+            ).rowcount
+
+    def query(
+        self,
+        user_id: str,
+        resource: str,
+        start: series.Time | None = None,
+        end: series.Time | None = None,
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """Get the samples of a resource in a time range.
+
+        Parameters
+        ----------
+        user_id : str
+            The user of the samples.
+        resource : str
+            The resource, e.g. `activities-heart-intraday` (see `series`).
+        start : series.Time | None, optional
+            The inclusive start of the range (see `series.timestamp`), by default
+            from the first sample.
+        end : series.Time | None, optional
+            The exclusive end of the range, by default until the last sample.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The `datetime64[s]` times and `float64` values, sorted by time.
+
+        Raises
+        ------
+        ModuleNotFoundError
+            If numpy is not installed.
+        """
+        if np is None:
+            raise ModuleNotFoundError(
+                "numpy is required for `query`. Install with `fitbit-web[numpy]`."
+            )
+        where, args = _where(user_id, resource, start, end)
+        with self._lock:
+            rows = np.fromiter(
+                self.connection.execute(
+                    f"SELECT time, value FROM samples WHERE {where} ORDER BY time",  # nosec: B608
+                    args,
+                ),
+                dtype=[("time", np.int64), ("value", np.float64)],
+            )
+        return rows["time"].astype("datetime64[s]"), rows["value"]
+
+    def span(self, user_id: str, resource: str) -> tuple[int, int] | None:
+        """Get the timestamps of the first and last samples of a resource, if any."""
+        with self._lock:
+            first, last = self.connection.execute(
+                "SELECT MIN(time), MAX(time) FROM samples WHERE user_id = ? AND resource = ?",
+                (user_id, resource),
+            ).fetchone()
+        return None if first is None else (first, last)
+
+    def resources(self, user_id: str) -> Sequence[str]:
+        """Get the resources stored for a user."""
+        with self._lock:
+            return [
+                resource
+                for (resource,) in self.connection.execute(
+                    "SELECT DISTINCT resource FROM samples WHERE user_id = ? ORDER BY resource",
+                    (user_id,),
+                )
+            ]
+
+
+def _where(
+    user_id: str,
+    resource: str | None,
+    start: series.Time | None,
+    end: series.Time | None,
+) -> tuple[str, list[Any]]:
+    conditions = ["user_id = ?"]
+    args: list[Any] = [user_id]
+    if resource is not None:
+        conditions.append("resource = ?")
+        args.append(resource)
+    if start is not None:
+        conditions.append("time >= ?")
+        args.append(series.timestamp(start))
+    if end is not None:
+        conditions.append("time < ?")
+        args.append(series.timestamp(end))
+    return " AND ".join(conditions), args
@@ -0,0 +1,96 @@
+"""Incremental parsing of response bodies for the streaming mode of the client.
+
+Parsing is done with the push interface of `ijson`, so the same code handles the
+chunks from `requests.Response.iter_content` and `aiohttp.StreamReader.iter_chunked`.
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ModuleNotFoundError:
+    ijson = None
+
+from fitbit_web import api
+
+if TYPE_CHECKING:
+    from fitbit_web import client
+
+CHUNK_SIZE: int = 64 * 1024
+
+
+def _parser(prefix: str | None):
+    if ijson is None:
+        raise ModuleNotFoundError(
+            "ijson is required for streaming. Install with `fitbit-web[streaming]`."
+        )
+    events = ijson.sendable_list()
+    if prefix is None:
+        return events, ijson.parse_coro(events)
+    return events, ijson.items_coro(events, prefix, use_float=True)
+
+
+def parse(chunks: Iterable[bytes], prefix: str | None = None) -> Iterator[Any]:
+    """Incrementally parse a JSON document.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The chunks of the document.
+    prefix : str | None, optional
+        The prefix of the items to yield, by default `None` which yields the
+        `(prefix, event, value)` parse events.
+
+    Yields
+    ------
+    Any
+        The items or events as soon as they are complete.
+    """
+    events, coro = _parser(prefix)
+    for chunk in chunks:
+        coro.send(chunk)
+        yield from events
+        del events[:]
+    coro.close()
+    yield from events
+
+
+async def aparse(
+    chunks: AsyncIterable[bytes], prefix: str | None = None
+) -> AsyncIterator[Any]:
+    """Incrementally parse a JSON document from an async stream, see `parse`."""
+    events, coro = _parser(prefix)
+    async for chunk in chunks:
+        coro.send(chunk)
+        for event in events:
+            yield event
+        del events[:]
+    coro.close()
+    for event in events:
+        yield event
+
+
+class StreamingApi(api.FitbitWebApi):
+    """View of a client where the endpoints stream their response bodies."""
+
+    def __init__(self, client: "client.BaseClient", prefix: str | None = None) -> None:
+        """Create a streaming view of a client."""
+        self.__client = client
+        self.__prefix = prefix
+
+    def _get(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ):
+        return self.__client._stream(url, param_kwargs, query_kwargs, self.__prefix)
+
+    async def _aget(
+        self,
+        url: str,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+    ):
+        return self.__client._astream(url, param_kwargs, query_kwargs, self.__prefix)
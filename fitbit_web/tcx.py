@@ -0,0 +1,163 @@
+"""Streaming parser for the TCX (Training Center XML) files of logged activities.
+
+The parser uses `xml.etree.ElementTree.iterparse` and discards each trackpoint once
+it has been read, so memory use is independent of the length of the activity.
+"""
+
+import array
+import datetime
+import io
+import math
+import os
+from typing import IO, Iterable, Iterator, NamedTuple, cast
+from xml.etree import ElementTree
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore
+
+Source = bytes | str | os.PathLike | IO[bytes] | Iterable[bytes]
+
+
+class Trackpoint(NamedTuple):
+    """A single point of a TCX track.
+
+    Missing values are `nan` so that each record has a fixed layout.
+    """
+
+    time: datetime.datetime
+    latitude: float
+    longitude: float
+    altitude: float
+    distance: float
+    heart_rate: float
+
+
+class _ChunkReader(io.RawIOBase):
+    """File-like wrapper around an iterable of chunks (e.g. a streamed response)."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            self._buffer = next(self._chunks, b"")
+            if not self._buffer:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size], self._buffer = self._buffer[:size], self._buffer[size:]
+        return size
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", maxsplit=1)[-1]
+
+
+def _parse_time(text: str) -> datetime.datetime:
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(text)
+
+
+def _float(text: str | None) -> float:
+    return float(text) if text else math.nan
+
+
+def _trackpoint(element: ElementTree.Element) -> Trackpoint:
+    values: dict[str, str | None] = {}
+    for child in element.iter():
+        name = _local_name(child.tag)
+        if name == "HeartRateBpm":
+            continue
+        if name == "Value":
+            name = "HeartRateBpm"
+        values[name] = child.text
+    return Trackpoint(
+        time=_parse_time(values["Time"] or ""),
+        latitude=_float(values.get("LatitudeDegrees")),
+        longitude=_float(values.get("LongitudeDegrees")),
+        altitude=_float(values.get("AltitudeMeters")),
+        distance=_float(values.get("DistanceMeters")),
+        heart_rate=_float(values.get("HeartRateBpm")),
+    )
+
+
+def trackpoints(source: Source) -> Iterator[Trackpoint]:
+    """Iterate over the trackpoints of a TCX document.
+
+    Parameters
+    ----------
+    source : bytes | str | os.PathLike | IO[bytes] | Iterable[bytes]
+        The raw TCX (as returned by `get_activities_tcx`), a path to a TCX file, a
+        binary file-like object or the chunks from the streaming view of the client.
+
+    Yields
+    ------
+    Trackpoint
+        Each trackpoint in document order.
+    """
+    readable: str | os.PathLike | IO[bytes]
+    if isinstance(source, bytes):
+        readable = io.BytesIO(source)
+    elif isinstance(source, (str, os.PathLike)):
+        readable = source
+    elif hasattr(source, "read"):
+        readable = cast(IO[bytes], source)
+    else:
+        readable = io.BufferedReader(_ChunkReader(cast(Iterable[bytes], source)))
+    parents: list[ElementTree.Element] = []
+    for event, element in ElementTree.iterparse(readable, events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            continue
+        parents.pop()
+        if _local_name(element.tag) == "Trackpoint":
+            yield _trackpoint(element)
+            if parents:
+                parents[-1].remove(element)
+
+
+def to_arrays(source: Source) -> dict[str, "np.ndarray"]:
+    """Read the trackpoints of a TCX document into NumPy arrays.
+
+    Values are accumulated in typed buffers rather than Python objects, so memory
+    use is 48 bytes per trackpoint.
+
+    Parameters
+    ----------
+    source : bytes | str | os.PathLike | IO[bytes] | Iterable[bytes]
+        The TCX document, see `trackpoints`.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        A mapping from the fields of `Trackpoint` to arrays. `time` is a UTC
+        `datetime64[ms]` array, the rest are `float64`.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If numpy is not installed.
+    """
+    if np is None:
+        raise ModuleNotFoundError(
+            "numpy is required for `to_arrays`. Install with `fitbit-web[numpy]`."
+        )
+    times = array.array("q")
+    columns = {field: array.array("d") for field in Trackpoint._fields[1:]}
+    for point in trackpoints(source):
+        times.append(round(point.time.timestamp() * 1000))
+        for field, column in columns.items():
+            column.append(getattr(point, field))
+    return {
+        "time": np.frombuffer(times, dtype=np.int64).astype("datetime64[ms]"),
+        **{
+            field: np.frombuffer(column, dtype=np.float64)
+            for field, column in columns.items()
+        },
+    }
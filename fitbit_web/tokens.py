@@ -0,0 +1,346 @@
+"""Stores of auth tokens which are shared safely by processes.
+
+Fitbit refresh tokens can only be used once, so when the clients of several processes
+share a user, the first to refresh invalidates the tokens of the others. A store
+keeps the latest tokens of each user, and refreshes them under an inter-process lock
+with an atomic compare-and-swap: a client whose tokens are stale gets the tokens
+refreshed by another process instead of refreshing them again::
+
+    token_store = tokens.SqliteTokenStore("tokens.db")
+    token_store.put(auth.get_tokens_local())
+    web_client = client.Client(token_store.get(user_id), token_store=token_store)
+"""
+
+import abc
+import contextlib
+import dataclasses
+import json
+import os
+import pathlib
+import sqlite3
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Iterator
+
+try:
+    import fcntl
+except ModuleNotFoundError:
+    fcntl = None  # type: ignore
+
+from fitbit_web import auth
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+def dumps(tokens: auth.AuthTokens) -> str:
+    """Encode tokens as JSON."""
+    return json.dumps(dataclasses.asdict(tokens), sort_keys=True)
+
+
+def parse(values: dict[str, Any]) -> auth.AuthTokens:
+    """Create tokens from decoded JSON, with the scope as a list or space separated."""
+    scope = values["scope"]
+    if isinstance(scope, str):
+        scope = scope.split()
+    return auth.AuthTokens(**{**values, "scope": tuple(scope)})
+
+
+def loads(text: str) -> auth.AuthTokens:
+    """Decode tokens from JSON."""
+    return parse(json.loads(text))
+
+
+class TokenStore(abc.ABC):
+    """Store of the latest auth tokens of users."""
+
+    def __enter__(self) -> "Self":
+        """Use the store as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Close the store."""
+        self.close()
+
+    @abc.abstractmethod
+    def users(self) -> list[str]:
+        """Get the IDs of the users with tokens."""
+
+    @abc.abstractmethod
+    def get(self, user_id: str) -> auth.AuthTokens | None:
+        """Get the tokens of a user, if any."""
+
+    @abc.abstractmethod
+    def put(self, tokens: auth.AuthTokens) -> None:
+        """Store the tokens of a user, replacing any stored."""
+
+    @abc.abstractmethod
+    def swap(self, old: auth.AuthTokens | None, new: auth.AuthTokens) -> bool:
+        """Atomically replace the tokens of a user, if they are still the old ones.
+
+        Returns
+        -------
+        bool
+            Whether the tokens were replaced.
+        """
+
+    @abc.abstractmethod
+    def lock(self, user_id: str) -> contextlib.AbstractContextManager:
+        """Lock the tokens of a user against refreshes by other threads and processes."""
+
+    def close(self) -> None:
+        """Close the store."""
+
+    def refresh(self, tokens: auth.AuthTokens) -> auth.AuthTokens:
+        """Refresh the tokens of a user, unless they have already been refreshed.
+
+        Parameters
+        ----------
+        tokens : auth.AuthTokens
+            The tokens which were rejected.
+
+        Returns
+        -------
+        auth.AuthTokens
+            The tokens stored by another client if they differ from the rejected
+            ones, otherwise the refreshed tokens, which are stored.
+        """
+        with self.lock(tokens.user_id):
+            current = self.get(tokens.user_id)
+            if current is not None and current.access_token != tokens.access_token:
+                return current
+            refreshed = (current or tokens).refresh()
+            if not self.swap(current, refreshed):
+                return self.get(tokens.user_id) or refreshed
+            return refreshed
+
+
+class MemoryTokenStore(TokenStore):
+    """Store which is not persisted, shared by the clients of a process."""
+
+    def __init__(self) -> None:
+        """Create an empty store."""
+        self.tokens: dict[str, auth.AuthTokens] = {}
+        self._lock = threading.RLock()
+
+    def users(self) -> list[str]:
+        """Get the IDs of the users with tokens."""
+        with self._lock:
+            return sorted(self.tokens)
+
+    def get(self, user_id: str) -> auth.AuthTokens | None:
+        """Get the tokens of a user, if any."""
+        return self.tokens.get(user_id)
+
+    def put(self, tokens: auth.AuthTokens) -> None:
+        """Store the tokens of a user."""
+        with self._lock:
+            self.tokens[tokens.user_id] = tokens
+
+    def swap(self, old: auth.AuthTokens | None, new: auth.AuthTokens) -> bool:
+        """Replace the tokens of a user, if they are still the old ones."""
+        with self._lock:
+            if self.tokens.get(new.user_id) != old:
+                return False
+            self.tokens[new.user_id] = new
+            return True
+
+    def lock(self, user_id: str) -> contextlib.AbstractContextManager:
+        """Lock the tokens against other threads."""
+        return self._lock
+
+
+class FileTokenStore(TokenStore):
+    """Store kept as a JSON file of the tokens by user ID.
+
+    The file is replaced atomically on each write, and is locked with `fcntl.flock`
+    on a lock file next to it, so it can be shared by the processes of a machine
+    (though not over a network file system). Without `fcntl` (i.e. on Windows) only
+    the threads of a process are locked against each other.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Open (or create) a store.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the JSON file.
+        """
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._file = self.path.with_name(f"{self.path.name}.lock").open("a")
+
+    def _read(self) -> dict[str, auth.AuthTokens]:
+        try:
+            with self.path.open(encoding="utf-8") as fp:
+                values = json.load(fp)
+        except FileNotFoundError:
+            return {}
+        return {user_id: parse(tokens) for user_id, tokens in values.items()}
+
+    def _write(self, tokens: dict[str, auth.AuthTokens]) -> None:
+        values = {
+            user_id: dataclasses.asdict(value) for user_id, value in tokens.items()
+        }
+        fd, temporary = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(values, fp, indent=2, sort_keys=True)
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def users(self) -> list[str]:
+        """Get the IDs of the users with tokens."""
+        return sorted(self._read())
+
+    def get(self, user_id: str) -> auth.AuthTokens | None:
+        """Get the tokens of a user, if any."""
+        return self._read().get(user_id)
+
+    def put(self, tokens: auth.AuthTokens) -> None:
+        """Store the tokens of a user."""
+        with self.lock(tokens.user_id):
+            self._write({**self._read(), tokens.user_id: tokens})
+
+    def swap(self, old: auth.AuthTokens | None, new: auth.AuthTokens) -> bool:
+        """Replace the tokens of a user, if they are still the old ones."""
+        with self.lock(new.user_id):
+            tokens = self._read()
+            if tokens.get(new.user_id) != old:
+                return False
+            self._write({**tokens, new.user_id: new})
+            return True
+
+    @contextlib.contextmanager
+    def lock(self, user_id: str) -> Iterator[None]:
+        """Lock the file against other threads and processes."""
+        with self._lock:
+            if self._depth == 0 and fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0 and fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Close the lock file."""
+        self._file.close()
+
+
+class SqliteTokenStore(TokenStore):
+    """Store kept in a SQLite database, which can be shared by processes.
+
+    The tokens of a user are refreshed in an immediate transaction, which locks the
+    database against writes by other connections until the refresh is stored. The
+    refresh request is made synchronously inside the transaction, so it blocks the
+    other connections until it completes (async clients make it in a thread).
+    """
+
+    def __init__(self, path: str | os.PathLike, table: str = "tokens") -> None:
+        """Open (or create) a store.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the database.
+        table : str, optional
+            The table of the tokens, by default "tokens".
+        """
+        self.table = table
+        self.connection = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("  # nosec: B608
+            "user_id TEXT PRIMARY KEY, tokens TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    def users(self) -> list[str]:
+        """Get the IDs of the users with tokens."""
+        with self._lock:
+            return [
+                user_id
+                for (user_id,) in self.connection.execute(
+                    f"SELECT user_id FROM {self.table} ORDER BY user_id"  # nosec: B608
+                )
+            ]
+
+    def get(self, user_id: str) -> auth.AuthTokens | None:
+        """Get the tokens of a user, if any."""
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT tokens FROM {self.table} WHERE user_id = ?",  # nosec: B608
+                (user_id,),
+            ).fetchone()
+        return None if row is None else loads(row[0])
+
+    def put(self, tokens: auth.AuthTokens) -> None:
+        """Store the tokens of a user."""
+        with self._lock:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (user_id, tokens)"  # nosec: B608
+                " VALUES (?, ?)",
+                (tokens.user_id, dumps(tokens)),
+            )
+
+    def swap(self, old: auth.AuthTokens | None, new: auth.AuthTokens) -> bool:
+        """Replace the tokens of a user, if they are still the old ones."""
+        with self._lock:
+            if old is None:
+                cursor = self.connection.execute(
+                    f"INSERT OR IGNORE INTO {self.table} (user_id, tokens)"  # nosec: B608
+                    " VALUES (?, ?)",
+                    (new.user_id, dumps(new)),
+                )
+            else:
+                cursor = self.connection.execute(
+                    f"UPDATE {self.table} SET tokens = ?"  # nosec: B608
+                    " WHERE user_id = ? AND tokens = ?",
+                    (dumps(new), new.user_id, dumps(old)),
+                )
+            return cursor.rowcount == 1
+
+    @contextlib.contextmanager
+    def lock(self, user_id: str) -> Iterator[None]:
+        """Lock the database against writes by other threads and processes."""
+        with self._lock:
+            if self._depth == 0:
+                self.connection.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                if self._depth == 1:
+                    self.connection.execute("ROLLBACK")
+                raise
+            else:
+                if self._depth == 1:
+                    self.connection.execute("COMMIT")
+            finally:
+                self._depth -= 1
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+
+def open(path: str | os.PathLike) -> TokenStore:
+    """Open a store, in SQLite if the path has one of `journal.SQLITE_SUFFIXES`."""
+    from fitbit_web import journal
+
+    if pathlib.Path(path).suffix.lower() in journal.SQLITE_SUFFIXES:
+        return SqliteTokenStore(path)
+    return FileTokenStore(path)
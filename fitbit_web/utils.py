@@ -1,35 +1,75 @@
 """Utility functions for the Web client."""
 
 import datetime
+import functools
+import re
 import urllib.parse
-from typing import Annotated, Any, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+BASE_URL = "https://api.fitbit.com/"
+
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TIME = re.compile(r"\d{2}:\d{2}")
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date(date: datetime.date | str) -> str:
+    if isinstance(date, str):
+        if _DATE.fullmatch(date):
+            datetime.date.fromisoformat(date)
+            return date
+        date = datetime.datetime.strptime(date, r"%Y-%m-%d").date()
+    return f"{date:%Y-%m-%d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_time(time: datetime.time | str) -> str:
+    if isinstance(time, str):
+        if _TIME.fullmatch(time):
+            datetime.time.fromisoformat(time)
+            return time
+        time = datetime.datetime.strptime(time, r"%H:%M").time()
+    return f"{time:%H:%M}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: datetime.datetime | str) -> str:
+    if isinstance(timestamp, str):
+        if _TIMESTAMP.fullmatch(timestamp):
+            datetime.datetime.fromisoformat(timestamp)
+            return timestamp
+        timestamp = datetime.datetime.strptime(timestamp, r"%Y-%m-%dT%H:%M:%S")
+    return f"{timestamp:%Y-%m-%dT%H:%M:%S}"
 
 
 def format_date(
     date: datetime.date | Literal["today"] | Annotated[str, "yyyy-MM-dd"]
 ) -> str:
-    """Format a date."""
+    """Format a date.
+
+    Strings already in the expected format are only validated, and the results are
+    memoized as the same dates are usually formatted many times.
+    """
     if date == "today":
-        date = datetime.datetime.now().date()
-    if not isinstance(date, datetime.date):
-        date = datetime.datetime.strptime(date, r"%Y-%m-%d").date()
-    return f"{date:%Y-%m-%d}"
+        return datetime.date.today().isoformat()
+    return _format_date(date)
 
 
 def format_time(time: datetime.time | Annotated[str, "HH:mm"]) -> str:
-    """Format a time."""
-    if not isinstance(time, datetime.time):
-        time = datetime.datetime.strptime(time, r"%H:%M").time()
-    return f"{time:%H:%M}"
+    """Format a time, see `format_date`."""
+    return _format_time(time)
 
 
 def format_timestamp(
     timestamp: datetime.datetime | Annotated[str, "yyyy-MM-ddTHH:mm:ss"]
 ) -> str:
-    """Format a timestamp."""
-    if not isinstance(timestamp, datetime.datetime):
-        timestamp = datetime.datetime.strptime(timestamp, r"%Y-%m-%dT%H:%M:%S")
-    return f"{timestamp:%Y-%m-%dT%H:%M:%S}"
+    """Format a timestamp, see `format_date`."""
+    return _format_timestamp(timestamp)
 
 
 def format_date_or_timestamp(
@@ -45,27 +85,116 @@ def format_date_or_timestamp(
     """Format a date or timestamp."""
     if date_or_timestamp is None:
         return None
-    try:
-        if not isinstance(date_or_timestamp, datetime.date):
-            return format_timestamp(date_or_timestamp)
-    except ValueError:
-        return format_date(date_or_timestamp)
+    if isinstance(date_or_timestamp, datetime.datetime) or (
+        isinstance(date_or_timestamp, str) and "T" in date_or_timestamp
+    ):
+        return format_timestamp(date_or_timestamp)
+    return format_date(date_or_timestamp)
+
+
+class UrlTemplate(str):
+    """The path of an endpoint, compiled for fast formatting.
+
+    The template is split once into its constant parts and the names of its path
+    parameters, so formatting a url is a single join. As a `str`, it can be used
+    anywhere the template itself is expected (e.g. as a metrics label).
+    """
+
+    _absolute: bool
+    _constants: tuple[str, ...]
+    _names: tuple[str, ...]
+    _prefixes: dict[str, str]
+    _keys: dict[str, str]
+
+    def __new__(cls, template: str) -> "Self":
+        """Compile a template such as `/1/user/-/sleep/date/{date}.json`."""
+        self = super().__new__(cls, template)
+        self._absolute = template.startswith("http")
+        parts = re.split(
+            r"\{([^{}]*)\}", template if self._absolute else template.lstrip("/")
+        )
+        self._constants = tuple(parts[::2])
+        self._names = tuple(parts[1::2])
+        self._prefixes = {}
+        self._keys = {}
+        return self
+
+    def build(
+        self,
+        param_kwargs: dict[str, Any] | None = None,
+        query_kwargs: dict[str, Any] | None = None,
+        base_url: str = BASE_URL,
+    ) -> str:
+        """Format the url, see `format_url`."""
+        if (prefix := self._prefixes.get(base_url)) is None:
+            prefix = self._prefixes[base_url] = (
+                self._constants[0]
+                if self._absolute
+                else base_url.rstrip("/") + "/" + self._constants[0]
+            )
+        if self._names:
+            params = param_kwargs or {}
+            parts = [prefix]
+            for name, constant in zip(self._names, self._constants[1:]):
+                if (value := params.get(name)) is None:
+                    raise KeyError(name)
+                parts.append(f"{value}")
+                parts.append(constant)
+            url = "".join(parts)
+        else:
+            url = prefix
+        if query_kwargs:
+            url += "?" + "&".join(
+                f"{self._key(key)}={_quote(value)}"
+                for key, value in query_kwargs.items()
+                if value is not None
+            )
+        return url
+
+    def _key(self, key: str) -> str:
+        if (quoted := self._keys.get(key)) is None:
+            quoted = self._keys[key] = urllib.parse.quote_plus(key)
+        return quoted
+
+
+_UNRESERVED = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+def _quote(value: Any) -> str:
+    value = f"{value}"
+    if _UNRESERVED.fullmatch(value):
+        return value
+    return urllib.parse.quote_plus(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(url: str) -> UrlTemplate:
+    return UrlTemplate(url)
 
 
 def format_url(
     url: str,
     param_kwargs: dict[str, Any] | None = None,
     query_kwargs: dict[str, Any] | None = None,
+    base_url: str = BASE_URL,
 ):
     """Format the url."""
-    if not url.startswith("http"):
-        url = "https://api.fitbit.com/" + url.lstrip("/")
-    url = url.format(**filter_dict(param_kwargs))
-    if query_kwargs:
-        url += "?" + urllib.parse.urlencode(filter_dict(query_kwargs))
-    return url
+    if not isinstance(url, UrlTemplate):
+        url = _compile(url)
+    return url.build(param_kwargs, query_kwargs, base_url)
 
 
 def filter_dict(dictionary: dict[str, Any | None] | None) -> dict[str, Any]:
     """Remove `None` values from a dictionary."""
     return {k: v for k, v in (dictionary or {}).items() if v is not None}
+
+
+def is_json(content_type: str | None) -> bool:
+    """Check whether a `Content-Type` header describes a JSON body.
+
+    A missing header is treated as JSON as that is what the Web API defaults to.
+    """
+    if not content_type:
+        return True
+    media_type = content_type.split(";", maxsplit=1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
@@ -0,0 +1,19 @@
+import pytest
+
+from fitbit_web import auth, mock_server
+
+TOKENS = auth.AuthTokens(
+    access_token="mock-access-0",
+    expires_in=28800,
+    refresh_token="mock-refresh-0",
+    scope=("activity", "heartrate", "profile", "sleep"),
+    token_type="Bearer",
+    user_id="MOCK01",
+)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with mock_server.MockServer().run_in_thread() as server:
+        monkeypatch.setattr(auth, "REFRESH_URL", f"{server.base_url}oauth2/token?")
+        yield server
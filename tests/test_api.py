@@ -1,4 +1,10 @@
-from fitbit_web import auth
+import subprocess
+import sys
+
+import pytest
+
+from fitbit_web import api, auth
+from fitbit_web.api import metadata
 
 
 def env_test():
@@ -6,6 +12,52 @@ def env_test():
     auth.check_secrets()
 
 
+def lazy_import_test():
+    """Test that importing the client does not import the endpoints or transports."""
+    code = (
+        "import sys, fitbit_web.client;"
+        "print(*sorted(m for m in sys.modules if m.startswith(('fitbit_web.api.',"
+        " 'requests', 'aiohttp'))))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout.split()
+    assert output == ["fitbit_web.api.base"]
+
+
+class _Api(api.FitbitWebApi):
+    def _get(self, url, param_kwargs=None, query_kwargs=None):
+        return url, param_kwargs
+
+    async def _aget(self, url, param_kwargs=None, query_kwargs=None):
+        return url, param_kwargs
+
+
+def lazy_method_test():
+    """Test that the endpoints are loaded from their module on first access."""
+    instance = _Api()
+    assert "get_profile" in dir(instance)
+    assert instance.get_profile() == ("/1/user/-/profile.json", None)
+    assert api.method("get_profile") is api.FitbitWebApi.get_profile
+    with pytest.raises(AttributeError, match="'_Api' object has no attribute"):
+        assert instance.get_nothing
+
+
+def metadata_test():
+    """Test that the metadata matches the generated methods."""
+    assert set(metadata.ENDPOINTS) == set(api.METHODS)
+    endpoint = metadata.ENDPOINTS["aget_sleep_by_date_range"]
+    assert endpoint is metadata.ENDPOINTS["get_sleep_by_date_range"]
+    assert endpoint.path == "/1.2/user/-/sleep/date/{base-date}/{end-date}.json"
+    assert endpoint.module == "sleep" and endpoint.max_range_days == 100
+    assert endpoint.parameter("base_date") is endpoint.parameter("base-date")
+    assert endpoint.parameter("base_date").formats == ("date",)
+    assert metadata.ENDPOINTS["get_temp_skin_summary_by_interval"].max_range_days == 30
+    assert metadata.ENDPOINTS["get_heart_by_date_intraday"].parameter(
+        "detail_level"
+    ).enum == ("1sec", "1min", "5min", "15min")
+
+
 if __name__ == "__main__":
     import sys
 
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from fitbit_web import archive, mock_server, series
+
+HEART = "/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json"
+RESOURCE = "activities-heart-intraday"
+
+
+def heart(date: str) -> dict:
+    return mock_server.payload(HEART, {"date": date, "detail-level": "1sec"})
+
+
+def archive_test(tmp_path):
+    """Test appending days across months and reading them back."""
+    store = archive.Archive(tmp_path)
+    assert store.ingest("A", heart("2024-01-31")) == 24 * 60 * 60 + 1
+    assert store.ingest("A", heart("2024-02-01")) == 24 * 60 * 60 + 1
+    assert store.ingest("A", heart("2024-02-01")) == 0
+    assert sorted(path.name for path in (tmp_path / "A" / RESOURCE).iterdir()) == [
+        "2024-01.fbts",
+        "2024-02.fbts",
+    ]
+    month = store.read("A", RESOURCE, "2024-02-01T12:00:00", "2024-02-01T13:00:00")
+    assert isinstance(month.base, np.memmap)
+    assert len(month) == 3600
+    assert month["time"][0] == series.timestamp("2024-02-01T12:00:00")
+    expected = heart("2024-02-01")["activities-heart-intraday"]["dataset"][12 * 3600]
+    assert month["value"][0] == expected["value"]
+    both = store.read("A", RESOURCE)
+    assert len(both) == 2 * 24 * 60 * 60
+    assert np.all(np.diff(both["time"]) == 1)
+    assert len(store.read("A", RESOURCE, "2024-03-01")) == 0
+    assert len(store.read("B", RESOURCE)) == 0
+
+
+def partial_record_test(tmp_path):
+    """Test that a partially written record is dropped on the next append."""
+    store = archive.Archive(tmp_path)
+    store.append("A", "value", [0, 1], [1.0, 2.0])
+    path = store.path("A", "value", "1970-01")
+    with open(path, "ab") as fp:
+        fp.write(b"\0" * 3)
+    assert len(store.read("A", "value")) == 2
+    store.append("A", "value", [1, 2], [2.0, 3.0])
+    assert store.read("A", "value")["value"].tolist() == [1.0, 2.0, 3.0]
+    assert path.stat().st_size == archive.HEADER_SIZE + 3 * archive.RECORD.itemsize
+
+
+def out_of_order_test(tmp_path):
+    """Test that an earlier day is merged into a month with later samples."""
+    store = archive.Archive(tmp_path)
+    assert store.ingest("A", heart("2024-02-02")) == 24 * 60 * 60 + 1
+    assert store.ingest("A", heart("2024-02-01")) == 24 * 60 * 60 + 1
+    assert store.ingest("A", heart("2024-02-01")) == 0
+    records = store.read("A", RESOURCE)
+    assert len(records) == 2 * 24 * 60 * 60
+    assert np.all(np.diff(records["time"]) == 1)
+    assert records["time"][0] == series.timestamp("2024-02-01")
+    store.append("A", "value", [3, 1], [3.0, 1.0])
+    assert store.append("A", "value", [0, 1, 2, 3], [0.0, 0.0, 2.0, 0.0]) == 2
+    assert store.read("A", "value")["value"].tolist() == [0.0, 1.0, 2.0, 3.0]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import pytest
+
+from fitbit_web import backfill, client, mock_server
+from tests.conftest import TOKENS
+
+SLEEP = "get_sleep_by_date_range"
+STEPS = ("get_activities_resource_by_date_range", {"resource_path": "steps"})
+
+
+def plan_test():
+    """Test that the history is covered by the fewest requests, most recent first."""
+    requests = backfill.plan([SLEEP, STEPS], "2023-01-01", "2024-12-31")
+    assert requests[:3] == [
+        (SLEEP, {"base_date": "2024-09-23", "end_date": "2024-12-31"}),
+        (
+            STEPS[0],
+            {
+                "resource_path": "steps",
+                "base_date": "2023-01-01",
+                "end_date": "2024-12-31",
+            },
+        ),
+        (SLEEP, {"base_date": "2024-06-15", "end_date": "2024-09-22"}),
+    ]
+    sleep = [request for request in requests if request.name == SLEEP]
+    assert len(sleep) == 8
+    assert sleep[-1].arguments == {"base_date": "2023-01-01", "end_date": "2023-01-31"}
+    with pytest.raises(ValueError):
+        backfill.plan(["get_profile"], "2024-01-01")
+
+
+def quota_test():
+    """Test the estimated completion time across rate limit windows."""
+    quota = backfill.Quota(clock=lambda: 0)
+    assert quota.eta(10) is None
+    quota.limit, quota.remaining, quota.reset, quota.latency = 150, 10, 600, 0.5
+    assert quota.eta(10) == 5
+    assert quota.eta(11) == 600 + 0.5
+    assert quota.eta(160) == 600 + 150 * 0.5
+    assert quota.eta(311) == 600 + 2 * backfill.WINDOW + 0.5
+    assert quota.wait() == 0
+    quota.remaining = 0
+    assert quota.wait() == 600
+
+
+def backfill_test(tmp_path):
+    """Test waiting for the rate limit and resuming from the checkpoint."""
+    requests = backfill.plan([SLEEP, STEPS], "2024-01-01", "2024-06-30")
+    assert len(requests) == 3
+    checkpoint = tmp_path / "backfill.jsonl"
+    delays = []
+
+    def sleep(delay: float) -> None:
+        delays.append(delay)
+        time.sleep(delay)
+
+    with mock_server.MockServer(
+        rate_limit=2, rate_limit_window=1
+    ).run_in_thread() as server:
+        web_client = client.Client(TOKENS, base_url=server.base_url)
+        with backfill.Backfill(requests, checkpoint, sleep=sleep) as job:
+            for request, response in job.run(web_client):
+                assert response["sleep"] if request.name == SLEEP else response
+                break
+            assert job.progress()[:2] == (0, 3)
+            for _ in job.run(web_client):
+                pass
+            assert job.progress().done == 3
+            assert job.progress().eta is not None
+            assert delays and not web_client.hooks
+            assert len(server.requests) == 4
+        assert job.journal._file.closed
+        with backfill.Backfill(requests, checkpoint) as resumed:
+            assert resumed.pending == []
+            assert list(resumed.run(web_client)) == []
+        with backfill.Backfill(requests, checkpoint, job=TOKENS.user_id) as other:
+            assert len(other.pending) == 3
+            assert other._key(requests[0]) == f"{TOKENS.user_id}:{requests[0].key}"
+
+
+def concurrent_test():
+    """Test retrying the requests over the rate limit while others succeed."""
+    requests = backfill.plan([SLEEP], "2024-01-01", "2024-12-31", max_days=30)
+
+    async def run(job: backfill.Backfill, web_client: client.Client) -> list:
+        return [request.key async for request, _ in job.arun(web_client, concurrency=4)]
+
+    async def main(web_client: client.Client) -> tuple[list, list]:
+        first = backfill.Backfill(requests[::2], retries=10)
+        second = backfill.Backfill(requests[1::2], retries=10)
+        return await asyncio.gather(run(first, web_client), run(second, web_client))
+
+    with mock_server.MockServer(
+        rate_limit=6, rate_limit_window=1
+    ).run_in_thread() as server:
+        web_client = client.Client(TOKENS, base_url=server.base_url)
+        first, second = asyncio.run(main(web_client))
+        assert sorted(first + second) == sorted(request.key for request in requests)
+        assert len(server.requests) > len(requests)
+        assert web_client.hooks == ()
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -0,0 +1,101 @@
+import asyncio
+import dataclasses
+import socket
+
+import aiohttp
+import pytest
+import requests
+
+from fitbit_web import breaker, client, mock_server
+from tests.conftest import TOKENS
+
+HEART = "/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json"
+
+
+def breaker_test():
+    """Test opening on the failure rate, failing fast and probing when half-open."""
+    now = [0.0]
+    circuit = breaker.CircuitBreaker(
+        failure_rate=0.5, min_requests=4, window=10, open_for=30, clock=lambda: now[0]
+    )
+    for success in (True, False, True):
+        circuit.record(HEART, success)
+    assert circuit.state(HEART) == "closed"
+    now[0] = 11
+    circuit.record(HEART, False)
+    circuit.record(HEART, True)
+    assert circuit.state(HEART) == "closed"
+    circuit.record(HEART, False)
+    circuit.record(HEART, False)
+    assert circuit.state(HEART) == "open"
+    assert circuit.state("/1/user/-/profile.json") == "closed"
+    with pytest.raises(breaker.CircuitOpenError) as error:
+        circuit.allow(HEART)
+    assert error.value.retry_after == 30
+    now[0] = 41
+    assert circuit.state(HEART) == "half-open"
+    assert circuit.allow(HEART)
+    with pytest.raises(breaker.CircuitOpenError):
+        circuit.allow(HEART)
+    circuit.record(HEART, False, probe=True)
+    assert circuit.state(HEART) == "open"
+    now[0] = 71
+    assert circuit.allow(HEART)
+    circuit.record(HEART, True, probe=True)
+    assert circuit.state(HEART) == "closed"
+    assert not circuit.allow(HEART)
+
+
+def client_test(server: mock_server.MockServer):
+    """Test that a client fails fast on the endpoints with server errors."""
+    circuit = breaker.CircuitBreaker(min_requests=2, open_for=60)
+    web_client = client.Client(TOKENS, base_url=server.base_url, breaker=circuit)
+    server.fail_next(503, 2)
+    for _ in range(2):
+        with pytest.raises(Exception, match="Injected failure"):
+            web_client.get_heart_by_date_intraday("2024-01-01")
+    with pytest.raises(breaker.CircuitOpenError):
+        asyncio.run(web_client.aget_heart_by_date_intraday("2024-01-01"))
+    assert len(server.requests) == 2
+    assert web_client.get_profile()["user"]
+    server.fail_next(404, 2)
+    for _ in range(2):
+        with pytest.raises(Exception, match="Injected failure"):
+            web_client.get_profile()
+    assert circuit.state("/1/user/-/profile.json") == "closed"
+
+
+def refresh_test(server: mock_server.MockServer):
+    """Test that failed refreshes of the tokens are not failures of the endpoint."""
+    circuit = breaker.CircuitBreaker(min_requests=2, open_for=60)
+    stale = dataclasses.replace(TOKENS, refresh_token="stale")
+    web_client = client.Client(stale, base_url=server.base_url, breaker=circuit)
+    server.token_lifetime = 0
+    server.refreshes.append("stale")
+    for _ in range(3):
+        with pytest.raises(Exception, match="invalid_grant"):
+            web_client.get_profile()
+    assert circuit.state("/1/user/-/profile.json") == "closed"
+    assert not circuit._circuits["/1/user/-/profile.json"].outcomes
+
+
+def connection_test():
+    """Test that failed connections are failures of the endpoint."""
+    circuit = breaker.CircuitBreaker(min_requests=2, open_for=60)
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        host, port = unused.getsockname()
+        web_client = client.Client(
+            TOKENS, base_url=f"http://{host}:{port}", breaker=circuit
+        )
+        with pytest.raises(requests.ConnectionError):
+            web_client.get_profile()
+        with pytest.raises(aiohttp.ClientConnectionError):
+            asyncio.run(web_client.aget_profile())
+    assert circuit.state("/1/user/-/profile.json") == "open"
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -0,0 +1,139 @@
+import pytest
+
+from fitbit_web import cache, client, instrumentation, mock_server
+from tests.conftest import TOKENS
+
+HEART = "/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json"
+
+
+class _Recorder(instrumentation.Hook):
+    def __init__(self) -> None:
+        self.infos: list[instrumentation.RequestInfo] = []
+
+    def request_end(self, info: instrumentation.RequestInfo) -> None:
+        self.infos.append(info)
+
+
+def aggregate_test():
+    """Test aggregating to a coarser detail level and slicing a time window."""
+    response = mock_server.payload(
+        HEART, {"date": "2024-01-01", "detail-level": "1sec"}
+    )
+    dataset = response["activities-heart-intraday"]["dataset"]
+    derived = cache.aggregate(response, "15min")
+    intraday = derived["activities-heart-intraday"]
+    assert derived["activities-heart"] == response["activities-heart"]
+    assert intraday["datasetInterval"] == 15
+    assert intraday["datasetType"] == "minute"
+    assert len(intraday["dataset"]) == 24 * 4
+    assert intraday["dataset"][1] == {
+        "time": "00:15:00",
+        "value": pytest.approx(
+            sum(sample["value"] for sample in dataset[900:1800]) / 900
+        ),
+    }
+    window = cache.aggregate(response, "1min", "08:00", "09:00")
+    assert [
+        sample["time"] for sample in window["activities-heart-intraday"]["dataset"]
+    ][::30] == ["08:00:00", "08:30:00", "09:00:00"]
+    steps = mock_server.payload(
+        "/1/user/-/activities/{resource-path}/date/{date}/1d/{detail-level}.json",
+        {"resource-path": "steps", "date": "2024-01-01", "detail-level": "1min"},
+    )
+    total = sum(
+        sample["value"] for sample in steps["activities-steps-intraday"]["dataset"][:15]
+    )
+    assert cache.aggregate(steps, "15min")["activities-steps-intraday"]["dataset"][
+        0
+    ] == {"time": "00:00:00", "value": total}
+    assert cache.aggregate({"sleep": []}, "15min") is None
+
+
+def client_cache_test(server: mock_server.MockServer):
+    """Test that coarser and windowed requests are answered from the cache."""
+    recorder = _Recorder()
+    web_client = client.Client(
+        TOKENS, base_url=server.base_url, hooks=[recorder], cache=cache.Cache()
+    )
+    full = web_client.get_heart_by_date_intraday("2024-01-01", "1min")
+    assert web_client.get_heart_by_date_intraday("2024-01-01", "1min") is full
+    coarse = web_client.get_heart_by_date_intraday("2024-01-01", "15min")
+    assert len(coarse["activities-heart-intraday"]["dataset"]) == 24 * 4
+    window = web_client.get_heart_by_date_timestamp_intraday(
+        "2024-01-01", "08:00", "08:59", "5min"
+    )
+    assert [
+        sample["time"] for sample in window["activities-heart-intraday"]["dataset"]
+    ][::6] == ["08:00:00", "08:30:00"]
+    assert len(server.requests) == 1
+    assert [info.cache_hit for info in recorder.infos] == [False, True, True, True]
+    assert all(info.status == 200 for info in recorder.infos)
+    web_client.get_heart_by_date_intraday("2024-01-01", "1sec")
+    web_client.get_heart_by_date_intraday("2024-01-02", "15min")
+    assert len(server.requests) == 3
+
+
+def split_test():
+    """Test splitting range responses into days and joining them back."""
+    dates = cache.days("2024-01-30", "2024-02-02")
+    assert dates == ["2024-01-30", "2024-01-31", "2024-02-01", "2024-02-02"]
+    for template in (
+        "/1.2/user/-/sleep/date/{base-date}/{end-date}.json",
+        "/1/user/-/spo2/date/{startDate}/{endDate}.json",
+    ):
+        params = dict(zip(cache.date_range(template)[:2], dates[::3]))
+        response = mock_server.payload(template, params)
+        parts = cache.split(response, dates)
+        assert list(parts) == dates
+        assert cache.join(list(parts.values())) == response
+    assert cache.split({"sleep": [{"dateOfSleep": "2024-03-01"}]}, dates) is None
+    assert cache.date_range("/1.2/user/-/sleep/date/{base-date}/{end-date}.json") == (
+        "base-date",
+        "end-date",
+        100,
+    )
+    assert cache.date_range(HEART) is None
+
+
+def range_cache_test(server: mock_server.MockServer):
+    """Test that only the days which are not cached are requested."""
+    web_client = client.Client(TOKENS, base_url=server.base_url, cache=cache.Cache())
+    first = web_client.get_sleep_by_date_range("2024-01-01", "2024-03-31")
+    second = web_client.get_sleep_by_date_range("2024-02-01", "2024-04-15")
+    assert first["sleep"][31:] == second["sleep"][:60]
+    assert [sleep["dateOfSleep"] for sleep in second["sleep"]] == cache.days(
+        "2024-02-01", "2024-04-15"
+    )
+    assert server.requests[1:] == ["/1.2/user/-/sleep/date/2024-04-01/2024-04-15.json"]
+    assert web_client.get_sleep_by_date_range("2024-01-10", "2024-01-20")["sleep"] == (
+        first["sleep"][9:20]
+    )
+    web_client.get_sleep_by_date_range("2023-12-01", "2024-08-31")
+    assert server.requests[2:] == [
+        "/1.2/user/-/sleep/date/2023-12-01/2023-12-31.json",
+        "/1.2/user/-/sleep/date/2024-04-16/2024-07-24.json",
+        "/1.2/user/-/sleep/date/2024-07-25/2024-08-31.json",
+    ]
+
+
+def expiry_test():
+    """Test the eviction of the least recently used and expired responses."""
+    responses = cache.Cache(maxsize=2, ttl=0)
+    responses.put("A", HEART, {"date": "2024-01-01"}, None, {})
+    assert responses.get("A", HEART, {"date": "2024-01-01"}) is None
+    responses = cache.Cache(maxsize=2)
+    for date in ("2024-01-01", "2024-01-02", "2024-01-03"):
+        responses.put("A", HEART, {"date": date}, None, {"date": date})
+    assert len(responses) == 2
+    assert responses.get("A", HEART, {"date": "2024-01-01"}) is None
+    assert responses.get("B", HEART, {"date": "2024-01-03"}) is None
+    assert responses.get("A", HEART, {"date": "2024-01-03"}) == {"date": "2024-01-03"}
+    responses = cache.Cache(recent_ttl=0)
+    responses.put("A", HEART, {"date": "2999-01-01"}, None, {})
+    assert responses.get("A", HEART, {"date": "2999-01-01"}) is None
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -0,0 +1,109 @@
+import asyncio
+import dataclasses
+import json
+
+import pytest
+
+from fitbit_web import __main__, cache, client, export, mock_server, store
+from tests.conftest import TOKENS
+
+SLEEP = "get_sleep_by_date_range"
+
+
+def writer_test(tmp_path):
+    """Test that the format of the output is chosen by its suffix."""
+    with export.writer(tmp_path / "out.jsonl") as output:
+        assert isinstance(output, export.JsonlWriter)
+    with export.writer(tmp_path / "out.db") as output:
+        assert isinstance(output, export.SqliteWriter)
+    with export.writer(tmp_path / "out", "sqlite") as output:
+        assert output.resumable
+    with pytest.raises(ValueError):
+        export.writer(tmp_path / "out.csv")
+
+
+def parquet_test(tmp_path):
+    """Test writing the samples to a Parquet file in row groups."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    response = {"sleep": [{"dateOfSleep": "2024-01-01", "efficiency": 90}]}
+    with export.writer(tmp_path / "out.parquet") as output:
+        output.row_group_size = 1
+        assert not output.resumable
+        assert output.write("A", export.backfill.Request(SLEEP, {}), response) == 1
+        output.write("B", export.backfill.Request(SLEEP, {}), response)
+    table = pq.read_table(tmp_path / "out.parquet")
+    assert table.column("user_id").to_pylist() == ["A", "B"]
+    assert pq.ParquetFile(tmp_path / "out.parquet").num_row_groups == 2
+
+
+def export_test(server: mock_server.MockServer, tmp_path):
+    """Test exporting several users with concurrent requests and a shared cache."""
+    shared = cache.Cache()
+    web_clients = [
+        client.Client(
+            dataclasses.replace(TOKENS, user_id=user_id),
+            base_url=server.base_url,
+            cache=shared,
+        )
+        for user_id in ("A", "B")
+    ]
+    reports = []
+    with export.writer(tmp_path / "fitbit.db") as output:
+        records = asyncio.run(
+            export.export(
+                output,
+                web_clients,
+                [SLEEP],
+                since="2024-01-01",
+                until="2024-02-29",
+                max_days=7,
+                concurrency=3,
+                progress=reports.append,
+            )
+        )
+    assert records > 0
+    assert len(server.requests) == 2 * 9
+    assert reports[-1][:2] == (18, 18)
+    with store.Store(tmp_path / "fitbit.db") as db:
+        assert db.resources("A") == db.resources("B")
+
+
+def cli_test(server: mock_server.MockServer, tmp_path):
+    """Test exporting to JSON lines from the command line and resuming."""
+    tokens = tmp_path / "tokens.json"
+    tokens.write_text(json.dumps([dataclasses.asdict(TOKENS)]))
+    output = tmp_path / "fitbit.jsonl"
+    argv = [
+        "export",
+        "--token-store",
+        str(tmp_path / "tokens.db"),
+        "--tokens",
+        str(tokens),
+        "--output",
+        str(output),
+        "--resource",
+        SLEEP,
+        "--resource",
+        "get_activities_resource_by_date_range:resource_path=steps",
+        "--journal",
+        str(tmp_path / "journal.jsonl"),
+        "--since",
+        "2024-01-01",
+        "--until",
+        "2024-06-30",
+        "--base-url",
+        server.base_url,
+    ]
+    assert __main__.main(argv) == 0
+    lines = output.read_text().splitlines()
+    assert len(lines) == len(server.requests) == 3
+    assert {json.loads(line)["user_id"] for line in lines} == {TOKENS.user_id}
+    assert __main__.main(argv + ["--quiet"]) == 0
+    assert len(output.read_text().splitlines()) == 3
+    assert len(server.requests) == 3
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
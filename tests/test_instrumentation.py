@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from fitbit_web import client, instrumentation, mock_server
+from tests.conftest import TOKENS
+
+
+class Recorder(instrumentation.Hook):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def request_start(self, info):
+        self.started.append(info.endpoint)
+
+    def request_end(self, info):
+        self.ended.append(info)
+
+
+def hooks_test(server: mock_server.MockServer):
+    """Test that the hooks receive the details of each request."""
+    recorder = Recorder()
+    web_client = client.Client(TOKENS, base_url=server.base_url, hooks=[recorder])
+    web_client.get_heart_by_date_intraday("2024-01-01", "1min")
+    asyncio.run(web_client.aget_profile())
+    server.token_lifetime = 2
+    server.fail_next(503)
+    with pytest.raises(Exception, match=r"Injected failure \(503\)"):
+        web_client.get_profile()
+    intraday, profile, failed = recorder.ended
+    assert recorder.started == [info.endpoint for info in recorder.ended]
+    assert intraday.endpoint == (
+        "/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json"
+    )
+    assert (intraday.status, intraday.mode, intraday.user_id) == (200, "sync", "MOCK01")
+    assert intraday.bytes > 0 and intraday.latency > 0
+    assert intraday.rate_limit_remaining == 149
+    assert profile.mode == "async"
+    assert (failed.status, failed.retries) == (503, 1)
+    assert failed.error is not None
+
+
+def observe_test(server: mock_server.MockServer):
+    """Test that observing hooks only see the requests made in their context."""
+    recorder, observer = Recorder(), Recorder()
+    web_client = client.Client(TOKENS, base_url=server.base_url, hooks=[recorder])
+
+    async def observed() -> None:
+        with instrumentation.observe(observer):
+            await web_client.aget_profile()
+
+    async def main() -> None:
+        await asyncio.gather(observed(), web_client.aget_devices())
+
+    asyncio.run(main())
+    web_client.get_profile()
+    assert len(recorder.ended) == 3
+    assert observer.started == ["/1/user/-/profile.json"]
+    assert web_client.hooks == (recorder,)
+
+
+def prometheus_test(server: mock_server.MockServer):
+    """Test that requests are recorded as Prometheus metrics."""
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    hook = instrumentation.PrometheusHook(registry=registry)
+    web_client = client.Client(TOKENS, base_url=server.base_url, hooks=[hook])
+    web_client.get_profile()
+    labels = {"endpoint": "/1/user/-/profile.json"}
+    assert (
+        registry.get_sample_value(
+            "fitbit_web_requests_total", {**labels, "status": "200", "cache": "miss"}
+        )
+        == 1
+    )
+    assert registry.get_sample_value("fitbit_web_request_latency_seconds_count", labels)
+
+
+def opentelemetry_test(server: mock_server.MockServer):
+    """Test that requests are recorded as spans."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider, export
+    from opentelemetry.sdk.trace.export import in_memory_span_exporter
+
+    exporter = in_memory_span_exporter.InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    hook = instrumentation.OpenTelemetryHook(provider.get_tracer(__name__))
+    web_client = client.Client(TOKENS, base_url=server.base_url, hooks=[hook])
+    web_client.get_profile()
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET /1/user/-/profile.json"
+    assert span.attributes["http.status_code"] == 200
@@ -0,0 +1,43 @@
+import pytest
+
+from fitbit_web import journal
+
+
+@pytest.mark.parametrize("name", ["done.jsonl", "done.db"])
+def journal_test(tmp_path, name: str):
+    """Test that recorded keys survive reopening the journal."""
+    with journal.open(tmp_path / name) as done:
+        assert isinstance(
+            done,
+            journal.SqliteJournal if name.endswith(".db") else journal.JsonlJournal,
+        )
+        done.record("a")
+        done.record("b")
+        done.record("a")
+        assert len(done) == 2
+    with journal.open(tmp_path / name) as done:
+        assert "a" in done and "b" in done and "c" not in done
+        assert list(done.pending(["a", "c", "b", "d"])) == ["c", "d"]
+        assert len(done) == 2
+
+
+def partial_line_test(tmp_path):
+    """Test that a partially written record is discarded."""
+    path = tmp_path / "done.jsonl"
+    with journal.JsonlJournal(path) as done:
+        done.record("a")
+    with open(path, "ab") as fp:
+        fp.write(b'{"key": "b", "ti')
+    with journal.JsonlJournal(path) as done:
+        assert "b" not in done
+        done.record("c")
+    assert [line[:15] for line in path.read_text().splitlines()] == [
+        '{"key": "a", "t',
+        '{"key": "c", "t',
+    ]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -0,0 +1,81 @@
+import asyncio
+import re
+
+import pytest
+
+from fitbit_web import client, mock_server
+from tests.conftest import TOKENS
+
+EXAMPLES = {
+    "start-time": "08:00",
+    "end-time": "09:00",
+    "end": "2024-01-07",
+    "date": "2024-01-05",
+    "period": "7d",
+    "level": "1min",
+    "resource": "steps",
+}
+
+
+def example(name: str) -> str:
+    return next((v for k, v in EXAMPLES.items() if k in name.lower()), "123")
+
+
+def routes_test():
+    """Test that every endpoint resolves to its own template."""
+    for template in mock_server.endpoints():
+        path = re.sub(r"\{([^}]+)\}", lambda m: example(m[1]), template)
+        assert mock_server.resolve(path)[0] == template
+
+
+def client_test(server: mock_server.MockServer):
+    """Test the sync and async client against the server."""
+    web_client = client.Client(TOKENS, base_url=server.base_url)
+    response = web_client.get_heart_by_date_intraday("2024-01-01", "1min")
+    assert len(response["activities-heart-intraday"]["dataset"]) == 24 * 60
+    assert (
+        asyncio.run(web_client.aget_heart_by_date_intraday("2024-01-01", "1min"))
+        == response
+    )
+    assert (
+        len(web_client.get_sleep_by_date_range("2024-01-01", "2024-01-31")["sleep"])
+        == 31
+    )
+    assert web_client.get_activities_tcx("1").startswith(b"<?xml")
+
+
+def compose_test(server: mock_server.MockServer):
+    """Test a client composed from some of the endpoint groups."""
+    AsyncClient = client.compose(
+        "heart_rate_intraday_time_series", "sleep", mode="async"
+    )
+    assert AsyncClient is client.compose(
+        "heart_rate_intraday_time_series", "sleep", mode="async"
+    )
+    web_client = AsyncClient(TOKENS, base_url=server.base_url)
+    assert not hasattr(web_client, "get_heart_by_date_intraday")
+    assert not hasattr(web_client, "aget_profile")
+    response = asyncio.run(web_client.aget_heart_by_date_intraday("2024-01-01", "1min"))
+    assert len(response["activities-heart-intraday"]["dataset"]) == 24 * 60
+
+
+def token_expiry_test(server: mock_server.MockServer):
+    """Test that expired tokens are refreshed."""
+    server.token_lifetime = 1
+    web_client = client.Client(TOKENS, base_url=server.base_url)
+    web_client.get_profile()
+    assert web_client.get_profile()["user"]["encodedId"] == "MOCK01"
+    assert len(server.requests) == 3
+
+
+def errors_test(server: mock_server.MockServer):
+    """Test that rate limits and injected failures are returned."""
+    server.rate_limit = 1
+    web_client = client.Client(TOKENS, base_url=server.base_url)
+    web_client.get_profile()
+    with pytest.raises(Exception, match="Too Many Requests"):
+        web_client.get_profile()
+    server.rate_limit = 150
+    server.fail_next(503)
+    with pytest.raises(Exception, match="503"):
+        web_client.get_profile()
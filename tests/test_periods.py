@@ -0,0 +1,57 @@
+import pytest
+
+from fitbit_web import cache, client, mock_server, periods
+from tests.conftest import TOKENS
+
+HEART_PERIOD = "/1/user/-/activities/heart/date/{date}/{period}.json"
+HEART_RANGE = "/1/user/-/activities/heart/date/{base-date}/{end-date}.json"
+
+
+def normalize_test():
+    """Test rewriting period requests as range requests."""
+    assert periods.normalize(HEART_PERIOD, {"date": "2024-03-01", "period": "7d"}) == (
+        HEART_RANGE,
+        {"base-date": "2024-02-24", "end-date": "2024-03-01"},
+    )
+    assert periods.normalize(
+        "/1/user/-/activities/{resource-path}/date/{date}/{period}.json",
+        {"date": "2024-03-01", "period": "1d", "resource-path": "steps"},
+    ) == (
+        "/1/user/-/activities/{resource-path}/date/{base-date}/{end-date}.json",
+        {"base-date": "2024-03-01", "end-date": "2024-03-01", "resource-path": "steps"},
+    )
+    weight = "/1/user/-/body/log/weight/date/{date}/{period}.json"
+    assert periods.normalize(weight, {"date": "2024-03-01", "period": "max"}) == (
+        weight,
+        {"date": "2024-03-01", "period": "max"},
+    )
+    assert periods.normalize(
+        weight, {"date": "2024-03-01", "period": "max"}, since="2020-01-01"
+    )[1] == {"base-date": "2020-01-01", "end-date": "2024-03-01"}
+    goals = "/1/user/-/activities/goals/{period}.json"
+    assert periods.normalize(goals, {"period": "daily"}) == (
+        goals,
+        {"period": "daily"},
+    )
+
+
+def shared_cache_test(server: mock_server.MockServer):
+    """Test that period and range requests share the cached days."""
+    web_client = client.Client(TOKENS, base_url=server.base_url, cache=cache.Cache())
+    week = web_client.get_heart_by_date_period("2024-01-07", "7d")
+    assert [day["dateTime"] for day in week["activities-heart"]] == cache.days(
+        "2024-01-01", "2024-01-07"
+    )
+    days = web_client.get_heart_by_date_range("2024-01-03", "2024-01-05")
+    assert days["activities-heart"] == week["activities-heart"][2:5]
+    web_client.get_heart_by_date_period("2024-01-10", "1w")
+    assert server.requests == [
+        "/1/user/-/activities/heart/date/2024-01-01/2024-01-07.json",
+        "/1/user/-/activities/heart/date/2024-01-08/2024-01-10.json",
+    ]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -0,0 +1,127 @@
+import asyncio
+import concurrent.futures
+import functools
+
+import pytest
+
+from fitbit_web import backfill, client, mock_server, pipeline
+from tests.conftest import TOKENS
+
+HEART = "activities-heart-intraday"
+
+
+def requests(days: int) -> list[backfill.Request]:
+    return [
+        backfill.Request(
+            "get_heart_by_date_intraday",
+            {"date": f"2024-01-{day:02}", "detail_level": "1min"},
+        )
+        for day in range(1, days + 1)
+    ]
+
+
+async def collect(pipe: pipeline.Pipeline, web_client, days: int, server) -> dict:
+    results = {}
+    async for request, samples in pipe.run(web_client, requests(days)):
+        assert len(server.requests) <= len(results) + pipe.max_pending
+        results[request.arguments["date"]] = samples
+    return results
+
+
+def pipeline_test(server: mock_server.MockServer):
+    """Test transforming responses in a process pool, with back-pressure."""
+    web_client = client.Client(TOKENS, base_url=server.base_url)
+    body = web_client.raw().get_heart_by_date_intraday("2024-01-01")
+    assert isinstance(body, bytes)
+    with concurrent.futures.ProcessPoolExecutor(2) as executor, pipeline.Pipeline(
+        executor=executor, max_pending=2
+    ) as pipe:
+        server.requests.clear()
+        results = asyncio.run(collect(pipe, web_client, 6, server))
+    assert sorted(results) == [f"2024-01-0{day}" for day in range(1, 7)]
+    assert results["2024-01-01"] == pipeline.samples(body)
+    assert len(results["2024-01-06"][HEART].times) == 24 * 60
+
+
+def close_test(server: mock_server.MockServer):
+    """Test that closing the iterator stops the requests."""
+    web_client = client.Client(TOKENS, base_url=server.base_url)
+    transform = functools.partial(pipeline.samples, name="heart")
+
+    async def first() -> backfill.Request:
+        results = pipe.run(web_client, requests(20))
+        request, _ = await anext(results)
+        await results.aclose()
+        return request
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor, pipeline.Pipeline(
+        transform, executor, max_pending=3
+    ) as pipe:
+        assert asyncio.run(first()).name == "get_heart_by_date_intraday"
+    assert len(server.requests) <= 4
+    with concurrent.futures.ThreadPoolExecutor(3) as executor:
+        assert pipeline.Pipeline(executor=executor, max_workers=3).max_pending == 6
+
+
+def stream_test(server: mock_server.MockServer):
+    """Test streaming a date range day by day, with back-pressure."""
+    web_client = client.Client(TOKENS, base_url=server.base_url)
+
+    async def collect() -> dict:
+        days = {}
+        async for date, response in web_client.stream(
+            "get_sleep_by_date_range",
+            "2024-01-01",
+            "2024-01-20",
+            concurrency=2,
+            max_queue=1,
+            max_days=5,
+        ):
+            assert len(server.requests) <= len(days) // 5 + 4
+            days[date] = response
+        return days
+
+    days = asyncio.run(collect())
+    assert sorted(days) == [f"2024-01-{day:02}" for day in range(1, 21)]
+    assert len(server.requests) == 4
+    assert all(response["sleep"] for response in days.values())
+    assert all(
+        sleep["dateOfSleep"] == date
+        for date, response in days.items()
+        for sleep in response["sleep"]
+    )
+
+
+def stream_dates_test(server: mock_server.MockServer):
+    """Test streaming a single date endpoint, and cancelling the stream."""
+    web_client = client.Client(TOKENS, base_url=server.base_url)
+
+    async def first() -> tuple[str, dict]:
+        days = web_client.stream(
+            "get_heart_by_date_intraday",
+            "2024-01-01",
+            "2024-01-31",
+            concurrency=2,
+            max_queue=2,
+            detail_level="1min",
+        )
+        item = await anext(days)
+        await days.aclose()
+        return item
+
+    date, response = asyncio.run(first())
+    assert date in ("2024-01-01", "2024-01-02")
+    assert HEART in response
+    assert len(server.requests) <= 5
+    with pytest.raises(ValueError, match="not the method of a date endpoint"):
+        asyncio.run(anext(web_client.stream("get_profile", "2024-01-01")))
+    with pytest.raises(ValueError, match=r"several dates \(date, end_date\)"):
+        asyncio.run(
+            anext(web_client.stream("get_heart_by_date_range_intraday", "2024-01-01"))
+        )
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
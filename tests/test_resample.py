@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from fitbit_web import mock_server, resample, series
+
+
+def resample_test():
+    """Test the aggregates and that gaps are kept as empty buckets."""
+    times = np.array([0, 60, 120, 600, 660, 1900]) + series.timestamp("2024-01-01")
+    values = [1.0, 2.0, np.nan, 4.0, 6.0, 10.0]
+    buckets = resample.resample(times, values, "5min")
+    assert buckets.time[0] == np.datetime64("2024-01-01T00:00:00")
+    assert buckets.counts.tolist() == [2, 0, 2, 0, 0, 0, 1]
+    assert buckets.sum.tolist() == [3.0, 0.0, 10.0, 0.0, 0.0, 0.0, 10.0]
+    np.testing.assert_array_equal(
+        buckets.mean, [1.5, np.nan, 5.0, np.nan, np.nan, np.nan, 10.0]
+    )
+    np.testing.assert_array_equal(
+        buckets.min, [1.0, np.nan, 4.0, np.nan, np.nan, np.nan, 10.0]
+    )
+    np.testing.assert_array_equal(
+        buckets.max, [2.0, np.nan, 6.0, np.nan, np.nan, np.nan, 10.0]
+    )
+    sparse = resample.resample(times[::-1], values[::-1], 600, min_count=2)
+    np.testing.assert_array_equal(sparse.mean, [1.5, 5.0, np.nan, np.nan])
+    assert sparse.counts.tolist() == [2, 2, 0, 1]
+
+
+def bounds_test():
+    """Test resampling into a fixed window."""
+    day = series.timestamp("2024-01-01")
+    times = np.arange(day - 60, day + 2 * 86400, 60).astype("datetime64[s]")
+    buckets = resample.resample(
+        times, np.ones(len(times)), "1d", "2024-01-01", "2024-01-02"
+    )
+    assert buckets.time.tolist() == [np.datetime64("2024-01-01T00:00:00").item()]
+    assert buckets.counts.tolist() == [24 * 60]
+    after = resample.resample(times, np.ones(len(times)), "1d", "2024-01-05")
+    assert len(after.time) == 0 and after.sum.dtype == np.float64
+    empty = resample.resample([], [], "1h")
+    assert len(empty.time) == 0 and empty.sum.dtype == np.float64
+
+
+def resample_response_test():
+    """Test resampling a 1min response to 15min, as if requested at 15min."""
+    response = mock_server.payload(
+        "/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json",
+        {"date": "2024-01-01", "detail-level": "1min"},
+    )
+    buckets = resample.resample_response(response, "15min")["activities-heart-intraday"]
+    assert len(buckets.time) == 24 * 4
+    assert np.all(buckets.counts == 15)
+    dataset = response["activities-heart-intraday"]["dataset"]
+    assert buckets.mean[0] == pytest.approx(
+        sum(sample["value"] for sample in dataset[:15]) / 15
+    )
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -0,0 +1,90 @@
+import concurrent.futures
+import dataclasses
+
+import pytest
+
+from fitbit_web import __main__, mock_server, runner, store
+from tests.conftest import TOKENS
+
+SLEEP = "get_sleep_by_date_range"
+
+
+def ring_test():
+    """Test that adding a shard only moves the keys it takes over."""
+    keys = [f"user{i}" for i in range(1000)]
+    before, after = runner.Ring(4), runner.Ring(5)
+    moved = [key for key in keys if before.shard(key) != after.shard(key)]
+    assert all(after.shard(key) == 4 for key in moved)
+    assert 100 < len(moved) < 300
+    shards = runner.partition(keys, before, 4)
+    assert sorted(key for shard in shards for key in shard) == sorted(keys)
+    assert all(150 < len(shard) < 350 for shard in shards)
+
+
+def config_test():
+    """Test that the users are partitioned across nodes and then workers."""
+    keys = [f"user{i}" for i in range(100)]
+    configs = [
+        runner.Config("state.db", "out.db", [SLEEP], node=node, nodes=2, workers=3)
+        for node in range(2)
+    ]
+    shards = [config.users(keys) for config in configs]
+    assert all(len(node) == 3 for node in shards)
+    users = [key for node in shards for shard in node for key in shard]
+    assert sorted(users) == sorted(keys)
+    assert configs[0].journal_path == "out.journal.db"
+
+
+def resource_test():
+    """Test parsing the resources of the command line."""
+    assert __main__.resource(SLEEP) == SLEEP
+    assert __main__.resource("get_x:resource_path=steps,a=b=c") == (
+        "get_x",
+        {"resource_path": "steps", "a": "b=c"},
+    )
+
+
+def run_test(server: mock_server.MockServer, tmp_path):
+    """Test ingesting several users, past one which fails, and resuming a run."""
+    state = tmp_path / "state.db"
+    with runner.State(state) as users:
+        tokens = [
+            {**dataclasses.asdict(TOKENS), "user_id": user_id, "scope": scope}
+            for user_id, scope in (
+                ("A", "sleep"),
+                ("B", "sleep"),
+                ("C", "sleep"),
+                ("D", "temperature"),
+            )
+        ]
+        assert runner.import_tokens(users, tokens) == 4
+        assert users.token_store.users() == ["A", "B", "C", "D"]
+        assert users.token_store.get("A").scope == ("sleep",)
+    config = runner.Config(
+        str(state),
+        str(tmp_path / "fitbit.db"),
+        [SLEEP],
+        since="2024-01-01",
+        until="2024-04-30",
+        workers=2,
+        base_url=server.base_url,
+    )
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        summary = runner.run(config, executor)
+        assert summary.requests == 6
+        assert list(summary.failures) == ["D"] and "sleep" in summary.failures["D"]
+        assert runner.run(config, executor).requests == 0
+    assert len(server.requests) == 6
+    with store.Store(config.output) as db:
+        for user_id in ("A", "B", "C"):
+            assert db.resources(user_id)
+    with runner.State(state) as users:
+        quota = runner.backfill.Quota()
+        users.load_rate_limit("A", quota)
+        assert quota.remaining is not None
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
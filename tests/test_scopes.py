@@ -0,0 +1,60 @@
+import pytest
+
+from fitbit_web import auth, client, mock_server, scopes
+
+TOKENS = auth.AuthTokens(
+    access_token="access",
+    expires_in=28800,
+    refresh_token="refresh",
+    scope=("heartrate", "nutrition"),
+    token_type="Bearer",
+    user_id="USER01",
+)
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("get_heart_by_date_intraday", True),
+        ("aget_foods_list", True),
+        ("get_sleep_by_date", True),
+        ("get_temp_core_summary_by_date", False),
+        ("/1/user/-/spo2/date/{date}.json", False),
+        ("/1/user/-/custom.json", True),
+    ],
+)
+def allowed_test(name: str, expected: bool):
+    assert scopes.allowed(name, TOKENS.scope) is expected
+
+
+def plan_test():
+    plan = scopes.plan(
+        TOKENS.scope, ["get_temp_core_summary_by_date", "get_heart_by_date_intraday"]
+    )
+    assert plan.allowed == ("get_heart_by_date_intraday",)
+    assert plan.denied == {"get_temp_core_summary_by_date": ("temperature",)}
+    plan = scopes.plan(TOKENS.scope)
+    assert "get_foods_list" in plan.allowed and "get_profile" in plan.denied
+    assert "aget_foods_list" not in plan.allowed
+
+
+def client_test():
+    """Test that the client fails before making a request."""
+    web_client = client.Client(TOKENS, base_url="http://127.0.0.1:9/")
+    with pytest.raises(scopes.ScopeError, match="temperature"):
+        web_client.get_temp_core_summary_by_date("today")
+
+
+def unknown_endpoint_test(server: mock_server.MockServer):
+    """Test that the client requests endpoints which are not in the spec."""
+    web_client = client.Client(TOKENS, base_url=server.base_url)
+    scopes.check("/1/user/-/custom.json", TOKENS.scope)
+    with pytest.raises(Exception, match="Unknown resource"):
+        web_client._get("/1/user/-/custom.json")
+    assert server.requests == ["/1/user/-/custom.json"]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from fitbit_web import mock_server, series, store
+
+HEART = "/1/user/-/activities/heart/date/{date}/1d/{detail-level}.json"
+
+
+def heart(date: str) -> dict:
+    return mock_server.payload(HEART, {"date": date, "detail-level": "1min"})
+
+
+def samples_test():
+    """Test the extraction of the samples of the different response shapes."""
+    response = heart("2024-01-02")
+    samples = series.samples(response)
+    times, values = samples["activities-heart-intraday"]
+    assert len(times) == len(values) == 24 * 60
+    assert times[0] == series.timestamp("2024-01-02")
+    assert times[1] - times[0] == 60
+    assert samples["activities-heart.restingHeartRate"].values[0] == (
+        response["activities-heart"][0]["value"]["restingHeartRate"]
+    )
+    hrv = series.samples(
+        mock_server.payload(
+            "/1/user/-/hrv/date/{startDate}/{endDate}.json",
+            {"startDate": "2024-01-01", "endDate": "2024-01-03"},
+        )
+    )
+    assert set(hrv) == {"hrv.dailyRmssd", "hrv.deepRmssd"}
+    spo2 = series.samples(
+        mock_server.payload(
+            "/1/user/-/spo2/date/{date}/all.json", {"date": "2024-01-01"}
+        ),
+        name="spo2",
+    )
+    assert len(spo2["spo2"].times) == 24 * 60
+    weight = series.samples(
+        {"weight": [{"date": "2024-01-01", "time": "07:30:00", "weight": 70.5}]}
+    )
+    assert list(map(list, weight["weight"])) == [
+        [series.timestamp("2024-01-01T07:30:00")],
+        [70.5],
+    ]
+    assert not series.samples(
+        {"cardioScore": [{"dateTime": "2024-01-01", "value": {"vo2Max": "44-48"}}]}
+    )
+
+
+def store_test(tmp_path):
+    """Test that re-fetched days are replaced and queried by range."""
+    with store.Store(tmp_path / "fitbit.db") as db:
+        assert db.ingest("A", heart("2024-01-01")) == 24 * 60 + 1
+        db.ingest("A", heart("2024-01-02"))
+        db.ingest("B", heart("2024-01-02"))
+        updated = heart("2024-01-02")
+        updated["activities-heart-intraday"]["dataset"][0]["value"] = 1000
+        db.ingest("A", updated)
+        times, values = db.query(
+            "A", "activities-heart-intraday", "2024-01-02", "2024-01-03"
+        )
+        assert len(times) == 24 * 60
+        assert times[0] == np.datetime64("2024-01-02T00:00:00")
+        assert values[0] == 1000 and np.all(np.diff(times) > np.timedelta64(0))
+        assert len(db.query("A", "activities-heart-intraday")[0]) == 2 * 24 * 60
+        assert db.span("A", "activities-heart-intraday") == (
+            series.timestamp("2024-01-01"),
+            series.timestamp("2024-01-02T23:59:00"),
+        )
+        assert "activities-heart.restingHeartRate" in db.resources("B")
+        assert db.delete("B") > 0 and db.resources("B") == []
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
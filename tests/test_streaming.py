@@ -0,0 +1,50 @@
+import asyncio
+import json
+
+from fitbit_web import streaming, tcx
+from tests.test_tcx import SAMPLE
+
+DOCUMENT = json.dumps(
+    {
+        "activities-heart-intraday": {
+            "dataset": [{"time": f"00:00:{i:02}", "value": 60 + i} for i in range(60)],
+            "datasetInterval": 1,
+        }
+    }
+).encode()
+
+
+def chunked(data: bytes, size: int = 7):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+def parse_test():
+    """Test that items are parsed from chunks."""
+    items = list(
+        streaming.parse(chunked(DOCUMENT), "activities-heart-intraday.dataset.item")
+    )
+    assert items == json.loads(DOCUMENT)["activities-heart-intraday"]["dataset"]
+    assert next(streaming.parse(chunked(DOCUMENT))) == ("", "start_map", None)
+
+
+def aparse_test():
+    """Test that items are parsed from async chunks."""
+
+    async def achunked():
+        for chunk in chunked(DOCUMENT):
+            yield chunk
+
+    async def collect():
+        return [
+            item
+            async for item in streaming.aparse(
+                achunked(), "activities-heart-intraday.dataset.item.value"
+            )
+        ]
+
+    assert asyncio.run(collect()) == list(range(60, 120))
+
+
+def tcx_chunks_test():
+    """Test that TCX can be parsed from streamed chunks."""
+    assert list(tcx.trackpoints(chunked(SAMPLE))) == list(tcx.trackpoints(SAMPLE))
@@ -0,0 +1,53 @@
+import datetime
+import io
+import math
+
+import numpy as np
+
+from fitbit_web import tcx
+
+SAMPLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<TrainingCenterDatabase xmlns="http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2">
+  <Activities>
+    <Activity Sport="Running">
+      <Id>2019-01-01T10:00:00.000-08:00</Id>
+      <Lap StartTime="2019-01-01T10:00:00.000-08:00">
+        <Track>
+          <Trackpoint>
+            <Time>2019-01-01T10:00:00.000-08:00</Time>
+            <Position>
+              <LatitudeDegrees>37.77</LatitudeDegrees>
+              <LongitudeDegrees>-122.41</LongitudeDegrees>
+            </Position>
+            <AltitudeMeters>12.5</AltitudeMeters>
+            <DistanceMeters>0.0</DistanceMeters>
+            <HeartRateBpm><Value>101</Value></HeartRateBpm>
+          </Trackpoint>
+          <Trackpoint>
+            <Time>2019-01-01T18:00:01Z</Time>
+            <DistanceMeters>2.4</DistanceMeters>
+            <HeartRateBpm><Value>103</Value></HeartRateBpm>
+          </Trackpoint>
+        </Track>
+      </Lap>
+    </Activity>
+  </Activities>
+</TrainingCenterDatabase>"""
+
+
+def trackpoints_test():
+    """Test that trackpoints are read from a TCX document."""
+    first, second = tcx.trackpoints(SAMPLE)
+    assert first.time == datetime.datetime(2019, 1, 1, 18, tzinfo=datetime.timezone.utc)
+    assert (first.latitude, first.longitude, first.heart_rate) == (37.77, -122.41, 101)
+    assert math.isnan(second.latitude)
+    assert second.distance == 2.4
+    assert list(tcx.trackpoints(io.BytesIO(SAMPLE))) == [first, second]
+
+
+def to_arrays_test():
+    """Test that trackpoints can be read into arrays."""
+    arrays = tcx.to_arrays(SAMPLE)
+    assert arrays["time"].dtype == np.dtype("datetime64[ms]")
+    assert (arrays["time"][1] - arrays["time"][0]) == np.timedelta64(1, "s")
+    np.testing.assert_array_equal(arrays["heart_rate"], [101, 103])
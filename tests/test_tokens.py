@@ -0,0 +1,98 @@
+import dataclasses
+import multiprocessing
+
+import pytest
+
+from fitbit_web import auth, client, mock_server, tokens
+from tests.conftest import TOKENS
+
+STORES = {
+    "memory": lambda path: tokens.MemoryTokenStore(),
+    "file": lambda path: tokens.FileTokenStore(path / "tokens.json"),
+    "sqlite": lambda path: tokens.SqliteTokenStore(path / "tokens.db"),
+}
+
+
+@pytest.fixture(params=list(STORES))
+def token_store(request, tmp_path):
+    with STORES[request.param](tmp_path) as token_store:
+        yield token_store
+
+
+def swap_test(token_store: tokens.TokenStore):
+    """Test that tokens are only swapped if they have not been replaced."""
+    refreshed = dataclasses.replace(TOKENS, access_token="mock-access-1")
+    assert token_store.get(TOKENS.user_id) is None
+    assert not token_store.swap(refreshed, TOKENS)
+    assert token_store.swap(None, TOKENS)
+    assert not token_store.swap(None, TOKENS)
+    assert token_store.get(TOKENS.user_id) == TOKENS
+    assert token_store.swap(TOKENS, refreshed)
+    assert not token_store.swap(TOKENS, refreshed)
+    token_store.put(dataclasses.replace(TOKENS, user_id="A"))
+    assert token_store.users() == ["A", TOKENS.user_id]
+    assert token_store.get(TOKENS.user_id) == refreshed
+
+
+def parse_test(tmp_path):
+    """Test decoding tokens with the scope as returned by the token endpoint."""
+    values = {**dataclasses.asdict(TOKENS), "scope": "activity heartrate"}
+    assert tokens.parse(values).scope == ("activity", "heartrate")
+    assert tokens.loads(tokens.dumps(TOKENS)) == TOKENS
+    with tokens.open(tmp_path / "tokens.sqlite") as token_store:
+        assert isinstance(token_store, tokens.SqliteTokenStore)
+    with tokens.open(tmp_path / "tokens.json") as token_store:
+        assert isinstance(token_store, tokens.FileTokenStore)
+
+
+def refresh_test(server: mock_server.MockServer, token_store: tokens.TokenStore):
+    """Test that clients sharing a store refresh the tokens only once."""
+    server.token_lifetime = 3
+    token_store.put(TOKENS)
+    clients = [
+        client.Client(TOKENS, base_url=server.base_url, token_store=token_store)
+        for _ in range(2)
+    ]
+    for web_client in clients:
+        web_client.get_profile()
+        web_client.get_profile()
+    assert clients[0].tokens == TOKENS
+    clients[0].get_profile()
+    assert server.refreshes == [TOKENS.refresh_token]
+    assert clients[0].tokens == clients[1].tokens == token_store.get(TOKENS.user_id)
+    assert clients[0].tokens.refresh_token == "mock-refresh-1"
+
+
+def single_use_test(server: mock_server.MockServer):
+    """Test that clients which do not share a store reuse the refresh token."""
+    server.token_lifetime = 1
+    clients = [client.Client(TOKENS, base_url=server.base_url) for _ in range(2)]
+    for web_client in clients:
+        web_client.get_profile()
+    with pytest.raises(Exception, match="invalid_grant"):
+        clients[0].get_profile()
+
+
+def _refresh(path: str) -> str:
+    with tokens.open(path) as token_store:
+        return token_store.refresh(TOKENS).access_token
+
+
+@pytest.mark.parametrize("name", ["tokens.json", "tokens.db"])
+def processes_test(server: mock_server.MockServer, tmp_path, name):
+    """Test that processes refreshing the same tokens at once refresh them once."""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("The refresh URL of the mock server is not inherited.")
+    path = str(tmp_path / name)
+    with tokens.open(path) as token_store:
+        token_store.put(TOKENS)
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        assert set(pool.map(_refresh, [path] * 8)) == {"mock-access-1"}
+    assert server.refreshes == [TOKENS.refresh_token]
+    assert auth.REFRESH_URL.startswith(server.base_url)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s"] + sys.argv))
@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 
 from fitbit_web import utils
@@ -13,7 +15,7 @@ def test_format(fn, sample: str, exception: type[Exception] | None):
 
 @pytest.mark.parametrize(
     ("sample", "exception"),
-    [("23:04", None), ("43:04", ValueError), ("23-04", ValueError)],
+    [("23:04", None), ("43:04", ValueError), ("23-04", ValueError), ("8:04", None)],
 )
 def time_test(sample: str, exception: type[Exception] | None):
     test_format(utils.format_time, sample, exception)
@@ -21,12 +23,83 @@ def time_test(sample: str, exception: type[Exception] | None):
 
 @pytest.mark.parametrize(
     ("sample", "exception"),
-    [("02-04-02", ValueError), ("2020-03-04", None), ("today", None)],
+    [
+        ("02-04-02", ValueError),
+        ("2020-03-04", None),
+        ("today", None),
+        ("2020-02-30", ValueError),
+        ("2020-3-4", None),
+    ],
 )
 def date_test(sample: str, exception: type[Exception] | None):
     test_format(utils.format_date, sample, exception)
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("2024-01-02", "2024-01-02"),
+        ("2024-1-2", "2024-01-02"),
+        (datetime.date(2024, 1, 2), "2024-01-02"),
+        ("2024-01-02T03:04:05", "2024-01-02T03:04:05"),
+        (datetime.datetime(2024, 1, 2, 3, 4, 5, 6), "2024-01-02T03:04:05"),
+    ],
+)
+def format_date_or_timestamp_test(value, expected: str | None):
+    assert utils.format_date_or_timestamp(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("url", "param_kwargs", "query_kwargs", "expected"),
+    [
+        (
+            "/1/user/-/sleep/date/{base-date}/{end-date}.json",
+            {"base-date": "2024-01-01", "end-date": "2024-01-31"},
+            None,
+            "https://api.fitbit.com/1/user/-/sleep/date/2024-01-01/2024-01-31.json",
+        ),
+        (
+            "/1/user/-/activities/list.json",
+            None,
+            {"afterDate": "2024-01-01", "sort": "asc", "limit": 100, "offset": None},
+            "https://api.fitbit.com/1/user/-/activities/list.json?afterDate=2024-01-01&sort=asc&limit=100",
+        ),
+        (
+            "/1/foods/search.json",
+            None,
+            {"query": "fish & chips"},
+            "https://api.fitbit.com/1/foods/search.json?query=fish+%26+chips",
+        ),
+    ],
+)
+def format_url_test(
+    url: str,
+    param_kwargs: dict | None,
+    query_kwargs: dict | None,
+    expected: str,
+):
+    assert utils.format_url(url, param_kwargs, query_kwargs) == expected
+    template = utils.UrlTemplate(url)
+    assert template == url
+    assert template.build(param_kwargs, query_kwargs) == expected
+    assert template.build(
+        param_kwargs, query_kwargs, "http://localhost:8080/"
+    ) == "http://localhost:8080/" + expected.removeprefix(utils.BASE_URL)
+
+
+@pytest.mark.parametrize(
+    ("content_type", "expected"),
+    [
+        ("application/json;charset=UTF-8", True),
+        (None, True),
+        ("application/vnd.garmin.tcx+xml", False),
+    ],
+)
+def is_json_test(content_type: str | None, expected: bool):
+    assert utils.is_json(content_type) is expected
+
+
 if __name__ == "__main__":
     import sys
 